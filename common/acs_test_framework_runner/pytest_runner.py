@@ -1,16 +1,35 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import itertools
+import multiprocessing
 import shutil
 import subprocess
 import sys
+import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 try:  # Support package imports and direct harness module loading.
     from .case_data_builders import CaseBuildError
+    from .runner_cache import (
+        build_case_cache_key,
+        case_cache_path,
+        load_cached_outcome,
+        store_cached_outcome,
+    )
     from .runner_checks import (
         ConfigError,
         RunCaseOptions,
@@ -39,8 +58,15 @@ try:  # Support package imports and direct harness module loading.
         write_case_log,
         write_junit_xml,
     )
+    from .runner_timings import case_timing_key, load_case_timings, save_case_timings
 except ImportError:  # pragma: no cover - exercised by flat-module harness imports.
     from case_data_builders import CaseBuildError
+    from runner_cache import (
+        build_case_cache_key,
+        case_cache_path,
+        load_cached_outcome,
+        store_cached_outcome,
+    )
     from runner_checks import (
         ConfigError,
         RunCaseOptions,
@@ -69,6 +95,7 @@ except ImportError:  # pragma: no cover - exercised by flat-module harness impor
         write_case_log,
         write_junit_xml,
     )
+    from runner_timings import case_timing_key, load_case_timings, save_case_timings
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = detect_project_root(SCRIPT_DIR)
@@ -111,6 +138,46 @@ def requires_serial_case_execution(suite_cases: list[dict[str, Any]]) -> bool:
     )
 
 
+def create_case_process_pool(jobs: int) -> ProcessPoolExecutor | None:
+    """
+    Return worker processes for the in-process case types, or None.
+
+    py_function and module_* cases chdir, replace os.environ and patch module
+    attributes in the interpreter that runs them, so two of them cannot run
+    in one process at the same time. Each worker runs one case at a time and
+    restores that state afterwards. All workers are forked here, before any
+    case thread exists. Without fork (or with one job) in-process cases run
+    in the runner itself and their suites run serially.
+    """
+    if jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    pool = ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("fork"),
+    )
+    for future in [pool.submit(int) for _ in range(jobs)]:
+        future.result()
+    return pool
+
+
+def build_testcase_name(suite_name: str, file_entry: str, case_name: str) -> str:
+    return f"{suite_name}::{Path(file_entry).name}::{case_name.strip()}"
+
+
+def run_check(
+    file_path: Path,
+    case_def: dict[str, Any],
+    work_dir: Path,
+    process_pool: Executor | None = None,
+) -> tuple[bool, str, str, bool]:
+    case_type = str(case_def.get("type", "cli"))
+    if process_pool is not None and case_type in IN_PROCESS_CASE_TYPES:
+        return process_pool.submit(
+            run_single_check, file_path, case_def, work_dir
+        ).result()
+    return run_single_check(file_path, case_def, work_dir)
+
+
 def run_case(
     suite_name: str,
     file_entry: str,
@@ -123,7 +190,7 @@ def run_case(
 
     file_path = resolve_target_path(file_entry)
     case_name = case_def["name"].strip()
-    testcase_name = f"{suite_name}::{Path(file_entry).name}::{case_name}"
+    testcase_name = build_testcase_name(suite_name, file_entry, case_name)
     case_type = str(case_def.get("type", "cli"))
 
     file_work_dir = get_file_work_dir(suite_name, file_entry)
@@ -142,14 +209,15 @@ def run_case(
 
     def persist_case_logs(status: str, outcome: TestOutcome) -> None:
         case_description = effective_case.get("description")
-        append_combined_case_log(
-            file_work_dir=file_work_dir,
-            testcase_name=testcase_name,
-            status=status,
-            message=outcome.message,
-            details=outcome.details,
-            description=case_description,
-        )
+        if options.combined_log:
+            append_combined_case_log(
+                file_work_dir=file_work_dir,
+                testcase_name=testcase_name,
+                status=status,
+                message=outcome.message,
+                details=outcome.details,
+                description=case_description,
+            )
         write_case_log(
             case_work_dir=work_dir,
             testcase_name=testcase_name,
@@ -159,9 +227,22 @@ def run_case(
             description=case_description,
         )
 
+    cache_key = None
+    if options.use_cache:
+        cache_key = build_case_cache_key(file_path, effective_case, work_dir)
+    if cache_key is not None:
+        cached_outcome = load_cached_outcome(
+            case_cache_path(testcase_name, file_entry, case_index),
+            cache_key,
+            meta,
+        )
+        if cached_outcome is not None:
+            persist_case_logs(case_log_status(cached_outcome), cached_outcome)
+            return cached_outcome
+
     try:
-        passed, message, details, is_error = run_single_check(
-            file_path, effective_case, work_dir
+        passed, message, details, is_error = run_check(
+            file_path, effective_case, work_dir, options.process_pool
         )
 
         warn_only = bool(effective_case.get("warn_only", False))
@@ -193,6 +274,12 @@ def run_case(
             )
         )
         persist_case_logs(status, outcome)
+        if cache_key is not None:
+            store_cached_outcome(
+                case_cache_path(testcase_name, file_entry, case_index),
+                cache_key,
+                outcome,
+            )
         return outcome
     except SkipCase as exc:
         outcome = create_outcome(
@@ -393,15 +480,74 @@ def select_yaml_runs_for_target(
 
 
 
-def run_yaml(
+def case_log_status(outcome: TestOutcome) -> str:
+    if outcome.error:
+        return "ERROR"
+    if outcome.skipped:
+        return "SKIPPED"
+    if outcome.warning:
+        return "WARNING"
+    return "PASS" if outcome.passed else "FAIL"
+
+
+@dataclass
+class FileRun:
+    """The cases of one suite run against one target file."""
+
+    yaml_file: Path
+    suite_name: str
+    file_entry: str
+    cases: list[tuple[int, dict[str, Any]]]
+    options: RunCaseOptions
+    serial: bool
+    outcomes: dict[int, TestOutcome] = field(default_factory=dict)
+
+    @property
+    def work_dir(self) -> Path:
+        return get_file_work_dir(self.suite_name, self.file_entry)
+
+    def batches(self) -> list[list[tuple[int, dict[str, Any]]]]:
+        """Work items of this run: all cases together if serial, otherwise one per case."""
+        if self.serial:
+            return [self.cases]
+        return [[case] for case in self.cases]
+
+    def timing_key(self, case_def: dict[str, Any]) -> str:
+        return case_timing_key(
+            self.file_entry,
+            build_testcase_name(self.suite_name, self.file_entry, case_def["name"]),
+        )
+
+
+@dataclass
+class GroupRun:
+    """One selected YAML group and its results, in manifest order."""
+
+    yaml_file: Path
+    group_name: str
+    xml_report: Path
+    # Each entry is a finished outcome or the (file run, case index) producing it
+    slots: list[TestOutcome | tuple[FileRun, int]] = field(default_factory=list)
+
+    def outcomes(self) -> list[TestOutcome]:
+        return [
+            slot if isinstance(slot, TestOutcome) else slot[0].outcomes[slot[1]]
+            for slot in self.slots
+        ]
+
+
+def plan_yaml_group(
     yaml_file: Path,
     selected_targets: set[str],
-    jobs: int = 4,
-) -> int:
-    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-
+    process_pool: Executor | None = None,
+    use_cache: bool = False,
+) -> tuple[GroupRun, list[FileRun]]:
     group_name = get_group_name(yaml_file)
-    xml_report = build_report_path(group_name, yaml_file)
+    group = GroupRun(
+        yaml_file=yaml_file,
+        group_name=group_name,
+        xml_report=build_report_path(group_name, yaml_file),
+    )
 
     print(f"\n[INFO] Running group : {group_name}")
     print(
@@ -410,45 +556,40 @@ def run_yaml(
     )
     print(
         f"[INFO] XML report    : "
-        f"{xml_report.relative_to(PROJECT_ROOT).as_posix()}"
+        f"{group.xml_report.relative_to(PROJECT_ROOT).as_posix()}"
     )
 
     try:
         config = load_yaml_config(yaml_file)
         suites = normalize_suites(config)
     except ConfigError as exc:
-        outcome = build_config_error_outcome(
-            yaml_file=yaml_file,
-            message=format_outcome_message("Configuration error", str(exc)),
-            details=traceback.format_exc(),
+        group.slots.append(
+            build_config_error_outcome(
+                yaml_file=yaml_file,
+                message=format_outcome_message("Configuration error", str(exc)),
+                details=traceback.format_exc(),
+            )
         )
-        write_junit_xml(xml_report, group_name, yaml_file, [outcome])
-        print_group_summary(group_name, [outcome], xml_report)
-        return 1
+        return group, []
 
-    outcomes: list[TestOutcome] = []
+    file_runs: list[FileRun] = []
 
     for suite_index, suite in enumerate(suites, start=1):
         suite_name = suite["name"]
-        run_case_options = RunCaseOptions(
-            suite_command=suite.get("command"),
-        )
-        suite_files = suite["files"]
         suite_cases = suite["cases"]
 
-        filtered_files = []
-        for file_entry in suite_files:
-            normalized_file_entry = Path(file_entry).as_posix()
-            if normalized_file_entry in selected_targets:
-                filtered_files.append(file_entry)
-
+        filtered_files = [
+            file_entry
+            for file_entry in suite["files"]
+            if Path(file_entry).as_posix() in selected_targets
+        ]
         if not filtered_files:
             continue
 
         print(f"[INFO] Suite         : {suite_name}")
 
         if not suite_cases:
-            outcomes.append(
+            group.slots.append(
                 create_outcome(
                     testcase_name=f"{suite_name}::no_cases",
                     file_path="",
@@ -467,67 +608,325 @@ def run_yaml(
 
         for file_entry in filtered_files:
             print(f"[INFO] Target file   : {file_entry}")
+            file_run = FileRun(
+                yaml_file=yaml_file,
+                suite_name=suite_name,
+                file_entry=file_entry,
+                cases=list(enumerate(suite_cases, start=1)),
+                options=RunCaseOptions(
+                    suite_command=suite.get("command"),
+                    process_pool=process_pool,
+                    use_cache=use_cache,
+                ),
+                serial=process_pool is None
+                and requires_serial_case_execution(suite_cases),
+            )
+            file_runs.append(file_run)
+            group.slots.extend((file_run, case_index) for case_index, _ in file_run.cases)
 
-            file_work_dir = get_file_work_dir(suite_name, file_entry)
+    return group, file_runs
 
-            if file_work_dir.exists():
-                shutil.rmtree(file_work_dir)
-            file_work_dir.mkdir(parents=True, exist_ok=True)
 
-            append_run_header(
-                file_work_dir=file_work_dir,
-                suite_name=suite_name,
-                yaml_file=yaml_file,
-                targets=[file_entry],
+def start_file_run(file_run: FileRun) -> None:
+    file_work_dir = file_run.work_dir
+    if file_work_dir.exists():
+        shutil.rmtree(file_work_dir)
+    file_work_dir.mkdir(parents=True, exist_ok=True)
+
+    append_run_header(
+        file_work_dir=file_work_dir,
+        suite_name=file_run.suite_name,
+        yaml_file=file_run.yaml_file,
+        targets=[file_run.file_entry],
+    )
+
+
+def finish_file_run(file_run: FileRun) -> None:
+    # combined.log lists the cases in manifest order, whatever order they finished in
+    for case_index, case_def in file_run.cases:
+        outcome = file_run.outcomes[case_index]
+        append_combined_case_log(
+            file_work_dir=file_run.work_dir,
+            testcase_name=outcome.testcase_name,
+            status=case_log_status(outcome),
+            message=outcome.message,
+            details=outcome.details,
+            description=case_def.get("description"),
+        )
+
+
+def run_file_cases(
+    file_run: FileRun,
+    cases: list[tuple[int, dict[str, Any]]],
+) -> list[tuple[int, TestOutcome]]:
+    results: list[tuple[int, TestOutcome]] = []
+    for case_index, case_def in cases:
+        started = time.perf_counter()
+        outcome = run_case(
+            suite_name=file_run.suite_name,
+            file_entry=file_run.file_entry,
+            case_index=case_index,
+            case_def=case_def,
+            options=replace(file_run.options, combined_log=False),
+        )
+        outcome.meta.duration = time.perf_counter() - started
+        results.append((case_index, outcome))
+    return results
+
+
+def estimate_case_durations(
+    file_runs: list[FileRun],
+    timings: dict[str, float],
+) -> dict[tuple[int, int], float]:
+    """
+    Return {(id(file run), case index): expected seconds} from past timings.
+
+    Cases without a recorded time are given the mean of the recorded ones,
+    or 0 when none of the cases has one.
+    """
+    recorded = {
+        (id(file_run), case_index): timings.get(file_run.timing_key(case_def))
+        for file_run in file_runs
+        for case_index, case_def in file_run.cases
+    }
+    known = [seconds for seconds in recorded.values() if seconds is not None]
+    default = sum(known) / len(known) if known else 0.0
+    return {
+        case_key: default if seconds is None else seconds
+        for case_key, seconds in recorded.items()
+    }
+
+
+def select_shard(
+    groups: list[GroupRun],
+    file_runs: list[FileRun],
+    timings: dict[str, float],
+    shard: tuple[int, int],
+) -> list[FileRun]:
+    """
+    Keep only the work items of shard index/count and return its file runs.
+
+    Work items (see FileRun.batches()) are dealt longest first to the least
+    loaded shard, so every shard gets about the same expected time, or the
+    same number of cases while there are no timings yet. The split depends
+    only on the selected cases and the timings, so shards given the same
+    timings file divide the work without overlap.
+    Configuration error outcomes are reported by the first shard.
+    """
+    index, count = shard
+    estimates = estimate_case_durations(file_runs, timings)
+    items = [
+        (
+            sum(estimates[(id(file_run), case_index)] for case_index, _ in batch),
+            file_run,
+            batch,
+        )
+        for file_run in file_runs
+        for batch in file_run.batches()
+    ]
+    # Stable sort: items with the same expected time keep manifest order
+    items.sort(key=lambda item: -item[0])
+
+    # (expected seconds, cases) per shard; the case count splits untimed work
+    loads = [(0.0, 0)] * count
+    kept: set[tuple[int, int]] = set()
+    for seconds, file_run, batch in items:
+        target_shard = loads.index(min(loads))
+        loads[target_shard] = (
+            loads[target_shard][0] + seconds,
+            loads[target_shard][1] + len(batch),
+        )
+        if target_shard == index - 1:
+            kept.update((id(file_run), case_index) for case_index, _ in batch)
+
+    shard_runs = []
+    for file_run in file_runs:
+        file_run.cases = [
+            case for case in file_run.cases if (id(file_run), case[0]) in kept
+        ]
+        if file_run.cases:
+            shard_runs.append(file_run)
+    for group in groups:
+        group.slots = [
+            slot
+            for slot in group.slots
+            if (
+                index == 1
+                if isinstance(slot, TestOutcome)
+                else (id(slot[0]), slot[1]) in kept
             )
+        ]
 
-            case_jobs = list(enumerate(suite_cases, start=1))
-            file_jobs = 1 if requires_serial_case_execution(suite_cases) else jobs
-
-            if file_jobs <= 1:
-                for case_index, case_def in case_jobs:
-                    outcomes.append(
-                        run_case(
-                            suite_name=suite_name,
-                            file_entry=file_entry,
-                            case_index=case_index,
-                            case_def=case_def,
-                            options=run_case_options,
-                        )
-                    )
-            else:
-                case_results: list[tuple[int, TestOutcome]] = []
-                with ThreadPoolExecutor(max_workers=file_jobs) as executor:
-                    future_map = {
-                        executor.submit(
-                            run_case,
-                            suite_name,
-                            file_entry,
-                            case_index,
-                            case_def,
-                            run_case_options,
-                        ): case_index
-                        for case_index, case_def in case_jobs
-                    }
-                    for future in as_completed(future_map):
-                        case_index = future_map[future]
-                        case_results.append((case_index, future.result()))
-
-                for _case_index, outcome in sorted(
-                    case_results,
-                    key=lambda item: item[0],
-                ):
-                    outcomes.append(outcome)
+    print(
+        f"[INFO] Shard         : {index}/{count}, "
+        f"{len(kept)} of {len(estimates)} cases, "
+        f"about {loads[index - 1][0]:.1f}s of "
+        f"{sum(seconds for seconds, _ in loads):.1f}s recorded time"
+    )
+    return shard_runs
+
+
+def run_file_runs(
+    file_runs: list[FileRun],
+    jobs: int,
+    timings: dict[str, float] | None = None,
+) -> None:
+    """
+    Run the cases of every file run on one pool of jobs threads.
+
+    Cases of different suites, files and YAML groups run side by side. A
+    file run whose suite must be serial is one work item, and file runs that
+    share a work directory (the same suite name and file stem) run one after
+    another in manifest order, since each one starts by clearing it.
+
+    Ready work items start longest first by their time in timings, counting
+    the file runs still queued behind them on the same work directory, so a
+    slow case does not start last and stretch the end of the run. Items
+    with the same expected time start in manifest order.
+    """
+    workers = max(1, jobs)
+    estimates = estimate_case_durations(file_runs, timings or {})
+
+    lanes: dict[Path, deque[FileRun]] = {}
+    for file_run in file_runs:
+        lanes.setdefault(file_run.work_dir, deque()).append(file_run)
+
+    queued_behind: dict[int, float] = {}
+    for lane in lanes.values():
+        lane_tail = 0.0
+        for file_run in reversed(lane):
+            queued_behind[id(file_run)] = lane_tail
+            lane_tail += sum(
+                estimates[(id(file_run), case_index)] for case_index, _ in file_run.cases
+            )
+
+    remaining: dict[int, int] = {}
+    pending: dict[Future, FileRun] = {}
+    ready: list[tuple[float, int, list[tuple[int, dict[str, Any]]], FileRun]] = []
+    ready_order = itertools.count()
 
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def start(file_run: FileRun) -> None:
+            start_file_run(file_run)
+            batches = file_run.batches()
+            remaining[id(file_run)] = len(batches)
+            for batch in batches:
+                seconds = queued_behind[id(file_run)] + sum(
+                    estimates[(id(file_run), case_index)] for case_index, _ in batch
+                )
+                heapq.heappush(ready, (-seconds, next(ready_order), batch, file_run))
+
+        def submit_ready() -> None:
+            while ready and len(pending) < workers:
+                _seconds, _order, batch, file_run = heapq.heappop(ready)
+                future = executor.submit(run_file_cases, file_run, batch)
+                pending[future] = file_run
+
+        for lane in lanes.values():
+            start(lane[0])
+        submit_ready()
+
+        while pending:
+            done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_run = pending.pop(future)
+                file_run.outcomes.update(future.result())
+                remaining[id(file_run)] -= 1
+                if remaining[id(file_run)]:
+                    continue
+                finish_file_run(file_run)
+                lane = lanes[file_run.work_dir]
+                lane.popleft()
+                if lane:
+                    start(lane[0])
+            submit_ready()
+
+
+def report_group(group: GroupRun) -> int:
+    outcomes = group.outcomes()
     if not outcomes:
         return 0
 
-    write_junit_xml(xml_report, group_name, yaml_file, outcomes)
-    print_group_summary(group_name, outcomes, xml_report)
+    write_junit_xml(group.xml_report, group.group_name, group.yaml_file, outcomes)
+    print_group_summary(group.group_name, outcomes, group.xml_report)
 
     return 0 if all(item.passed or item.skipped or item.warning for item in outcomes) else 1
 
 
+def run_yaml_groups(
+    selected_runs: list[tuple[Path, set[str]]],
+    jobs: int = 4,
+    process_pool: Executor | None = None,
+    use_cache: bool = False,
+    shard: tuple[int, int] | None = None,
+) -> list[int]:
+    """
+    Run the selected YAML groups together and return their exit codes.
+
+    All cases go through one scheduler (see run_file_runs()), so a run is
+    bounded by the total work rather than by the slowest group. XML reports
+    and combined case logs are written in manifest order, as a serial run
+    writes them. With use_cache, passed cases whose cache key is unchanged
+    (see runner_cache.build_case_cache_key()) are replayed instead of run.
+    With shard, only that share of the cases runs (see select_shard()).
+    The wall time of each case that ran is recorded in the timings file.
+    """
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    groups: list[GroupRun] = []
+    file_runs: list[FileRun] = []
+    for yaml_file, selected_targets in selected_runs:
+        group, group_file_runs = plan_yaml_group(
+            yaml_file,
+            selected_targets,
+            process_pool,
+            use_cache,
+        )
+        groups.append(group)
+        file_runs.extend(group_file_runs)
+
+    timings = load_case_timings()
+    if shard is not None:
+        file_runs = select_shard(groups, file_runs, timings, shard)
+
+    run_file_runs(file_runs, jobs, timings)
+
+    save_case_timings({
+        file_run.timing_key(case_def): file_run.outcomes[case_index].duration
+        for file_run in file_runs
+        for case_index, case_def in file_run.cases
+        if not file_run.outcomes[case_index].cached
+    })
+
+    return [report_group(group) for group in groups]
+
+
+def run_yaml(
+    yaml_file: Path,
+    selected_targets: set[str],
+    jobs: int = 4,
+    process_pool: Executor | None = None,
+    use_cache: bool = False,
+) -> int:
+    return run_yaml_groups(
+        [(yaml_file, selected_targets)], jobs, process_pool, use_cache
+    )[0]
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    index_text, separator, count_text = value.partition("/")
+    try:
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        index, count = 0, 0
+    if not separator or count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(
+            f"expected i/N with 1 <= i <= N, got {value!r}"
+        )
+    return index, count
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Run YAML-driven tests for impacted files or a manual target."
@@ -542,6 +941,17 @@ def main() -> int:
         default=4,
         help="Number of YAML test cases to run in parallel (default: 4)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every selected case instead of replaying cached passed results",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="Run only shard I of N, split by the recorded case durations",
+    )
     args = parser.parse_args()
 
     jobs = max(1, args.jobs)
@@ -610,14 +1020,20 @@ def main() -> int:
             print(f"      * target: {target}")
 
     overall_exit_code = 0
-    for yaml_file, selected_targets in selected_runs:
-        exit_code = run_yaml(
-            yaml_file,
-            selected_targets=selected_targets,
-            jobs=jobs,
-        )
-        if exit_code != 0:
-            overall_exit_code = exit_code
+    process_pool = create_case_process_pool(jobs)
+    try:
+        for exit_code in run_yaml_groups(
+            selected_runs,
+            jobs,
+            process_pool,
+            use_cache=not args.no_cache,
+            shard=args.shard,
+        ):
+            if exit_code != 0:
+                overall_exit_code = exit_code
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown()
 
     print("\n[INFO] Custom YAML test execution completed.")
     print(
@@ -239,7 +239,11 @@ def get_recently_changed_paths() -> list[Path]:
     return paths
 
 
-def run_pytest(target: str | None = None, jobs: int = 4) -> tuple[int, str, str]:
+def run_pytest(
+    target: str | None = None,
+    jobs: int = 4,
+    use_cache: bool = True,
+) -> tuple[int, str, str]:
     if not RUNNER_FILE.exists():
         return 1, "", f"ERROR: Runner file not found: {RUNNER_FILE}"
 
@@ -247,6 +251,8 @@ def run_pytest(target: str | None = None, jobs: int = 4) -> tuple[int, str, str]
     if target:
         cmd.extend(["--target", target])
     cmd.extend(["--jobs", str(max(1, jobs))])
+    if not use_cache:
+        cmd.append("--no-cache")
 
     result = subprocess.run(
         cmd,
@@ -962,6 +968,11 @@ def main() -> int:
         default=4,
         help="Number of YAML test cases to run in parallel (default: 4)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every selected case instead of replaying cached passed results",
+    )
     args = parser.parse_args()
 
     ensure_reports_dir()
@@ -973,7 +984,11 @@ def main() -> int:
             f"Manual target override enabled: {args.target}"
         )
 
-    pytest_exit_code, _pytest_stdout, _pytest_stderr = run_pytest(args.target, jobs=args.jobs)
+    pytest_exit_code, _pytest_stdout, _pytest_stderr = run_pytest(
+        args.target,
+        jobs=args.jobs,
+        use_cache=not args.no_cache,
+    )
     pylint_exit_code = run_pylint(args.target)
     mypy_exit_code = run_mypy(args.target)
 
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+try:  # Support package imports and direct harness module loading.
+    from .mock_loader import expand_case_mapping
+    from .runner_checks import (
+        DESTRUCTIVE_TEST_ENV,
+        TestMeta,
+        TestOutcome,
+        create_outcome,
+        detect_project_root,
+        source_tree_root,
+    )
+except ImportError:  # pragma: no cover - exercised by flat-module harness imports.
+    from mock_loader import expand_case_mapping
+    from runner_checks import (
+        DESTRUCTIVE_TEST_ENV,
+        TestMeta,
+        TestOutcome,
+        create_outcome,
+        detect_project_root,
+        source_tree_root,
+    )
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = detect_project_root(SCRIPT_DIR)
+REPORTS_DIR = PROJECT_ROOT / "common" / "reports"
+# Kept outside _work, which is cleared at the start of every run
+CASE_CACHE_DIR = REPORTS_DIR / "_case_cache"
+CASE_CACHE_VERSION = 1
+
+# Source tree root -> digest, computed once per run
+_TREE_DIGESTS: dict[Path, str] = {}
+
+
+def digest_source_tree(root: Path) -> str:
+    cached = _TREE_DIGESTS.get(root)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(
+            name for name in dir_names
+            if name != "__pycache__" and not name.startswith(".")
+        )
+        for file_name in sorted(file_names):
+            if file_name.endswith((".pyc", ".pyo")):
+                continue
+            path = Path(dir_path) / file_name
+            digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+            digest.update(b"\0")
+            try:
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+            except OSError:
+                digest.update(b"unreadable")
+    _TREE_DIGESTS[root] = digest.hexdigest()
+    return _TREE_DIGESTS[root]
+
+
+def harness_digest() -> str:
+    """Digest of the harness sources and the interpreter running them."""
+    digest = hashlib.sha256(digest_source_tree(SCRIPT_DIR).encode("ascii"))
+    digest.update(sys.version.encode("utf-8"))
+    digest.update(str(os.environ.get(DESTRUCTIVE_TEST_ENV)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_case_cache_key(
+    file_path: Path,
+    case_def: dict[str, Any],
+    work_dir: Path,
+) -> str | None:
+    """
+    Return the cache key of a case, or None if it cannot be cached.
+
+    The key covers the case after token expansion, the target's source tree
+    (see source_tree_root()), the harness sources and the Python version.
+    """
+    try:
+        expanded_case = expand_case_mapping(case_def, work_dir, file_path)
+        case_text = json.dumps(expanded_case, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return None
+    if not file_path.is_file():
+        return None
+
+    digest = hashlib.sha256()
+    for part in (
+        str(CASE_CACHE_VERSION),
+        harness_digest(),
+        file_path.resolve().as_posix(),
+        digest_source_tree(source_tree_root(file_path)),
+        case_text,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def case_cache_path(testcase_name: str, file_entry: str, case_index: int) -> Path:
+    # One entry per case: a new result for a case replaces its old one
+    name = f"{file_entry}\0{case_index}\0{testcase_name}"
+    return CASE_CACHE_DIR / f"{hashlib.sha256(name.encode('utf-8')).hexdigest()}.json"
+
+
+def load_cached_outcome(
+    cache_path: Path,
+    key: str,
+    meta: TestMeta,
+) -> TestOutcome | None:
+    try:
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+
+    try:
+        return create_outcome(
+            testcase_name=entry["testcase_name"],
+            file_path=entry["file_path"],
+            passed=True,
+            message=entry["message"],
+            meta=meta,
+            details=(
+                "Result replayed from the case cache: the case, its target's "
+                "sources and the harness are unchanged since it last passed."
+                + (f"\n\n{entry['details']}" if entry["details"] else "")
+            ),
+            warning=bool(entry["warning"]),
+            cached=True,
+        )
+    except KeyError:
+        return None
+
+
+def store_cached_outcome(cache_path: Path, key: str, outcome: TestOutcome) -> None:
+    """Cache a passed or warn-only outcome; failures, errors and skips always re-run."""
+    if not outcome.passed or outcome.error or outcome.skipped or outcome.cached:
+        return
+
+    entry = {
+        "key": key,
+        "testcase_name": outcome.testcase_name,
+        "file_path": outcome.file_path,
+        "message": outcome.message,
+        "details": outcome.details,
+        "warning": outcome.warning,
+    }
+    CASE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_name(f"{cache_path.name}.{uuid4().hex[:8]}.tmp")
+    try:
+        temp_path.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
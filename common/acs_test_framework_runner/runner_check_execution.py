@@ -36,10 +36,13 @@ try:  # Support package imports and direct harness module loading.
         ensure_list,
         ensure_list_of_strings,
         ensure_string_or_list_of_strings,
+        exec_module_code,
         load_module_from_path,
         normalize_completed_stream,
         read_source,
         sanitize_xml_text,
+        source_tree_root,
+        target_import_path,
     )
 except ImportError:  # pragma: no cover - exercised by flat-module harness imports.
     from case_data_builders import (
@@ -63,10 +66,13 @@ except ImportError:  # pragma: no cover - exercised by flat-module harness impor
         ensure_list,
         ensure_list_of_strings,
         ensure_string_or_list_of_strings,
+        exec_module_code,
         load_module_from_path,
         normalize_completed_stream,
         read_source,
         sanitize_xml_text,
+        source_tree_root,
+        target_import_path,
     )
 
 
@@ -885,6 +891,10 @@ def build_cli_env(
     work_dir: Path,
 ) -> dict[str, str]:
     env = os.environ.copy()
+    # The script finds the shared helpers of its area as it does in-process
+    env["PYTHONPATH"] = os.pathsep.join(
+        part for part in (str(source_tree_root(file_path)), env.get("PYTHONPATH")) if part
+    )
     raw_env = case_def.get("env")
     if raw_env is None:
         return env
@@ -1078,7 +1088,7 @@ def check_module_cli(
                 target_context={"module": "__main__"},
             ):
                 with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-                    spec.loader.exec_module(script_module)
+                    exec_module_code(script_module, file_path)
         except SystemExit as exc:
             exit_code = exc.code if isinstance(exc.code, int) else 0
         except MockExpectationError as exc:
@@ -1207,4 +1217,5 @@ def run_single_check(
     if handler is None:
         raise ConfigError(f"Unsupported test type: {case_type}")
 
-    return handler(file_path, case_def, work_dir)
+    with target_import_path(file_path):
+        return handler(file_path, case_def, work_dir)
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import ast
 import importlib.util
+import os
 import re
 import subprocess
 import sys
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import CodeType
 from typing import Any
 from uuid import uuid4
 
@@ -44,6 +49,8 @@ class TestMeta:
     suite_name: str
     phase: str
     test_type: str
+    # Wall time of the case in seconds, set by the runner
+    duration: float = 0.0
 
 
 @dataclass
@@ -59,6 +66,7 @@ class TestOutcome:
             "error": False,
             "skipped": False,
             "warning": False,
+            "cached": False,
         }
     )
 
@@ -74,6 +82,14 @@ class TestOutcome:
     def warning(self) -> bool:
         return self.flags["warning"]
 
+    @property
+    def cached(self) -> bool:
+        return self.flags["cached"]
+
+    @property
+    def duration(self) -> float:
+        return self.meta.duration
+
 
 class ConfigError(Exception):
     """Raised when a YAML configuration is invalid."""
@@ -97,6 +113,12 @@ class CommandRunResult:
 @dataclass(frozen=True)
 class RunCaseOptions:
     suite_command: str | None = None
+    # In-process cases run in this pool when set (see create_case_process_pool())
+    process_pool: Executor | None = None
+    # False when the caller writes combined.log itself (see finish_file_run())
+    combined_log: bool = True
+    # Replay passed results from the case cache (see runner_cache.py)
+    use_cache: bool = False
 
 
 def create_runner_temp_dir(prefix: str = "runner_env_") -> Path:
@@ -238,6 +260,7 @@ def create_outcome(
             "error": kwargs.get("error", False),
             "skipped": kwargs.get("skipped", False),
             "warning": kwargs.get("warning", False),
+            "cached": kwargs.get("cached", False),
         },
     )
 
@@ -246,7 +269,78 @@ def build_runner_module_name(file_path: Path) -> str:
     return f"runner_module_{sanitize_name(file_path.stem)}_{uuid4().hex}"
 
 
+# Target path -> (mtime_ns, size, code object)
+_MODULE_CODE_CACHE: dict[str, tuple[int, int, CodeType]] = {}
+
+
+def get_module_code(file_path: Path) -> CodeType:
+    """
+    Return the compiled code of a target script.
+
+    The code is compiled once per run and reused until the file's mtime or
+    size changes, so a target loaded by many in-process cases is not read,
+    checked against its .pyc, or compiled again for each one.
+    """
+    path = str(file_path)
+    stat_result = os.stat(path)
+    cached = _MODULE_CODE_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+        return cached[2]
+    with open(path, "rb") as handle:
+        code = compile(handle.read(), path, "exec", dont_inherit=True)
+    _MODULE_CODE_CACHE[path] = (stat_result.st_mtime_ns, stat_result.st_size, code)
+    return code
+
+
+def source_tree_root(file_path: Path) -> Path:
+    """
+    Return the directory whose files a target may depend on.
+
+    Targets import their siblings and shared helpers, and run_log_parser.py
+    runs the other parsers as scripts, so a target under common/<area>
+    depends on the whole area (e.g. common/log_parser) rather than on its own
+    source. Other targets depend on their own directory.
+    """
+    common_dir = PROJECT_ROOT / "common"
+    try:
+        relative = file_path.resolve().relative_to(common_dir)
+    except ValueError:
+        return file_path.resolve().parent
+    if len(relative.parts) < 2:
+        return file_path.resolve().parent
+    return common_dir / relative.parts[0]
+
+
+@contextmanager
+def target_import_path(file_path: Path) -> Iterator[None]:
+    """
+    Put the target's directory and its source tree root first on sys.path.
+
+    As under `python <target>`, a target imports its siblings by name, and
+    the scripts in a subdirectory import the shared helpers at its root
+    (e.g. common/log_parser). sys.path is restored when the case is done.
+    """
+    entries = [str(file_path.resolve().parent), str(source_tree_root(file_path))]
+    original_path = sys.path[:]
+    sys.path[:0] = list(dict.fromkeys(entries))
+    try:
+        yield
+    finally:
+        sys.path[:] = original_path
+
+
+def exec_module_code(module: Any, file_path: Path) -> None:
+    """Run a target script's cached code in a fresh module namespace."""
+    exec(get_module_code(file_path), module.__dict__)  # pylint: disable=exec-used
+
+
 def load_module_from_path(file_path: Path) -> Any:
+    """
+    Load a target script as a new module for one case.
+
+    The module is registered in sys.modules under a unique name while it
+    runs; callers remove it when the case is done.
+    """
     module_name = build_runner_module_name(file_path)
     spec = importlib.util.spec_from_file_location(
         module_name,
@@ -257,8 +351,8 @@ def load_module_from_path(file_path: Path) -> Any:
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
     try:
-        spec.loader.exec_module(module)
-    except Exception:
+        exec_module_code(module, file_path)
+    except BaseException:
         sys.modules.pop(module_name, None)
         raise
     return module
@@ -31,6 +31,7 @@ REPORTS_DIR = PROJECT_ROOT / "common" / "reports"
 PLACEHOLDER_XML = REPORTS_DIR / "pytest-placeholder.xml"
 LOG_SEPARATOR = "=" * 100
 LOG_WRITE_LOCK = Lock()
+SLOWEST_CASE_COUNT = 5
 
 
 def append_run_header(
@@ -219,6 +220,7 @@ def write_junit_xml(
     passed = sum(
         1 for item in outcomes if item.passed and not item.skipped and not item.warning
     )
+    cached = sum(1 for item in outcomes if item.cached)
 
     testsuite = xml_et.Element("testsuite")
     testsuite.set("name", sanitize_xml_text(suite_name))
@@ -226,6 +228,7 @@ def write_junit_xml(
     testsuite.set("failures", str(failures))
     testsuite.set("errors", str(errors))
     testsuite.set("skipped", str(skipped))
+    testsuite.set("time", f"{sum(item.duration for item in outcomes):.3f}")
 
     properties = xml_et.SubElement(testsuite, "properties")
 
@@ -244,6 +247,10 @@ def write_junit_xml(
     warnings_prop.set("name", "warnings")
     warnings_prop.set("value", sanitize_xml_text(str(warnings)))
 
+    cached_prop = xml_et.SubElement(properties, "property")
+    cached_prop.set("name", "cached")
+    cached_prop.set("value", sanitize_xml_text(str(cached)))
+
     for outcome in outcomes:
         testcase = xml_et.SubElement(testsuite, "testcase")
         testcase.set(
@@ -252,6 +259,7 @@ def write_junit_xml(
         )
         testcase.set("name", sanitize_xml_text(outcome.testcase_name))
         testcase.set("file", sanitize_xml_text(outcome.file_path))
+        testcase.set("time", f"{outcome.duration:.3f}")
 
         if outcome.skipped:
             skipped_node = xml_et.SubElement(testcase, "skipped")
@@ -273,6 +281,7 @@ def write_junit_xml(
             f"phase={outcome.meta.phase}",
             f"type={outcome.meta.test_type}",
             f"warning={outcome.warning}",
+            f"cached={outcome.cached}",
             f"message={outcome.message}",
         ]
         if outcome.details:
@@ -315,6 +324,9 @@ def print_group_summary(
     print(f"Failed  : {failures}")
     print(f"Errors  : {errors}")
     print(f"Warnings: {warnings}")
+    cached = sum(1 for item in outcomes if item.cached)
+    if cached:
+        print(f"Cached  : {cached}")
 
     failed_items = [
         item for item in outcomes
@@ -339,6 +351,20 @@ def print_group_summary(
                 f"{item.file_path} :: {item.testcase_name} :: {item.message}"
             )
 
+    slowest_items = sorted(
+        (item for item in outcomes if item.duration > 0),
+        key=lambda item: item.duration,
+        reverse=True,
+    )[:SLOWEST_CASE_COUNT]
+    if slowest_items:
+        print("\n[SLOWEST]")
+        for item in slowest_items:
+            label = " (cached)" if item.cached else ""
+            print(
+                f"  - {item.duration:7.2f}s "
+                f"{item.file_path} :: {item.testcase_name}{label}"
+            )
+
 
 def build_config_error_outcome(
     yaml_file: Path,
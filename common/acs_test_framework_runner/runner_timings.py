@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from uuid import uuid4
+
+try:  # Support package imports and direct harness module loading.
+    from .runner_checks import detect_project_root
+except ImportError:  # pragma: no cover - exercised by flat-module harness imports.
+    from runner_checks import detect_project_root
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = detect_project_root(SCRIPT_DIR)
+REPORTS_DIR = PROJECT_ROOT / "common" / "reports"
+# Kept between runs; only XML reports and _work are cleared at start-up
+CASE_TIMINGS_FILE = REPORTS_DIR / "case_timings.json"
+
+
+def case_timing_key(file_entry: str, testcase_name: str) -> str:
+    return f"{file_entry}::{testcase_name}"
+
+
+def load_case_timings() -> dict[str, float]:
+    """Return {case timing key: seconds} from the last runs, or {} if there are none."""
+    try:
+        timings = json.loads(CASE_TIMINGS_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(timings, dict):
+        return {}
+    return {
+        key: float(value)
+        for key, value in timings.items()
+        if isinstance(value, (int, float)) and value >= 0
+    }
+
+
+def save_case_timings(measured: dict[str, float]) -> None:
+    """Merge newly measured durations into the timings file."""
+    if not measured:
+        return
+
+    timings = load_case_timings()
+    timings.update({key: round(value, 3) for key, value in measured.items()})
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    temp_path = CASE_TIMINGS_FILE.with_name(
+        f"{CASE_TIMINGS_FILE.name}.{uuid4().hex[:8]}.tmp"
+    )
+    try:
+        temp_path.write_text(
+            json.dumps(timings, indent=1, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        os.replace(temp_path, CASE_TIMINGS_FILE)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
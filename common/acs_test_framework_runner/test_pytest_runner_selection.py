@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import shutil
 import sys
+import time
+from concurrent.futures import Future
 from pathlib import Path
 
 
@@ -206,3 +209,316 @@ def test_collect_pytest_case_logs_skips_missing_case_description(
         ]
     finally:
         shutil.rmtree(temp_path, ignore_errors=True)
+
+
+def test_run_check_sends_only_in_process_cases_to_the_pool(monkeypatch) -> None:
+    submitted = []
+
+    class RecordingPool:
+        def submit(self, func, *args):
+            submitted.append(args[1]["type"])
+            future = Future()
+            future.set_result(func(*args))
+            return future
+
+    monkeypatch.setattr(
+        pytest_runner,
+        "run_single_check",
+        lambda _file_path, case_def, _work_dir: (True, case_def["type"], "", False),
+    )
+
+    for case_type in ("py_function", "cli", "module_main_with_env", "file_exists"):
+        result = pytest_runner.run_check(
+            Path("target.py"),
+            {"type": case_type},
+            Path("work"),
+            RecordingPool(),
+        )
+        assert result == (True, case_type, "", False)
+
+    assert submitted == ["py_function", "module_main_with_env"]
+
+
+def test_case_process_pool_runs_py_function_cases_in_a_worker(tmp_path) -> None:
+    target = tmp_path / "target.py"
+    target.write_text(
+        "import os\n\ndef worker_pid():\n    return os.getpid()\n",
+        encoding="utf-8",
+    )
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    assert pytest_runner.create_case_process_pool(1) is None
+    pool = pytest_runner.create_case_process_pool(2)
+    if pool is None:
+        return
+    try:
+        passed, message, _details, is_error = pytest_runner.run_check(
+            target,
+            {"name": "pid", "type": "py_function", "function": "worker_pid"},
+            work_dir,
+            pool,
+        )
+    finally:
+        pool.shutdown()
+
+    assert passed is True
+    assert is_error is False
+    assert message.startswith("Function returned ")
+    assert message != f"Function returned {os.getpid()}"
+
+
+def test_run_file_runs_orders_logs_and_shared_work_dirs(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(pytest_runner, "REPORTS_DIR", tmp_path)
+    events = []
+
+    def fake_run_case(suite_name, file_entry, case_index, case_def, **_kwargs):
+        events.append(("start", file_entry, case_index))
+        # Later cases finish first
+        time.sleep(0.02 * (4 - case_index))
+        events.append(("end", file_entry, case_index))
+        return pytest_runner.create_outcome(
+            testcase_name=f"{suite_name}::{file_entry}::{case_def['name']}",
+            file_path=file_entry,
+            passed=True,
+            message="ok",
+            meta=pytest_runner.TestMeta(
+                suite_name=suite_name,
+                phase="case",
+                test_type="cli",
+            ),
+        )
+
+    monkeypatch.setattr(pytest_runner, "run_case", fake_run_case)
+    cases = [(index, {"name": f"case{index}"}) for index in (1, 2, 3)]
+    # Same suite and file stem, so both use one work directory
+    file_runs = [
+        pytest_runner.FileRun(
+            yaml_file=pytest_runner.TEST_YAML_DIR / "group.yaml",
+            suite_name="suite",
+            file_entry=file_entry,
+            cases=cases,
+            options=pytest_runner.RunCaseOptions(),
+            serial=False,
+        )
+        for file_entry in ("a/target.py", "b/target.py")
+    ]
+
+    pytest_runner.run_file_runs(file_runs, jobs=4)
+
+    first_end = max(
+        position
+        for position, event in enumerate(events)
+        if event[:2] == ("end", "a/target.py")
+    )
+    second_start = min(
+        position
+        for position, event in enumerate(events)
+        if event[:2] == ("start", "b/target.py")
+    )
+    assert first_end < second_start
+    assert [file_run.outcomes[1].message for file_run in file_runs] == ["ok", "ok"]
+
+    combined_log = (file_runs[1].work_dir / "combined.log").read_text(encoding="utf-8")
+    positions = [
+        combined_log.index(f"suite::b/target.py::case{index}") for index in (1, 2, 3)
+    ]
+    assert positions == sorted(positions)
+    assert "a/target.py" not in combined_log.split("TEST CASE", 1)[1]
+
+
+def test_load_module_from_path_reuses_code_until_the_file_changes(tmp_path) -> None:
+    runner_checks = sys.modules["runner_checks"]
+    target = tmp_path / "target.py"
+    target.write_text("TABLE = {'value': 1}\n", encoding="utf-8")
+
+    first = runner_checks.load_module_from_path(target)
+    second = runner_checks.load_module_from_path(target)
+    try:
+        assert first is not second
+        assert first.TABLE is not second.TABLE
+        assert runner_checks.get_module_code(target) is runner_checks.get_module_code(target)
+    finally:
+        sys.modules.pop(first.__name__, None)
+        sys.modules.pop(second.__name__, None)
+
+    code = runner_checks.get_module_code(target)
+    target.write_text("TABLE = {'value': 22}\n", encoding="utf-8")
+    os.utime(target, ns=(0, 0))
+
+    third = runner_checks.load_module_from_path(target)
+    sys.modules.pop(third.__name__, None)
+    assert runner_checks.get_module_code(target) is not code
+    assert third.TABLE == {"value": 22}
+
+
+def test_run_case_replays_cached_passes_until_the_target_changes(
+    monkeypatch,
+    tmp_path,
+) -> None:
+    runner_cache = sys.modules["runner_cache"]
+    target = tmp_path / "src" / "target.py"
+    target.parent.mkdir()
+    target.write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.setattr(runner_cache, "CASE_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(runner_cache, "_TREE_DIGESTS", {})
+    monkeypatch.setattr(
+        pytest_runner,
+        "get_file_work_dir",
+        lambda suite_name, file_entry: tmp_path / "work",
+    )
+    checks = []
+
+    def fake_run_check(_file_path, case_def, _work_dir, _process_pool=None):
+        checks.append(case_def["name"])
+        return case_def["name"] != "fails", "checked", "details", False
+
+    def run(case_name, use_cache=True):
+        return pytest_runner.run_case(
+            suite_name="suite",
+            file_entry=str(target),
+            case_index=1,
+            case_def={"name": case_name, "type": "py_compile"},
+            options=pytest_runner.RunCaseOptions(use_cache=use_cache),
+        )
+
+    monkeypatch.setattr(pytest_runner, "run_check", fake_run_check)
+
+    assert run("passes").cached is False
+    replayed = run("passes")
+    assert replayed.cached is True
+    assert replayed.passed is True
+    assert replayed.details.endswith("details")
+    assert "Result replayed from the case cache" in (
+        tmp_path / "work" / "1_passes" / "case.log"
+    ).read_text(encoding="utf-8")
+    assert run("passes", use_cache=False).cached is False
+    assert checks == ["passes", "passes"]
+
+    run("fails")
+    assert run("fails").cached is False
+    assert checks[2:] == ["fails", "fails"]
+
+    target.write_text("VALUE = 2\n", encoding="utf-8")
+    runner_cache._TREE_DIGESTS.clear()  # pylint: disable=protected-access
+    assert run("passes").cached is False
+    assert run("passes").cached is True
+    assert checks[4:] == ["passes"]
+
+
+def make_file_runs(file_entries, case_count=1, serial=False):
+    return [
+        pytest_runner.FileRun(
+            yaml_file=pytest_runner.TEST_YAML_DIR / "group.yaml",
+            suite_name="suite",
+            file_entry=file_entry,
+            cases=[(index, {"name": f"case{index}"}) for index in range(1, case_count + 1)],
+            options=pytest_runner.RunCaseOptions(),
+            serial=serial,
+        )
+        for file_entry in file_entries
+    ]
+
+
+def test_run_file_runs_starts_the_longest_recorded_cases_first(
+    monkeypatch,
+    tmp_path,
+) -> None:
+    monkeypatch.setattr(pytest_runner, "REPORTS_DIR", tmp_path)
+    started = []
+
+    def fake_run_case(suite_name, file_entry, case_index, case_def, **_kwargs):
+        started.append(f"{file_entry}:{case_index}")
+        return pytest_runner.create_outcome(
+            testcase_name=f"{suite_name}::{file_entry}::{case_def['name']}",
+            file_path=file_entry,
+            passed=True,
+            message="ok",
+            meta=pytest_runner.TestMeta(
+                suite_name=suite_name,
+                phase="case",
+                test_type="cli",
+            ),
+        )
+
+    monkeypatch.setattr(pytest_runner, "run_case", fake_run_case)
+    file_runs = make_file_runs(["fast.py", "slow.py", "new.py"], case_count=2)
+    timings = {
+        file_runs[0].timing_key({"name": "case1"}): 0.1,
+        file_runs[0].timing_key({"name": "case2"}): 0.2,
+        file_runs[1].timing_key({"name": "case1"}): 5.0,
+        file_runs[1].timing_key({"name": "case2"}): 3.0,
+    }
+
+    pytest_runner.run_file_runs(file_runs, jobs=1, timings=timings)
+
+    # Untimed cases are expected to take the mean of the timed ones (2.075s)
+    assert started == [
+        "slow.py:1",
+        "slow.py:2",
+        "new.py:1",
+        "new.py:2",
+        "fast.py:2",
+        "fast.py:1",
+    ]
+    assert all(
+        outcome.duration >= 0
+        for file_run in file_runs
+        for outcome in file_run.outcomes.values()
+    )
+
+
+def test_select_shard_splits_work_items_by_recorded_time() -> None:
+    file_runs = make_file_runs(["a.py", "b.py", "c.py"], case_count=2)
+    file_runs[2].serial = True
+    timings = {
+        file_runs[0].timing_key({"name": "case1"}): 4.0,
+        file_runs[0].timing_key({"name": "case2"}): 1.0,
+        file_runs[1].timing_key({"name": "case1"}): 1.0,
+        file_runs[1].timing_key({"name": "case2"}): 1.0,
+        file_runs[2].timing_key({"name": "case1"}): 1.5,
+        file_runs[2].timing_key({"name": "case2"}): 1.5,
+    }
+    config_error = pytest_runner.create_outcome(
+        testcase_name="suite::no_cases",
+        file_path="",
+        passed=False,
+        message="Suite has no cases defined",
+        meta=pytest_runner.TestMeta(suite_name="suite", phase="suite", test_type="config"),
+        error=True,
+    )
+
+    shards = []
+    for index in (1, 2):
+        shard_file_runs = make_file_runs(["a.py", "b.py", "c.py"], case_count=2)
+        shard_file_runs[2].serial = True
+        group = pytest_runner.GroupRun(
+            yaml_file=pytest_runner.TEST_YAML_DIR / "group.yaml",
+            group_name="group",
+            xml_report=pytest_runner.REPORTS_DIR / "group.xml",
+            slots=[config_error]
+            + [
+                (file_run, case_index)
+                for file_run in shard_file_runs
+                for case_index, _ in file_run.cases
+            ],
+        )
+        kept_runs = pytest_runner.select_shard([group], shard_file_runs, timings, (index, 2))
+        shards.append(
+            (
+                {
+                    f"{file_run.file_entry}:{case_index}"
+                    for file_run in kept_runs
+                    for case_index, _ in file_run.cases
+                },
+                group.slots,
+            )
+        )
+
+    first_cases, first_slots = shards[0]
+    second_cases, second_slots = shards[1]
+    assert first_cases == {"a.py:1", "b.py:1"}
+    assert second_cases == {"c.py:1", "c.py:2", "a.py:2", "b.py:2"}
+    assert first_slots[0] is config_error
+    assert config_error not in second_slots
+    assert len(second_slots) == 4
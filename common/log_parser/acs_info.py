@@ -23,6 +23,8 @@ import re
 import json
 from datetime import datetime
 
+from log_encoding import log_exists, log_name, open_text
+
 def get_system_info(dmidecode_log_path):
     """
     Parse a saved dmidecode output file and return:
@@ -47,8 +49,8 @@ def get_system_info(dmidecode_log_path):
     kv_re = re.compile(r"^\s*([A-Za-z0-9 /()._-]+)\s*:\s*(.*)\s*$")
 
     try:
-        dmidecode_log = open(
-            dmidecode_log_path, "r", encoding="utf-8", errors="replace"
+        dmidecode_log = open_text(
+            dmidecode_log_path, encoding="utf-8", errors="replace"
         )
     except OSError as exc:
         print(
@@ -127,19 +129,19 @@ def get_uefi_version(uefi_version_log):
     """
     Reads 'UEFI v...' from UTF-16 encoded log file. Returns 'Unknown' if not found.
     """
-    if uefi_version_log and os.path.isfile(uefi_version_log):
+    if uefi_version_log and log_exists(uefi_version_log):
         try:
-            with open(uefi_version_log, 'r', encoding='utf-16') as file:
+            with open_text(uefi_version_log, encoding='utf-16') as file:
                 for line in file:
                     if 'UEFI v' in line:
                         return line.strip()
         except Exception as e:
-            print(f"Warning: reading UEFI version log {uefi_version_log}: {e}")
+            print(f"Warning: reading UEFI version log {log_name(uefi_version_log)}: {e}")
     return 'Unknown'
 
 def extract_bmc_firmware_from_ipmitool_log(log_path):
     """Extract firmware revision from ipmitool mc info log output."""
-    if not log_path or not os.path.isfile(log_path):
+    if not log_path or not log_exists(log_path):
         warn_prefix = "\033[1;93mWARNING:"
         warn_suffix = "\033[0m"
         if not log_path:
@@ -148,7 +150,7 @@ def extract_bmc_firmware_from_ipmitool_log(log_path):
             print(f"{warn_prefix} ipmitool log not found at {log_path}{warn_suffix}")
         return None
     fw_re = re.compile(r"^\s*Firmware\s+Revision\s*:\s*(.+)\s*$", re.IGNORECASE)
-    with open(log_path, "r", errors="replace") as f:
+    with open_text(log_path, errors="replace") as f:
         for raw in f:
             m = fw_re.match(raw)
             if m:
@@ -162,11 +164,11 @@ def get_bmc_firmware_version(ipmitool_log_path):
 
 def get_psci_version(psci_kernel_log_path):
     """Return PSCI version from kernel log or Unknown if missing."""
-    if not psci_kernel_log_path or not os.path.isfile(psci_kernel_log_path):
+    if not psci_kernel_log_path or not log_exists(psci_kernel_log_path):
         return "Unknown"
 
     version_re = re.compile(r"psci:\s+PSCIv([\d.]+)\s+detected in firmware\.", re.IGNORECASE)
-    with open(psci_kernel_log_path, "r", errors="replace") as f:
+    with open_text(psci_kernel_log_path, errors="replace") as f:
         for raw in f:
             match = version_re.search(raw.strip())
             if match:
@@ -183,7 +185,7 @@ def is_systemready_dt_band(acs_conf):
     return band_val == "systemready devicetree band"
 
 
-def main():
+def main(argv=None):
     """Entry point for acs_info.json generation."""
     parser = argparse.ArgumentParser(
         description="Collect ACS-like system info & summary data, then write to acs_info.txt & acs_info.json."
@@ -195,14 +197,34 @@ def main():
     parser.add_argument("--output_dir", default=".", help="Directory where acs_info.txt and acs_info.json will be created.")
     parser.add_argument("--ipmitool_log", default="", help="Path to ipmitool mc info log for BMC firmware extraction")
     parser.add_argument("--psci_kernel_log", default="", help="Path to psci_kernel.log for PSCI version extraction")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    final_json = collect_acs_info(
+        acs_config_path=args.acs_config_path,
+        system_config_path=args.system_config_path,
+        uefi_version_log=args.uefi_version_log,
+        dmidecode_log=args.dmidecode_log,
+        ipmitool_log=args.ipmitool_log,
+        psci_kernel_log=args.psci_kernel_log,
+    )
+
+    # Write to JSON
+    os.makedirs(args.output_dir, exist_ok=True)
+    json_path = os.path.join(args.output_dir, "acs_info.json")
+    with open(json_path, "w") as jf:
+        json.dump(final_json, jf, indent=4)
+
+    #print(f"acs_info.json created at: {json_path}")
 
+def collect_acs_info(acs_config_path="", system_config_path="", uefi_version_log="",
+                     dmidecode_log=".", ipmitool_log="", psci_kernel_log=""):
+    """Build the acs_info.json content without writing it."""
     # Gather system info from dmidecode
-    system_info = get_system_info(args.dmidecode_log)
+    system_info = get_system_info(dmidecode_log)
 
     # Parse and merge config files
-    acs_conf = parse_config(args.acs_config_path)
-    sys_conf = parse_config(args.system_config_path)
+    acs_conf = parse_config(acs_config_path)
+    sys_conf = parse_config(system_config_path)
 
     # 3) Merge them into system_info
     #    For instance, you might have 'ACS version', 'SRS version', etc. in acs_config.txt
@@ -212,13 +234,13 @@ def main():
         system_info[k] = v
 
     # Add UEFI and BMC firmware versions
-    uefi_ver = get_uefi_version(args.uefi_version_log)
+    uefi_ver = get_uefi_version(uefi_version_log)
     if uefi_ver != 'Unknown':
         system_info['UEFI Version'] = uefi_ver
     if is_systemready_dt_band(acs_conf):
-        system_info['PSCI version'] = get_psci_version(args.psci_kernel_log)
+        system_info['PSCI version'] = get_psci_version(psci_kernel_log)
     if is_systemready_band(acs_conf):
-        system_info['BMC Firmware Version'] = get_bmc_firmware_version(args.ipmitool_log)
+        system_info['BMC Firmware Version'] = get_bmc_firmware_version(ipmitool_log)
 
     # Build ACS Results Summary
     band_val = acs_conf.get("Band", "Unknown")
@@ -229,19 +251,11 @@ def main():
         "Date": date_str,
     }
 
-    # Assemble and write final JSON
-    final_json = {
+    # Assemble final JSON
+    return {
         "System Info": system_info,
         "ACS Results Summary": acs_results_summary
     }
 
-    # Write to JSON
-    os.makedirs(args.output_dir, exist_ok=True)
-    json_path = os.path.join(args.output_dir, "acs_info.json")
-    with open(json_path, "w") as jf:
-        json.dump(final_json, jf, indent=4)
-
-    #print(f"acs_info.json created at: {json_path}")
-
 if __name__ == "__main__":
     main()
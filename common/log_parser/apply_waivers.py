@@ -20,6 +20,11 @@ import json
 import re
 import argparse
 
+from fail_counts import FailCounter, recorded_fail_counts, store_fail_counts
+
+# Overridden by main(); library callers may set it directly.
+verbose = True
+
 def clean_description(desc):
     """Normalize a description string for older description-based waiver matching."""
     desc = desc.strip().lower()
@@ -72,15 +77,31 @@ def _append_waiver_to_result(result):
         return result
     return result + ' (WITH WAIVER)'
 
+# The recorded compliance counts (see fail_counts) are kept up to date as
+# failures are waived instead of walking the suite again afterwards. fails is
+# None where count_fails() does not read the result, e.g. the subtests of a
+# suite that has testcases.
+def _count_waiver(fails, old_result, new_result):
+    """Count new_result instead of old_result in fails, if given."""
+    if fails is not None:
+        fails.replace(old_result, new_result)
+
+def _subtest_fails(test_suite_entry, fails):
+    """Return fails for the top-level subtests of an entry, or None if they are not counted."""
+    return None if test_suite_entry.get('testcases') else fails
+
 # BSA/SBSA use Test_result, while some older parsers use test_result. Keep the
 # marking in one place so suite/testsuite/testcase waivers behave consistently.
-def _mark_failed_case_waived(testcase, reason):
+def _mark_failed_case_waived(testcase, reason, fails=None):
     """Mark a failed testcase as waived when it is not already waived."""
     result_key = 'Test_result' if 'Test_result' in testcase else 'test_result'
     test_result = testcase.get(result_key, '')
     if _is_failed_result(test_result) and not _has_waiver_result(test_result):
         testcase[result_key] = _append_waiver_to_result(test_result)
         testcase['waiver_reason'] = reason
+        # count_fails() only reads Test_result
+        if result_key == 'Test_result':
+            _count_waiver(fails, test_result, testcase[result_key])
         return True
     return False
 
@@ -100,7 +121,7 @@ def _mark_failed_subtests_waived(subtests, reason):
 # If a failed parent only contains waived failed children, mark that parent as
 # failed-with-waiver too. Passing/skipped/not-implemented children do not block
 # this because they are not unwaived failures.
-def _propagate_nested_bsa_waivers(testcase):
+def _propagate_nested_bsa_waivers(testcase, fails=None):
     """Move waiver state upward through failed BSA/SBSA nested parents."""
     def propagate_subtest(subtest):
         """Return failed, unwaived failed, and waived failed state for one branch."""
@@ -155,9 +176,126 @@ def _propagate_nested_bsa_waivers(testcase):
     ):
         _mark_failed_case_waived(
             testcase,
-            'All failed nested subtests were waived.'
+            'All failed nested subtests were waived.',
+            fails
         )
 
+def _testcase_rule_id(testcase_name):
+    """Return the rule id of a testcase name such as 'B_PE_01 : 1'."""
+    return testcase_name.split(':')[0].strip() if ':' in testcase_name else testcase_name
+
+def _cleaned_description(desc):
+    """Return clean_description(desc), or None when there is no description."""
+    return clean_description(desc) if isinstance(desc, str) else None
+
+def _index_first(index, key, entry):
+    """Keep the first (position, waiver) entry seen for key."""
+    try:
+        index.setdefault(key, entry)
+    except TypeError:
+        # Unhashable value in a hand-written waiver; it cannot match by key
+        pass
+
+def _lookup(index, key):
+    """Return the entry for key, or None when absent or unhashable."""
+    try:
+        return index.get(key)
+    except TypeError:
+        return None
+
+def _earliest(*entries):
+    """Return the waiver of the entry that comes first in the waiver file."""
+    found = [entry for entry in entries if entry is not None]
+    return min(found, key=lambda entry: entry[0])[1] if found else None
+
+# Waiver files can hold thousands of subtest entries and BSA/SBSA results tens
+# of thousands of nested subtests, so subtests are matched through indexes
+# rather than by scanning every waiver. When several waivers match, the first
+# one in the waiver file still wins.
+class SubtestWaivers(list):
+    """Subtest-level waiver entries in file order, indexed by match key."""
+
+    def __init__(self, waivers=()):
+        super().__init__(waivers)
+        # BSA/SBSA keys are (testcase rule id, value), compared as-is
+        self.by_path = {}
+        self.by_number = {}
+        self.by_rule_id = {}
+        self.by_description = {}
+        # Other suites match SubTestID or the cleaned description
+        self.by_subtest_id = {}
+        self.by_clean_description = {}
+        # SBMR only looks at SubTestID when the waiver has no description
+        self.by_subtest_id_only = {}
+        # Substring matching cannot use a hash; keep each cleaned text once
+        self.clean_descriptions = []
+
+        for position, waiver in enumerate(self):
+            entry = (position, waiver)
+            testcase = waiver.get('Test_case', '')
+            if isinstance(testcase, str):
+                testcase_id = _testcase_rule_id(testcase)
+                for index, field in ((self.by_path, 'sub_Test_Path'),
+                                     (self.by_number, 'sub_Test_Number'),
+                                     (self.by_rule_id, 'sub_Rule_ID'),
+                                     (self.by_description, 'sub_Test_Description')):
+                    value = waiver.get(field, '')
+                    if value:
+                        _index_first(index, (testcase_id, value), entry)
+
+            subtest_id = waiver.get('SubTestID')
+            if subtest_id:
+                _index_first(self.by_subtest_id, subtest_id, entry)
+            desc = waiver.get('sub_Test_Description')
+            if desc:
+                cleaned = _cleaned_description(desc)
+                if cleaned is not None:
+                    _index_first(self.by_clean_description, cleaned, entry)
+                    self.clean_descriptions.append((position, cleaned, waiver))
+            elif subtest_id:
+                _index_first(self.by_subtest_id_only, subtest_id, entry)
+
+    def _substring_entry(self, cleaned_desc):
+        """Return the first entry whose cleaned description occurs in cleaned_desc."""
+        if cleaned_desc is None:
+            return None
+        # An exact match bounds the scan: only an earlier waiver can beat it
+        exact = self.by_clean_description.get(cleaned_desc)
+        end = exact[0] if exact else len(self)
+        for position, cleaned, waiver in self.clean_descriptions:
+            if position >= end:
+                break
+            if cleaned in cleaned_desc:
+                return position, waiver
+        return exact
+
+    def match_nested(self, testcase_id, subtest):
+        """Return the waiver for a BSA/SBSA subtest of testcase_id, or None."""
+        return _earliest(
+            _lookup(self.by_path, (testcase_id, subtest.get('sub_Test_Path', ''))),
+            _lookup(self.by_number, (testcase_id, subtest.get('sub_Test_Number', ''))),
+            _lookup(self.by_rule_id, (testcase_id, _subtest_rule_id(subtest))),
+            _lookup(self.by_description, (testcase_id, subtest.get('sub_Test_Description', ''))),
+        )
+
+    def match_description(self, cleaned_desc):
+        """Return the first waiver whose cleaned description equals cleaned_desc."""
+        return _earliest(_lookup(self.by_clean_description, cleaned_desc))
+
+    def match_description_substring(self, cleaned_desc):
+        """Return the first waiver whose cleaned description occurs in cleaned_desc."""
+        return _earliest(self._substring_entry(cleaned_desc))
+
+    def match_id_or_description(self, subtest_id, cleaned_desc):
+        """Return the first waiver matching SubTestID or the cleaned description."""
+        return _earliest(_lookup(self.by_subtest_id, subtest_id),
+                         _lookup(self.by_clean_description, cleaned_desc))
+
+    def match_sbmr(self, cleaned_desc, subtest_number):
+        """Return the first waiver matching an SBMR description or SubTestID."""
+        return _earliest(self._substring_entry(cleaned_desc),
+                         _lookup(self.by_subtest_id_only, subtest_number))
+
 def load_waivers(waiver_data, suite_name):
     """Collect waiver entries by scope for the requested suite."""
     suite_level_waivers = []
@@ -307,17 +445,19 @@ def load_waivers(waiver_data, suite_name):
 
             break  # Found the suite, no need to continue
 
+    subtest_level_waivers = SubtestWaivers(subtest_level_waivers)
     return suite_level_waivers, testsuite_level_waivers, subsuite_level_waivers, testcase_level_waivers, subtest_level_waivers
 
-def apply_suite_level_waivers(test_suite_entry, suite_waivers):
+def apply_suite_level_waivers(test_suite_entry, suite_waivers, fails=None):
     """Apply suite-level waivers to failed results below a suite."""
+    subtest_fails = _subtest_fails(test_suite_entry, fails)
     # Apply waivers to all applicable failed subtests in the suite
     for waiver in suite_waivers:
         reason = waiver['Reason']
 
         # Apply to testcases (BSA/SBSA/SCMI)
         for testcase in test_suite_entry.get('testcases', []):
-            if _mark_failed_case_waived(testcase, reason):
+            if _mark_failed_case_waived(testcase, reason, fails):
                 _mark_failed_subtests_waived(testcase.get('subtests', []), reason)
                 if verbose:
                     print(f"Suite-level waiver applied to testcase '{testcase.get('Test_case')}' with reason: {reason}")
@@ -329,8 +469,10 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
             # Apply waiver only if the test has failed
             if isinstance(sub_test_result, dict):
                 if sub_test_result.get('FAILED', 0) > 0:
+                    old_result = dict(sub_test_result)
                     sub_test_result['FAILED'] -= 1
                     sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                    _count_waiver(subtest_fails, old_result, sub_test_result)
                     # Insert waiver_reason inside sub_test_result
                     sub_test_result['waiver_reason'] = reason
                     existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
@@ -342,6 +484,7 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
                 if 'FAILED' in sub_test_result.upper() or 'FAILURE' in sub_test_result.upper():
                     if '(WITH WAIVER)' not in sub_test_result.upper():
                         subtest['sub_test_result'] += ' (WITH WAIVER)'
+                        _count_waiver(subtest_fails, sub_test_result, subtest['sub_test_result'])
                         subtest['waiver_reason'] = reason
                         if verbose:
                             print(f"Suite-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with reason: {reason}")
@@ -355,8 +498,10 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
                     sub_test_result = subtest.get('sub_test_result')
                     if isinstance(sub_test_result, dict):
                         if sub_test_result.get('FAILED', 0) > 0:
+                            old_result = dict(sub_test_result)
                             sub_test_result['FAILED'] -= 1
                             sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                            _count_waiver(fails, old_result, sub_test_result)
                             sub_test_result['waiver_reason'] = reason
                             existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                             updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
@@ -366,10 +511,12 @@ def apply_suite_level_waivers(test_suite_entry, suite_waivers):
                         if 'FAILED' in result_upper or 'FAILURE' in result_upper or 'FAIL' in result_upper:
                             if '(WITH WAIVER)' not in result_upper:
                                 subtest['sub_test_result'] += ' (WITH WAIVER)'
+                                _count_waiver(fails, sub_test_result, subtest['sub_test_result'])
                                 subtest['waiver_reason'] = reason
 
-def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
+def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers, fails=None):
     """Apply testsuite-level waivers to matching failed testcases or subtests."""
+    subtest_fails = _subtest_fails(test_suite_entry, fails)
     # Get the test_suite_name considering different keys
     test_suite_name = test_suite_entry.get('Test_suite') or test_suite_entry.get('Test_suite_name')
     # Apply waivers to all applicable failed tests within specific TestSuites
@@ -379,7 +526,7 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
         if test_suite_name == target_testsuite:
             # For BSA/SBSA: apply to testcases
             for testcase in test_suite_entry.get('testcases', []):
-                if _mark_failed_case_waived(testcase, reason):
+                if _mark_failed_case_waived(testcase, reason, fails):
                     _mark_failed_subtests_waived(testcase.get('subtests', []), reason)
                     if verbose:
                         print(f"TestSuite-level waiver applied to testcase '{testcase.get('Test_case')}' in TestSuite '{target_testsuite}' with reason: {reason}")
@@ -391,8 +538,10 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                 # Apply waiver only if the test has failed
                 if isinstance(sub_test_result, dict):
                     if sub_test_result.get('FAILED', 0) > 0:
+                        old_result = dict(sub_test_result)
                         sub_test_result['FAILED'] -= 1
                         sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                        _count_waiver(subtest_fails, old_result, sub_test_result)
                         # Insert waiver_reason inside sub_test_result
                         sub_test_result['waiver_reason'] = reason
                         existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
@@ -404,6 +553,8 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                     if 'FAILED' in sub_test_result.upper() or 'FAILURE' in sub_test_result.upper():
                         if '(WITH WAIVER)' not in sub_test_result.upper():
                             subtest['sub_test_result'] += ' (WITH WAIVER)'
+                            _count_waiver(subtest_fails, sub_test_result,
+                                          subtest['sub_test_result'])
                             subtest['waiver_reason'] = reason
                             if verbose:
                                 print(f"TestSuite-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' in TestSuite '{target_testsuite}' with reason: {reason}")
@@ -419,8 +570,10 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                         sub_test_result = subtest.get('sub_test_result')
                         if isinstance(sub_test_result, dict):
                             if sub_test_result.get('FAILED', 0) > 0:
+                                old_result = dict(sub_test_result)
                                 sub_test_result['FAILED'] -= 1
                                 sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                                _count_waiver(fails, old_result, sub_test_result)
                                 sub_test_result['waiver_reason'] = reason
                                 existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                                 updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
@@ -430,10 +583,13 @@ def apply_testsuite_level_waivers(test_suite_entry, testsuite_waivers):
                             if 'FAILED' in result_upper or 'FAILURE' in result_upper:
                                 if '(WITH WAIVER)' not in result_upper:
                                     subtest['sub_test_result'] += ' (WITH WAIVER)'
+                                    _count_waiver(fails, sub_test_result,
+                                                  subtest['sub_test_result'])
                                     subtest['waiver_reason'] = reason
 
-def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers):
+def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers, fails=None):
     """Apply subsuite-level waivers where the parsed JSON has subsuite results."""
+    subtest_fails = _subtest_fails(test_suite_entry, fails)
     # Apply waivers to all applicable failed subtests within specific SubSuites
     for waiver in subsuite_waivers:
         target_subsuite = waiver['SubSuite']
@@ -445,8 +601,10 @@ def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers):
                 # Apply waiver only if the test has failed
                 if isinstance(sub_test_result, dict):
                     if sub_test_result.get('FAILED', 0) > 0:
+                        old_result = dict(sub_test_result)
                         sub_test_result['FAILED'] -= 1
                         sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                        _count_waiver(subtest_fails, old_result, sub_test_result)
                         # Insert waiver_reason inside sub_test_result
                         sub_test_result['waiver_reason'] = reason
                         existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
@@ -458,29 +616,42 @@ def apply_subsuite_level_waivers(test_suite_entry, subsuite_waivers):
                     if 'FAILED' in sub_test_result.upper() or 'FAILURE' in sub_test_result.upper():
                         if '(WITH WAIVER)' not in sub_test_result.upper():
                             subtest['sub_test_result'] += ' (WITH WAIVER)'
+                            _count_waiver(subtest_fails, sub_test_result,
+                                          subtest['sub_test_result'])
                             subtest['waiver_reason'] = reason
                             if verbose:
                                 print(f"SubSuite-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with reason: {reason}")
 
-def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
+def apply_testcase_level_waivers(test_suite_entry, testcase_waivers, fails=None):
     """Apply testcase-level waivers to matching failed testcases."""
+    subtest_fails = _subtest_fails(test_suite_entry, fails)
+    # For BSA/SBSA: apply directly to testcases. The first waiver naming a
+    # testcase wins, so look testcases up instead of pairing every waiver
+    # with every testcase.
+    testcases = test_suite_entry.get('testcases', [])
+    if testcases:
+        waivers_by_testcase = {}
+        for position, waiver in enumerate(testcase_waivers):
+            _index_first(waivers_by_testcase, waiver['Test_case'], (position, waiver))
+        for testcase in testcases:
+            test_case_name = testcase.get('Test_case', '')
+            # Extract just the rule ID from "B_XXX_01 : 1" format
+            test_case_id = _testcase_rule_id(test_case_name)
+            waiver = _earliest(_lookup(waivers_by_testcase, test_case_id),
+                               _lookup(waivers_by_testcase, test_case_name))
+            if waiver is None:
+                continue
+            reason = waiver['Reason']
+            if _mark_failed_case_waived(testcase, reason, fails):
+                _mark_failed_subtests_waived(testcase.get('subtests', []), reason)
+                if verbose:
+                    print(f"Test_case-level waiver applied to testcase '{test_case_name}' with reason: {reason}")
+
     # Apply waivers to all applicable failed subtests within specific Test_cases
     for waiver in testcase_waivers:
         target_testcase = waiver['Test_case']
         reason = waiver['Reason']
 
-        # For BSA/SBSA: apply directly to testcases
-        for testcase in test_suite_entry.get('testcases', []):
-            test_case_name = testcase.get('Test_case', '')
-            # Extract just the rule ID from "B_XXX_01 : 1" format
-            test_case_id = test_case_name.split(':')[0].strip() if ':' in test_case_name else test_case_name
-
-            if test_case_id == target_testcase or test_case_name == target_testcase:
-                if _mark_failed_case_waived(testcase, reason):
-                    _mark_failed_subtests_waived(testcase.get('subtests', []), reason)
-                    if verbose:
-                        print(f"Test_case-level waiver applied to testcase '{test_case_name}' with reason: {reason}")
-
         # For other structures: apply to subtests
         if test_suite_entry.get('Test_case') == target_testcase:
             for subtest in test_suite_entry.get('subtests', []):
@@ -489,8 +660,10 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                 # Apply waiver only if the test has failed
                 if isinstance(sub_test_result, dict):
                     if sub_test_result.get('FAILED', 0) > 0:
+                        old_result = dict(sub_test_result)
                         sub_test_result['FAILED'] -= 1
                         sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                        _count_waiver(subtest_fails, old_result, sub_test_result)
                         # Insert waiver_reason inside sub_test_result
                         sub_test_result['waiver_reason'] = reason
                         existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
@@ -502,6 +675,8 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                     if 'FAILED' in sub_test_result.upper() or 'FAILURE' in sub_test_result.upper():
                         if '(WITH WAIVER)' not in sub_test_result.upper():
                             subtest['sub_test_result'] += ' (WITH WAIVER)'
+                            _count_waiver(subtest_fails, sub_test_result,
+                                          subtest['sub_test_result'])
                             subtest['waiver_reason'] = reason
                             if verbose:
                                 print(f"Test_case-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with reason: {reason}")
@@ -517,8 +692,10 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                         sub_test_result = subtest.get('sub_test_result')
                         if isinstance(sub_test_result, dict):
                             if sub_test_result.get('FAILED', 0) > 0:
+                                old_result = dict(sub_test_result)
                                 sub_test_result['FAILED'] -= 1
                                 sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                                _count_waiver(fails, old_result, sub_test_result)
                                 sub_test_result['waiver_reason'] = reason
                                 existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
                                 updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
@@ -528,61 +705,42 @@ def apply_testcase_level_waivers(test_suite_entry, testcase_waivers):
                             if 'FAILED' in result_upper or 'FAILURE' in result_upper:
                                 if '(WITH WAIVER)' not in result_upper:
                                     subtest['sub_test_result'] += ' (WITH WAIVER)'
+                                    _count_waiver(fails, sub_test_result,
+                                                  subtest['sub_test_result'])
                                     subtest['waiver_reason'] = reason
 
-def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
+def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name, fails=None):
     """Apply subtest-level waivers, including nested BSA/SBSA subtests."""
+    if not isinstance(subtest_waivers, SubtestWaivers):
+        subtest_waivers = SubtestWaivers(subtest_waivers)
+    subtest_fails = _subtest_fails(test_suite_entry, fails)
+
     # For BSA/SBSA: apply waivers to subtests within testcases
     if suite_name.upper() in ['BSA', 'SBSA']:
         for testcase in test_suite_entry.get('testcases', []):
             testcase_name = testcase.get('Test_case', '')
-            testcase_id = testcase_name.split(':')[0].strip() if ':' in testcase_name else testcase_name
+            testcase_id = _testcase_rule_id(testcase_name)
 
             # Check every nested subtest, not only direct children of the
             # testcase, so deeper SBSA/BSA rule failures can be waived.
             for subtest in _iter_nested_subtests(testcase.get('subtests', [])):
-                sub_rule_id = _subtest_rule_id(subtest)
-                sub_test_number = subtest.get('sub_Test_Number', '')
-                sub_test_path = subtest.get('sub_Test_Path', '')
-                sub_test_desc = subtest.get('sub_Test_Description', '')
                 sub_test_result = subtest.get('sub_test_result', '')
+                if not isinstance(sub_test_result, str):
+                    continue
+                if 'FAILED' not in sub_test_result.upper() or '(WITH WAIVER)' in sub_test_result.upper():
+                    continue
 
-                # Check if this subtest has a waiver
-                for waiver in subtest_waivers:
-                    # Waiver must match the testcase
-                    waiver_testcase = waiver.get('Test_case', '')
-                    waiver_testcase_id = waiver_testcase.split(':')[0].strip() if ':' in waiver_testcase else waiver_testcase
-
-                    if waiver_testcase_id != testcase_id and waiver_testcase != testcase_id:
-                        continue
-
-                    # sub_Test_Path is safest for nested logs because the same
-                    # sub_Test_Number can appear in different parent branches.
-                    # Number, rule id, and description are kept as fallbacks for
-                    # old waiver files and hand-written waivers.
-                    waiver_id = waiver.get('sub_Rule_ID', '')
-                    waiver_number = waiver.get('sub_Test_Number', '')
-                    waiver_path = waiver.get('sub_Test_Path', '')
-                    waiver_desc = waiver.get('sub_Test_Description', '')
+                # sub_Test_Path is safest for nested logs because the same
+                # sub_Test_Number can appear in different parent branches.
+                # Number, rule id, and description are kept as fallbacks for
+                # old waiver files and hand-written waivers.
+                waiver = subtest_waivers.match_nested(testcase_id, subtest)
+                if waiver is not None:
                     reason = waiver.get('Reason', '')
-
-                    match = False
-                    if waiver_path and waiver_path == sub_test_path:
-                        match = True
-                    elif waiver_number and waiver_number == sub_test_number:
-                        match = True
-                    elif waiver_id and waiver_id == sub_rule_id:
-                        match = True
-                    elif waiver_desc and waiver_desc == sub_test_desc:
-                        match = True
-
-                    if match and isinstance(sub_test_result, str):
-                        if 'FAILED' in sub_test_result.upper() and '(WITH WAIVER)' not in sub_test_result.upper():
-                            subtest['sub_test_result'] = sub_test_result + ' (WITH WAIVER)'
-                            subtest['waiver_reason'] = reason
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{sub_rule_id}' ({sub_test_desc}) in testcase '{testcase_name}' with reason: {reason}")
-                            break  # Waiver applied
+                    subtest['sub_test_result'] = sub_test_result + ' (WITH WAIVER)'
+                    subtest['waiver_reason'] = reason
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{_subtest_rule_id(subtest)}' ({subtest.get('sub_Test_Description', '')}) in testcase '{testcase_name}' with reason: {reason}")
 
     # Apply waivers to individual subtests based on SubTestID or sub_Test_Description
     for subtest in test_suite_entry.get('subtests', []):
@@ -591,65 +749,59 @@ def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
         if isinstance(sub_test_result, dict):
             # For FWTSResults.json and STANDALONE JSONs where sub_test_result is a dict with result counts
             subtest_description = subtest.get('sub_Test_Description')
-            subtest_number = subtest.get('sub_Test_Number')
-
-            for waiver in subtest_waivers:
-                waiver_desc = waiver.get('sub_Test_Description')
-                # For FWTS and STANDALONE, use descriptions
-                if waiver_desc:
-                    cleaned_waiver_desc = clean_description(waiver_desc)
-                    cleaned_subtest_desc = clean_description(subtest_description)
-                    # Special handling for "Boot sources" TestSuite
-                    if suite_name.upper() == 'STANDALONE':
-                        # If TestSuite-level waiver is applied, all subtests should have waivers already
-                        # Otherwise, handle individual subtest waivers
-                        if cleaned_waiver_desc in cleaned_subtest_desc:
-                            # Apply waiver
-                            failed = sub_test_result.get('FAILED', 0)
-                            failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
-
-                            if failed > 0:
-                                sub_test_result['FAILED'] = failed - 1
-                                sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
-                            else:
-                                # Edge case: FAILED is already 0
-                                sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
+            cleaned_subtest_desc = _cleaned_description(subtest_description)
+
+            # Special handling for "Boot sources" TestSuite
+            if suite_name.upper() == 'STANDALONE':
+                # If TestSuite-level waiver is applied, all subtests should have waivers already
+                # Otherwise, handle individual subtest waivers
+                waiver = subtest_waivers.match_description_substring(cleaned_subtest_desc)
+                if waiver is not None:
+                    # Apply waiver
+                    old_result = dict(sub_test_result)
+                    failed = sub_test_result.get('FAILED', 0)
+                    failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
+
+                    if failed > 0:
+                        sub_test_result['FAILED'] = failed - 1
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
+                    else:
+                        # Edge case: FAILED is already 0
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
+                    _count_waiver(subtest_fails, old_result, sub_test_result)
 
-                            # Add waiver_reason inside sub_test_result
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                sub_test_result['waiver_reason'] = reason
-                                existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
-                                updated_fail_reasons = [(s + ' (WITH WAIVER)') for fr in existing_fail_reasons for s in (fr if isinstance(fr, list) else [fr])]
-                                sub_test_result['fail_reasons'] = updated_fail_reasons
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break  # Waiver applied, exit the loop
+                    # Add waiver_reason inside sub_test_result
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        sub_test_result['waiver_reason'] = reason
+                        existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
+                        updated_fail_reasons = [(s + ' (WITH WAIVER)') for fr in existing_fail_reasons for s in (fr if isinstance(fr, list) else [fr])]
+                        sub_test_result['fail_reasons'] = updated_fail_reasons
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
+            else:
+                # For FWTS, BBSR-FWTS, and other suites
+                waiver = subtest_waivers.match_description(cleaned_subtest_desc)
+                if waiver is not None:
+                    # Apply waiver
+                    old_result = dict(sub_test_result)
+                    failed = sub_test_result.get('FAILED', 0)
+                    failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
+                    if failed > 0:
+                        sub_test_result['FAILED'] = failed - 1
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
                     else:
-                        # For FWTS, BBSR-FWTS, and other suites
-                        if cleaned_waiver_desc == cleaned_subtest_desc:
-                            # Apply waiver
-                            if isinstance(sub_test_result, dict):
-                                failed = sub_test_result.get('FAILED', 0)
-                                failed_with_waiver = sub_test_result.get('FAILED_WITH_WAIVER', 0)
-                                if failed > 0:
-                                    sub_test_result['FAILED'] = failed - 1
-                                    sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
-                                else:
-                                    sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
-                            else:
-                                if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                    subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            # Add waiver_reason inside sub_test_result
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                sub_test_result['waiver_reason'] = reason
-                                existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
-                                updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
-                                sub_test_result['fail_reasons'] = updated_fail_reasons
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break  # Waiver applied, exit the loop
+                        sub_test_result['FAILED_WITH_WAIVER'] = failed_with_waiver + 1
+                    _count_waiver(subtest_fails, old_result, sub_test_result)
+                    # Add waiver_reason inside sub_test_result
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        sub_test_result['waiver_reason'] = reason
+                        existing_fail_reasons = _as_list(sub_test_result.get('fail_reasons'))
+                        updated_fail_reasons = [fr + ' (WITH WAIVER)' for fr in existing_fail_reasons]
+                        sub_test_result['fail_reasons'] = updated_fail_reasons
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
 
         elif isinstance(sub_test_result, str):
             # Only apply waivers to FAILED/FAILURE tests
@@ -657,75 +809,53 @@ def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
                 continue
 
             subtest_description = subtest.get('sub_Test_Description')
-            subtest_number = subtest.get('sub_Test_Number')
-
-            # Get the subtest_id based on the suite
-            if suite_name.upper() in ['SCT', 'BBSR-SCT']:
-                subtest_id = subtest.get('sub_Test_GUID')
+            cleaned_subtest_desc = _cleaned_description(subtest_description)
+
+            if suite_name.upper() in ['FWTS', 'STANDALONE', 'BBSR-FWTS', 'PFDI']:
+                # For FWTS, STANDALONE, and BBSR-FWTS, use descriptions
+                waiver = subtest_waivers.match_description_substring(cleaned_subtest_desc)
+                if waiver is not None:
+                    # Apply waiver
+                    if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                        _count_waiver(subtest_fails, sub_test_result, subtest['sub_test_result'])
+                    # Add waiver_reason inside sub_test_result
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        subtest['sub_test_result'] += f', waiver_reason: "{reason}"'  # Adding inside sub_test_result
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
+            elif suite_name.upper() == 'SBMR':
+                # For SBMR, allow description-based matching as well
+                waiver = subtest_waivers.match_description_substring(cleaned_subtest_desc)
+                if waiver is not None:
+                    if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                        _count_waiver(subtest_fails, sub_test_result, subtest['sub_test_result'])
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        subtest['waiver_reason'] = reason
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
             else:
-                subtest_id = subtest_number
-
-            for waiver in subtest_waivers:
-                waiver_desc = waiver.get('sub_Test_Description')
-                waiver_id = waiver.get('SubTestID')
-                if suite_name.upper() in ['FWTS', 'STANDALONE', 'BBSR-FWTS','PFDI']:
-                    # For FWTS, STANDALONE, and BBSR-FWTS, use descriptions
-                    if waiver_desc:
-                        cleaned_waiver_desc = clean_description(waiver_desc)
-                        cleaned_subtest_desc = clean_description(subtest_description)
-                        if cleaned_waiver_desc in cleaned_subtest_desc:
-                            # Apply waiver
-                            if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            # Add waiver_reason inside sub_test_result
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['sub_test_result'] += f', waiver_reason: "{reason}"'  # Adding inside sub_test_result
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break
-                elif suite_name.upper() == 'SBMR':
-                    # For SBMR, allow description-based matching as well
-                    if waiver_desc:
-                        cleaned_waiver_desc = clean_description(waiver_desc)
-                        cleaned_subtest_desc = clean_description(subtest_description)
-                        if cleaned_waiver_desc in cleaned_subtest_desc:
-                            if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['waiver_reason'] = reason
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break
+                # For other suites, check SubTestID and description
+                if suite_name.upper() in ['SCT', 'BBSR-SCT']:
+                    subtest_id = subtest.get('sub_Test_GUID')
                 else:
-                    # For other suites, check SubTestID and description
-                    if waiver_id and waiver_id == subtest_id:
-                        # Apply waiver
-                        if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                            subtest['sub_test_result'] += ' (WITH WAIVER)'
-                        # Add waiver_reason as a separate key
-                        reason = waiver.get('Reason', '')
-                        if reason:
-                            subtest['waiver_reason'] = reason
-                        if verbose:
-                            print(f"Subtest-level waiver applied to subtest '{subtest.get('sub_Test_Description')}' with SubTestID '{subtest_id}' and reason: {reason}")
-                        break
-                    elif waiver_desc:
-                        cleaned_waiver_desc = clean_description(waiver_desc)
-                        cleaned_subtest_desc = clean_description(subtest_description)
-                        if cleaned_waiver_desc == cleaned_subtest_desc:
-                            # Apply waiver
-                            if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            # Add waiver_reason as a separate key
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['waiver_reason'] = reason
-                            if verbose:
-                                print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
-                            break
-            # Handle other cases if needed
+                    subtest_id = subtest.get('sub_Test_Number')
+
+                waiver = subtest_waivers.match_id_or_description(subtest_id, cleaned_subtest_desc)
+                if waiver is not None:
+                    # Apply waiver
+                    if 'FAILED (WITH WAIVER)' not in sub_test_result.upper() and 'FAILURE (WITH WAIVER)' not in sub_test_result.upper():
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                        _count_waiver(subtest_fails, sub_test_result, subtest['sub_test_result'])
+                    # Add waiver_reason as a separate key
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        subtest['waiver_reason'] = reason
+                    if verbose:
+                        print(f"Subtest-level waiver applied to subtest '{subtest_description}' with reason: {reason}")
 
     # SBMR: also walk nested Test_cases -> subtests for subtest-level waivers
     if suite_name.upper() == 'SBMR' and test_suite_entry.get('Test_cases') and subtest_waivers:
@@ -735,80 +865,45 @@ def apply_subtest_level_waivers(test_suite_entry, subtest_waivers, suite_name):
                 # Apply only to failures
                 if isinstance(sub_test_result, str) and ('FAILED' not in sub_test_result.upper() and 'FAILURE' not in sub_test_result.upper()):
                     continue
-                subtest_description = subtest.get('sub_Test_Description')
-                subtest_number = subtest.get('sub_Test_Number')
-                for waiver in subtest_waivers:
-                    waiver_desc = waiver.get('sub_Test_Description')
-                    waiver_id = waiver.get('SubTestID')
-                    if waiver_desc:
-                        if clean_description(waiver_desc) in clean_description(subtest_description or ''):
-                            if isinstance(sub_test_result, dict):
-                                failed = sub_test_result.get('FAILED', 0)
-                                if failed > 0:
-                                    sub_test_result['FAILED'] = failed - 1
-                                    sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
-                                sub_test_result['waiver_reason'] = waiver.get('Reason', '')
-                            elif isinstance(sub_test_result, str):
-                                if ' (WITH WAIVER)' not in sub_test_result.upper():
-                                    subtest['sub_test_result'] += ' (WITH WAIVER)'
-                                reason = waiver.get('Reason', '')
-                                if reason:
-                                    subtest['waiver_reason'] = reason
-                            break
-                    elif waiver_id and waiver_id == subtest_number:
-                        if isinstance(sub_test_result, dict):
-                            failed = sub_test_result.get('FAILED', 0)
-                            if failed > 0:
-                                sub_test_result['FAILED'] = failed - 1
-                                sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
-                            sub_test_result['waiver_reason'] = waiver.get('Reason', '')
-                        elif isinstance(sub_test_result, str):
-                            if ' (WITH WAIVER)' not in sub_test_result.upper():
-                                subtest['sub_test_result'] += ' (WITH WAIVER)'
-                            reason = waiver.get('Reason', '')
-                            if reason:
-                                subtest['waiver_reason'] = reason
-                        break
-
-def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_file=None):
-    """Apply all matching waivers to one parsed JSON file."""
-    # Load the JSON data
-    try:
-        with open(json_file, 'r', encoding='utf-8') as json_handle:
-            json_data = json.load(json_handle)
-    except Exception as err:
-        if verbose:
-            print(f"WARNING: Failed to read or parse {json_file}: {err}")
-        return
-
-    # Load waiver.json
-    try:
-        with open(waiver_file, 'r', encoding='utf-8') as waiver_handle:
-            waiver_data = json.load(waiver_handle)
-    except Exception as err:
-        if verbose:
-            print(f"INFO: Failed to read or parse {waiver_file}: {err}")
-        return
+                waiver = subtest_waivers.match_sbmr(
+                    clean_description(subtest.get('sub_Test_Description') or ''),
+                    subtest.get('sub_Test_Number')
+                )
+                if waiver is None:
+                    continue
+                if isinstance(sub_test_result, dict):
+                    failed = sub_test_result.get('FAILED', 0)
+                    if failed > 0:
+                        old_result = dict(sub_test_result)
+                        sub_test_result['FAILED'] = failed - 1
+                        sub_test_result['FAILED_WITH_WAIVER'] = sub_test_result.get('FAILED_WITH_WAIVER', 0) + 1
+                        _count_waiver(fails, old_result, sub_test_result)
+                    sub_test_result['waiver_reason'] = waiver.get('Reason', '')
+                elif isinstance(sub_test_result, str):
+                    if ' (WITH WAIVER)' not in sub_test_result.upper():
+                        subtest['sub_test_result'] += ' (WITH WAIVER)'
+                        _count_waiver(fails, sub_test_result, subtest['sub_test_result'])
+                    reason = waiver.get('Reason', '')
+                    if reason:
+                        subtest['waiver_reason'] = reason
 
-    # Load test_category.json if provided
-    if output_json_file:
-        try:
-            with open(output_json_file, 'r', encoding='utf-8') as output_handle:
-                output_json_data = json.load(output_handle)
-        except Exception as err:
-            if verbose:
-                print(f"WARNING: Failed to read or parse {output_json_file}: {err}")
-            output_json_data = None
-    else:
-        output_json_data = None
+def apply_waivers_to_data(suite_name, json_data, waiver_data, output_json_data=None, source="<data>",
+                          waivers=None):
+    """
+    Apply all matching waivers to already-loaded suite data in place; return True if applied.
 
-    # Get waivers for the suite, categorized by their scope
-    suite_level_waivers, testsuite_level_waivers, subsuite_level_waivers, testcase_level_waivers, subtest_level_waivers = load_waivers(waiver_data, suite_name)
+    waivers is the load_waivers() result for suite_name; pass it in to reuse
+    the indexes when several JSON files of one suite are waived.
+    """
+    if waivers is None:
+        waivers = load_waivers(waiver_data, suite_name)
+    # Waivers for the suite, categorized by their scope
+    suite_level_waivers, testsuite_level_waivers, subsuite_level_waivers, testcase_level_waivers, subtest_level_waivers = waivers
 
     if not (suite_level_waivers or testsuite_level_waivers or (suite_name.upper() in ['SCT', 'STANDALONE', 'BBSR-SCT', 'BBSR-FWTS', "SBMR", 'BSA', 'SBSA', 'SCMI'] and (subsuite_level_waivers or testcase_level_waivers)) or subtest_level_waivers):
         if verbose:
             print(f"No valid waivers found for suite '{suite_name}'. No changes applied.")
-        return
+        return False
 
     # Handle different json_data structures
     if 'test_results' in json_data:
@@ -821,8 +916,13 @@ def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_
         test_suite_entries = [json_data]
     else:
         if verbose:
-            print(f"ERROR: Unexpected JSON data structure in {json_file}")
-        return
+            print(f"ERROR: Unexpected JSON data structure in {source}")
+        return False
+
+    # The summaries are rebuilt below, so read the recorded counts first;
+    # fails tracks how each waiver moves them
+    recorded = recorded_fail_counts(json_data)
+    fails = FailCounter()
 
     # Process each test suite in the JSON data
     for test_suite_entry in test_suite_entries:
@@ -853,45 +953,45 @@ def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_
 
         # Apply suite-level waivers if any
         if suite_level_waivers:
-            apply_suite_level_waivers(test_suite_entry, suite_level_waivers)
+            apply_suite_level_waivers(test_suite_entry, suite_level_waivers, fails)
 
         # Apply TestSuite-level waivers if any
         if testsuite_level_waivers:
-            apply_testsuite_level_waivers(test_suite_entry, testsuite_level_waivers)
+            apply_testsuite_level_waivers(test_suite_entry, testsuite_level_waivers, fails)
 
         # Apply Test_case level waivers for BSA/SBSA and other suites
         if testcase_level_waivers:
             if suite_name.upper() in ['BSA', 'SBSA', 'SCT', 'STANDALONE', 'BBSR-SCT', 'BBSR-FWTS', 'BBSR-TPM', 'SCMI']:
-                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers)
+                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers, fails)
 
         # Include 'BBSR-SCT' and 'BBSR-FWTS' suites
         # Only apply SubSuite and Test_case level waivers if the suite is 'SCT', 'STANDALONE', 'BBSR-SCT', or 'BBSR-FWTS'
         if suite_name.upper() in ['SCT', 'STANDALONE', 'BBSR-SCT', 'BBSR-FWTS', 'BBSR-TPM']:
             # Apply SubSuite-level waivers if any
             if subsuite_level_waivers:
-                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers)
+                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers, fails)
 
             # Apply Test_case-level waivers if any
             if testcase_level_waivers:
-                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers)
+                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers, fails)
 
         # SBMR: apply SubSuite/Test_case level waivers without modifying the original condition
         if suite_name.upper() == 'SBMR':
             if subsuite_level_waivers:
-                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers)
+                apply_subsuite_level_waivers(test_suite_entry, subsuite_level_waivers, fails)
             if testcase_level_waivers:
-                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers)
+                apply_testcase_level_waivers(test_suite_entry, testcase_level_waivers, fails)
 
         # Apply subtest-level waivers
         if subtest_level_waivers:
-            apply_subtest_level_waivers(test_suite_entry, subtest_level_waivers, suite_name)
+            apply_subtest_level_waivers(test_suite_entry, subtest_level_waivers, suite_name, fails)
 
         # Subtest waivers are applied at the leaf/branch where they match. This
         # pass then updates failed parents only when no failed child remains
         # unwaived, keeping mixed waived/unwaived failures visible.
         if suite_name.upper() in ('BSA', 'SBSA'):
             for testcase in test_suite_entry.get('testcases', []):
-                _propagate_nested_bsa_waivers(testcase)
+                _propagate_nested_bsa_waivers(testcase, fails)
 
         # Update test suite summary
         # Determine the summary field based on suite name
@@ -1242,15 +1342,73 @@ def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_
             global_notimpl += suite_summary.get("Not Implemented", 0)
             global_warnings += suite_summary.get("Warnings", 0)
 
-    # Write the updated JSON data back to the file
-    try:
-        with open(json_file, 'w', encoding='utf-8') as json_handle:
-            json.dump(json_data, json_handle, indent=4)
-        print(f"Waivers successfully applied and '{json_file}' has been updated.")
-    except Exception as err:
-        if verbose:
-            print(f"ERROR: Failed to write updated data to {json_file}: {err}")
-        return
+    # Waived failures move from the failed to the failed_with_waiver count.
+    # Without recorded counts (legacy JSON) merge still walks the results.
+    if recorded is not None:
+        store_fail_counts(json_data, recorded[0] + fails.failed,
+                          recorded[1] + fails.failed_with_waiver)
+    return True
+
+def apply_waivers(suite_name, json_file, waiver_file='waiver.json', output_json_file=None):
+    """Apply all matching waivers to one parsed JSON file."""
+    apply_waivers_to_files([(suite_name, json_file)], waiver_file, output_json_file)
+
+def apply_waivers_to_files(suite_jsons, waiver_file='waiver.json', output_json_file=None):
+    """
+    Apply one waiver file to several parsed JSON files.
+
+    suite_jsons is a list of (suite_name, json_file) pairs. The waiver and
+    test category files are read once, and the waivers of each suite are
+    loaded and indexed once however many of its JSON files are listed.
+    """
+    waiver_data = None
+    output_json_data = None
+    suite_waivers = {}
+
+    for suite_name, json_file in suite_jsons:
+        # Load the JSON data
+        try:
+            with open(json_file, 'r', encoding='utf-8') as json_handle:
+                json_data = json.load(json_handle)
+        except Exception as err:
+            if verbose:
+                print(f"WARNING: Failed to read or parse {json_file}: {err}")
+            continue
+
+        if waiver_data is None:
+            # Load waiver.json
+            try:
+                with open(waiver_file, 'r', encoding='utf-8') as waiver_handle:
+                    waiver_data = json.load(waiver_handle)
+            except Exception as err:
+                if verbose:
+                    print(f"INFO: Failed to read or parse {waiver_file}: {err}")
+                return
+
+            # Load test_category.json if provided
+            if output_json_file:
+                try:
+                    with open(output_json_file, 'r', encoding='utf-8') as output_handle:
+                        output_json_data = json.load(output_handle)
+                except Exception as err:
+                    if verbose:
+                        print(f"WARNING: Failed to read or parse {output_json_file}: {err}")
+                    output_json_data = None
+
+        if suite_name not in suite_waivers:
+            suite_waivers[suite_name] = load_waivers(waiver_data, suite_name)
+        if not apply_waivers_to_data(suite_name, json_data, waiver_data, output_json_data, json_file,
+                                     suite_waivers[suite_name]):
+            continue
+
+        # Write the updated JSON data back to the file
+        try:
+            with open(json_file, 'w', encoding='utf-8') as json_handle:
+                json.dump(json_data, json_handle, indent=4)
+            print(f"Waivers successfully applied and '{json_file}' has been updated.")
+        except Exception as err:
+            if verbose:
+                print(f"ERROR: Failed to write updated data to {json_file}: {err}")
 
 def main():
     """Parse command line arguments and apply waivers."""
@@ -1259,6 +1417,9 @@ def main():
     parser.add_argument('json_file', help='Path to the JSON file')
     parser.add_argument('waiver_file', nargs='?', default='waiver.json', help='Path to the waiver file (default: waiver.json)')
     parser.add_argument('output_json_file', nargs='?', default=None, help='Path to the test category file (default: None)')
+    parser.add_argument('--suite-json', nargs=2, action='append', default=[],
+                        metavar=('SUITE_NAME', 'JSON_FILE'),
+                        help='Also apply the waivers to another suite JSON (can be repeated)')
     parser.add_argument('--quiet', action='store_true', help='Suppress detailed output')
     args = parser.parse_args()
 
@@ -1266,8 +1427,9 @@ def main():
     global verbose
     verbose = not args.quiet
 
-    # Now call the apply_waivers function
-    apply_waivers(args.suite_name, args.json_file, args.waiver_file, args.output_json_file)
+    # Now apply the waiver file to every listed JSON in one pass
+    suite_jsons = [(args.suite_name, args.json_file)] + [tuple(pair) for pair in args.suite_json]
+    apply_waivers_to_files(suite_jsons, args.waiver_file, args.output_json_file)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run the ACS log parser pipeline over many result sets on a process pool.
+
+Result sets are the entries of a directory (results directories, directories
+holding an acs_results/ directory, or .tar.gz/.zip archives of them) or are
+listed in a JSON manifest; acs_config.txt, system_config.txt and waiver.json
+next to an acs_results/ directory are used for that set. Each set goes
+through run_log_parser.run_pipeline: parsing, waivers, merge, summary and,
+if requested, the PDF. The console
+output of a set goes to acs_summary/log_parser.log under its output
+directory. A status table is printed at the end and an index of the outputs
+written as JSON.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+import run_log_parser
+from results_archive import archive_stem, is_archive
+
+INDEX_NAME = "batch_index.json"
+SET_LOG_NAME = "log_parser.log"
+
+# Top-level directories that mark a directory as an ACS results directory
+RESULT_DIRS = frozenset(pattern.split("/")[0] for pattern in run_log_parser.ARCHIVE_PATTERNS
+                        if not pattern.startswith(".."))
+
+# Files picked up from a result set directory that holds an acs_results/ directory
+SET_FILES = {"acs_config": "acs_config.txt", "system_config": "system_config.txt",
+             "waiver": "waiver.json"}
+
+# Manifest keys of a result set besides "results"
+MANIFEST_KEYS = ("name", "acs_config", "system_config", "waiver", "output_dir")
+
+
+def _set_name(path):
+    path = archive_stem(path) if os.path.isfile(path) else os.path.normpath(path)
+    if os.path.basename(path) == "acs_results":
+        path = os.path.dirname(path)
+    return os.path.basename(path)
+
+
+def discover_result_sets(batch_dir):
+    """Return the result sets found directly in batch_dir, sorted by name."""
+    result_sets = []
+    for entry in sorted(os.listdir(batch_dir)):
+        path = os.path.join(batch_dir, entry)
+        if os.path.isfile(path):
+            if is_archive(path):
+                result_sets.append({"name": _set_name(path), "results": path})
+        elif os.path.isdir(os.path.join(path, "acs_results")):
+            result_set = {"name": entry, "results": os.path.join(path, "acs_results")}
+            # Config files saved next to acs_results/ belong to that set
+            for key, file_name in SET_FILES.items():
+                if os.path.isfile(os.path.join(path, file_name)):
+                    result_set[key] = os.path.join(path, file_name)
+            result_sets.append(result_set)
+        elif os.path.isdir(path) and RESULT_DIRS.intersection(os.listdir(path)):
+            result_sets.append({"name": entry, "results": path})
+    return result_sets
+
+
+def load_manifest(manifest_path):
+    """
+    Return the result sets listed in a JSON manifest.
+
+    The manifest is a list whose entries are either the path of a result set
+    or an object with "results" and optionally "name", "acs_config",
+    "system_config", "waiver" and "output_dir". Relative paths are taken from
+    the manifest's directory.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{manifest_path}: expected a list of result sets")
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    result_sets = []
+    for index, entry in enumerate(entries, start=1):
+        if isinstance(entry, str):
+            entry = {"results": entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get("results"), str):
+            raise ValueError(f"{manifest_path}: entry {index} has no \"results\" path")
+        result_set = {"results": os.path.join(base_dir, entry["results"])}
+        for key in MANIFEST_KEYS:
+            value = entry.get(key)
+            if value:
+                result_set[key] = value if key == "name" else os.path.join(base_dir, value)
+        result_set.setdefault("name", _set_name(result_set["results"]))
+        result_sets.append(result_set)
+    return result_sets
+
+
+def build_jobs(result_sets, args):
+    """Fill in the defaults of every result set; names are made unique."""
+    jobs = []
+    seen = collections.Counter()
+    for result_set in result_sets:
+        name = result_set["name"]
+        seen[name] += 1
+        if seen[name] > 1:
+            name = f"{name}-{seen[name]}"
+        results = result_set["results"]
+        output_dir = result_set.get("output_dir")
+        if not output_dir:
+            if args.output_root:
+                output_dir = os.path.join(args.output_root, name)
+            elif os.path.isfile(results):
+                output_dir = archive_stem(results)
+            else:
+                output_dir = results
+        jobs.append({
+            "name": name,
+            "results": results,
+            "acs_config": result_set.get("acs_config", args.acs_config),
+            "system_config": result_set.get("system_config", args.system_config),
+            "waiver": result_set.get("waiver", args.waiver),
+            "output_dir": output_dir,
+            "use_cache": not args.no_cache,
+            "compact_json": args.compact_json,
+            "verify_counts": args.verify_counts,
+            "pdf": True if args.pdf else None,
+        })
+    return jobs
+
+
+def _compliance(merged_json):
+    try:
+        with open(merged_json, "r", encoding="utf-8") as f:
+            merged = json.load(f)
+        return merged["Suite_Name: acs_info"]["ACS Results Summary"]["Overall Compliance Result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return ""
+
+
+def run_result_set(job):
+    """Pool entry point: run the pipeline for one result set and describe the outcome."""
+    start = time.monotonic()
+    summary_dir = os.path.join(job["output_dir"], "acs_summary")
+    entry = {
+        "name": job["name"],
+        "results": job["results"],
+        "output_dir": job["output_dir"],
+        "status": "failed",
+        "error": "",
+        "log": os.path.join(summary_dir, SET_LOG_NAME),
+    }
+    if not os.path.exists(job["results"]):
+        entry.update(status="missing", error=f"{job['results']} not found", log="")
+        entry["duration_sec"] = 0.0
+        return entry
+
+    # Steps export variables for later stages; keep them from leaking into the next set
+    saved_env = dict(os.environ)
+    try:
+        os.makedirs(summary_dir, exist_ok=True)
+        with open(entry["log"], "w", encoding="utf-8") as log, \
+                contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            try:
+                results = run_log_parser.run_pipeline(
+                    job["results"], job["acs_config"], job["system_config"], job["waiver"],
+                    jobs=1, use_cache=job["use_cache"], compact_json=job["compact_json"],
+                    output_path=job["output_dir"], pdf=job["pdf"],
+                    verify_counts=job["verify_counts"])
+            except Exception:
+                traceback.print_exc()
+                raise
+        if results is None:
+            entry["error"] = f"results could not be read; see {entry['log']}"
+        else:
+            entry["status"] = "done"
+            entry["processed_suites"] = sorted(key for key, result in results.items()
+                                               if result["processed"])
+    except Exception as exc:
+        entry["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+    merged_json = os.path.join(summary_dir, "acs_jsons", "merged_results.json")
+    summary_html = os.path.join(summary_dir, "html_detailed_summaries", "acs_summary.html")
+    summary_pdf = os.path.join(summary_dir, "acs_summary.pdf")
+    entry["compliance"] = _compliance(merged_json)
+    entry["merged_json"] = merged_json if os.path.isfile(merged_json) else ""
+    entry["summary_html"] = summary_html if os.path.isfile(summary_html) else ""
+    entry["summary_pdf"] = summary_pdf if os.path.isfile(summary_pdf) else ""
+    entry["duration_sec"] = round(time.monotonic() - start, 2)
+    return entry
+
+
+def _crashed(job, error):
+    return {
+        "name": job["name"], "results": job["results"], "output_dir": job["output_dir"],
+        "status": "crashed", "error": error, "log": "", "duration_sec": 0.0,
+    }
+
+
+def run_batch(jobs, workers, on_done=None):
+    """
+    Run every job on a fork-based process pool; return their entries in job order.
+
+    A worker that dies breaks the whole pool, so every set still running at
+    that point is retried afterwards, each alone in a fresh one-worker pool.
+    A set that kills that worker too is reported as crashed.
+    """
+    mp_context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+        # Import and compile everything once; the workers inherit it
+        run_log_parser.preload_scripts(run_log_parser.STEP_SCRIPTS + run_log_parser.STAGE_SCRIPTS)
+        run_log_parser.parser_version()
+
+    entries = {}
+    suspects = []
+
+    def finish(index, entry):
+        entries[index] = entry
+        if on_done is not None:
+            on_done(len(entries), len(jobs), entry)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        running = {pool.submit(run_result_set, job): index for index, job in enumerate(jobs)}
+        for future in concurrent.futures.as_completed(running):
+            index = running[future]
+            try:
+                finish(index, future.result())
+            except concurrent.futures.process.BrokenProcessPool:
+                suspects.append(index)
+            except Exception as exc:
+                finish(index, _crashed(jobs[index], f"{type(exc).__name__}: {exc}"))
+
+    for index in suspects:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as pool:
+            try:
+                finish(index, pool.submit(run_result_set, jobs[index]).result())
+            except concurrent.futures.process.BrokenProcessPool:
+                finish(index, _crashed(jobs[index], "worker process died"))
+    return [entries[index] for index in range(len(jobs))]
+
+
+def format_status_table(entries):
+    """Return the per-result-set status table printed at the end of a batch."""
+    header = ("Result set", "Status", "Time (s)", "Compliance", "Summary / error")
+    rows = []
+    for entry in entries:
+        compliance = entry.get("compliance", "").split(":", 1)[0].strip()
+        detail = entry.get("summary_html") or entry.get("error", "")
+        rows.append((entry["name"], entry["status"], f"{entry['duration_sec']:.1f}",
+                     compliance, detail))
+    widths = [max(len(row[col]) for row in rows + [header]) for col in range(len(header) - 1)]
+    lines = []
+    for row in [header] + rows:
+        cells = [cell.ljust(width) for cell, width in zip(row, widths)]
+        lines.append("  ".join(cells + [row[-1]]).rstrip())
+    lines.insert(1, "-" * len(lines[0]))
+    return "\n".join(lines)
+
+
+def write_index(index_path, entries, source):
+    index = {
+        "source": source,
+        "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total": len(entries),
+        "done": sum(1 for entry in entries if entry["status"] == "done"),
+        "result_sets": entries,
+    }
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=4)
+    os.replace(index_path + ".tmp", index_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Parse many ACS result sets in parallel (batch form of run_log_parser.py)."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("batch_dir", nargs="?",
+                        help="Directory whose entries are result sets (directories or archives)")
+    source.add_argument("--manifest",
+                        help="JSON list of result sets to parse instead of a directory")
+    parser.add_argument("--acs-config", default="",
+                        help="acs_config.txt for sets that do not name one")
+    parser.add_argument("--system-config", default="",
+                        help="system_config.txt for sets that do not name one")
+    parser.add_argument("--waiver", default="", help="waiver.json for sets that do not name one")
+    parser.add_argument("-o", "--output-root", default="",
+                        help="Write each set's acs_summary/ under OUTPUT_ROOT/<name> "
+                             "(default: next to its results, as run_log_parser.py does)")
+    parser.add_argument("--index", default="",
+                        help=f"Where to write the JSON index (default: {INDEX_NAME} in the batch "
+                             "directory, or next to the manifest)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of result sets parsed in parallel (default: number of CPUs)")
+    parser.add_argument("--pdf", action="store_true",
+                        help="Also convert every ACS summary to PDF (default: DT mode only)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse every set from scratch")
+    parser.add_argument("--compact-json", action="store_true",
+                        help="Write merged_results.json without indentation")
+    parser.add_argument("--verify-counts", action="store_true",
+                        help="Recount each suite's failures in the merge "
+                             "instead of trusting suite_summary")
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    try:
+        if args.manifest:
+            result_sets = load_manifest(args.manifest)
+            source_path = os.path.abspath(args.manifest)
+            index_dir = os.path.dirname(source_path)
+        else:
+            if not os.path.isdir(args.batch_dir):
+                parser.error(f"{args.batch_dir} is not a directory")
+            result_sets = discover_result_sets(args.batch_dir)
+            source_path = index_dir = os.path.abspath(args.batch_dir)
+    except (OSError, ValueError) as exc:
+        print(f"{run_log_parser.RED}ERROR: {exc}{run_log_parser.NC}")
+        return 1
+    if not result_sets:
+        print(f"{run_log_parser.YELLOW}WARNING: No result sets found in {source_path}."
+              f"{run_log_parser.NC}")
+        return 1
+
+    jobs = build_jobs(result_sets, args)
+    print(f"Parsing {len(jobs)} result sets with {min(args.jobs, len(jobs))} workers.")
+
+    def progress(done, total, entry):
+        print(f"[{done}/{total}] {entry['name']}: {entry['status']} ({entry['duration_sec']:.1f}s)")
+        sys.stdout.flush()
+
+    entries = run_batch(jobs, min(args.jobs, len(jobs)), on_done=progress)
+    print("")
+    print(format_status_table(entries))
+
+    index_path = args.index or os.path.join(index_dir, INDEX_NAME)
+    write_index(index_path, entries, source_path)
+    print("")
+    print(f"Batch index: {index_path}")
+    return 0 if all(entry["status"] == "done" for entry in entries) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,10 +14,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
 import re
 import json
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import store_fail_counts
+from log_encoding import open_text
+# pylint: enable=wrong-import-position
+
+# Per-line patterns, compiled once
+RUNNING_TEST_NAME = re.compile(r'\b(\w+)\b')
+SEPARATOR_LINE = re.compile(r'^[=\-]+$')
+SUBTEST_LINE = re.compile(r"Test (\d+) of (\d+): (.+)")
+NEW_ENTRY_LINE = re.compile(r"^(Test \d+ of \d+:|\w+:|PASSED\b|FAILED\b|SKIPPED\b|WARNING\b|ABORTED\b)")
+ACPI_TABLE_SKIP = re.compile(r"ACPI\s+(\S+)\s+table does not exist, skipping test")
+
+def is_new_entry_line(text):
+    return bool(NEW_ENTRY_LINE.match(text))
+
 def is_pci_test(test_suite_name):
     """
     Check if a test is PCI-related.
@@ -30,11 +51,13 @@ def is_pci_test(test_suite_name):
     return "pci" in test_lower
 
 def parse_fwts_log(log_path):
-    with open(log_path, 'r') as f:
+    with open_text(log_path) as f:
         log_data = f.readlines()
 
     results = []
-    main_tests = []
+    # Names from the "Running tests:" list; a main test starts on a line
+    # "<name>: <description>", so the text before the first colon is looked up
+    main_tests = set()
     current_test = None
     current_subtest = None
     Test_suite_description = None
@@ -48,54 +71,51 @@ def parse_fwts_log(log_path):
         "total_warnings": 0
     }
 
-    def is_new_entry_line(text):
-        return bool(re.match(r"^(Test \d+ of \d+:|\w+:|PASSED\b|FAILED\b|SKIPPED\b|WARNING\b|ABORTED\b)", text))
-
     # First, identify all main tests from the "Running tests:" lines
     running_tests_started = False
     for line in log_data:
         if "Running tests:" in line:
             running_tests_started = True
-            main_tests += re.findall(r'\b(\w+)\b', line.split(':', 1)[1].strip())
-        elif running_tests_started and not re.match(r'^[=\-]+$', line.strip()):  # Continuation of Running tests line
-            main_tests += re.findall(r'\b(\w+)\b', line.strip())
-        elif running_tests_started and re.match(r'^[=\-]+$', line.strip()):  # Stop if separator line appears
-            break
+            main_tests.update(RUNNING_TEST_NAME.findall(line.split(':', 1)[1].strip()))
+        elif running_tests_started:
+            stripped = line.strip()
+            if SEPARATOR_LINE.match(stripped):  # Stop if separator line appears
+                break
+            main_tests.update(RUNNING_TEST_NAME.findall(stripped))  # Continuation of Running tests line
 
     # Process the log data
     for i, line in enumerate(log_data):
         # Detect the start of a new main test
-        for main_test in main_tests:
-            if line.startswith(main_test + ":"):
-                if current_test:  # Save the previous test
-                    if current_subtest:
-                        current_test["subtests"].append(current_subtest)
-                        current_subtest = None
-                    # Update the test_suite_summary based on subtests
-                    for sub in current_test["subtests"]:
-                        for key in ["PASSED", "FAILED", "ABORTED", "SKIPPED", "WARNINGS"]:
-                            current_test["test_suite_summary"][f"total_{key.lower()}"] += sub["sub_test_result"][key]
-                    results.append(current_test)
+        main_test, colon, _ = line.partition(":")
+        if colon and main_test in main_tests:
+            if current_test:  # Save the previous test
+                if current_subtest:
+                    current_test["subtests"].append(current_subtest)
+                    current_subtest = None
+                # Update the test_suite_summary based on subtests
+                for sub in current_test["subtests"]:
+                    for key in ["PASSED", "FAILED", "ABORTED", "SKIPPED", "WARNINGS"]:
+                        current_test["test_suite_summary"][f"total_{key.lower()}"] += sub["sub_test_result"][key]
+                results.append(current_test)
 
-                # Start a new main test
-                Test_suite_description = line.split(':', 1)[1].strip() if ':' in line else "No description"
-                current_test = {
-                    "Test_suite": main_test,
-                    "Test_suite_description": Test_suite_description,
-                    "subtests": [],
-                    "test_suite_summary": {
-                        "total_passed": 0,
-                        "total_failed": 0,
-                        "total_aborted": 0,
-                        "total_skipped": 0,
-                        "total_warnings": 0
-                    }
+            # Start a new main test
+            Test_suite_description = line.split(':', 1)[1].strip() if ':' in line else "No description"
+            current_test = {
+                "Test_suite": main_test,
+                "Test_suite_description": Test_suite_description,
+                "subtests": [],
+                "test_suite_summary": {
+                    "total_passed": 0,
+                    "total_failed": 0,
+                    "total_aborted": 0,
+                    "total_skipped": 0,
+                    "total_warnings": 0
                 }
-                current_subtest = None  # Reset current_subtest
-                break
+            }
+            current_subtest = None  # Reset current_subtest
 
         # Detect subtest start, subtest number, and subtest description
-        subtest_match = re.match(r"Test (\d+) of (\d+): (.+)", line)
+        subtest_match = SUBTEST_LINE.match(line)
         if subtest_match:
             if current_subtest:  # Save the previous subtest
                 current_test["subtests"].append(current_subtest)
@@ -209,7 +229,7 @@ def parse_fwts_log(log_path):
         else:
             # Handle SKIPPED when no current_subtest exists
             # detect lines like "ACPI XXX table does not exist, skipping test"
-            skip_acpi_match = re.search(r"ACPI\s+(\S+)\s+table does not exist, skipping test", line)
+            skip_acpi_match = ACPI_TABLE_SKIP.search(line)
             if skip_acpi_match and current_test:
                 # Create a new subtest to record the skip
                 sub_desc = current_test.get("Test_suite_description")
@@ -257,14 +277,8 @@ def parse_fwts_log(log_path):
                 current_subtest = None
                 continue
 
-        # Parse per-test summary lines
-        per_test_summary_match = re.match(
-            r"^(\d+) passed,\s*(\d+) failed,\s*(\d+) warning,\s*(\d+) aborted,\s*(\d+) skipped,\s*(\d+) info only\.$",
-            line.strip()
-        )
-        if per_test_summary_match:
-            # Not updating counts here; we sum from subtests anyway
-            continue
+        # Per-test summary lines ("N passed, N failed, ...") are not parsed;
+        # the counts are summed from the subtests instead.
 
     # After processing all lines, save the last test + subtest
     if current_subtest:
@@ -365,10 +379,11 @@ def parse_fwts_log(log_path):
             if not sub_res["warning_reasons"]:
                 del sub_res["warning_reasons"]
 
-    return {
+    # Every failure is a subtest FAILED count, already summed into total_failed
+    return store_fail_counts({
         "test_results": results,
         "suite_summary": final_suite_summary
-    }
+    }, final_suite_summary["total_failed"], 0)
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
@@ -17,13 +17,30 @@
 import json
 import argparse
 import re
-import chardet
 import os
+import sys
+from collections import deque
+
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import FailCounter
+from log_encoding import open_log
+# pylint: enable=wrong-import-position
 
 # Determine if we're in Device Tree (DT) mode or SR mode by checking yocto flag.
 YOCTO_FLAG_PATH = "/mnt/yocto_image.flag"
 DT_OR_SR_MODE = "DT" if os.path.isfile(YOCTO_FLAG_PATH) else "SR"
 
+# Line patterns, compiled once since every log line is checked against them
+DEVICE_PATH_RE = re.compile(r'^\s*Device\s*Path\s*:', re.IGNORECASE)
+SEPARATOR_RE = re.compile(r'-+')
+TEST_RESULT_RE = re.compile(r'^([^:]+):\s*\[(.*?)\]')
+SUBTEST_RESULT_RE = re.compile(r'--\s*(PASS|FAIL|FAILURE|WARNING|NOT SUPPORTED)', re.IGNORECASE)
+
 def normalize_result(r):
     r = r.strip().upper()
     # Map single-word states to full past tense
@@ -465,11 +482,32 @@ test_mapping = {
     }
 }
 
-def detect_file_encoding(file_path):
-    with open(file_path, 'rb') as file:
-        raw_data = file.read()
-        result = chardet.detect(raw_data)
-        return result['encoding']
+class LineWindow:
+    """
+    Iterate over the stripped lines of a file while allowing a peek at the
+    lines that follow, so look-ahead never needs the whole log in memory.
+    Only lines that have been peeked at are buffered.
+    """
+    def __init__(self, file):
+        self._lines = iter(file)
+        self._ahead = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._ahead:
+            return self._ahead.popleft()
+        return next(self._lines).strip()
+
+    def peek(self, n=1):
+        """Return the n-th line after the current one, or None past the end."""
+        while len(self._ahead) < n:
+            try:
+                self._ahead.append(next(self._lines).strip())
+            except StopIteration:
+                return None
+        return self._ahead[n - 1]
 
 def clean_test_description(description):
     if description.startswith("/"):
@@ -485,37 +523,38 @@ def find_test_suite_and_subsuite(test_case_name):
     return None, None
 
 def main(input_file, output_file):
-    file_encoding = detect_file_encoding(input_file)
-    results = []
-    test_entry = None
-    sub_test_number = 0
-    capture_description = False
+    bbsr_sct_flag = os.path.basename(output_file).startswith("bbsr_")
 
-    # We'll fill "suite_summary" after final classification
-    suite_summary = {
-        "total_passed": 0,
-        "total_failed": 0,
-        "total_failed_with_waiver": 0,
-        "total_aborted": 0,
-        "total_skipped": 0,
-        "total_warnings": 0,
-        # NEW - Not used until final classification,
-        # but we show how to handle if we want total_ignored here
-        # We won't add it unless specifically needed
-    }
+    # Merge with edk2_test_parser.json if present
+    if bbsr_sct_flag:
+        edk2_file = os.path.join(os.path.dirname(output_file), "edk2_test_parser-bbsr.json")
+    else:
+        edk2_file = os.path.join(os.path.dirname(output_file), "edk2_test_parser.json")
 
-    bbsr_sct_flag = False
-    output_base = os.path.basename(output_file)
-    if output_base.startswith("bbsr_"):
-        bbsr_sct_flag = True
+    edk2_data = None
+    if os.path.exists(edk2_file):
+        with open(edk2_file, "r", encoding="utf-8") as f:
+            edk2_data = json.load(f)
 
-    with open(input_file, "r", encoding=file_encoding, errors="ignore") as file:
-        lines = file.readlines()
+    output_data = parse_sct_log(input_file, edk2_data)
+
+    with open(output_file, 'w') as json_file:
+        json.dump(output_data, json_file, indent=4)
+
+def iter_sct_entries(input_file):
+    """
+    Yield the raw test entries of an SCT summary log one at a time, as each
+    entry completes. Memory use is bounded by a single entry.
+    """
+    test_entry = None
+    sub_test_number = 0
+    capture_description = False
 
-        for i, line in enumerate(lines):
-            line = line.strip()
+    with open_log(input_file) as file:
+        lines = LineWindow(file)
 
-            if re.match(r'^\s*Device\s*Path\s*:', line, re.IGNORECASE):
+        for line in lines:
+            if DEVICE_PATH_RE.match(line):
                 dp_value = line.split(':', 1)[1].strip()
                 if test_entry is not None:
                     test_entry["Device Path"] = dp_value
@@ -524,7 +563,7 @@ def main(input_file, output_file):
             # Start of a new test entry
             if "BBR ACS" in line:
                 if test_entry:
-                    results.append(test_entry)
+                    yield test_entry
                 test_entry = {
                     "Test_suite": "",
                     "Sub_test_suite": "",
@@ -544,8 +583,9 @@ def main(input_file, output_file):
                     }
                 }
                 # Next line is the test name
-                if i + 1 < len(lines):
-                    test_entry["Test_case"] = lines[i+1].strip()
+                next_line = lines.peek(1)
+                if next_line is not None:
+                    test_entry["Test_case"] = next_line
 
                 sub_test_number = 0
                 # Attempt to find the test suite/subsuite
@@ -557,7 +597,7 @@ def main(input_file, output_file):
                 capture_description = True
                 continue
 
-            if capture_description and line and not re.match(r'-+', line):
+            if capture_description and line and not SEPARATOR_RE.match(line):
                 test_entry["Test_case_description"] = line
                 capture_description = False
 
@@ -567,20 +607,22 @@ def main(input_file, output_file):
             if "Returned Status Code" in line:
                 test_entry["Returned Status Code"] = line.split(':', 1)[1].strip()
                 # Attempt to parse next lines for "XYZ: [RESULT]"
-                j = i + 1
-                while j < len(lines):
-                    candidate = lines[j].strip()
+                j = 1
+                while True:
+                    candidate = lines.peek(j)
                     j += 1
+                    if candidate is None:
+                        break
                     if not candidate:
                         continue
-                    m = re.search(r'^([^:]+):\s*\[(.*?)\]', candidate)
+                    m = TEST_RESULT_RE.search(candidate)
                     if m:
                         test_entry["test_result"] = normalize_result(m.group(2))
                         test_entry["reason"] = ""
                     break
 
             # Sub-test detection from lines like "FooTest -- PASS"
-            if re.search(r'--\s*(PASS|FAIL|FAILURE|WARNING|NOT SUPPORTED)', line, re.IGNORECASE):
+            if SUBTEST_RESULT_RE.search(line):
                 parts = line.rsplit(' -- ', 1)
                 test_desc = clean_test_description(parts[0])
                 result_str = normalize_result(parts[1])
@@ -603,8 +645,8 @@ def main(input_file, output_file):
                 else:
                     test_entry["test_case_summary"]["total_ignored"] += 1
 
-                test_guid = lines[i+1].strip() if i+1 < len(lines) else ""
-                file_path = lines[i+2].strip() if i+2 < len(lines) else ""
+                test_guid = lines.peek(1) or ""
+                file_path = lines.peek(2) or ""
 
                 sub_test_number += 1
 
@@ -626,32 +668,14 @@ def main(input_file, output_file):
 
         # End of loop: add last test entry
         if test_entry:
-            results.append(test_entry)
-
-    # Skip SMBIOS tests in DT mode
-    if DT_OR_SR_MODE == "DT":
-        results = [test for test in results if not is_smbios_test(test.get("Test_case", ""))]
-
-    # Filter out Runtime Properties Table test from subtests (appears only as subtest)
-    for test in results:
-        if "subtests" in test and isinstance(test["subtests"], list):
-            test["subtests"] = [
-                subtest for subtest in test["subtests"]
-                if not is_runtime_properties_table_test(subtest.get("sub_Test_Description", ""))
-            ]
-
-    # Merge with edk2_test_parser.json if present
-    if bbsr_sct_flag:
-        edk2_file = os.path.join(os.path.dirname(output_file), "edk2_test_parser-bbsr.json")
-    else:
-        edk2_file = os.path.join(os.path.dirname(output_file), "edk2_test_parser.json")
-
-    if os.path.exists(edk2_file):
-        with open(edk2_file, "r", encoding="utf-8") as f:
-            edk2_data = json.load(f)
-
-        subtest_dict = {}
-        test_guid_dict = {}
+            yield test_entry
+
+def parse_sct_log(input_file, edk2_data=None):
+    # Index edk2_test_parser.json results up front so each test entry can be
+    # finalized as soon as the log parser yields it
+    subtest_dict = {}
+    test_guid_dict = {}
+    if edk2_data is not None:
         for item in edk2_data:
             ep_guid = item.get("Test Entry Point GUID", "").strip()
             sub_guid = item.get("sub_Test_GUID", "").strip()
@@ -673,8 +697,31 @@ def main(input_file, output_file):
                     "reason": reason_val
                 }
 
-        # Apply overrides
-        for test_obj in results:
+    results = []
+    final_suite_summary = {
+        "total_passed": 0,
+        "total_failed": 0,
+        "total_failed_with_waiver": 0,
+        "total_aborted": 0,
+        "total_skipped": 0,
+        "total_warnings": 0,
+        "total_ignored": 0  # <--- match the new field
+    }
+    fails = FailCounter()
+
+    for test_obj in iter_sct_entries(input_file):
+        # Skip SMBIOS tests in DT mode
+        if DT_OR_SR_MODE == "DT" and is_smbios_test(test_obj.get("Test_case", "")):
+            continue
+
+        # Filter out Runtime Properties Table test from subtests (appears only as subtest)
+        test_obj["subtests"] = [
+            subtest for subtest in test_obj["subtests"]
+            if not is_runtime_properties_table_test(subtest.get("sub_Test_Description", ""))
+        ]
+
+        # Apply edk2_test_parser.json overrides if provided
+        if edk2_data is not None:
             ep_guid_current = test_obj["Test Entry Point GUID"].upper()
             if ep_guid_current in test_guid_dict:
                 test_obj["test_result"] = normalize_result(test_guid_dict[ep_guid_current]["result"])
@@ -697,8 +744,7 @@ def main(input_file, output_file):
                         subtest["sub_test_result"] = normalize_result(result_val)
                         subtest["reason"] = reason_val
 
-    # Reorder final dictionary so "test_result" & "reason" appear after "Returned Status Code"
-    for i, test_obj in enumerate(results):
+        # Reorder so "test_result" & "reason" appear after "Returned Status Code"
         reordered = {
             "Test_suite": test_obj["Test_suite"],
             "Sub_test_suite": test_obj["Sub_test_suite"],
@@ -717,10 +763,9 @@ def main(input_file, output_file):
 
         reordered["subtests"] = test_obj["subtests"]
         reordered["test_case_summary"] = test_obj["test_case_summary"]
-        results[i] = reordered
+        test_obj = reordered
 
-    # Final step: re-tally subtests so the final results reflect overrides
-    for test_obj in results:
+        # Re-tally subtests so the final results reflect overrides
         tcsum = test_obj["test_case_summary"]
         # Reset them all to 0, including new "total_ignored"
         tcsum["total_passed"] = 0
@@ -732,6 +777,7 @@ def main(input_file, output_file):
         tcsum["total_ignored"] = 0  # <--- NEW category for all overrides
 
         for subtest in test_obj["subtests"]:
+            fails.add(subtest["sub_test_result"])
             final_result = subtest["sub_test_result"].upper()
             # Classify final_result - check WARNING first to catch "PASS WITH WARNING"
             if "WARNING" in final_result:
@@ -751,18 +797,7 @@ def main(input_file, output_file):
                 # ANY other override (IGNORED, KNOWN U-BOOT LIMITATION, etc)
                 tcsum["total_ignored"] += 1
 
-    # Sum them all into suite_summary
-    final_suite_summary = {
-        "total_passed": 0,
-        "total_failed": 0,
-        "total_failed_with_waiver": 0,
-        "total_aborted": 0,
-        "total_skipped": 0,
-        "total_warnings": 0,
-        "total_ignored": 0  # <--- match the new field
-    }
-    for test_obj in results:
-        tcsum = test_obj["test_case_summary"]
+        # Sum them all into suite_summary
         final_suite_summary["total_passed"] += tcsum["total_passed"]
         final_suite_summary["total_failed"] += tcsum["total_failed"]
         final_suite_summary["total_failed_with_waiver"] += tcsum["total_failed_with_waiver"]
@@ -771,7 +806,6 @@ def main(input_file, output_file):
         final_suite_summary["total_warnings"] += tcsum["total_warnings"]
         final_suite_summary["total_ignored"] += tcsum["total_ignored"]
 
-
         # Also count test-level results (tests with no subtests or test-level overrides)
         test_result = test_obj.get("test_result", "").upper()
         if test_result and len(test_obj.get("subtests", [])) == 0:
@@ -792,13 +826,12 @@ def main(input_file, output_file):
             else:
                 final_suite_summary["total_ignored"] += 1
 
-    output_data = {
+        results.append(test_obj)
+
+    return fails.record({
         "test_results": results,
         "suite_summary": final_suite_summary
-    }
-
-    with open(output_file, 'w') as json_file:
-        json.dump(output_data, json_file, indent=4)
+    })
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Parse an SCT Log file and save results to a JSON file.")
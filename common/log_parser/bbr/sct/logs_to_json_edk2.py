@@ -22,14 +22,15 @@ import json
 import re
 import sys
 import os
-import chardet
 
-def detect_file_encoding(file_path):
-    """Detect file encoding using chardet."""
-    with open(file_path, 'rb') as f:
-        raw_data = f.read()
-        result = chardet.detect(raw_data)
-    return result.get('encoding', 'utf-8')
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from log_encoding import open_log, log_exists, log_name
+# pylint: enable=wrong-import-position
 
 def parse_edk2_log(input_file):
     """
@@ -41,11 +42,10 @@ def parse_edk2_log(input_file):
     
     Returns a list of dictionaries.
     """
-    if not os.path.exists(input_file):
-        print(f"Error: File not found: {input_file}", file=sys.stderr)
+    if not log_exists(input_file):
+        print(f"Error: File not found: {log_name(input_file)}", file=sys.stderr)
         sys.exit(1)
 
-    encoding = detect_file_encoding(input_file)
     results = []
     header_found = False
     col_index_map = {}
@@ -58,7 +58,7 @@ def parse_edk2_log(input_file):
         "updated by": "reason"
     }
 
-    with open(input_file, 'r', encoding=encoding, errors='ignore') as f:
+    with open_log(input_file) as f:
         lines = f.readlines()
 
     for line in lines:
@@ -15,10 +15,19 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Environment
+import os
+import sys
+
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from report_templates import register_filters, render_to_file
+from suite_info import suite_info_for_page
+from summary_chart import bar_chart_html
+# pylint: enable=wrong-import-position
 
 def determine_css_class(subtest_result):
     subtest_result_upper = subtest_result.upper()
@@ -38,11 +47,14 @@ def determine_css_class(subtest_result):
         # e.g. "IGNORED", "NOT SUPPORTED", etc.
         return 'unknown'
 
+# Used by the detailed table in report_templates/tpm.html
+register_filters(tpm_result_class=determine_css_class)
+
 def generate_bar_chart_improved(suite_summary):
     """
     Creates a bar chart for:
       Passed, Failed, Failed with Waiver, Aborted, Skipped, Warnings, Ignored
-    then returns it as base64-encoded PNG data.
+    then returns it as inline chart HTML.
     """
     labels = [
         'Passed',
@@ -73,262 +85,12 @@ def generate_bar_chart_improved(suite_summary):
         '#cccccc'   # Ignored (gray)
     ]
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    total_tests = sum(sizes)
-    for bar, size in zip(bars, sizes):
-        yval = bar.get_height()
-        if total_tests > 0:
-            percentage = (size / total_tests) * 100
-        else:
-            percentage = 0
-        plt.text(
-            bar.get_x() + bar.get_width() / 2,
-            yval + max(sizes) * 0.01,
-            f'{percentage:.2f}%',
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('TPM Test Results Distribution', fontsize=18, fontweight='bold')
-    plt.ylabel('Total Count', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart_html(labels, sizes, colors, 'TPM Test Results Distribution')
 
 # -----------------------------------------------------------------------------
 # Generate HTML using Jinja2, same format/structure as the SCT snippet
 # -----------------------------------------------------------------------------
 def generate_html_improved(suite_summary, test_results, chart_data, output_html_path, is_summary_page=True):
-    env = Environment(autoescape=True)
-    env.filters['determine_css_class'] = determine_css_class
-
-    template = env.from_string("""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>TPM Test Summary</title>
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                margin: 20px;
-                background-color: #f4f4f4;
-            }
-            h1, h2, h3 {
-                color: #2c3e50;
-                text-align: center;
-            }
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin: 20px 0;
-            }
-            th, td {
-                padding: 12px;
-                border: 1px solid #ddd;
-                font-size: 16px;
-            }
-            th {
-                background-color: #3498db;
-                color: white;
-                font-weight: bold;
-                text-align: left;
-            }
-            .pass {
-                background-color: #d4edda;
-                font-weight: bold;
-            }
-            .fail {
-                background-color: #f8d7da;
-                font-weight: bold;
-            }
-            .fail-waiver {
-                background-color: #f39c12;
-                font-weight: bold;
-                color: white;
-            }
-            .warning {
-                background-color: #fff3cd;
-                font-weight: bold;
-            }
-            .aborted {
-                background-color: #9e9e9e;
-                font-weight: bold;
-            }
-            .skipped {
-                background-color: #ffe0b2;
-                font-weight: bold;
-            }
-            .unknown {
-                background-color: #cccccc;
-                font-weight: bold;
-            }
-            .summary-table {
-                margin: 0 auto;
-                width: 80%;
-            }
-            .summary-table td.total-tests {
-                text-align: center;
-            }
-            .chart-container {
-                display: flex;
-                justify-content: center;
-            }
-            .result-summary, .detailed-summary {
-                margin-top: 40px;
-                padding: 20px;
-                background-color: #fff;
-                border-radius: 10px;
-                box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-            }
-            .result-summary h2 {
-                border-bottom: 2px solid #27ae60;
-                padding-bottom: 10px;
-                margin-bottom: 20px;
-                font-weight: bold;
-            }
-            .heading {
-                font-size: 18px;
-                margin-bottom: 5px;
-                color: #34495e;
-                font-weight: bold;
-            }
-            .heading span {
-                font-weight: normal;
-            }
-            td.pass, td.fail, td.fail-waiver, td.warning, td.aborted, td.skipped, td.unknown {
-                text-align: center;
-                font-weight: bold;
-            }
-            .waiver-reason {
-                text-align: center;
-                font-weight: normal;
-            }
-            .reason-col {
-                text-align: center;
-                font-weight: normal;
-            }
-        </style>
-    </head>
-    <body>
-        <h1>TPM Test Summary</h1>
-
-        {% if not is_summary_page %}
-        <div class="chart-container">
-            <img src="data:image/png;base64,{{ chart_data }}" alt="Test Results Distribution">
-        </div>
-        {% endif %}
-
-        <div class="result-summary">
-            <h2>Result Summary</h2>
-            <table class="summary-table">
-                <thead>
-                    <tr>
-                        <th>Status</th>
-                        <th>Total</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <tr>
-                        <td>Total Tests</td>
-                        <td class="total-tests">{{ total_tests }}</td>
-                    </tr>
-                    <tr>
-                        <td>Passed</td>
-                        <td class="pass">{{ total_passed }}</td>
-                    </tr>
-                    <tr>
-                        <td>Failed</td>
-                        <td class="fail">{{ total_failed }}</td>
-                    </tr>
-                    <tr>
-                        <td>Failed with Waiver</td>
-                        <td class="fail-waiver">{{ total_failed_with_waiver }}</td>
-                    </tr>
-                    <tr>
-                        <td>Aborted</td>
-                        <td class="aborted">{{ total_aborted }}</td>
-                    </tr>
-                    <tr>
-                        <td>Skipped</td>
-                        <td class="skipped">{{ total_skipped }}</td>
-                    </tr>
-                    <tr>
-                        <td>Warnings</td>
-                        <td class="warning">{{ total_warnings }}</td>
-                    </tr>
-                    <tr>
-                        <td>Ignored</td>
-                        <td class="unknown">{{ total_ignored }}</td>
-                    </tr>
-                </tbody>
-            </table>
-        </div>
-
-        {% if not is_summary_page %}
-        <div class="detailed-summary">
-            {% for test in test_results %}
-            <div class="heading">Test Suite Name: <span>{{ test.Test_suite }}</span></div>
-            <div class="heading">Sub Test Suite: <span>{{ test.Sub_test_suite }}</span></div>
-            <div class="heading">Test Case: <span>{{ test.Test_case }}</span></div>
-            <div class="heading">Test Case Description: <span>{{ test.Test_case_description }}</span></div>
-            <br>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Sub Test #</th>
-                        <th>Sub Test Description</th>
-                        <th>Sub Test Result</th>
-                        <th>Reason</th>
-                        <th>Waiver Reason</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for subtest in test.subtests %}
-                    <tr>
-                        <!-- Use loop.index for auto numbering subtest # -->
-                        <td>{{ loop.index }}</td>
-                        <td>{{ subtest.sub_Test_Description }}</td>
-                        <td class="{{ subtest.sub_test_result | determine_css_class }}">{{ subtest.sub_test_result }}</td>
-                        <td class="reason-col">
-                            {% if subtest.reason is sequence and subtest.reason | length > 0 %}
-                                {{ subtest.reason | join('<br>') }}
-                            {% elif subtest.reason is sequence and subtest.reason | length == 0 %}
-                                N/A
-                            {% elif subtest.reason %}
-                                {{ subtest.reason | replace('\n', '<br>') }}
-                            {% else %}
-                                N/A
-                            {% endif %}
-                        </td>
-
-                        <td class="waiver-reason">
-                            {% if 'FAILED WITH WAIVER' in subtest.sub_test_result.upper() or 'FAILURE (WITH WAIVER)' in subtest.sub_test_result.upper() %}
-                                {{ subtest.waiver_reason | default("N/A") }}
-                            {% else %}
-                                N/A
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-            {% endfor %}
-        </div>
-        {% endif %}
-    </body>
-    </html>
-    """)
-
     # Count total tests
     total_tests = (
         suite_summary.get("total_passed", 0)
@@ -340,7 +102,10 @@ def generate_html_improved(suite_summary, test_results, chart_data, output_html_
         + suite_summary.get("total_ignored", 0)
     )
 
-    html_content = template.render(
+    render_to_file(
+        "tpm.html",
+        output_html_path,
+        suite_info=suite_info_for_page(output_html_path),
         chart_data=chart_data,
         total_tests=total_tests,
         total_passed=suite_summary.get("total_passed", 0),
@@ -354,14 +119,15 @@ def generate_html_improved(suite_summary, test_results, chart_data, output_html_
         is_summary_page=is_summary_page
     )
 
-    with open(output_html_path, "w", encoding="utf-8") as file:
-        file.write(html_content)
-
 
 def main(input_json_file, detailed_html_file, summary_html_file):
     # Load JSON data
     with open(input_json_file, 'r', encoding="utf-8") as json_file:
         data = json.load(json_file)
+    render_reports(data, detailed_html_file, summary_html_file)
+
+
+def render_reports(data, detailed_html_file, summary_html_file):
     suite_summary = data.get("suite_summary", {})
     test_results = data.get("test_results", [])
 
@@ -386,8 +152,6 @@ def main(input_json_file, detailed_html_file, summary_html_file):
     )
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) != 4:
         print("Usage: python tpm_json_to_html.py <input_json_file> <detailed_html_file> <summary_html_file>")
         sys.exit(1)
@@ -18,8 +18,19 @@ import re
 import json
 import argparse
 import os
-
-def parse_tpm_log(lines):
+import sys
+
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import FailCounter
+from log_encoding import log_exists, log_name, open_text
+# pylint: enable=wrong-import-position
+
+def parse_tpm_log(lines, fails=None):
     # Single test-entry approach:
     tpm_entry = {
         "Test_suite": "BBSR-TPM",
@@ -96,23 +107,35 @@ def parse_tpm_log(lines):
 
 
             tpm_entry["subtests"].append(sub_test)
+            if fails is not None:
+                fails.add(result_str)
 
     return tpm_entry
 
 def main(input_file, output_file):
-    if not os.path.isfile(input_file):
-        print(f"ERROR: Input file '{input_file}' not found.")
+    output_data = build_tpm_output(input_file)
+    if output_data is None:
         return
 
-    with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
+    # Write out JSON
+    with open(output_file, "w", encoding="utf-8") as out_f:
+        json.dump(output_data, out_f, indent=4)
+
+def build_tpm_output(input_file):
+    if not log_exists(input_file):
+        print(f"ERROR: Input file '{log_name(input_file)}' not found.")
+        return None
+
+    with open_text(input_file, encoding="utf-8", errors="ignore") as f:
         lines = f.readlines()
 
     # Parse the TPM log
-    tpm_entry = parse_tpm_log(lines)
+    fails = FailCounter()
+    tpm_entry = parse_tpm_log(lines, fails)
 
     # If we found zero subtests, you can optionally handle that
     if len(tpm_entry["subtests"]) == 0:
-        print(f"WARNING: No 'Verify ... : PASS|FAIL' patterns found in {input_file}.")
+        print(f"WARNING: No 'Verify ... : PASS|FAIL' patterns found in {log_name(input_file)}.")
 
     # Build the suite_summary from the single test_entry
     summary = tpm_entry["test_case_summary"]
@@ -126,14 +149,10 @@ def main(input_file, output_file):
         "total_ignored": summary["total_ignored"]
     }
 
-    output_data = {
+    return fails.record({
         "test_results": [tpm_entry],
         "suite_summary": suite_summary
-    }
-
-    # Write out JSON
-    with open(output_file, "w", encoding="utf-8") as out_f:
-        json.dump(output_data, out_f, indent=4)
+    })
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Parse TPM logs and convert to JSON (similar to SCT format).")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare whole-file chardet detection with log_encoding.open_log.
+
+Generates UTF-8 and UTF-16 logs of the requested size and times reading
+each one as text both ways.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import chardet
+
+from log_encoding import detect_file_encoding, open_log
+
+# One SCT-style test record; repeated to reach the requested size
+SAMPLE_RECORD = (
+    "Test Configuration #0\n"
+    "------------------------------------------------------------\n"
+    "Required elements test\n"
+    "Test Entry Point GUID: A0A8BED3-3D6F-4AD8-907A-84D52EE1543B\n"
+    "Returned Status Code: Success\n"
+    "RequiredElements: [PASSED]\n"
+    "  Passes........... 12\n"
+    "  Warnings......... 0\n"
+    "  Errors........... 0\n"
+    "  Reason: \u00b5s timer drift \u2014 see firmware log\n"
+    "\n"
+)
+
+# (label, codec, BOM written by the generator)
+LOG_FORMATS = (
+    ("utf-8", "utf-8", b""),
+    ("utf-16 (BOM)", "utf-16-le", b"\xff\xfe"),
+    ("utf-16le (no BOM)", "utf-16-le", b""),
+)
+
+
+def write_log(path, size_mb, codec, bom):
+    record = SAMPLE_RECORD.encode(codec)
+    count = max(1, int(size_mb * 1024 * 1024) // len(record))
+    with open(path, "wb") as f:
+        f.write(bom)
+        for _ in range(count):
+            f.write(record)
+
+
+def whole_file_encoding(path):
+    with open(path, "rb") as f:
+        return chardet.detect(f.read())["encoding"] or "utf-8"
+
+
+def read_whole_file_chardet(path):
+    """The previous approach: chardet over every byte, then a second read."""
+    encoding = whole_file_encoding(path)
+    with open(path, "r", encoding=encoding, errors="ignore") as f:
+        return len(f.read().splitlines())
+
+
+def read_open_log(path):
+    with open_log(path) as f:
+        return sum(1 for _ in f)
+
+
+def best_of(func, path, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark log encoding detection.")
+    parser.add_argument("--size-mb", type=float, default=8.0,
+                        help="Approximate size of each generated log (default: 8)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per measurement; the fastest is reported (default: 3)")
+    args = parser.parse_args()
+
+    print(f"{'Log':<20} {'chardet (s)':>12} {'open_log (s)':>13} {'Speedup':>8}"
+          "  Detected (chardet / open_log)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, codec, bom in LOG_FORMATS:
+            path = os.path.join(tmp, "bench.log")
+            write_log(path, args.size_mb, codec, bom)
+            old = best_of(read_whole_file_chardet, path, args.repeat)
+            new = best_of(read_open_log, path, args.repeat)
+            detected = f"{whole_file_encoding(path)} / {detect_file_encoding(path)}"
+            print(f"{label:<20} {old:>12.3f} {new:>13.3f} {old / new:>7.1f}x  {detected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Synthetic ACS logs for benchmarking the log parsers.
+
+Each generator writes the logs of one suite below a results directory, in
+the layout run_log_parser.py expects, and returns the waiver.json TestSuites
+entries that waive part of the failures it wrote. At scale 1 a log is about
+the size of a real run; scale N repeats its tests N times with fresh numbers,
+GUIDs and results. Results are drawn from random.Random(seed), so the same
+scale and seed always give the same bytes.
+"""
+
+import argparse
+import json
+import os
+import random
+
+# Share of PASS / FAIL / SKIP results; the rest are warnings where a format has them
+PASS_RATE = 0.78
+FAIL_RATE = 0.12
+SKIP_RATE = 0.06
+# One failure in WAIVE_EVERY gets a waiver entry
+WAIVE_EVERY = 3
+
+BSA_MODULES = ("PE", "GIC", "TIMER", "WATCHDOG", "PCIE", "MEMORY_MAP", "PERIPHERAL",
+               "POWER_WAKEUP", "SMMU", "EXERCISER")
+PFDI_MODULES = ("PFDI_VERSION", "PFDI_FEATURES", "PFDI_PE_TEST_ID", "PFDI_PE_TEST_PART_COUNT",
+                "PFDI_PE_TEST_RUN", "PFDI_PE_TEST_RESULT", "PFDI_FW_CHECK", "PFDI_FORCE_ERROR")
+FWTS_TESTS = ("acpitables", "apicinstance", "dmicheck", "esrt", "uefibootpath", "uefirtmisc",
+              "uefirttime", "uefirtvariable", "uefivarinfo", "xsdt", "spcr", "gtdt", "mcfg",
+              "madt", "dbg2", "iort", "pptt", "bert")
+# (Test_case, description) pairs named like the SCT test_mapping entries
+SCT_CASES = (
+    ("PlatformSpecificElements", "UEFI Platform Specific Elements test"),
+    ("RequiredElements", "UEFI Required Elements test"),
+    ("CloseEvent_Func", "Function test for CloseEvent"),
+    ("SetTimer_Func", "Function test for SetTimer"),
+    ("FreePages_Conf", "Conformance test for FreePages"),
+    ("DisconnectController_Conf", "Conformance test for DisconnectController"),
+    ("LocateDevicePath_Conf", "Conformance test for LocateDevicePath"),
+    ("ExitBootServices_Conf", "Conformance test for ExitBootServices"),
+    ("SetMem_Func", "Function test for SetMem"),
+    ("GetNextVariableName_Conf", "Conformance test for GetNextVariableName"),
+    ("SetVariable_Conf", "Conformance test for SetVariable"),
+    ("SetTime_Conf", "Conformance test for SetTime"),
+    ("AppendDeviceNode_Functionality", "Functionality test for AppendDeviceNode"),
+    ("RouteConfig_Conf", "Conformance test for RouteConfig"),
+    ("Start_Func", "Function test for SimpleNetwork Start"),
+    ("QueryMode_Conf", "Conformance test for QueryMode"),
+)
+SCMI_PROTOCOLS = ("BASE", "POWER DOMAIN", "SYSTEM POWER", "PERFORMANCE", "CLOCK",
+                  "SENSOR", "RESET", "VOLTAGE", "POWERCAP", "PIN CONTROL")
+SBMR_SUITES = {
+    "ib": ("Linux Tests", "Redfish Host Interface", "IPMI In-Band"),
+    "oob": ("Redfish Service", "IPMI Over LAN", "Event Logs"),
+}
+TPM_EVENTS = ("EV_POST_CODE", "EV_EFI_VARIABLE_DRIVER_CONFIG", "EV_SEPARATOR",
+              "EV_EFI_BOOT_SERVICES_APPLICATION", "EV_EFI_ACTION", "EV_EFI_PLATFORM_FIRMWARE_BLOB2")
+ETHTOOL_CHECKS = ("Bring up", "Ethtool self tests", "Link detected", "IPv4 DHCP",
+                  "IPv4 address present", "Gateway address present", "Ping gateway",
+                  "Ping www.arm.com", "wget and curl")
+NETWORK_BOOT_CHECKS = ("Image URL", "EFI System Partition (ESP)", "HTTP Boot Option",
+                       "DHCP Server", "Boot Image Download")
+
+
+def _result(rng, outcomes=("PASSED", "FAILED", "SKIPPED")):
+    """Draw one of outcomes (pass, fail, skip) with the configured rates."""
+    value = rng.random()
+    if value < PASS_RATE:
+        return outcomes[0]
+    if value < PASS_RATE + FAIL_RATE:
+        return outcomes[1]
+    return outcomes[2]
+
+
+def _guid(rng):
+    return "{:08X}-{:04X}-{:04X}-{:04X}-{:012X}".format(
+        rng.getrandbits(32), rng.getrandbits(16), rng.getrandbits(16),
+        rng.getrandbits(16), rng.getrandbits(48))
+
+
+def _write(results_dir, rel_path, text):
+    path = os.path.join(results_dir, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def _subtest_waivers(test_suite, test_case, descriptions):
+    """TestSuites entry waiving the given subtest descriptions of one test case."""
+    return {
+        "TestSuite": test_suite,
+        "TestCase": {
+            "Test_case": test_case,
+            "SubTests": [{"sub_Test_Description": desc, "Reason": "Benchmark waiver"}
+                         for desc in descriptions],
+        },
+    }
+
+
+################################################################################
+# Generators
+################################################################################
+
+def _rule_log(rng, scale, modules, prefix, rules_per_module=12):
+    """BSA-style rule log: numbered rules, every fourth one with referenced rules."""
+    lines = ["", " ---------------------- Running tests ------------------------"]
+    waived = {}
+    index = 0
+    for module in modules:
+        lines.append(f"*** Running {module} tests ***")
+        for number in range(1, rules_per_module * scale + 1):
+            index += 1
+            rule = f"{prefix}_{module}_{number:02d}"
+            lines.append(f"{rule} : {index} : "
+                         f"Check {module.lower().replace('_', ' ')} rule {number}")
+            result = _result(rng)
+            if number % 4 == 0:
+                lines.append(f"=== Start tests for rules referenced by {rule} ===")
+                for child in range(1, rng.randint(1, 3) + 1):
+                    child_result = _result(rng)
+                    lines.append(f"    {module}_{number:02d}_{child} : {index * 100 + child} : "
+                                 f"Referenced check {child}")
+                    if child_result == "FAILED":
+                        lines.append(f"       Checkpoint -- {child:2d}")
+                        result = "FAILED"
+                    lines.append(f"       Result: {child_result}")
+                lines.append(f"=== End tests for rules referenced by {rule} ===")
+            if result == "FAILED":
+                lines.append(f"       Checkpoint -- {number % 16:2d}")
+            lines.append(f"       Result: {result}")
+            if result == "FAILED" and index % WAIVE_EVERY == 0:
+                waived.setdefault(module, []).append(rule)
+    test_suites = [{"TestSuite": module,
+                    "TestCases": [{"Test_case": rule, "Reason": "Benchmark waiver"}
+                                  for rule in rules]}
+                   for module, rules in waived.items()]
+    return "\n".join(lines) + "\n", test_suites
+
+
+def generate_bsa(results_dir, scale, rng):
+    text, waivers = _rule_log(rng, scale, BSA_MODULES, "B")
+    _write(results_dir, "uefi/BsaResults.log", text)
+    return {"BSA": waivers}
+
+
+def generate_sbsa(results_dir, scale, rng):
+    text, waivers = _rule_log(rng, scale, BSA_MODULES, "S_L3")
+    _write(results_dir, "uefi/SbsaResults.log", text)
+    return {"SBSA": waivers}
+
+
+def generate_pfdi(results_dir, scale, rng):
+    text, _ = _rule_log(rng, scale, PFDI_MODULES, "P", rules_per_module=6)
+    _write(results_dir, "uefi/pfdiresults.log", text)
+    return {}
+
+
+def generate_fwts(results_dir, scale, rng, rel_path="fwts/FWTSResults.log"):
+    lines = ["Results generated by fwts: Version V24.01.00 (2024-01-24 03:22:41).", "",
+             "Running tests: " + " ".join(FWTS_TESTS) + ".", "",
+             "=" * 80]
+    test_suites = []
+    for test in FWTS_TESTS:
+        count = 5 * scale
+        lines.append(f"{test}: {test.upper()} table and runtime checks.")
+        lines.append("-" * 80)
+        waived = []
+        for number in range(1, count + 1):
+            desc = f"{test} check {number}"
+            lines.append(f"Test {number} of {count}: {desc}.")
+            result = _result(rng)
+            if result == "PASSED":
+                lines.append(f"PASSED: Test {number}, {desc} is valid.")
+            elif result == "FAILED":
+                lines.append(f"FAILED [HIGH] {test.capitalize()}Invalid{number}: Test {number}, "
+                             f"{desc} returned an unexpected value.")
+                if number % WAIVE_EVERY == 0:
+                    waived.append(f"{desc}.")
+            else:
+                lines.append(f"SKIPPED: Test {number}, {desc} is not supported.")
+            lines.append("")
+        lines.append("=" * 80)
+        if waived:
+            test_suites.append(_subtest_waivers(test, test, waived))
+    _write(results_dir, rel_path, "\n".join(lines) + "\n")
+    return {"FWTS": test_suites}
+
+
+def generate_sct(results_dir, scale, rng, rel_path="sct_results/Overall/Summary.log",
+                 edk2_rel_path="edk2-test-parser/edk2-test-parser.log"):
+    """SCT Summary.log plus the edk2-test-parser table that overrides some failures."""
+    lines = []
+    edk2_rows = ["| set guid | guid | name | result | updated by |", "|---|---|---|---|---|"]
+    waived = []
+    failures = 0
+    for repeat in range(scale):
+        for case, description in SCT_CASES:
+            entry_guid = _guid(rng)
+            lines += ["", "BBR ACS", case, "Test Configuration #0",
+                      "------------------------------------------------------------",
+                      description, f"Test Entry Point GUID: {entry_guid}",
+                      "Returned Status Code: Success", f"{case}: [PASSED]", ""]
+            for number in range(1, 7):
+                sub_guid = _guid(rng)
+                sub_desc = f"{case} - check {repeat * 6 + number}"
+                result = _result(rng, ("PASS", "FAIL", "WARNING"))
+                lines += [f"{sub_desc} -- {result}", sub_guid,
+                          f"/home/edk2-test/uefi-sct/SctPkg/TestCase/{case}.c:{100 + number}:"
+                          f"Status - {'Success' if result == 'PASS' else 'Unsupported'}"]
+                if result == "FAIL":
+                    failures += 1
+                    if failures % 2 == 0:
+                        edk2_rows.append(f"| {entry_guid} | {sub_guid} | {sub_desc} | "
+                                         f"KNOWN U-BOOT LIMITATION | u-boot |")
+                    elif failures % WAIVE_EVERY == 0:
+                        waived.append({"SubTestID": sub_guid, "sub_Test_Description": sub_desc,
+                                       "Reason": "Benchmark waiver"})
+    _write(results_dir, rel_path, "\n".join(lines) + "\n")
+    _write(results_dir, edk2_rel_path, "\n".join(edk2_rows) + "\n")
+    return {"SCT": [{"TestSuite": "BootServicesTest",
+                     "TestCase": {"Test_case": "SCT", "SubTests": waived}}] if waived else []}
+
+
+def generate_tpm(results_dir, scale, rng):
+    lines = []
+    waived = []
+    for number in range(12 * scale):
+        event = TPM_EVENTS[number % len(TPM_EVENTS)]
+        desc = f"Verify {event} event {number} with recommended strings"
+        result = _result(rng, ("PASS", "FAIL", "SKIPPED"))
+        lines.append(f"{desc} : {result}")
+        lines.append(f"    PCR[{number % 8}] digest matches the event log" if result == "PASS"
+                     else f"    PCR[{number % 8}] event data does not match")
+        if result == "FAIL" and number % WAIVE_EVERY == 0:
+            waived.append(desc)
+    _write(results_dir, "bbsr/tpm2/verify_tpm_measurements.log", "\n".join(lines) + "\n")
+    return {"BBSR-TPM": [_subtest_waivers("TPM", "TPM", waived)] if waived else []}
+
+
+def generate_scmi(results_dir, scale, rng):
+    lines = ["**** SCMI Compliance Suite ****", "Version 2.0"]
+    waived = []
+    for protocol_index, protocol in enumerate(SCMI_PROTOCOLS, 1):
+        lines += ["", f"*** Starting {protocol} tests ***"]
+        for number in range(1, 8 * scale + 1):
+            test_id = protocol_index * 100 + number
+            desc = f"{protocol.title()} check {number}"
+            result = _result(rng, ("CONFORMANT", "NON CONFORMANT", "SKIPPED"))
+            if result == "NON CONFORMANT":
+                lines += [f"{test_id} : {desc}",
+                          "  CHECK STATUS",
+                          f"  EXPECTED 0x0 RECEIVED 0x{number:x} : {result}"]
+                if number % WAIVE_EVERY == 0:
+                    waived.append({"Test_case": f"{test_id}", "Reason": "Benchmark waiver"})
+            else:
+                lines.append(f"{test_id} : {desc} : {result}")
+    _write(results_dir, "linux_acs/scmi_acs_app/arm_scmi_test_log.txt", "\n".join(lines) + "\n")
+    return {"SCMI": [{"TestSuite": "SCMI", "TestCases": waived}] if waived else []}
+
+
+def generate_sbmr(results_dir, scale, rng):
+    waivers = []
+    for band, band_dir in (("ib", "sbmr_in_band_logs"), ("oob", "sbmr_out_of_band_logs")):
+        parts = ['<?xml version="1.0" encoding="UTF-8"?>',
+                 '<robot generator="Robot 6.1.1 (Python 3.10.12 on linux)">',
+                 f'<suite id="s1" name="SBMR {band.upper()}">']
+        waived = []
+        for suite_index, suite in enumerate(SBMR_SUITES[band], 1):
+            parts.append(f'<suite id="s1-s{suite_index}" name="{suite}">')
+            for number in range(1, 10 * scale + 1):
+                name = f"{suite} check {number}"
+                status = _result(rng, ("PASS", "FAIL", "SKIP"))
+                parts.append(f'<test id="s1-s{suite_index}-t{number}" name="{name}">')
+                parts.append(f'<kw name="Run Check"><msg level="INFO">Running {name}</msg>'
+                             f'<status status="{status}"/></kw>')
+                message = "" if status == "PASS" else f"{name} did not complete"
+                parts.append(f'<status status="{status}">{message}</status></test>')
+                if status == "FAIL" and number % WAIVE_EVERY == 0:
+                    waived.append(name)
+            parts.append("</suite>")
+        parts += ["</suite>", "</robot>"]
+        _write(results_dir, f"sbmr/{band_dir}/output.xml", "\n".join(parts) + "\n")
+        if waived:
+            waivers.append(_subtest_waivers(f"SBMR {band.upper()}", band, waived))
+    return {"SBMR": waivers}
+
+
+def generate_post_script(results_dir, scale, rng):
+    lines = []
+    for number in range(20 * scale):
+        value = rng.random()
+        if value < 0.2:
+            lines.append(f"ERROR check_dmesg: unexpected message {number} in dmesg")
+        elif value < 0.5:
+            lines.append(f"WARNING check_uefi: variable {number} has a non-standard attribute")
+        else:
+            lines.append(f"INFO check_file: result {number} present")
+    _write(results_dir, "post-script/post-script.log", "\n".join(lines) + "\n")
+    return {}
+
+
+def generate_standalone(results_dir, scale, rng):
+    """Logs for every format standalone_tests/logs_to_json.py recognises by content."""
+    lines = ["selftests: dt: test_unprobed_devices.sh", "# TAP version 13"]
+    waived = []
+    for number in range(1, 40 * scale + 1):
+        result = _result(rng, ("ok", "not ok", "skip"))
+        if result == "skip":
+            lines.append(f"# ok {number} /soc/device@{number:x} # SKIP")
+        else:
+            lines.append(f"# {result} {number} /soc/device@{number:x}")
+            if result == "not ok" and number % WAIVE_EVERY == 0:
+                waived.append(f"/soc/device@{number:x}")
+    _write(results_dir, "linux_tools/dt_kselftest.log", "\n".join(lines) + "\n")
+
+    lines = ["DeviceTree bindings of Linux kernel version 6.6", "",
+             "Non-ignored entries", "-" * 40]
+    for number in range(1, 25 * scale + 1):
+        level = "error" if rng.random() < 0.4 else "warning"
+        lines.append(f"/soc/bus@{number:x}/node@{number}  dt-validate  {level}  "
+                     f"'compatible' is a required property")
+    _write(results_dir, "linux_tools/dt-validate-parser.log", "\n".join(lines) + "\n")
+
+    interfaces = [f"eth{number}" for number in range(2 * scale)]
+    lines = ["Running Networking Checks", "", "SUMMARY", "=" * 40,
+             f"Detected Interfaces : ({', '.join(interfaces)})"]
+    for iface in interfaces:
+        lines += ["", f"Interface {iface}"]
+        for check in ETHTOOL_CHECKS:
+            result = _result(rng, ("PASSED", "FAILED", "SKIPPED"))
+            lines.append(f"  {check} : {result}"
+                         + ("" if result == "PASSED" else " (not available)"))
+    _write(results_dir, "linux_tools/ethtool-test.log", "\n".join(lines) + "\n")
+
+    lines = ["[INFO] network_boot_checks", "Mon Jan  1 00:00:00 UTC 2026"]
+    for repeat in range(scale):
+        for check in NETWORK_BOOT_CHECKS:
+            result = _result(rng, ("PASSED", "FAILED", "FAILED"))
+            lines.append(f"{check} {repeat}: {result} (checked on attempt {repeat})")
+    lines.append("Network_Boot_Result: PASSED")
+    _write(results_dir, "network_boot/network_boot_results.log", "\n".join(lines) + "\n")
+
+    lines = ["Testing Runtime Device Mapping Conflict Test"]
+    lines += [f"DEBUG: region 0x{number:08x} mapped once" for number in range(30 * scale)]
+    lines.append("RESULTS: PASSED")
+    _write(results_dir, "linux_tools/runtime_device_mapping_conflict_test.log",
+           "\n".join(lines) + "\n")
+
+    _write(results_dir, "linux_tools/psci/psci_kernel.log",
+           "[    0.000000] psci: probing for conduit method from DT.\n"
+           "[    0.000000] psci: PSCIv1.1 detected in firmware.\n")
+    # Standalone waivers name the test case only
+    test_case = _subtest_waivers("dt_kselftest", "dt_kselftest", waived)["TestCase"]
+    return {"Standalone": [{"TestCase": test_case}] if waived else []}
+
+
+# Benchmark case -> (generator, run in DT mode, run_log_parser steps it feeds)
+GENERATORS = {
+    "bsa": (generate_bsa, False, ("bsa",)),
+    "sbsa": (generate_sbsa, False, ("sbsa",)),
+    "fwts": (generate_fwts, False, ("fwts",)),
+    "sct": (generate_sct, False, ("edk2", "sct")),
+    "bbsr_tpm": (generate_tpm, False, ("bbsr_tpm",)),
+    "sbmr": (generate_sbmr, False, ("sbmr_ib", "sbmr_oob")),
+    "pfdi": (generate_pfdi, True, ("pfdi",)),
+    "scmi": (generate_scmi, True, ("scmi",)),
+    "post_script": (generate_post_script, True, ("post_script",)),
+    "standalone": (generate_standalone, True, ("standalone",)),
+}
+
+
+def generate(case, results_dir, scale=1, seed=0):
+    """Write the logs of one case below results_dir; return its waiver.json content."""
+    generator = GENERATORS[case][0]
+    waivers = generator(results_dir, scale, random.Random(seed))
+    return {"Suites": [{"Suite": suite, "TestSuites": test_suites}
+                       for suite, test_suites in waivers.items()]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write synthetic ACS logs for benchmarking.")
+    parser.add_argument("output_dir", help="Results directory to write the logs into")
+    parser.add_argument("--case", action="append", choices=sorted(GENERATORS),
+                        help="Case to generate; may be repeated (default: all)")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="Multiplier for the number of tests in each log (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    waiver = {"Suites": []}
+    for case in args.case or sorted(GENERATORS):
+        waiver["Suites"] += generate(case, args.output_dir, args.scale, args.seed)["Suites"]
+    with open(os.path.join(args.output_dir, "waiver.json"), "w", encoding="utf-8") as f:
+        json.dump(waiver, f, indent=4)
+    print(f"Logs written to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
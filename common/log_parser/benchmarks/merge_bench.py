@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark merge_jsons.py on large result sets.
+
+Builds the suite JSONs of a multi-OS result set (BSA, SBSA, SCT, FWTS, BBSR
+TPM, SBMR and the standalone suites, with the ethtool JSON copied once per
+OS) from the synthetic logs of log_generators.py, then times merge_jsons.py
+on them in a child process and reports its wall time and peak RSS.
+Results are written as JSON; pass an earlier results file as --baseline to
+compare two commits.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.log_generators import generate
+from benchmarks.parser_bench import git_commit, load_results, parse_scales, run_case
+
+_MERGE_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "merge_jsons.py")
+DEFAULT_SCALES = (10, 100)
+# Parser benchmark cases whose JSONs make up the merged result set
+MERGE_CASES = ("bsa", "sbsa", "sct", "fwts", "bbsr_tpm", "sbmr", "standalone")
+OS_NAMES = ("linux_debian", "linux_fedora", "linux_opensuse", "linux_ubuntu", "linux_rhel",
+            "linux_sles")
+
+
+def build_result_set(work_dir, scale, seed, os_count):
+    """Write the suite JSONs of one result set; return them in merge order."""
+    results_dir = os.path.join(work_dir, "acs_results")
+    output_path = os.path.join(work_dir, "out")
+    waiver = {"Suites": []}
+    for case in MERGE_CASES:
+        waiver["Suites"] += generate(case, results_dir, scale, seed)["Suites"]
+    waiver_json = os.path.join(work_dir, "waiver.json")
+    with open(waiver_json, "w", encoding="utf-8") as f:
+        json.dump(waiver, f, indent=4)
+    for case in MERGE_CASES:
+        run_case(case, results_dir, waiver_json, output_path)
+
+    jsons_dir = os.path.join(output_path, "acs_summary", "acs_jsons")
+    ethtool_json = os.path.join(jsons_dir, "ethtool_test.json")
+    for os_name in OS_NAMES[:os_count]:
+        shutil.copyfile(ethtool_json, os.path.join(jsons_dir, f"ethtool_test_{os_name}.json"))
+    return sorted(os.path.join(jsons_dir, name) for name in os.listdir(jsons_dir))
+
+
+def time_merge(json_files, output_file):
+    """Run merge_jsons.py once; return its wall seconds and peak RSS in bytes."""
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, _MERGE_SCRIPT, output_file] + json_files,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(child.pid, 0)
+    child.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.perf_counter() - start
+    if child.returncode != 0:
+        raise RuntimeError(f"merge_jsons.py exited with {child.returncode}")
+    # ru_maxrss is in KiB on Linux
+    return wall, usage.ru_maxrss * 1024
+
+
+def bench_scale(scale, seed, os_count, repeat, work_dir):
+    scale_dir = os.path.join(work_dir, f"scale-{scale}")
+    json_files = build_result_set(scale_dir, scale, seed, os_count)
+    output_file = os.path.join(scale_dir, "merged_results.json")
+    best_wall = best_rss = None
+    for _ in range(repeat):
+        wall, rss = time_merge(json_files, output_file)
+        best_wall = wall if best_wall is None else min(best_wall, wall)
+        best_rss = rss if best_rss is None else min(best_rss, rss)
+    return {
+        "scale": scale,
+        "input_files": len(json_files),
+        "input_bytes": sum(os.path.getsize(p) for p in json_files),
+        "largest_input_bytes": max(os.path.getsize(p) for p in json_files),
+        "output_bytes": os.path.getsize(output_file),
+        "wall_seconds": round(best_wall, 6),
+        "peak_rss_bytes": best_rss,
+    }
+
+
+def print_results(results, baseline=None):
+    base = {r["scale"]: r for r in (baseline or {}).get("results", [])}
+    mib = 1024 * 1024
+    header = (f"{'Scale':>5} {'Files':>5} {'Inputs (MiB)':>13} {'Largest (MiB)':>14} "
+              f"{'Wall (s)':>9} {'Peak RSS (MiB)':>15}")
+    if baseline is not None:
+        header += f" {'Time vs base':>13} {'RSS vs base':>12}"
+    print(header)
+    for entry in results:
+        line = (f"{entry['scale']:>5} {entry['input_files']:>5} "
+                f"{entry['input_bytes'] / mib:>13.1f} "
+                f"{entry['largest_input_bytes'] / mib:>14.1f} {entry['wall_seconds']:>9.3f} "
+                f"{entry['peak_rss_bytes'] / mib:>15.1f}")
+        if baseline is not None:
+            old = base.get(entry["scale"])
+            if old:
+                line += (f" {old['wall_seconds'] / entry['wall_seconds']:>12.2f}x"
+                         f" {old['peak_rss_bytes'] / entry['peak_rss_bytes']:>11.2f}x")
+            else:
+                line += f" {'-':>13} {'-':>12}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark merge_jsons.py on large result sets.")
+    parser.add_argument("--scales", type=parse_scales, default=list(DEFAULT_SCALES),
+                        help="Comma-separated log size multipliers (default: 10,100)")
+    parser.add_argument("--os-count", type=int, default=3, choices=range(1, len(OS_NAMES) + 1),
+                        help="OS ethtool JSONs in the result set (default: 3)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per measurement; the fastest is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the logs (default: 0)")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare with")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for scale in args.scales:
+            results.append(bench_scale(scale, args.seed, args.os_count, max(1, args.repeat),
+                                       work_dir))
+
+    document = {
+        "benchmark": "merge_bench",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "os_count": args.os_count,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=4)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
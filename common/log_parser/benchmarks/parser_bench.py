@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the log parsers on synthetic logs.
+
+For every case in log_generators.GENERATORS, writes its logs at each scale
+and runs the matching run_log_parser.py suite steps on them, timing the
+logs_to_json, apply_waivers and json_to_html stages through stage_metrics.
+Results are written as JSON; pass an earlier results file as --baseline to
+compare two commits.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+import run_log_parser
+from benchmarks.log_generators import GENERATORS, generate
+
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SCALES = (1, 10, 100)
+# Stages recorded inside a suite step, timed separately
+TIMED_STAGES = ("parse", "waivers", "render")
+
+
+def parse_scales(text):
+    try:
+        scales = [int(part) for part in text.split(",") if part.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid scale list: {text!r}") from exc
+    if not scales or min(scales) < 1:
+        raise argparse.ArgumentTypeError(f"invalid scale list: {text!r}")
+    return scales
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=_LOG_PARSER_DIR,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def tree_size(path):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, files in os.walk(path) for name in files)
+
+
+def run_case(case, results_dir, waiver_json, output_path):
+    """Run the suite steps of case once; return the seconds spent per stage."""
+    _, dt_mode, step_keys = GENERATORS[case]
+    stage_metrics = run_log_parser.load_script("stage_metrics.py")
+    run = run_log_parser.ParserRun(results_dir, waiver_json=waiver_json, output_path=output_path)
+    run.yocto = dt_mode
+    # Without test_category.json every test suite is waivable, so the waiver
+    # pass does its full work in both modes
+    run.test_category = ""
+    os.makedirs(run.jsons_dir, exist_ok=True)
+    os.makedirs(run.htmls_dir, exist_ok=True)
+
+    recorder = stage_metrics.StageRecorder(pipeline="parser_bench")
+    previous = stage_metrics.activate(recorder)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            run.load_waivers()
+            for key in step_keys:
+                run_log_parser.run_step(run, run_log_parser.STEPS_BY_KEY[key])
+    finally:
+        stage_metrics.activate(previous)
+
+    seconds = dict.fromkeys(TIMED_STAGES + ("step",), 0.0)
+    for record in recorder.records:
+        name = record["stage"].rpartition("/")[2]
+        if record["depth"] == 0:
+            seconds["step"] += record["wall_seconds"]
+        elif record["depth"] == 1 and name in seconds:
+            seconds[name] += record["wall_seconds"]
+    return seconds
+
+
+def bench_case(case, scale, seed, repeat, work_dir):
+    """Generate the logs of case at scale and time its stages, best of repeat runs."""
+    case_dir = os.path.join(work_dir, f"{case}-{scale}")
+    results_dir = os.path.join(case_dir, "acs_results")
+    waiver_json = os.path.join(case_dir, "waiver.json")
+    os.makedirs(results_dir)
+    with open(waiver_json, "w", encoding="utf-8") as f:
+        json.dump(generate(case, results_dir, scale, seed), f, indent=4)
+    log_bytes = tree_size(results_dir)
+
+    best = None
+    for attempt in range(repeat):
+        seconds = run_case(case, results_dir, waiver_json, os.path.join(case_dir, f"out{attempt}"))
+        best = seconds if best is None else {k: min(best[k], v) for k, v in seconds.items()}
+    entry = {"case": case, "scale": scale, "log_bytes": log_bytes}
+    entry.update({f"{name}_seconds": round(value, 6) for name, value in best.items()})
+    return entry
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if not isinstance(document, dict) or not isinstance(document.get("results"), list):
+        raise ValueError(f"{path} is not a parser_bench results file")
+    return document
+
+
+def print_results(results, baseline=None):
+    base = {(r["case"], r["scale"]): r for r in (baseline or {}).get("results", [])}
+    header = (f"{'Case':<12} {'Scale':>5} {'Logs (KB)':>10} {'Parse (s)':>10} "
+              f"{'Waivers (s)':>12} {'Render (s)':>11} {'Step (s)':>9}")
+    if baseline is not None:
+        header += f" {'vs ' + str(baseline.get('commit') or 'baseline'):>14}"
+    print(header)
+    for entry in results:
+        line = (f"{entry['case']:<12} {entry['scale']:>5} {entry['log_bytes'] / 1024:>10.1f} "
+                f"{entry['parse_seconds']:>10.3f} {entry['waivers_seconds']:>12.3f} "
+                f"{entry['render_seconds']:>11.3f} {entry['step_seconds']:>9.3f}")
+        if baseline is not None:
+            old = base.get((entry["case"], entry["scale"]))
+            if old and entry["step_seconds"]:
+                line += f" {old['step_seconds'] / entry['step_seconds']:>13.2f}x"
+            else:
+                line += f" {'-':>14}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the log parsers on synthetic logs.")
+    parser.add_argument("--case", action="append", choices=sorted(GENERATORS),
+                        help="Case to run; may be repeated (default: all)")
+    parser.add_argument("--scales", type=parse_scales, default=list(DEFAULT_SCALES),
+                        help="Comma-separated log size multipliers (default: 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per measurement; the fastest is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the logs (default: 0)")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare the step times with")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+
+    run_log_parser.preload_scripts()
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for case in args.case or list(GENERATORS):
+            for scale in args.scales:
+                results.append(bench_case(case, scale, args.seed, max(1, args.repeat), work_dir))
+
+    document = {
+        "benchmark": "parser_bench",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print_results(results, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=4)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,11 +15,21 @@
 # limitations under the License.
 
 import argparse
-import chardet
 import json
+import os
 import re
 import sys
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import FailCounter
+from log_encoding import log_name, open_log
+# pylint: enable=wrong-import-position
 
 # Keep these patterns in one place so the parser can read both clean ACS logs
 # and raw simulator/terminal logs without a separate pre-cleaning step.
@@ -33,13 +43,22 @@ REFERENCED_RULES_MARKER_RE = re.compile(
 )
 RULE_LINE_RE = re.compile(r'\b([A-Za-z0-9_]+)\s*:\s*(-|\d+)\s*:\s*(.*)$')
 RESULT_RE = re.compile(r'\bResult:\s*(.*)$', re.IGNORECASE)
+START_LINE_RE = re.compile(r'\bSTART\s+([^\s:]+)\s+([A-Za-z0-9_]+)\s+([^\s:]+)\s*:\s*(.*)$')
+END_LINE_RE = re.compile(r'\bEND\s+([A-Za-z0-9_]+)\s+(.*)$')
+START_KEYWORD_RE = re.compile(r'\bSTART\s+')
+STATUS_TRAILER_RE = re.compile(r'\s+(?:===|\*\*\*)')
 MAX_SUBTEST_DESCRIPTION_CHARS = 49
 
-def detect_file_encoding(file_path):
-    with open(file_path, 'rb') as file:
-        raw_data = file.read()
-        result = chardet.detect(raw_data)
-        return result['encoding']
+# Token kinds produced by tokenize_line(), in the order the parser handles them
+TOKEN_SUITE = "suite"
+TOKEN_MARKER = "marker"
+TOKEN_RULE = "rule"
+TOKEN_RESULT = "result"
+TOKEN_START = "start"
+TOKEN_END = "end"
+
+# kind is one of the TOKEN_* values; match is the regex match for that kind
+LineToken = namedtuple("LineToken", ["kind", "match"])
 
 def classify_status(status_text):
     if not status_text:
@@ -138,15 +157,79 @@ def update_summary_counts(summary, summary_category, formatted_result):
 def normalize_log_line(raw_line):
     # Raw simulator logs can prefix every ACS line with timestamp/tube text.
     # Remove only that wrapper text and leave the ACS rule/result text intact.
-    line = ANSI_ESCAPE_RE.sub('', raw_line)
-    line = BRACKET_TIMESTAMP_RE.sub('', line)
-    return SIM_TUBE_PREFIX_RE.sub('', line)
+    # Most lines carry neither, so only run a pattern when its first character
+    # is present.
+    line = ANSI_ESCAPE_RE.sub('', raw_line) if '\x1b' in raw_line else raw_line
+    if line[:1].isspace():
+        head = line.lstrip()[:1]
+    else:
+        head = line[:1]
+    if head == '[':
+        line = BRACKET_TIMESTAMP_RE.sub('', line)
+        head = line.lstrip()[:1]
+    if head == '#':
+        line = SIM_TUBE_PREFIX_RE.sub('', line)
+    return line
+
+def starts_processing(line):
+    # Rules are only parsed after the "Selected rules" / "Running tests" banner
+    # (or the first START line of old logs), so shell noise before it is skipped.
+    return (
+        "---------------------- Running tests ------------------------" in line
+        or "Selected rules:" in line
+        or "*** Running " in line
+        or ("START" in line and START_KEYWORD_RE.search(line) is not None)
+    )
+
+def tokenize_line(line):
+    """
+    Classify a stripped, normalized log line in one pass.
+
+    Returns the LineTokens of the line in the order the parser consumes them:
+    an optional suite header and referenced-rules marker, then at most one of
+    rule, result, START or END. Each pattern is only tried when the literal
+    text it needs appears in the line, so informational lines cost a few
+    substring checks.
+    """
+    tokens = []
+    if "***" in line:
+        match = SUITE_HEADER_RE.search(line)
+        if match:
+            tokens.append(LineToken(TOKEN_SUITE, match))
+    if "===" in line:
+        match = REFERENCED_RULES_MARKER_RE.search(line)
+        if match:
+            tokens.append(LineToken(TOKEN_MARKER, match))
+
+    # Rule lines have two colons, Result and START lines at least one; END
+    # lines need "END".
+    colons = line.count(":")
+    if colons:
+        if colons > 1:
+            match = RULE_LINE_RE.search(line)
+            if match:
+                tokens.append(LineToken(TOKEN_RULE, match))
+                return tokens
+        match = RESULT_RE.search(line)
+        if match:
+            tokens.append(LineToken(TOKEN_RESULT, match))
+            return tokens
+        if "START" in line:
+            match = START_LINE_RE.search(line)
+            if match:
+                tokens.append(LineToken(TOKEN_START, match))
+                return tokens
+    if "END" in line:
+        match = END_LINE_RE.search(line)
+        if match:
+            tokens.append(LineToken(TOKEN_END, match))
+    return tokens
 
 def extract_status_text(status_text):
     # Some logs print a Result and the next marker/header on the same line.
     # Keep only the status part so markers do not leak into Test_result.
     status_text = (status_text or "").strip()
-    status_text = re.split(r'\s+(?:===|\*\*\*)', status_text, maxsplit=1)[0]
+    status_text = STATUS_TRAILER_RE.split(status_text, maxsplit=1)[0]
     return status_text.strip()
 
 def make_test_number(rule_id, test_index):
@@ -288,6 +371,15 @@ def merge_matching_subtests(existing_subtests, override_subtests):
             existing_by_key[key].update(override)
 
 def main(input_files, output_file):
+    output = parse_bsa_logs(input_files)
+    if output is None:
+        sys.exit(1)
+
+    with open(output_file, "w") as jf:
+        json.dump(output, jf, indent=2)
+
+def parse_bsa_logs(input_files):
+    """Parse BSA/SBSA/PFDI logs; return None when no rules were run."""
     # Per-suite list of testcases
     testcases_per_suite = defaultdict(list)
     # Per-suite summary
@@ -304,46 +396,31 @@ def main(input_files, output_file):
         current_suite = ""
         processing = False
 
-        lower_path = input_file.lower()
+        lower_path = log_name(input_file).lower()
         if "/linux" in lower_path or "bsaresultskernel" in lower_path or "/linux_acs" in lower_path:
             current_source = "linux"
         elif "/uefi" in lower_path:
             current_source = "uefi"
         else:
             current_source = "unknown"
-        file_encoding = detect_file_encoding(input_file)
-
-        with open(input_file, "r", encoding=file_encoding, errors="ignore") as f:
+        with open_log(input_file) as f:
             lines = f.read().splitlines()
 
-        i = 0
-        while i < len(lines):
-            raw_line = lines[i]
-            i += 1
-
-            line_no_timestamp = normalize_log_line(raw_line)
-
+        for raw_line in lines:
             # Strip leading spaces before matching. Nesting comes from explicit
             # referenced-rule markers, not indentation.
-            line = line_no_timestamp.strip()
+            line = normalize_log_line(raw_line).strip()
 
             if not line:
                 continue
 
             # Start processing when we see Selected rules / Running tests / START (old format)
             # or "*** Running <suite> tests ***" (new format)
-            if not processing and (
-                "---------------------- Running tests ------------------------" in line
-                or "Selected rules:" in line
-                or re.search(r'\bSTART\s+', line)
-                or "*** Running " in line
-            ):
-                processing = True
-
             if not processing:
-                continue
+                if not starts_processing(line):
+                    continue
+                processing = True
 
-            # ---------------- New log format support ----------------
             # Newer BSA/SBSA logs can nest rule groups:
             #   <PARENT_RULE> : <index> : <description>
             #     === Start tests for rules referenced by <PARENT_RULE> ===
@@ -351,56 +428,76 @@ def main(input_files, output_file):
             #       Result: <status text>
             #     === End tests for rules referenced by <PARENT_RULE> ===
             #   Result: <status text>
-            suite_hdr = SUITE_HEADER_RE.search(line)
-            if suite_hdr:
-                current_suite = suite_hdr.group(1).strip().replace(" ", "_")
-
-            referenced_rules_marker = REFERENCED_RULES_MARKER_RE.search(line)
-            if referenced_rules_marker:
-                marker_action = referenced_rules_marker.group(1).lower()
-                marker_rule_id = referenced_rules_marker.group(2).strip()
-                if marker_action == "start":
-                    # The marker names the parent rule. Children that follow
-                    # should be attached under this open parent frame.
-                    frame_idx = find_frame_from_top(rule_stack, marker_rule_id)
-                    if frame_idx is not None:
-                        marker_stack.append(rule_stack[frame_idx])
-                else:
-                    # End marker closes the current parent scope, but does not
-                    # complete the parent rule. The following Result line does.
-                    for marker_idx in range(len(marker_stack) - 1, -1, -1):
-                        if marker_stack[marker_idx].get("rule_id") == marker_rule_id:
-                            marker_stack.pop(marker_idx)
-                            break
-
-            # RULE line. Start/End referenced-by markers provide explicit parent
-            # scope for nested logs.
-            rule_line = RULE_LINE_RE.search(line)
-            if rule_line:
-                rule_id = rule_line.group(1).strip()
-                test_index = (rule_line.group(2) or "").strip() or "-"
-                desc = (rule_line.group(3) or "").strip()
-                suite = current_suite or ""
-                inline_result = RESULT_RE.search(desc)
-                status_text = ""
-                if inline_result:
-                    # Compact logs may print "RULE : idx : desc Result: PASS".
-                    # Split it so Result is not stored as part of description.
-                    status_text = extract_status_text(inline_result.group(1))
-                    desc = desc[:inline_result.start()].strip()
-
-                parent = marker_stack[-1] if marker_stack else None
-                if parent is None and rule_stack:
-                    # A new top-level rule should only appear after the previous
-                    # top-level result. If a malformed log leaves frames open,
-                    # clear them instead of guessing a parent from whitespace.
-                    rule_stack.clear()
-                    marker_stack.clear()
-
-                frame = make_rule_frame(
-                    suite, rule_id, test_index, desc, parent, current_source
-                )
-                if inline_result:
+            for kind, match in tokenize_line(line):
+                if kind == TOKEN_SUITE:
+                    current_suite = match.group(1).strip().replace(" ", "_")
+
+                elif kind == TOKEN_MARKER:
+                    marker_action = match.group(1).lower()
+                    marker_rule_id = match.group(2).strip()
+                    if marker_action == "start":
+                        # The marker names the parent rule. Children that follow
+                        # should be attached under this open parent frame.
+                        frame_idx = find_frame_from_top(rule_stack, marker_rule_id)
+                        if frame_idx is not None:
+                            marker_stack.append(rule_stack[frame_idx])
+                    else:
+                        # End marker closes the current parent scope, but does not
+                        # complete the parent rule. The following Result line does.
+                        for marker_idx in range(len(marker_stack) - 1, -1, -1):
+                            if marker_stack[marker_idx].get("rule_id") == marker_rule_id:
+                                marker_stack.pop(marker_idx)
+                                break
+
+                elif kind == TOKEN_RULE:
+                    # RULE line. Start/End referenced-by markers provide explicit
+                    # parent scope for nested logs.
+                    rule_id = match.group(1).strip()
+                    test_index = (match.group(2) or "").strip() or "-"
+                    desc = (match.group(3) or "").strip()
+                    suite = current_suite or ""
+                    inline_result = RESULT_RE.search(desc)
+                    status_text = ""
+                    if inline_result:
+                        # Compact logs may print "RULE : idx : desc Result: PASS".
+                        # Split it so Result is not stored as part of description.
+                        status_text = extract_status_text(inline_result.group(1))
+                        desc = desc[:inline_result.start()].strip()
+
+                    parent = marker_stack[-1] if marker_stack else None
+                    if parent is None and rule_stack:
+                        # A new top-level rule should only appear after the previous
+                        # top-level result. If a malformed log leaves frames open,
+                        # clear them instead of guessing a parent from whitespace.
+                        rule_stack.clear()
+                        marker_stack.clear()
+
+                    frame = make_rule_frame(
+                        suite, rule_id, test_index, desc, parent, current_source
+                    )
+                    if inline_result:
+                        formatted_result, summary_category = classify_status(status_text)
+                        complete_rule_frame(
+                            frame,
+                            formatted_result,
+                            summary_category,
+                            testcases_per_suite,
+                            suite_summaries,
+                            total_summary
+                        )
+                    else:
+                        rule_stack.append(frame)
+
+                elif kind == TOKEN_RESULT:
+                    # In the new log format, Result closes the most recently opened
+                    # rule. That rule is either emitted as a testcase or attached
+                    # to its parent.
+                    status_text = extract_status_text(match.group(1))
+                    if not rule_stack:
+                        continue
+
+                    frame = rule_stack.pop()
+                    remove_marker_frame(marker_stack, frame)
                     formatted_result, summary_category = classify_status(status_text)
                     complete_rule_frame(
                         frame,
@@ -410,95 +507,63 @@ def main(input_files, output_file):
                         suite_summaries,
                         total_summary
                     )
-                else:
-                    rule_stack.append(frame)
-                continue
-
-            # In the new log format, Result closes the most recently opened rule.
-            # That rule is either emitted as a testcase or attached to its parent.
-            result_match = RESULT_RE.search(line)
-            if result_match:
-                status_text = extract_status_text(result_match.group(1))
-                if not rule_stack:
-                    continue
 
-                frame = rule_stack.pop()
-                remove_marker_frame(marker_stack, frame)
-                formatted_result, summary_category = classify_status(status_text)
-                complete_rule_frame(
-                    frame,
-                    formatted_result,
-                    summary_category,
-                    testcases_per_suite,
-                    suite_summaries,
-                    total_summary
-                )
-                continue
-            # -------------- End new log format support --------------
-
-            #   START <suite_or_dash> <RULE_ID> <index_or_dash> : <description...>
-            # Old-format START/END logs use the same stack. Flat old logs stay
-            # flat unless explicit referenced-rule markers provide parent scope.
-            start_match = re.search(
-                r'\bSTART\s+([^\s:]+)\s+([A-Za-z0-9_]+)\s+([^\s:]+)\s*:\s*(.*)$',
-                line
-            )
-            if start_match:
-                suite_tok = start_match.group(1).strip()
-                rule_id = start_match.group(2).strip()
-                index_tok = start_match.group(3).strip()
-                desc = (start_match.group(4) or "").strip()
-
-                # Update current suite unless '-'
-                if suite_tok != "-":
-                    current_suite = suite_tok
-
-                if not current_suite:
-                    # Leave empty if genuinely unknown, but usually logs set it.
-                    current_suite = ""
-
-                # Normalize index
-                test_index = index_tok if index_tok != "" else "-"
-
-                parent = marker_stack[-1] if marker_stack else None
-                if parent is None and rule_stack:
-                    rule_stack.clear()
-                    marker_stack.clear()
-
-                rule_stack.append(
-                    make_rule_frame(current_suite, rule_id, test_index, desc, parent, current_source)
-                )
-                continue
+                elif kind == TOKEN_START:
+                    #   START <suite_or_dash> <RULE_ID> <index_or_dash> : <description...>
+                    # Old-format START/END logs use the same stack. Flat old logs
+                    # stay flat unless explicit referenced-rule markers provide
+                    # parent scope.
+                    suite_tok = match.group(1).strip()
+                    rule_id = match.group(2).strip()
+                    index_tok = match.group(3).strip()
+                    desc = (match.group(4) or "").strip()
+
+                    # Update current suite unless '-'
+                    if suite_tok != "-":
+                        current_suite = suite_tok
+
+                    if not current_suite:
+                        # Leave empty if genuinely unknown, but usually logs set it.
+                        current_suite = ""
+
+                    # Normalize index
+                    test_index = index_tok if index_tok != "" else "-"
+
+                    parent = marker_stack[-1] if marker_stack else None
+                    if parent is None and rule_stack:
+                        rule_stack.clear()
+                        marker_stack.clear()
+
+                    rule_stack.append(
+                        make_rule_frame(current_suite, rule_id, test_index, desc, parent, current_source)
+                    )
 
-            # END line:
-            #   END <RULE_ID> <status text...>
-            end_match = re.search(r'\bEND\s+([A-Za-z0-9_]+)\s+(.*)$', line)
-            if end_match:
-                rule_id = end_match.group(1).strip()
-                status_text = extract_status_text(end_match.group(2))
+                elif kind == TOKEN_END:
+                    # END line:
+                    #   END <RULE_ID> <status text...>
+                    rule_id = match.group(1).strip()
+                    status_text = extract_status_text(match.group(2))
 
-                formatted_result, summary_category = classify_status(status_text)
+                    formatted_result, summary_category = classify_status(status_text)
 
-                # END names the rule being closed. Search from the top of the
-                # stack so repeated rule IDs close the nearest matching instance.
-                frame_idx = find_frame_from_top(rule_stack, rule_id)
-                if frame_idx is None:
-                    continue
+                    # END names the rule being closed. Search from the top of the
+                    # stack so repeated rule IDs close the nearest matching instance.
+                    frame_idx = find_frame_from_top(rule_stack, rule_id)
+                    if frame_idx is None:
+                        continue
 
-                frame = rule_stack.pop(frame_idx)
-                remove_marker_frame(marker_stack, frame)
-                complete_rule_frame(
-                    frame,
-                    formatted_result,
-                    summary_category,
-                    testcases_per_suite,
-                    suite_summaries,
-                    total_summary
-                )
-                continue
+                    frame = rule_stack.pop(frame_idx)
+                    remove_marker_frame(marker_stack, frame)
+                    complete_rule_frame(
+                        frame,
+                        formatted_result,
+                        summary_category,
+                        testcases_per_suite,
+                        suite_summaries,
+                        total_summary
+                    )
 
-            # Ignore all other lines (debug, informational, etc.)
-            continue
+            # All other lines (debug, informational, etc.) yield no tokens.
 
     # Post-process UEFI/Linux duplicates per testcase
     processed_testcases = defaultdict(list)
@@ -554,11 +619,13 @@ def main(input_files, output_file):
     # Recompute summaries from processed testcases
     suite_summaries = defaultdict(init_summary)
     total_summary = init_summary()
+    fails = FailCounter()
     for suite_name, tcs in testcases_per_suite.items():
         for tc in tcs:
             formatted_result, summary_category = classify_status(tc.get("Test_result"))
             update_summary_counts(suite_summaries[suite_name], summary_category, formatted_result)
             update_summary_counts(total_summary, summary_category, formatted_result)
+            fails.add(tc.get("Test_result"))
 
     # Build final JSON structure
     output = {
@@ -577,10 +644,9 @@ def main(input_files, output_file):
 
     acs_run_true = total_summary.get("Total Rules Run", 0) > 0
     if not acs_run_true:
-        sys.exit(1)
+        return None
 
-    with open(output_file, "w") as jf:
-        json.dump(output, jf, indent=2)
+    return fails.record(output)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
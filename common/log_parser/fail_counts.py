@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Failure counts used for compliance, shared by the parsers and merge_jsons.
+
+The parsers count the failed and waived failures of a suite with a
+FailCounter while they set its results, and record them in its top-level
+suite_summary; apply_waivers moves each failure it waives between the two
+recorded counts. merge_jsons then reads two numbers per suite instead of
+walking every testcase and subtest. The counts follow the rules merge_jsons
+has always used: testcase results when a suite has testcases, otherwise
+subtest results, plus the subtests of SBMR Test_cases. count_fails() still
+walks a suite, for --verify-counts and for JSONs without recorded counts.
+"""
+
+# Keys of the recorded counts in suite_summary
+FAILED_KEY = "compliance_failed"
+FAILED_WITH_WAIVER_KEY = "compliance_failed_with_waiver"
+
+
+def _add_result(counts, result):
+    if isinstance(result, dict):
+        # e.g. {"FAILED": 1, "FAILED_WITH_WAIVER": 1, ...}
+        counts[0] += result.get("FAILED", 0)
+        counts[1] += result.get("FAILED_WITH_WAIVER", 0)
+    elif isinstance(result, str):
+        # e.g. "FAILED (WITH WAIVER)"
+        result_upper = result.upper()
+        if "FAIL" in result_upper:
+            if "(WITH WAIVER)" in result_upper:
+                counts[1] += 1
+            else:
+                counts[0] += 1
+
+
+def count_fails(data):
+    """
+    Walk suite data and count its failed and waived failures.
+
+    data is a parsed suite JSON: a dict with a 'test_results' list or a
+    list of test suites. Returns (failed, failed_with_waiver); (0, 0) for
+    anything else.
+    """
+    if isinstance(data, dict) and "test_results" in data:
+        test_results = data["test_results"]
+    elif isinstance(data, list):
+        test_results = data
+    else:
+        return (0, 0)
+    if not isinstance(test_results, list):
+        return (0, 0)
+
+    counts = [0, 0]
+    for suite_entry in test_results:
+        # If testcases exist, count only testcase-level results to avoid double counting.
+        testcases = suite_entry.get("testcases", [])
+        if testcases:
+            for testcase in testcases:
+                result = testcase.get("Test_result", "")
+                if isinstance(result, str):
+                    _add_result(counts, result)
+        else:
+            for sub in suite_entry.get("subtests", []):
+                _add_result(counts, sub.get("sub_test_result"))
+        # SBMR nested structure
+        for case in suite_entry.get("Test_cases", []):
+            for sub in case.get("subtests", []):
+                _add_result(counts, sub.get("sub_test_result"))
+    return (counts[0], counts[1])
+
+
+def store_fail_counts(data, failed, failed_with_waiver):
+    """
+    Store the counts in the suite_summary of data and return data.
+
+    Data without a top-level suite_summary dict is returned unchanged; merge
+    counts those by walking them.
+    """
+    if isinstance(data, dict) and isinstance(data.get("suite_summary"), dict):
+        data["suite_summary"][FAILED_KEY] = failed
+        data["suite_summary"][FAILED_WITH_WAIVER_KEY] = failed_with_waiver
+    return data
+
+
+class FailCounter:
+    """
+    Running failed and failed_with_waiver counts of one suite.
+
+    add() takes a result as count_fails() reads it: a result string or a
+    dict of per-status counts. Only the results count_fails() would count
+    should be added.
+    """
+
+    def __init__(self):
+        self.failed = 0
+        self.failed_with_waiver = 0
+
+    def _update(self, result, sign):
+        counts = [0, 0]
+        _add_result(counts, result)
+        self.failed += sign * counts[0]
+        self.failed_with_waiver += sign * counts[1]
+
+    def add(self, result):
+        self._update(result, 1)
+
+    def replace(self, old_result, new_result):
+        """Count new_result instead of old_result, e.g. after waiving a failure."""
+        self._update(old_result, -1)
+        self._update(new_result, 1)
+
+    def record(self, data):
+        """Store the counts in the suite_summary of data and return data."""
+        return store_fail_counts(data, self.failed, self.failed_with_waiver)
+
+
+def recorded_fail_counts(data):
+    """Return the (failed, failed_with_waiver) stored in data, or None if there are none."""
+    summary = data.get("suite_summary") if isinstance(data, dict) else None
+    if not isinstance(summary, dict):
+        return None
+    counts = (summary.get(FAILED_KEY), summary.get(FAILED_WITH_WAIVER_KEY))
+    if all(isinstance(count, int) and not isinstance(count, bool) and count >= 0
+           for count in counts):
+        return counts
+    return None
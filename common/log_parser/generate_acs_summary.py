@@ -21,8 +21,10 @@ import argparse
 import os
 import subprocess
 import re
-import html
-from jinja2 import Template
+
+from log_encoding import log_exists, open_text
+from report_templates import render_to_file
+from stage_metrics import load_metrics
 
 def get_system_info():
     system_info = {}
@@ -109,8 +111,8 @@ def parse_config(config_path):
 def get_uefi_version(uefi_version_log):
     uefi_version = 'Unknown'
     try:
-        if uefi_version_log and os.path.exists(uefi_version_log):
-            with open(uefi_version_log, 'r', encoding='utf-16') as file:
+        if uefi_version_log and log_exists(uefi_version_log):
+            with open_text(uefi_version_log, encoding='utf-16') as file:
                 for line in file:
                     if 'UEFI v' in line:
                         uefi_version = line.strip()
@@ -148,105 +150,6 @@ def read_html_content(file_path):
     else:
         return None
 
-def inject_test_suite_info(merged_json_path, output_dir):
-    # Add Test_suite_info into detailed HTMLs after they are generated.
-    if not merged_json_path or not os.path.isfile(merged_json_path):
-        return
-    try:
-        with open(merged_json_path, 'r') as jf:
-            data = json.load(jf)
-    except Exception:
-        return
-
-    def entries(v):
-        # Always return a list of suite entries.
-        if isinstance(v, list):
-            return v
-        if isinstance(v, dict) and isinstance(v.get("test_results"), list):
-            return v["test_results"]
-        if isinstance(v, dict):
-            return [v]
-        return []
-
-    suite_map = {}
-    if isinstance(data, dict):
-        for suite_key, suite_data in data.items():
-            for entry in entries(suite_data):
-                if not isinstance(entry, dict):
-                    continue
-                name = (entry.get("Test_suite") or entry.get("Test_suite_name") or "").strip()
-                info = entry.get("Test_suite_info")
-                if name and info is not None:
-                    # Store by lowercase name so PCIe/PCIE still matches.
-                    suite_map.setdefault(suite_key, {})[name.lower()] = info
-
-    def fmt_info(info):
-        # Format list info as bullets; otherwise keep as plain text.
-        if isinstance(info, list):
-            items = "".join(f"<li>{html.escape(str(i))}</li>" for i in info)
-            return f"<ul style=\"margin: 6px 0 0 18px;\">{items}</ul>"
-        return html.escape(str(info))
-
-    patterns = [
-        # Different detailed HTML templates use different headers.
-        (r'(<div class="test-suite-header">Test Suite:\s*([^<]+)</div>)', 2),
-        (r'(<div class="suite-header">Test Suite:\s*([^<]+)</div>)', 2),
-        (r'(<div class="heading">Test Suite Name:\s*<span>([^<]+)</span></div>)', 2),
-        (r'(<h3>\s*([^:<]+)\s*:[^<]*</h3>)', 2),
-    ]
-    files = [
-        # All detailed HTML files that should get Test_suite_info.
-        ("bsa_detailed.html", "Suite_Name: BSA"),
-        ("sbsa_detailed.html", "Suite_Name: SBSA"),
-        ("fwts_detailed.html", "Suite_Name: FWTS"),
-        ("sct_detailed.html", "Suite_Name: SCT"),
-        ("bbsr_fwts_detailed.html", "Suite_Name: BBSR-FWTS"),
-        ("bbsr_sct_detailed.html", "Suite_Name: BBSR-SCT"),
-        ("bbsr_tpm_detailed.html", "Suite_Name: BBSR-TPM"),
-        ("pfdi_detailed.html", "Suite_Name: PFDI"),
-        ("post_script_detailed.html", "Suite_Name: POST_SCRIPT"),
-        ("scmi_detailed.html", "Suite_Name: SCMI"),
-        ("sbmr_ib_detailed.html", "Suite_Name: SBMR-IB"),
-        ("sbmr_oob_detailed.html", "Suite_Name: SBMR-OOB"),
-        ("standalone_tests_detailed.html", "Suite_Name: Standalone"),
-        ("os_tests_detailed.html", "Suite_Name: OS Tests"),
-    ]
-
-    for filename, suite_key in files:
-        info_map = suite_map.get(suite_key)
-        if not info_map:
-            continue
-        file_path = os.path.join(output_dir, filename)
-        if not os.path.exists(file_path):
-            continue
-        with open(file_path, 'r') as file:
-            content = file.read()
-        updated = content
-        for pattern, name_group in patterns:
-            out = []
-            last = 0
-            for match in re.finditer(pattern, updated, re.IGNORECASE):
-                out.append(updated[last:match.end()])
-                suite_name = (match.group(name_group) or "").strip().lower()
-                info = info_map.get(suite_name)
-                if info is not None:
-                    # Avoid duplicating Test_suite_info in the same section.
-                    lookahead = updated[match.end():match.end() + 300]
-                    if "Test_suite_info" not in lookahead:
-                        block = (
-                            "<div class=\"test-suite-info\" "
-                            "style=\"margin: 6px 0 16px 0; color: #7f8c8d; font-size: 16px;\">"
-                            "<strong>Test_suite_info:</strong>"
-                            f"{fmt_info(info)}</div>"
-                        )
-                        out.append(block)
-                last = match.end()
-            out.append(updated[last:])
-            updated = "".join(out)
-        if updated != content:
-            with open(file_path, 'w') as file:
-                file.write(updated)
-
 def adjust_bbsr_headings(content, suite_name):
     if content:
         pattern = r'(<h[1-6][^>]*>)(.*? Test Summary)(</h[1-6]>)'
@@ -354,13 +257,29 @@ def read_overall_compliance_from_merged_json(merged_json_path):
 
     return overall_result, bbsr_result, scmi_result, mandatory_details, recommended_details, bbsr_details, scmi_details
 
+def adjust_detailed_summary_headings(html_dir):
+    """Retitle the detailed suite pages in html_dir with their suite names."""
+    detailed_summaries = [
+        ('bbsr_fwts_detailed.html', 'BBSR-FWTS'),
+        ('bbsr_sct_detailed.html', 'BBSR-SCT'),
+        ('bbsr_tpm_detailed.html', 'BBSR-TPM'),
+        ('sbmr_ib_detailed.html', 'SBMR-IB'),
+        ('sbmr_oob_detailed.html', 'SBMR-OOB'),
+        ('pfdi_detailed.html', 'PFDI'),
+        ('os_tests_detailed.html', 'OS'),
+        ('standalone_tests_detailed.html', 'Standalone'),
+        ('post_script_detailed.html', 'POST-SCRIPT')
+    ]
+    for file_name, suite_name in detailed_summaries:
+        adjust_detailed_summary_heading(os.path.join(html_dir, file_name), suite_name)
+
 def generate_html(system_info, acs_results_summary,
                   bsa_summary_path, sbsa_summary_path, fwts_summary_path, sct_summary_path,
                   sbmr_ib_summary_path, sbmr_oob_summary_path, scmi_summary_path,
                   bbsr_fwts_summary_path, bbsr_sct_summary_path, bbsr_tpm_summary_path, pfdi_summary_path,
                   post_script_summary_path,
                   standalone_summary_path, OS_tests_summary_path,
-                  output_html_path):
+                  output_html_path, stage_metrics=None):
 
     # Read the summary HTML content from each suite
     bsa_summary_content = read_html_content(bsa_summary_path)
@@ -386,499 +305,10 @@ def generate_html(system_info, acs_results_summary,
     OS_tests_summary_content = adjust_bbsr_headings(OS_tests_summary_content, 'OS')
     standalone_summary_content = adjust_bbsr_headings(standalone_summary_content, 'Standalone')
 
-    # Jinja2 template for the final HTML page
-    html_template = '''
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <title>ACS Summary</title>
-        <style>
-            body {
-                font-family: 'Arial', sans-serif;
-                background-color: #f5f5f5;
-                color: #333;
-                margin: 0;
-                padding: 0;
-            }
-            .header {
-                background-color: #2c3e50;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                font-size: 24px;
-            }
-            .container {
-                width: 80%;
-                margin: 40px auto;
-                padding: 20px;
-                background-color: #fff;
-                box-shadow: 0 0 10px rgba(0, 0, 0, 0.1);
-                border-radius: 8px;
-            }
-            h1, h2 {
-                color: #2c3e50;
-                text-align: left;
-            }
-            .system-info, .acs-results-summary {
-                margin-bottom: 40px;
-                padding: 20px;
-                border-bottom: 1px solid #ddd;
-                text-align: left;
-            }
-            .system-info h2, .acs-results-summary h2 {
-                text-align: left;
-                color: #2c3e50;
-            }
-            .acs-results-summary table, .system-info table {
-                width: 100%;
-                table-layout: fixed;
-            }
-            .acs-results-summary table th, .system-info table th {
-                width: 320px;        /* set your fixed left column width */
-                vertical-align: top;
-                white-space: normal;
-            }
-            .summary-section {
-                margin-bottom: 40px;
-            }
-            .summary {
-                margin-bottom: 40px;
-                padding: 20px;
-                border-bottom: 1px solid #ddd;
-            }
-            .details-link {
-                text-align: center;
-                margin-top: 10px;
-            }
-            .details-link a {
-                color: #3498db;
-                text-decoration: none;
-                font-weight: bold;
-                padding: 10px 20px;
-                border: 2px solid #3498db;
-                border-radius: 5px;
-                display: inline-block;
-                transition: background-color 0.3s, color 0.3s;
-            }
-            .details-link a:hover {
-                background-color: #3498db;
-                color: white;
-            }
-            .dropdown {
-                text-align: center;
-                margin-bottom: 40px;
-                position: relative;
-                display: inline-block;
-            }
-            .dropdown button {
-                background-color: #3498db;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 5px;
-                cursor: pointer;
-                font-size: 16px;
-            }
-            .dropdown-content {
-                display: none;
-                position: absolute;
-                background-color: #f9f9f9;
-                min-width: 220px;
-                box-shadow: 0px 8px 16px 0px rgba(0,0,0,0.2);
-                z-index: 1;
-                left: 50%;
-                transform: translateX(-50%);
-            }
-            .dropdown-content a {
-                color: black;
-                padding: 12px 16px;
-                text-decoration: none;
-                display: block;
-                text-align: left;
-            }
-            .dropdown-content a:hover {
-                background-color: #f1f1f1;
-            }
-            .dropdown:hover .dropdown-content {
-                display: block;
-            }
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 20px;
-            }
-            table, th, td {
-                border: 1px solid #ddd;
-            }
-            th, td {
-                padding: 12px;
-                text-align: left;
-            }
-            th {
-                background-color: #f2f2f2;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            ACS Summary
-        </div>
-        <div class="container">
-            <div class="system-info">
-                <h2>System Information</h2>
-                <table>
-                    <tr>
-                        <th>Vendor</th>
-                        <td>{{ system_info.get('Vendor', 'Unknown') }}</td>
-                    </tr>
-                    <tr>
-                        <th>System</th>
-                        <td>{{ system_info.get('System Name', 'Unknown') }}</td>
-                    </tr>
-                    <tr>
-                        <th>SoC Family</th>
-                        <td>{{ system_info.get('SoC Family', 'Unknown') }}</td>
-                    </tr>
-                    <tr>
-                        <th>Firmware Version</th>
-                        <td>{{ system_info.get('Firmware Version', 'Unknown') }}</td>
-                    </tr>
-                    {% if system_info.get('BMC Firmware Version') %}
-                    <tr>
-                        <th>BMC Firmware Version</th>
-                        <td>{{ system_info.get('BMC Firmware Version') }}</td>
-                    </tr>
-                    {% endif %}
-                    {% for key, value in system_info.items() %}
-                    {% if key not in ['Vendor', 'System Name', 'SoC Family', 'Firmware Version', 'BMC Firmware Version'] %}
-                    <tr>
-                        <th>{{ key }}</th>
-                        <td>{{ value }}</td>
-                    </tr>
-                    {% endif %}
-                    {% endfor %}
-                </table>
-            </div>
-            <div class="acs-results-summary">
-                <h2>ACS Results Summary</h2>
-                <table>
-                    <tr>
-                        <th>Band</th>
-                        <td>{{ acs_results_summary.get('Band', 'Unknown') }}</td>
-                    </tr>
-                    <tr>
-                        <th>Date</th>
-                        <td>{{ acs_results_summary.get('Date', 'Unknown') }}</td>
-                    </tr>
-                    <tr>
-                        <th rowspan="3">SRS requirements compliance results</th>
-                        <td style="
-                            color:
-                            {% if 'Not Compliant' in acs_results_summary.get('Overall Compliance Results', '') %}
-                                red
-                            {% elif 'Compliant with Waivers' in acs_results_summary.get('Overall Compliance Results', '') %}
-                                #FFBF00
-                            {% elif 'Compliant' in acs_results_summary.get('Overall Compliance Results', '') %}
-                                green
-                            {% else %}
-                                black
-                            {% endif %}
-                        ">
-                            {% set overall = acs_results_summary.get('Overall Compliance Results', 'Unknown') %}
-                            {% if ':' in overall %}
-                                {{ overall.split(':')[0].strip() }}
-                            {% else %}
-                                {{ overall }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% set mandatory = acs_results_summary.get('Mandatory Details', {}) %}
-                    {% set recommended = acs_results_summary.get('Recommended Details', {}) %}
-                    {% if mandatory.get('not_run') or mandatory.get('failed') %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Mandatory:</strong>
-                            {% if mandatory.get('not_run') %}
-                                not run: {{ mandatory.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if mandatory.get('not_run') and mandatory.get('failed') %}; {% endif %}
-                            {% if mandatory.get('failed') %}
-                                failed: {{ mandatory.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                    {% if recommended.get('not_run') or recommended.get('failed') %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Recommended:</strong>
-                            {% if recommended.get('not_run') %}
-                                not run: {{ recommended.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if recommended.get('not_run') and recommended.get('failed') %}; {% endif %}
-                            {% if recommended.get('failed') %}
-                                failed: {{ recommended.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                </table>
-            </div>
-            <div class="acs-results-summary">
-                <h2>Extensions</h2>
-                <table>
-                    {% set bbsr_ext = acs_results_summary.get('BBSR Details', {}) %}
-                    {% set bbsr_has_details = bbsr_ext.get('not_run') or bbsr_ext.get('failed') %}
-                    <tr>
-                        <th rowspan="{{ 2 if bbsr_has_details else 1 }}">BBSR compliance results</th>
-                        <td style="
-                            color:
-                            {% if 'Not Compliant' in acs_results_summary.get('BBSR compliance results', '') %}
-                                red
-                            {% elif 'waiver' in acs_results_summary.get('BBSR compliance results', '')|lower %}
-                                #FFBF00
-                            {% elif 'Compliant' in acs_results_summary.get('BBSR compliance results', '') %}
-                                green
-                            {% else %}
-                                black
-                            {% endif %}
-                        ">
-                            {% set bbsr = acs_results_summary.get('BBSR compliance results', 'Not run') %}
-                            {% if ':' in bbsr %}
-                                {{ bbsr.split(':')[0].strip() }}
-                            {% else %}
-                                {{ bbsr }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% if bbsr_has_details %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Mandatory:</strong>
-                            {% if bbsr_ext.get('not_run') %}
-                                not run: {{ bbsr_ext.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if bbsr_ext.get('not_run') and bbsr_ext.get('failed') %}; {% endif %}
-                            {% if bbsr_ext.get('failed') %}
-                                failed: {{ bbsr_ext.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                    {% if 'SCMI compliance results' in acs_results_summary %}
-                    {% set scmi_ext = acs_results_summary.get('SCMI Details', {}) %}
-                    {% set scmi_has_details = scmi_ext.get('not_run') or scmi_ext.get('failed') %}
-                    <tr>
-                        <th rowspan="{{ 2 if scmi_has_details else 1 }}">SCMI compliance results</th>
-                        <td style="
-                            color:
-                            {% if 'not compliant' in acs_results_summary.get('SCMI compliance results', '')|lower %}
-                                red
-                            {% elif 'waiver' in acs_results_summary.get('SCMI compliance results', '')|lower %}
-                                #FFBF00
-                            {% elif 'Compliant' in acs_results_summary.get('SCMI compliance results', '') %}
-                                green
-                            {% else %}
-                                black
-                            {% endif %}
-                        ">
-                            {% set scmi = acs_results_summary.get('SCMI compliance results', 'Not run') %}
-                            {% if ':' in scmi %}
-                                {{ scmi.split(':')[0].strip() }}
-                            {% else %}
-                                {{ scmi }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% if scmi_has_details %}
-                    <tr>
-                        <td style="padding-left: 20px; color: red;">
-                            <strong>Mandatory:</strong>
-                            {% if scmi_ext.get('not_run') %}
-                                not run: {{ scmi_ext.get('not_run')|join(', ') }}
-                            {% endif %}
-                            {% if scmi_ext.get('not_run') and scmi_ext.get('failed') %}; {% endif %}
-                            {% if scmi_ext.get('failed') %}
-                                failed: {{ scmi_ext.get('failed')|join(', ') }}
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endif %}
-                    {% endif %}
-                </table>
-            </div>
-            <div class="dropdown">
-                <button>Go to Summary</button>
-                <div class="dropdown-content">
-                    {% if bsa_summary_content %}
-                    <a href="#bsa_summary">BSA Summary</a>
-                    {% endif %}
-                    {% if sbsa_summary_content %}
-                    <a href="#sbsa_summary">SBSA Summary</a>
-                    {% endif %}
-                    {% if fwts_summary_content %}
-                    <a href="#fwts_summary">FWTS Summary</a>
-                    {% endif %}
-                    {% if sct_summary_content %}
-                    <a href="#sct_summary">SCT Summary</a>
-                    {% endif %}
-                    {% if scmi_summary_content %}
-                    <a href="#scmi_summary">SCMI Summary</a>
-                    {% endif %}
-                    {% if sbmr_ib_summary_content %}
-                    <a href="#sbmr_ib_summary">SBMR-IB Summary</a>
-                    {% endif %}
-                    {% if sbmr_oob_summary_content %}
-                    <a href="#sbmr_oob_summary">SBMR-OOB Summary</a>
-                    {% endif %}
-                    {% if post_script_summary_content %}
-                    <a href="#post_script_summary">POST-SCRIPT Summary</a>
-                    {% endif %}
-                    {% if standalone_summary_content %}
-                    <a href="#standalone_summary">Standalone tests Summary</a>
-                    {% endif %}
-                    {% if bbsr_fwts_summary_content %}
-                    <a href="#bbsr_fwts_summary">BBSR-FWTS Summary</a>
-                    {% endif %}
-                    {% if bbsr_sct_summary_content %}
-                    <a href="#bbsr_sct_summary">BBSR-SCT Summary</a>
-                    {% endif %}
-                    {% if pfdi_summary_content %}
-                    <a href="#pfdi_summary">PFDI Summary</a>
-                    {% endif %}
-                    {% if bbsr_tpm_summary_content %}
-                    <a href="#bbsr_tpm_summary">BBSR-TPM Summary</a>
-                    {% endif %}
-                    {% if OS_tests_summary_content %}
-                    <a href="#OS_tests_summary">OS tests Summary</a>
-                    {% endif %}
-                </div>
-            </div>
-            <div class="summary-section">
-                <h2>Test Summaries</h2>
-                {% if bsa_summary_content %}
-                <div class="summary" id="bsa_summary">
-                    {{ bsa_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bsa_detailed.html" target="_blank">Click here to go to the detailed summary for BSA</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sbsa_summary_content %}
-                <div class="summary" id="sbsa_summary">
-                    {{ sbsa_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sbsa_detailed.html" target="_blank">Click here to go to the detailed summary for SBSA</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if fwts_summary_content %}
-                <div class="summary" id="fwts_summary">
-                    {{ fwts_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="fwts_detailed.html" target="_blank">Click here to go to the detailed summary for FWTS</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sct_summary_content %}
-                <div class="summary" id="sct_summary">
-                    {{ sct_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sct_detailed.html" target="_blank">Click here to go to the detailed summary for SCT</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if scmi_summary_content %}
-                <div class="summary" id="scmi_summary">
-                    {{ scmi_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="scmi_detailed.html" target="_blank">Click here to go to the detailed summary for SCMI</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sbmr_ib_summary_content %}
-                <div class="summary" id="sbmr_ib_summary">
-                    {{ sbmr_ib_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sbmr_ib_detailed.html" target="_blank">Click here to go to the detailed summary for SBMR-IB</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if sbmr_oob_summary_content %}
-                <div class="summary" id="sbmr_oob_summary">
-                    {{ sbmr_oob_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="sbmr_oob_detailed.html" target="_blank">Click here to go to the detailed summary for SBMR-OOB</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if post_script_summary_content %}
-                <div class="summary" id="post_script_summary">
-                    {{ post_script_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="post_script_detailed.html" target="_blank">Click here to go to the detailed summary for POST-SCRIPT</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if standalone_summary_content %}
-                <div class="summary" id="standalone_summary">
-                    {{ standalone_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="standalone_tests_detailed.html" target="_blank">Click here to go to the detailed summary for Standalone tests</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if bbsr_fwts_summary_content %}
-                <div class="summary" id="bbsr_fwts_summary">
-                    {{ bbsr_fwts_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bbsr_fwts_detailed.html" target="_blank">Click here to go to the detailed summary for BBSR-FWTS</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if bbsr_sct_summary_content %}
-                <div class="summary" id="bbsr_sct_summary">
-                    {{ bbsr_sct_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bbsr_sct_detailed.html" target="_blank">Click here to go to the detailed summary for BBSR-SCT</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if bbsr_tpm_summary_content %}
-                <div class="summary" id="bbsr_tpm_summary">
-                    {{ bbsr_tpm_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="bbsr_tpm_detailed.html" target="_blank">Click here to go to the detailed summary for BBSR-TPM</a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if pfdi_summary_content %}
-                <div class="summary" id="pfdi_summary">
-                    {{ pfdi_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="pfdi_detailed.html" target="_blank">
-                            Click here to go to the detailed summary for PFDI
-                        </a>
-                    </div>
-                </div>
-                {% endif %}
-                {% if OS_tests_summary_content %}
-                <div class="summary" id="OS_tests_summary">
-                    {{ OS_tests_summary_content | safe }}
-                    <div class="details-link">
-                        <a href="os_tests_detailed.html" target="_blank">Click here to go to the detailed summary for OS Tests</a>
-                    </div>
-                </div>
-                {% endif %}
-            </div>
-        </div>
-    </body>
-    </html>
-    '''
-
-    template = Template(html_template)
-    html_output = template.render(
+    # Stream the final page straight into the output file
+    render_to_file(
+        "acs_summary.html",
+        output_html_path,
         system_info=system_info,
         acs_results_summary=acs_results_summary,
         bsa_summary_content=bsa_summary_content,
@@ -894,28 +324,19 @@ def generate_html(system_info, acs_results_summary,
         pfdi_summary_content=pfdi_summary_content,
         post_script_summary_content=post_script_summary_content,
         standalone_summary_content=standalone_summary_content,
-        OS_tests_summary_content=OS_tests_summary_content
+        OS_tests_summary_content=OS_tests_summary_content,
+        stage_metrics=stage_metrics
     )
 
-    with open(output_html_path, 'w') as html_file:
-        html_file.write(html_output)
+    adjust_detailed_summary_headings(os.path.dirname(output_html_path))
 
-    # Adjust headings in the *detailed* summary pages
-    detailed_summaries = [
-        (os.path.join(os.path.dirname(output_html_path), 'bbsr_fwts_detailed.html'), 'BBSR-FWTS'),
-        (os.path.join(os.path.dirname(output_html_path), 'bbsr_sct_detailed.html'), 'BBSR-SCT'),
-        (os.path.join(os.path.dirname(output_html_path), 'bbsr_tpm_detailed.html'), 'BBSR-TPM'),
-        (os.path.join(os.path.dirname(output_html_path), 'sbmr_ib_detailed.html'),  'SBMR-IB'),
-        (os.path.join(os.path.dirname(output_html_path), 'sbmr_oob_detailed.html'), 'SBMR-OOB'),
-        (os.path.join(os.path.dirname(output_html_path), 'pfdi_detailed.html'), 'PFDI'),
-        (os.path.join(os.path.dirname(output_html_path), 'os_tests_detailed.html'), 'OS'),
-        (os.path.join(os.path.dirname(output_html_path), 'standalone_tests_detailed.html'), 'Standalone'),
-        (os.path.join(os.path.dirname(output_html_path), 'post_script_detailed.html'), 'POST-SCRIPT')
-    ]
-    for file_path, suite_name in detailed_summaries:
-        adjust_detailed_summary_heading(file_path, suite_name)
+def main(argv=None, uefi_version_log=None):
+    """
+    Build the consolidated ACS summary page from the per-suite summaries.
 
-if __name__ == "__main__":
+    uefi_version_log, if given, is used instead of --uefi_version_log; it may
+    be an in-memory log read from a results archive.
+    """
     parser = argparse.ArgumentParser(description="Generate ACS Summary HTML page")
     parser.add_argument("--merged_json", default="", help="Path to merged_results.json if you want to pull final compliance from there")
     parser.add_argument("bsa_summary_path", help="Path to the BSA summary HTML file")
@@ -939,8 +360,9 @@ if __name__ == "__main__":
     parser.add_argument("--uefi_version_log", default="", help="Path to the uefi_version.log file")
     parser.add_argument("--device_tree_dts", default="", help="Path to the device_tree.dts file")
     parser.add_argument("--acs_info_json", default="", help="Path to acs_info.json for System Info fields")
+    parser.add_argument("--stage_metrics_json", default="", help="Path to stage_metrics.json to add a pipeline stage table")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # 1) Basic system info
     system_info = get_system_info()
@@ -952,7 +374,9 @@ if __name__ == "__main__":
     system_info.update(system_config_info)
 
     # 3) UEFI version
-    uefi_version = get_uefi_version(args.uefi_version_log)
+    if uefi_version_log is None:
+        uefi_version_log = args.uefi_version_log
+    uefi_version = get_uefi_version(uefi_version_log)
     system_info['UEFI Version'] = uefi_version
 
     # 3b) BMC firmware version from acs_info.json
@@ -975,25 +399,7 @@ if __name__ == "__main__":
         else:
             standalone_summary_content += "<hr/>\n" + capsule_update_summary_content
 
-    # 6) Collect the summary contents for each suite so we can get the fail/waiver counts (purely for printing)
-    suite_content_map = {
-        "BSA": read_html_content(args.bsa_summary_path),
-        "SBSA": read_html_content(args.sbsa_summary_path),
-        "FWTS": read_html_content(args.fwts_summary_path),
-        "SCT": read_html_content(args.sct_summary_path),
-        "SCMI": read_html_content(args.scmi_summary_path),
-        "SBMR-IB":  read_html_content(args.sbmr_ib_summary_path),
-        "SBMR-OOB": read_html_content(args.sbmr_oob_summary_path),
-        "BBSR-FWTS": read_html_content(args.bbsr_fwts_summary_path),
-        "BBSR-SCT": read_html_content(args.bbsr_sct_summary_path),
-        "BBSR-TPM": read_html_content(args.bbsr_tpm_summary_path),
-        "PFDI": read_html_content(args.pfdi_summary_path),
-        "POST-SCRIPT": read_html_content(args.post_script_summary_path),
-        "Standalone tests": standalone_summary_content,
-        "OS tests": read_html_content(args.OS_tests_summary_path)
-    }
-
-    # 8) Read overall compliance solely from merged JSON (if provided)
+    # 6) Read overall compliance solely from merged JSON (if provided)
     overall_compliance = "Unknown"
     mandatory_details = {"not_run": [], "failed": []}
     recommended_details = {"not_run": [], "failed": []}
@@ -1005,7 +411,7 @@ if __name__ == "__main__":
         print("Warning: merged JSON not provided or does not exist => Overall compliance unknown")
         overall_compliance, bbsr_compliance, scmi_compliance = "Unknown", "Unknown", "Unknown"
 
-    # 9) Prepare the dictionary that will be used in the final HTML
+    # 7) Prepare the dictionary that will be used in the final HTML
     acs_results_summary = {
         'Band': acs_config_info.get('Band', 'Unknown'),
         'Date': summary_generated_date,
@@ -1019,7 +425,7 @@ if __name__ == "__main__":
     if scmi_compliance:
         acs_results_summary['SCMI compliance results'] = scmi_compliance
 
-    # 10) Finally, generate the consolidated HTML page
+    # 8) Finally, generate the consolidated HTML page
     generate_html(
         system_info,
         acs_results_summary,
@@ -1037,8 +443,9 @@ if __name__ == "__main__":
         args.post_script_summary_path,
         args.standalone_summary_path,
         args.OS_tests_summary_path,
-        args.output_html_path
+        args.output_html_path,
+        stage_metrics=load_metrics(args.stage_metrics_json) if args.stage_metrics_json else None
     )
 
-    # Inject Test_suite_info into detailed HTMLs (no change to suite parsers)
-    inject_test_suite_info(args.merged_json, os.path.dirname(args.output_html_path))
+if __name__ == "__main__":
+    main()
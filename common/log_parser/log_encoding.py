@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Encoding detection shared by the log parsers.
+
+UEFI logs are usually UTF-16 (with or without a BOM) and Linux logs UTF-8,
+so both are recognised from the first bytes of the file. chardet is only
+consulted for anything else, and only on a bounded sample. Since the sample
+may not be representative of the rest of the file, bytes that do not decode
+in the detected encoding are read as latin-1 rather than dropped.
+
+A log is given as a path, as an archive member that opens like a path but
+is named by its path inside the archive (see results_archive.LogMember), or
+as an in-memory io.BytesIO named after its path. Every open of an in-memory
+log reads it from the start, as reopening a file would.
+"""
+
+import codecs
+import io
+import os
+
+# Bytes sampled from the start of a log to decide its encoding
+SAMPLE_SIZE = 64 * 1024
+
+# Error handler of open_log(): undecodable bytes are read as latin-1
+LATIN1_FALLBACK = "acs-latin-1-fallback"
+
+# Longest BOM first, since the UTF-32LE BOM starts with the UTF-16LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _latin1_fallback(exc):
+    if not isinstance(exc, UnicodeDecodeError):
+        raise exc
+    return exc.object[exc.start:exc.end].decode("latin-1"), exc.end
+
+
+codecs.register_error(LATIN1_FALLBACK, _latin1_fallback)
+
+
+def sniff_encoding(sample):
+    """Return the encoding of a log given the first bytes of it."""
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    # BOM-less UTF-16: ASCII text leaves every other byte NUL
+    nulls = sample.count(b"\x00")
+    if nulls > max(16, len(sample) // 10):
+        if sample[1::2].count(b"\x00") >= sample[0::2].count(b"\x00"):
+            return "utf-16-le"
+        return "utf-16-be"
+
+    # A plain ASCII sample says nothing about the rest of the file; UTF-8
+    # decodes it identically and keeps UTF-8 text further on (open_log()
+    # reads any other bytes as latin-1).
+    if sample.isascii():
+        return "utf-8"
+
+    # Only imported here: most logs never get this far, and the parsers that
+    # only ever see UTF-8 or UTF-16 logs then run without chardet installed
+    import chardet  # pylint: disable=import-outside-toplevel
+
+    encoding = chardet.detect(sample)["encoding"]
+    if not encoding or encoding.lower() == "ascii":
+        return "utf-8"
+    return encoding
+
+
+def log_name(source):
+    """Return the path of a log, for messages and path-based checks."""
+    if isinstance(source, io.BytesIO) or getattr(source, "archive_member", False):
+        return getattr(source, "name", "")
+    return os.fspath(source)
+
+
+def log_exists(source):
+    """True if the log can be opened: an in-memory log, or an existing file."""
+    return isinstance(source, io.BytesIO) or os.path.isfile(source)
+
+
+def _open_binary(source):
+    if isinstance(source, io.BytesIO):
+        # A new stream over the same buffer; getvalue() does not copy it
+        return io.BytesIO(source.getvalue())
+    return open(source, "rb")
+
+
+def open_text(source, encoding=None, errors=None):
+    """Open a log for reading as text, like open(path, "r", encoding=..., errors=...)."""
+    if isinstance(source, io.BytesIO):
+        return io.TextIOWrapper(_open_binary(source), encoding=encoding, errors=errors)
+    return open(source, "r", encoding=encoding, errors=errors)
+
+
+def detect_file_encoding(file_path):
+    """Return the encoding of a log file, reading at most SAMPLE_SIZE bytes."""
+    with _open_binary(file_path) as f:
+        return sniff_encoding(f.read(SAMPLE_SIZE))
+
+
+def open_log(file_path, errors=LATIN1_FALLBACK):
+    """
+    Open a log file for reading as text in its detected encoding.
+
+    The sample is taken from the read buffer, so the file is only read once.
+    Text past the sample that is not valid in the detected encoding, e.g.
+    Windows-1252 after an ASCII start, is read as latin-1.
+    """
+    if isinstance(file_path, io.BytesIO):
+        raw = _open_binary(file_path)
+        encoding = sniff_encoding(raw.getvalue()[:SAMPLE_SIZE])
+        return io.TextIOWrapper(raw, encoding=encoding, errors=errors)
+    raw = open(file_path, "rb", buffering=SAMPLE_SIZE)
+    try:
+        encoding = sniff_encoding(raw.peek(SAMPLE_SIZE)[:SAMPLE_SIZE])
+        return io.TextIOWrapper(raw, encoding=encoding, errors=errors)
+    except Exception:
+        raw.close()
+        raise
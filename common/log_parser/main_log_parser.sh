@@ -31,6 +31,17 @@ if [ $# -lt 1 ]; then
     exit 1
 fi
 
+# A .tar.gz/.zip of the results is read in place, without extracting it, by
+# the single-process driver; reports go next to the archive. The suffixes are
+# those of results_archive.ARCHIVE_SUFFIXES.
+if [ -f "$1" ]; then
+    case "${1,,}" in
+        *.tar.gz|*.tgz|*.tar.bz2|*.tbz2|*.tar.xz|*.txz|*.tar|*.zip)
+            exec python3 "$SCRIPTS_PATH/run_log_parser.py" "$@"
+            ;;
+    esac
+fi
+
 # Add the YOCTO_FLAG variable
 YOCTO_FLAG="/mnt/yocto_image.flag"
 
@@ -80,6 +91,19 @@ JSONS_DIR="$ACS_SUMMARY_DIR/acs_jsons"
 mkdir -p "$ACS_SUMMARY_DIR"
 mkdir -p "$JSONS_DIR"
 
+# With ACS_STAGE_METRICS=1, every python3 step below runs through
+# stage_metrics.py, which records its wall time, CPU time, peak RSS and I/O
+# bytes in stage_metrics.json. It is off by default, as it starts a second
+# interpreter for each step.
+STAGE_METRICS_JSON="$ACS_SUMMARY_DIR/stage_metrics.json"
+rm -f "$STAGE_METRICS_JSON"
+if [ "$ACS_STAGE_METRICS" = "1" ]; then
+    python3() {
+        command python3 "$SCRIPTS_PATH/stage_metrics.py" run --metrics "$STAGE_METRICS_JSON" \
+            --scripts-path "$SCRIPTS_PATH" -- "$@"
+    }
+fi
+
 #echo "Gathering ACS info into acs_info.txt and acs_info.json..."
 IPMITOOL_LOG="$LOGS_PATH/linux_dump/ipmitool.txt"
 PSCI_KERNEL_LOG="$LOGS_PATH/linux_tools/psci/psci_kernel.log"
@@ -135,13 +159,21 @@ print_missing_json() {
     fi
 }
 
-# Function to apply waivers
+# Function to apply waivers; all JSON files given for a suite are waived by
+# one apply_waivers.py run, which reads waiver.json only once
 apply_waivers() {
     local suite_name="$1"
-    local json_file="$2"
-
-    if [ "$WAIVERS_APPLIED" -eq 1 ]; then
-        python3 "$SCRIPTS_PATH/apply_waivers.py" "$suite_name" "$json_file" "$WAIVER_JSON" "$test_category" --quiet
+    shift
+
+    if [ "$WAIVERS_APPLIED" -eq 1 ] && [ $# -gt 0 ]; then
+        local json_file="$1"
+        local more_jsons=()
+        local extra_json
+        shift
+        for extra_json in "$@"; do
+            more_jsons+=(--suite-json "$suite_name" "$extra_json")
+        done
+        python3 "$SCRIPTS_PATH/apply_waivers.py" "$suite_name" "$json_file" "$WAIVER_JSON" "$test_category" "${more_jsons[@]}" --quiet
     fi
 }
 
@@ -412,6 +444,7 @@ if [ "$YOCTO_FLAG_PRESENT" -eq 0 ]; then
     # Reset flags
     SBMR_IB_PROCESSED=0
     SBMR_OOB_PROCESSED=0
+    SBMR_WAIVER_JSONS=()
 
     # Parse IB
     if check_file "$SBMR_IB_XML" "M"; then
@@ -421,7 +454,7 @@ if [ "$YOCTO_FLAG_PRESENT" -eq 0 ]; then
             SBMR_IB_PROCESSED=0
             echo -e "${RED}ERROR: SBMR IB logs parsing to json failed.${NC}"
         else
-            apply_waivers "SBMR" "$SBMR_IB_JSON"
+            SBMR_WAIVER_JSONS+=("$SBMR_IB_JSON")
         fi
     fi
 
@@ -433,10 +466,12 @@ if [ "$YOCTO_FLAG_PRESENT" -eq 0 ]; then
             SBMR_OOB_PROCESSED=0
             echo -e "${RED}ERROR: SBMR OOB logs parsing to json failed.${NC}"
         else
-            apply_waivers "SBMR" "$SBMR_OOB_JSON"
+            SBMR_WAIVER_JSONS+=("$SBMR_OOB_JSON")
         fi
     fi
 
+    apply_waivers "SBMR" "${SBMR_WAIVER_JSONS[@]}"
+
     # Generate separate HTMLs per band
     if [ $SBMR_IB_PROCESSED -eq 1 ]; then
         python3 "$SCRIPTS_PATH/sbmr/json_to_html.py" \
@@ -486,6 +521,8 @@ fi
 if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
     LINUX_TOOLS_LOGS_PATH="$LOGS_PATH/linux_tools"
     Standalone_JSONS=()
+    # Waived together just before the HTML is generated
+    Standalone_WAIVER_JSONS=()
 
     # 1) DT_KSELFTEST
     DT_KSELFTEST_LOG="$LINUX_TOOLS_LOGS_PATH/dt_kselftest.log"
@@ -495,7 +532,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             "$DT_KSELFTEST_LOG" \
             "$DT_KSELFTEST_JSON"
         Standalone_JSONS+=("$DT_KSELFTEST_JSON")
-        apply_waivers "Standalone" "$DT_KSELFTEST_JSON"
+        Standalone_WAIVER_JSONS+=("$DT_KSELFTEST_JSON")
     fi
 
     # 2) DT_VALIDATE
@@ -506,7 +543,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             "$DT_VALIDATE_LOG" \
             "$DT_VALIDATE_JSON"
         Standalone_JSONS+=("$DT_VALIDATE_JSON")
-        apply_waivers "Standalone" "$DT_VALIDATE_JSON"
+        Standalone_WAIVER_JSONS+=("$DT_VALIDATE_JSON")
     fi
 
     # 3) ETHTOOL_TEST
@@ -517,7 +554,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             "$ETHTOOL_TEST_LOG" \
             "$ETHTOOL_TEST_JSON"
         Standalone_JSONS+=("$ETHTOOL_TEST_JSON")
-        apply_waivers "Standalone" "$ETHTOOL_TEST_JSON"
+        Standalone_WAIVER_JSONS+=("$ETHTOOL_TEST_JSON")
     fi
 
     # 4) READ_WRITE_CHECK
@@ -528,7 +565,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             "$READ_WRITE_CHECK_LOG" \
             "$READ_WRITE_CHECK_JSON"
         Standalone_JSONS+=("$READ_WRITE_CHECK_JSON")
-        apply_waivers "Standalone" "$READ_WRITE_CHECK_JSON"
+        Standalone_WAIVER_JSONS+=("$READ_WRITE_CHECK_JSON")
     fi
 
     # 5) CAPSULE UPDATE => parse as standalone
@@ -548,7 +585,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
 
         if [ -f "$CAPSULE_JSON" ]; then
             CAPSULE_PROCESSED=1
-            apply_waivers "Standalone" "$CAPSULE_JSON"
+            Standalone_WAIVER_JSONS+=("$CAPSULE_JSON")
             Standalone_JSONS+=("$CAPSULE_JSON")
         else
             echo "WARNING: Capsule Update JSON not created."
@@ -579,7 +616,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             "$SMBIOS_JSON"
         # If parser succeeded, include in Standalone reports
         if [ $? -eq 0 ]; then
-            apply_waivers "Standalone" "$SMBIOS_JSON"
+            Standalone_WAIVER_JSONS+=("$SMBIOS_JSON")
             Standalone_JSONS+=("$SMBIOS_JSON")
         else
             echo -e "${RED}ERROR: SMBIOS log parsing to json failed.${NC}"
@@ -596,7 +633,7 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             "$NETWORK_BOOT_LOG" \
             "$NETWORK_BOOT_JSON"
         if [ $? -eq 0 ]; then
-            apply_waivers "Standalone" "$NETWORK_BOOT_JSON"
+            Standalone_WAIVER_JSONS+=("$NETWORK_BOOT_JSON")
             Standalone_JSONS+=("$NETWORK_BOOT_JSON")
         else
             echo -e "${RED}ERROR: Network boot log parsing to json failed.${NC}"
@@ -611,13 +648,15 @@ if [ $YOCTO_FLAG_PRESENT -eq 1 ]; then
             "$RUNTIME_DEV_MAP_LOG" \
             "$RUNTIME_DEV_MAP_JSON"
         if [ $? -eq 0 ]; then
-            apply_waivers "Standalone" "$RUNTIME_DEV_MAP_JSON"
+            Standalone_WAIVER_JSONS+=("$RUNTIME_DEV_MAP_JSON")
             Standalone_JSONS+=("$RUNTIME_DEV_MAP_JSON")
         else
             echo -e "${RED}ERROR: Runtime device mapping log parsing to json failed.${NC}"
         fi
     fi
 
+    apply_waivers "Standalone" "${Standalone_WAIVER_JSONS[@]}"
+
     # Now generate a single STANDALONE HTML
     if [ ${#Standalone_JSONS[@]} -gt 0 ]; then
         Standalone_PROCESSED=1
@@ -990,6 +1029,11 @@ if [ -f "$MERGED_JSON" ]; then
     GENERATE_ACS_SUMMARY_CMD+=" --merged_json \"$MERGED_JSON\""
 fi
 
+# Stage timings of the steps so far, if asked for (ACS_STAGE_METRICS_HTML=1)
+if [ "$ACS_STAGE_METRICS_HTML" = "1" ] && [ -f "$STAGE_METRICS_JSON" ]; then
+    GENERATE_ACS_SUMMARY_CMD+=" --stage_metrics_json \"$STAGE_METRICS_JSON\""
+fi
+
 # Finally, call generate_acs_summary.py exactly ONCE at the end
 eval "$GENERATE_ACS_SUMMARY_CMD"
 
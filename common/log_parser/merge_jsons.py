@@ -15,9 +15,12 @@
 # limitations under the License.
 
 import json
-from collections import OrderedDict
+from json.encoder import encode_basestring_ascii
 import argparse
 import os
+import tempfile
+
+from fail_counts import count_fails, recorded_fail_counts
 
 # Define color codes
 RED = "\033[91m"
@@ -100,89 +103,38 @@ def compliance_label(suite_name: str) -> str:
     return f"Suite_Name: {tag}  : {suite_name}_compliance"
 
 
-def reformat_json(json_file_path):
+def load_json(json_file_path, reformat=False):
     """
-    Re-format (pretty-print) the file to confirm it's valid JSON.
+    Load a JSON file, validating it in the same single read.
+
+    With reformat, the file is also rewritten pretty-printed (indent=4), as
+    merge used to do for every input. Raises FileNotFoundError or
+    json.JSONDecodeError.
     """
-    try:
-        with open(json_file_path, 'r') as jf:
-            data = json.load(jf)
+    with open(json_file_path, 'r') as jf:
+        data = json.load(jf)
+    if reformat:
         with open(json_file_path, 'w') as jf:
             json.dump(data, jf, indent=4)
-    except FileNotFoundError:
-        raise
-    except json.JSONDecodeError:
-        print(f"Warning: {json_file_path} is invalid JSON. Skipping.")
+    return data
 
-def count_fails_in_json(data):
+def suite_fail_counts(data, verify=False, source="<data>"):
     """
-    Inspect JSON data and count how many tests are 'FAILED' vs 'FAILED_WITH_WAIVER'.
-    Returns (failed, failed_with_waiver).
-
-    Expects a structure with top-level 'test_results' => [ {subtests: [...]} ]
-    or a top-level list for subtests. If not recognized, returns (0,0).
+    Return (failed, failed_with_waiver) for one suite's data.
 
+    The counts the parsers and apply_waivers recorded in suite_summary are
+    used when present; data without them is walked with count_fails(). With
+    verify, the data is always walked and a recorded count that disagrees
+    is reported and replaced by the walked one.
     """
-    total_failed = 0
-    total_failed_with_waiver = 0
-
-    if isinstance(data, dict) and "test_results" in data:
-        test_results = data["test_results"]
-    elif isinstance(data, list):
-        test_results = data
-    else:
-        return (0, 0)  # no recognized substructure
-
-    if not isinstance(test_results, list):
-        return (0, 0)
-
-    for suite_entry in test_results:
-        # If testcases exist, count only testcase-level results to avoid double counting.
-        testcases = suite_entry.get("testcases", [])
-        if testcases:
-            for testcase in testcases:
-                test_result = testcase.get("Test_result", "")
-                if isinstance(test_result, str):
-                    if "FAILED" in test_result.upper() or "FAILURE" in test_result.upper() or "FAIL" in test_result.upper():
-                        if "(WITH WAIVER)" in test_result.upper():
-                            total_failed_with_waiver += 1
-                        else:
-                            total_failed += 1
-        else:
-            # Standard structure: subtests at suite level
-            subtests = suite_entry.get("subtests", [])
-            for sub in subtests:
-                res = sub.get("sub_test_result")
-                if isinstance(res, dict):
-                    # e.g. { "FAILED": 1, "FAILED_WITH_WAIVER": 1, ... }
-                    f = res.get("FAILED", 0)
-                    fw = res.get("FAILED_WITH_WAIVER", 0)
-                    total_failed += f
-                    total_failed_with_waiver += fw
-                elif isinstance(res, str):
-                    # e.g. "FAILED (WITH WAIVER)"
-                    if "FAILED" in res.upper() or "FAILURE" in res.upper() or "FAIL" in res.upper():
-                        if "(WITH WAIVER)" in res.upper():
-                            total_failed_with_waiver += 1
-                        else:
-                            total_failed += 1
-        # SBMR nested structure
-        for case in suite_entry.get("Test_cases", []):
-            for sub in case.get("subtests", []):
-                res = sub.get("sub_test_result")
-                if isinstance(res, dict):
-                    f = res.get("FAILED", 0)
-                    fw = res.get("FAILED_WITH_WAIVER", 0)
-                    total_failed += f
-                    total_failed_with_waiver += fw
-                elif isinstance(res, str):
-                    if "FAILED" in res.upper() or "FAILURE" in res.upper() or "FAIL" in res.upper():
-                        if "(WITH WAIVER)" in res.upper():
-                            total_failed_with_waiver += 1
-                        else:
-                            total_failed += 1
-
-    return (total_failed, total_failed_with_waiver)
+    recorded = recorded_fail_counts(data)
+    if recorded is not None and not verify:
+        return recorded
+    counted = count_fails(data)
+    if recorded is not None and recorded != counted:
+        print(f"{YELLOW}Warning: {source}: recorded failure counts {recorded} "
+              f"do not match the results {counted}; using the results.{RESET}")
+    return counted
 
 def _get_suite_summary(d):
     if isinstance(d, dict):
@@ -241,37 +193,176 @@ def build_testcategory_dict(category_data):
 
 test_cat_dict = build_testcategory_dict(test_category_data)
 
-def recursive_sort(obj):
-    if isinstance(obj, dict):
-        # Maintain priority: "Test_suite" first, "Sub_test_suite" second, "subtests" last
-        priority_first = ["Test_suite", "Test_sub_suite"]
-        priority_last = ["subtests"]
-
-        def sort_key(k):
-            k_lower = k.lower()
-            if k in priority_first:
-                # Force these to the top, in defined order
-                return (0, priority_first.index(k))
-            elif k in priority_last:
-                # Force these to the end
-                return (2, 0)
-            else:
-                # Everything else goes in the middle alphabetically
-                return (1, k_lower)
-
-        return OrderedDict(
-            (k, recursive_sort(v))
-            for k, v in sorted(obj.items(), key=lambda kv: sort_key(kv[0]))
-        )
+# Merged JSON key order: "Test_suite" and "Test_sub_suite" first, "subtests"
+# last, everything else alphabetically (case-insensitive)
+KEY_PRIORITY_FIRST = ["Test_suite", "Test_sub_suite"]
+KEY_PRIORITY_LAST = ["subtests"]
+# Characters copied per read when a spooled section is written out
+SPOOL_COPY_CHARS = 1 << 20
+
+def merged_key_order(item):
+    """Sort key for a (key, value) pair of a merged JSON object."""
+    k = item[0]
+    if k in KEY_PRIORITY_FIRST:
+        return (0, KEY_PRIORITY_FIRST.index(k))
+    if k in KEY_PRIORITY_LAST:
+        return (2, 0)
+    return (1, k.lower())
+
+def _encode_scalar(value):
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        # Same spelling as json.dump for the non-finite values
+        if value != value:
+            return 'NaN'
+        if value in (float('inf'), float('-inf')):
+            return 'Infinity' if value > 0 else '-Infinity'
+        return float.__repr__(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def iter_sorted_json(obj, indent=4, level=0):
+    """
+    Yield the JSON text of obj in chunks, with the keys of every object in
+    merged_key_order.
 
-    elif isinstance(obj, list):
-        return [recursive_sort(v) for v in obj]
+    The output is what json.dump() writes for a copy of obj with its keys
+    sorted that way (indent=None writes it compact), but keys are sorted
+    object by object while writing, so obj is not copied. level is the
+    indentation level obj starts at.
+    """
+    if isinstance(obj, dict):
+        if not obj:
+            yield '{}'
+            return
+        items = sorted(obj.items(), key=merged_key_order)
+        opening, closing = '{', '}'
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            yield '[]'
+            return
+        items = obj
+        opening, closing = '[', ']'
+    else:
+        yield _encode_scalar(obj)
+        return
+
+    if indent is None:
+        separator = ','
+        key_separator = ':'
+        opening_line = opening
+        closing_line = closing
     else:
-        return obj
+        pad = ' ' * indent
+        newline = '\n' + pad * (level + 1)
+        separator = ',' + newline
+        key_separator = ': '
+        opening_line = opening + newline
+        closing_line = '\n' + pad * level + closing
+
+    prefix = opening_line
+    is_object = opening == '{'
+    for item in items:
+        if is_object:
+            key, value = item
+            prefix += encode_basestring_ascii(key) + key_separator
+        else:
+            value = item
+        if isinstance(value, (dict, list, tuple)):
+            yield prefix
+            yield from iter_sorted_json(value, indent, level + 1)
+        else:
+            yield prefix + _encode_scalar(value)
+        prefix = separator
+    yield closing_line
 
-def merge_json_files(json_files, output_file):
-    merged_results = {}
+class SectionSpool:
+    """
+    Encoded suite sections kept in a temporary file until the merged JSON
+    is written, so only one suite's data is held in memory at a time.
+    """
+
+    def __init__(self, indent):
+        self.indent = indent
+        self.file = tempfile.TemporaryFile(mode='w+', encoding='ascii')
+
+    def add(self, values, level):
+        """Spool values, joined as array items at level; return their span."""
+        start = self.file.tell()
+        length = 0
+        item_separator = ',' if self.indent is None else ',\n' + ' ' * (self.indent * level)
+        for index, value in enumerate(values):
+            if index:
+                self.file.write(item_separator)
+                length += len(item_separator)
+            for chunk in iter_sorted_json(value, self.indent, level):
+                self.file.write(chunk)
+                length += len(chunk)
+        return start, length
+
+    def copy_to(self, span, out):
+        start, length = span
+        self.file.seek(start)
+        while length > 0:
+            chunk = self.file.read(min(length, SPOOL_COPY_CHARS))
+            out.write(chunk)
+            length -= len(chunk)
+        self.file.seek(0, os.SEEK_END)
+
+    def close(self):
+        self.file.close()
+
+def merge_json_files(json_files, output_file, preloaded=None, compact=False, reformat_inputs=False,
+                     verify_counts=False):
+    # preloaded maps a path in json_files to its already-parsed data, letting
+    # in-process callers skip reading that file. compact writes output_file
+    # without indentation; reformat_inputs rewrites each input JSON read from
+    # disk pretty-printed. verify_counts checks the failure counts recorded
+    # in each suite_summary against the results (see suite_fail_counts).
+    preloaded = preloaded or {}
     suite_fail_data = {}
+    indent = None if compact else 4
+
+    RENAME_SUITES_TO_STANDALONE = {
+        "Suite_Name: DT Kselftest": "Suite_Name: Standalone",
+        "Suite_Name: CAPSULE_UPDATE": "Suite_Name: Standalone",
+        "Suite_Name: DT Validate": "Suite_Name: Standalone",
+        "Suite_Name: Ethtool Test": "Suite_Name: Standalone",
+        "Suite_Name: Read Write Check Block Devices": "Suite_Name: Standalone",
+        "Suite_Name: PSCI": "Suite_Name: Standalone",
+        "Suite_Name: SMBIOS": "Suite_Name: Standalone",
+        "Suite_Name: Network boot": "Suite_Name: Standalone",
+        "Suite_Name: Runtime device mapping": "Suite_Name: Standalone"
+    }
+
+    def _entry_to_list(entry):
+        if isinstance(entry, list):
+            return entry
+        if (
+            isinstance(entry, dict)
+            and "test_results" in entry
+            and isinstance(entry["test_results"], list)
+        ):
+            return entry["test_results"]
+        return [entry]
+
+    # Each suite's data is encoded into the spool as soon as it has been
+    # counted, so only one suite is held in memory at a time. sections maps
+    # a section name to its span in the spool (the last file of a suite
+    # wins); standalone_parts does the same for the sub-suites that end up
+    # in "Suite_Name: Standalone", encoded as items of that list.
+    spool = SectionSpool(indent)
+    sections = {}
+    standalone_parts = {}
+    acs_info_section = None
 
     # We'll store the "acs_info" data in acs_info_data (if found)
     acs_info_path = None
@@ -285,12 +376,18 @@ def merge_json_files(json_files, output_file):
     acs_info_data = None
     acs_results_summary = None
 
-    if acs_info_path and os.path.isfile(acs_info_path):
+    if acs_info_path in preloaded:
+        acs_info_data = preloaded[acs_info_path]
+        acs_info_section = acs_info_data
+        if isinstance(acs_info_data, dict):
+            acs_results_summary = acs_info_data.get("ACS Results Summary")
+            if not isinstance(acs_results_summary, dict):
+                acs_results_summary = {}
+                acs_info_data["ACS Results Summary"] = acs_results_summary
+    elif acs_info_path and os.path.isfile(acs_info_path):
         try:
-            reformat_json(acs_info_path)
-            with open(acs_info_path, 'r') as f:
-                acs_info_data = json.load(f)
-            merged_results["Suite_Name: acs_info"] = acs_info_data
+            acs_info_data = load_json(acs_info_path, reformat_inputs)
+            acs_info_section = acs_info_data
 
             if isinstance(acs_info_data, dict):
                 acs_results_summary = acs_info_data.get("ACS Results Summary")
@@ -302,28 +399,24 @@ def merge_json_files(json_files, output_file):
 
     if not acs_results_summary:
         acs_results_summary = {}
-        merged_results["Suite_Name: acs_info"] = {
+        acs_info_section = {
             "ACS Results Summary": acs_results_summary
         }
 
     os_logs_found = 0
     # Step 2) Process each suite JSON
     for json_path in new_json_files:
-        if not os.path.isfile(json_path):
+        if json_path in preloaded:
+            data = preloaded[json_path]
+        elif not os.path.isfile(json_path):
             print(f"Warning: {json_path} not found. Skipping.")
             continue
-
-        try:
-            reformat_json(json_path)
-        except json.JSONDecodeError:
-            continue
-
-        try:
-            with open(json_path, 'r') as jf:
-                data = json.load(jf)
-        except (FileNotFoundError, json.JSONDecodeError):
-            print(f"Warning: {json_path} is invalid JSON. Skipping.")
-            continue
+        else:
+            try:
+                data = load_json(json_path, reformat_inputs)
+            except (FileNotFoundError, json.JSONDecodeError):
+                print(f"Warning: {json_path} is invalid JSON. Skipping.")
+                continue
 
         # Identify suite name from filename
         fn = os.path.basename(json_path).upper()
@@ -481,9 +574,8 @@ def merge_json_files(json_files, output_file):
                                 temp[key] = val
                         ts_dict.clear()
                         ts_dict.update(temp)
-        merged_results[section_name] = data
 
-        f, fw = count_fails_in_json(data)
+        f, fw = suite_fail_counts(data, verify_counts, json_path)
         if suite_key in suite_fail_data:
             suite_fail_data[suite_key]["Failed"] += f
             suite_fail_data[suite_key]["Failed_with_Waiver"] += fw
@@ -492,6 +584,13 @@ def merge_json_files(json_files, output_file):
                 "Failed": f,
                 "Failed_with_Waiver": fw
             }
+
+        if section_name in RENAME_SUITES_TO_STANDALONE:
+            entries = _entry_to_list(data)
+            standalone_parts[section_name] = spool.add(entries, 2) if entries else None
+        else:
+            sections[section_name] = spool.add([data], 1)
+        del data, data_list
     # --- ensure labels use the right Mandatory/Recommended tags for this mode ---
     base_table = DT_SRS_SCOPE_TABLE if DT_OR_SR_MODE == "DT" else SR_SRS_SCOPE_TABLE
     for n, r in base_table:
@@ -527,7 +626,7 @@ def merge_json_files(json_files, output_file):
     if acs_info_data and isinstance(acs_info_data, dict):
         acs_results_summary = acs_info_data.get("ACS Results Summary", {})
     else:
-        acs_results_summary = merged_results["Suite_Name: acs_info"].get("ACS Results Summary", {})
+        acs_results_summary = acs_info_section.get("ACS Results Summary", {})
 
     for suite_name, requirement in mandatory_suites:
         if suite_name not in suite_fail_data:
@@ -729,44 +828,48 @@ def merge_json_files(json_files, output_file):
             else:
                 acs_results_summary["SCMI compliance results"] = scmi_status
 
-    merged_results["Suite_Name: acs_info"]["ACS Results Summary"]["BBSR compliance results"] = (acs_results_summary.pop("BBSR compliance results", None))
+    acs_info_section["ACS Results Summary"]["BBSR compliance results"] = (acs_results_summary.pop("BBSR compliance results", None))
     if DT_OR_SR_MODE == "DT":
-        merged_results["Suite_Name: acs_info"]["ACS Results Summary"]["SCMI compliance results"] = (acs_results_summary.pop("SCMI compliance results", None))
-
-    RENAME_SUITES_TO_STANDALONE = {
-        "Suite_Name: DT Kselftest": "Suite_Name: Standalone",
-        "Suite_Name: CAPSULE_UPDATE": "Suite_Name: Standalone",
-        "Suite_Name: DT Validate": "Suite_Name: Standalone",
-        "Suite_Name: Ethtool Test": "Suite_Name: Standalone",
-        "Suite_Name: Read Write Check Block Devices": "Suite_Name: Standalone",
-        "Suite_Name: PSCI": "Suite_Name: Standalone",
-        "Suite_Name: SMBIOS": "Suite_Name: Standalone",
-        "Suite_Name: Network boot": "Suite_Name: Standalone",
-        "Suite_Name: Runtime device mapping": "Suite_Name: Standalone"
-    }
-
-    def _entry_to_list(entry):
-        if isinstance(entry, list):
-            return entry
-        if (
-            isinstance(entry, dict)
-            and "test_results" in entry
-            and isinstance(entry["test_results"], list)
-        ):
-            return entry["test_results"]
-        return [entry]
-
-    for old_key, new_key in RENAME_SUITES_TO_STANDALONE.items():
-        if old_key in merged_results:
-            old_data_list = _entry_to_list(merged_results.pop(old_key))
-            merged_results.setdefault(new_key, [])
-            merged_results[new_key].extend(old_data_list)
-
-    # Recursive alphabetical sorting of entire JSON
-    merged_results = recursive_sort(merged_results)
-
+        acs_info_section["ACS Results Summary"]["SCMI compliance results"] = (acs_results_summary.pop("SCMI compliance results", None))
+
+    # Standalone sub-suites are listed in RENAME_SUITES_TO_STANDALONE order
+    standalone = [standalone_parts[key] for key in RENAME_SUITES_TO_STANDALONE
+                  if key in standalone_parts]
+    top_level = {"Suite_Name: acs_info": None}
+    top_level.update(dict.fromkeys(sections))
+    if standalone:
+        top_level["Suite_Name: Standalone"] = None
+
+    # Write the top-level object with its keys in merged_key_order, copying
+    # each suite section from the spool
+    def newline(level):
+        return "" if indent is None else "\n" + " " * (indent * level)
+
+    key_separator = ":" if indent is None else ": "
     with open(output_file, 'w') as outj:
-        json.dump(merged_results, outj, indent=4)
+        outj.write("{")
+        for index, key in enumerate(sorted(top_level, key=lambda k: merged_key_order((k, None)))):
+            if index:
+                outj.write(",")
+            outj.write(newline(1) + encode_basestring_ascii(key) + key_separator)
+            if key == "Suite_Name: acs_info":
+                for chunk in iter_sorted_json(acs_info_section, indent, 1):
+                    outj.write(chunk)
+            elif key == "Suite_Name: Standalone":
+                parts = [span for span in standalone if span is not None]
+                if not parts:
+                    outj.write("[]")
+                    continue
+                outj.write("[" + newline(2))
+                for part_index, span in enumerate(parts):
+                    if part_index:
+                        outj.write("," + newline(2))
+                    spool.copy_to(span, outj)
+                outj.write(newline(1) + "]")
+            else:
+                spool.copy_to(sections[key], outj)
+        outj.write(newline(0) + "}")
+    spool.close()
 
 def main():
     parser = argparse.ArgumentParser(
@@ -775,9 +878,17 @@ def main():
     parser.add_argument("output_file", help="Output merged JSON file")
     parser.add_argument("json_files", nargs='+',
                         help="List of JSON files to merge (including acs_info.json if present)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write the merged JSON without indentation or spaces")
+    parser.add_argument("--reformat-inputs", action="store_true",
+                        help="Also rewrite each input JSON pretty-printed (indent=4)")
+    parser.add_argument("--verify-counts", action="store_true",
+                        help="Recount failures from the results instead of trusting suite_summary")
     args = parser.parse_args()
 
-    merge_json_files(args.json_files, args.output_file)
+    merge_json_files(args.json_files, args.output_file,
+                     compact=args.compact, reformat_inputs=args.reformat_inputs,
+                     verify_counts=args.verify_counts)
 
 if __name__ == "__main__":
     main()
@@ -19,6 +19,16 @@ import re
 import json
 import os
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import store_fail_counts
+from log_encoding import open_text
+# pylint: enable=wrong-import-position
+
 ansi_escape = re.compile(r'\x1B\[[0-9;]*[A-Za-z]')
 
 def create_subtest(subtest_number, description, status, reason=""):
@@ -344,9 +354,11 @@ def parse_ethtool_test_log(log_data, os_name):
     }
 
 def parse_log(log_file_path, os_name):
-    with open(log_file_path, 'r') as f:
+    with open_text(log_file_path) as f:
         log_data = f.readlines()
-    return parse_ethtool_test_log(log_data, os_name)
+    data = parse_ethtool_test_log(log_data, os_name)
+    # Each FAILED subtest holds one failure, already counted in total_failed
+    return store_fail_counts(data, data["suite_summary"]["total_failed"], 0)
 
 if __name__ == "__main__":
     if len(sys.argv) != 4:
@@ -18,6 +18,16 @@ import json
 import os
 import sys
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import store_fail_counts
+from log_encoding import log_exists, log_name, open_text
+# pylint: enable=wrong-import-position
+
 OS_RELEASE_FILE_NAME = "cat-etc-os-release.txt"
 
 def create_subtest(subtest_number, description, status, reason=""):
@@ -63,7 +73,7 @@ def collect_os_release_files(os_logs_path):
 
 def os_dir_from_release_path(os_logs_path, release_path):
     try:
-        rel_path = os.path.relpath(release_path, os_logs_path)
+        rel_path = os.path.relpath(log_name(release_path), os_logs_path)
     except ValueError:
         return None
     parts = rel_path.split(os.sep)
@@ -73,7 +83,7 @@ def parse_os_release(os_release_path):
     name = None
     version_id = None
     try:
-        with open(os_release_path, "r", encoding="utf-8") as handle:
+        with open_text(os_release_path, encoding="utf-8") as handle:
             for line in handle:
                 line = line.strip()
                 if line.startswith("NAME=") and name is None:
@@ -88,10 +98,10 @@ def parse_os_release(os_release_path):
 
 def parse_post_script_errors(log_path, tokens):
     errors = []
-    if not os.path.isfile(log_path):
+    if not log_exists(log_path):
         return errors
     tokens_lower = [t.lower() for t in tokens if t]
-    with open(log_path, "r", encoding="utf-8") as handle:
+    with open_text(log_path, encoding="utf-8") as handle:
         for line in handle:
             if not line.startswith("ERROR"):
                 continue
@@ -100,7 +110,11 @@ def parse_post_script_errors(log_path, tokens):
                 errors.append(line.strip())
     return errors
 
-def build_results(os_logs_path, post_script_log):
+def build_results(os_logs_path, post_script_log, release_files=None):
+    """
+    Build the OS test results. release_files lists the os-release logs below
+    os_logs_path (paths or in-memory logs); by default they are searched for.
+    """
     suite_summary = {
         "total_passed": 0,
         "total_failed": 0,
@@ -125,7 +139,9 @@ def build_results(os_logs_path, post_script_log):
     sle_info = None
     all_os_dirs = set()
 
-    for release_path in collect_os_release_files(os_logs_path):
+    if release_files is None:
+        release_files = collect_os_release_files(os_logs_path)
+    for release_path in release_files:
         name, version_id = parse_os_release(release_path)
         if not name or not version_id:
             continue
@@ -157,8 +173,8 @@ def build_results(os_logs_path, post_script_log):
     add_presence_subtest("SLE", sle_info)
 
     errors = parse_post_script_errors(post_script_log, ["os-logs"])
-    if not os.path.isfile(post_script_log):
-        desc = f"post-script.log not found at {post_script_log}"
+    if not log_exists(post_script_log):
+        desc = f"post-script.log not found at {log_name(post_script_log)}"
         sub = create_subtest(subtest_number, desc, "FAILED", "post-script.log missing")
         test_suite["subtests"].append(sub)
         update_suite_summary(test_suite["test_suite_summary"], "FAILED")
@@ -199,10 +215,11 @@ def build_results(os_logs_path, post_script_log):
         "total_warnings": test_suite["test_suite_summary"]["total_warnings"]
     }
 
-    return {
+    # Each FAILED subtest holds one failure, already counted in total_failed
+    return store_fail_counts({
         "test_results": [test_suite],
         "suite_summary": suite_summary
-    }
+    }, suite_summary["total_failed"], 0)
 
 def main():
     if len(sys.argv) != 4:
@@ -15,13 +15,22 @@
 # limitations under the License.
 
 import argparse
-import chardet
 import json
+import os
 import re
 from collections import defaultdict
 from pathlib import Path
 import sys
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from log_encoding import open_log
+# pylint: enable=wrong-import-position
+
 RESULT_MAP = {
     "PASS": "PASSED",
     "PASSED": "PASSED",
@@ -35,10 +44,6 @@ RESULT_MAP = {
     "WARNING": "WARNING",
 }
 
-def detect_file_encoding(path: Path) -> str:
-    raw = path.read_bytes()
-    return chardet.detect(raw)["encoding"] or "utf‑8"
-
 def parse_files(input_files, output_file):
     processing = False
     in_test = False
@@ -57,9 +62,8 @@ def parse_files(input_files, output_file):
 
     for file_name in input_files:
         path = Path(file_name)
-        enc = detect_file_encoding(path)
 
-        with path.open("r", encoding=enc, errors="ignore") as fh:
+        with open_log(path) as fh:
             lines = fh.read().splitlines()
 
         i = 0
@@ -15,12 +15,20 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Template
+import os
 import sys
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from report_templates import render_to_file
+from suite_info import suite_info_for_page
+from summary_chart import bar_chart_html
+# pylint: enable=wrong-import-position
+
 # Helper function for case-insensitive dictionary get
 def get_case_insensitive(d, key, default=0):
     for k, v in d.items():
@@ -44,274 +52,9 @@ def generate_bar_chart(suite_summary):
     # Same color array as FWTS
     colors = ['#d4edda', '#f8d7da', '#f39c12', '#9e9e9e', '#ffe0b2', '#fff3cd']
 
-    plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    total_tests = sum(sizes)
-    max_size = max(sizes) if sizes else 0
-    for bar, size in zip(bars, sizes):
-        height = bar.get_height()
-        pct = (size / total_tests) * 100 if total_tests else 0
-        # Place the % label slightly above each bar
-        plt.text(
-            bar.get_x() + bar.get_width()/2,
-            height + (0.01 * max_size if max_size else 0.05),
-            f'{pct:.2f}%',
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('Post-Script Test Results Distribution', fontsize=18, fontweight='bold')
-    plt.ylabel('Total Count', fontsize=14)
-    plt.xticks(fontsize=12)
-    plt.yticks(fontsize=12)
-    plt.tight_layout()
-
-    # Convert plot to base64
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart_html(labels, sizes, colors, 'Post-Script Test Results Distribution')
 
 def generate_html(suite_summary, test_results, chart_data, output_html_path, is_summary_page=False):
-    template = Template(r"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Post-Script Test {{ "Summary" if is_summary_page else "Detailed Results" }}</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f4f4f4;
-        }
-        h1, h2, h3 {
-            color: #2c3e50;
-            text-align: center;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }
-        th, td {
-            padding: 12px;
-            border: 1px solid #ddd;
-            font-size: 16px;
-        }
-        th {
-            background-color: #3498db;
-            color: white;
-            font-weight: bold;
-            text-align: left;
-        }
-
-        /* Matching FWTS color classes */
-        .pass {
-            background-color: #d4edda;
-            font-weight: bold;
-        }
-        .fail {
-            background-color: #f8d7da;
-            font-weight: bold;
-        }
-        .fail-waiver {
-            background-color: #f39c12;
-            font-weight: bold;
-        }
-        .warning {
-            background-color: #fff3cd;
-            font-weight: bold;
-        }
-        .aborted {
-            background-color: #9e9e9e;
-            font-weight: bold;
-        }
-        .skipped {
-            background-color: #ffe0b2;
-            font-weight: bold;
-        }
-
-        .summary-container, .detailed-container {
-            margin-top: 40px;
-            padding: 20px;
-            background-color: #fff;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }
-        .summary-container h2 {
-            border-bottom: 2px solid #27ae60;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-            font-weight: bold;
-        }
-        .summary-table {
-            margin: 0 auto;
-            width: 50%;
-        }
-        .chart-container {
-            display: flex;
-            justify-content: center;
-        }
-    </style>
-</head>
-<body>
-    <h1>Post-Script Log {{ "Summary" if is_summary_page else "Detailed Results" }}</h1>
-
-    {% if not is_summary_page %}
-    <div class="chart-container">
-        <img src="data:image/png;base64,{{ chart_data }}" alt="Test Results Distribution">
-    </div>
-    {% endif %}
-
-    <div class="summary-container">
-        <h2>Result Summary</h2>
-        <table class="summary-table">
-            <thead>
-                <tr>
-                    <th>Status</th>
-                    <th>Total</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Total Tests</td>
-                    <td>{{ total_tests }}</td>
-                </tr>
-                <tr>
-                    <td>Passed</td>
-                    <td class="pass">{{ suite_summary.total_passed }}</td>
-                </tr>
-                <tr>
-                    <td>Failed</td>
-                    <td class="fail">{{ suite_summary.total_failed }}</td>
-                </tr>
-                <tr>
-                    <td>Failed with Waiver</td>
-                    <td class="fail-waiver">{{ suite_summary.total_failed_with_waiver }}</td>
-                </tr>
-                <tr>
-                    <td>Aborted</td>
-                    <td class="aborted">{{ suite_summary.total_aborted }}</td>
-                </tr>
-                <tr>
-                    <td>Skipped</td>
-                    <td class="skipped">{{ suite_summary.total_skipped }}</td>
-                </tr>
-                <tr>
-                    <td>Warnings</td>
-                    <td class="warning">{{ suite_summary.total_warnings }}</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-
-    {% if not is_summary_page %}
-    <div class="detailed-container">
-        <h2>Detailed Subtests</h2>
-        {% for suite in test_results %}
-        <h3>{{ suite.Test_suite }}: {{ suite.Test_suite_description }}</h3>
-        <table>
-            <thead>
-                <tr>
-                    <th>Sub Test Number</th>
-                    <th>Sub Test Description</th>
-                    <th>Result</th>
-                    <th>Reasons</th>
-                    <th>Waiver Reason</th>
-                </tr>
-            </thead>
-            <tbody>
-            {% for st in suite.subtests %}
-                {% set r = st.sub_test_result %}
-                <tr>
-                    <td>{{ st.sub_Test_Number }}</td>
-                    <td>{{ st.sub_Test_Description }}</td>
-
-                    {# Determine the correct CSS class based on result #}
-                    {% set result_class = "" %}
-                    {% if r.PASSED > 0 %}
-                        {% set result_class = "pass" %}
-                    {% elif r.FAILED > 0 %}
-                        {% set result_class = "fail" %}
-                    {% elif r.FAILED_WITH_WAIVER is defined and r.FAILED_WITH_WAIVER > 0 %}
-                        {% set result_class = "fail-waiver" %}
-                    {% elif r.ABORTED > 0 %}
-                        {% set result_class = "aborted" %}
-                    {% elif r.SKIPPED > 0 %}
-                        {% set result_class = "skipped" %}
-                    {% elif r.WARNINGS > 0 %}
-                        {% set result_class = "warning" %}
-                    {% else %}
-                        {% set result_class = "" %}
-                    {% endif %}
-
-                    <td class="{{ result_class }}">
-                        {% if r.PASSED > 0 %}
-                            PASSED
-                        {% elif r.FAILED > 0 %}
-                            FAILED
-                        {% elif r.FAILED_WITH_WAIVER is defined and r.FAILED_WITH_WAIVER > 0 %}
-                            FAILED WITH WAIVER
-                        {% elif r.ABORTED > 0 %}
-                            ABORTED
-                        {% elif r.SKIPPED > 0 %}
-                            SKIPPED
-                        {% elif r.WARNINGS > 0 %}
-                            WARNING
-                        {% else %}
-                            UNKNOWN
-                        {% endif %}
-                    </td>
-
-                    {# Collect all reason lists #}
-                    {% set all_reasons = [] %}
-                    {% if r.pass_reasons is defined %}
-                        {% for reason in r.pass_reasons %}
-                            {% set _ = all_reasons.append(reason) %}
-                        {% endfor %}
-                    {% endif %}
-                    {% if r.fail_reasons is defined %}
-                        {% for reason in r.fail_reasons %}
-                            {% set _ = all_reasons.append(reason) %}
-                        {% endfor %}
-                    {% endif %}
-                    {% if r.abort_reasons is defined %}
-                        {% for reason in r.abort_reasons %}
-                            {% set _ = all_reasons.append(reason) %}
-                        {% endfor %}
-                    {% endif %}
-                    {% if r.skip_reasons is defined %}
-                        {% for reason in r.skip_reasons %}
-                            {% set _ = all_reasons.append(reason) %}
-                        {% endfor %}
-                    {% endif %}
-                    {% if r.warning_reasons is defined %}
-                        {% for reason in r.warning_reasons %}
-                            {% set _ = all_reasons.append(reason) %}
-                        {% endfor %}
-                    {% endif %}
-
-                    <td>{{ all_reasons|join("; ") if all_reasons else "N/A" }}</td>
-
-                    {% if r.FAILED_WITH_WAIVER is defined and r.FAILED_WITH_WAIVER > 0 and r.waiver_reason is defined %}
-                        <td>{{ r.waiver_reason }}</td>
-                    {% else %}
-                        <td>N/A</td>
-                    {% endif %}
-                </tr>
-            {% endfor %}
-            </tbody>
-        </table>
-        {% endfor %}
-    </div>
-    {% endif %}
-</body>
-</html>
-""")
-
     total_tests = (
         suite_summary["total_passed"]
         + suite_summary["total_failed"]
@@ -321,7 +64,10 @@ def generate_html(suite_summary, test_results, chart_data, output_html_path, is_
         + suite_summary["total_warnings"]
     )
 
-    html_content = template.render(
+    render_to_file(
+        "post_script.html",
+        output_html_path,
+        suite_info=suite_info_for_page(output_html_path),
         is_summary_page=is_summary_page,
         suite_summary=suite_summary,
         total_tests=total_tests,
@@ -329,9 +75,6 @@ def generate_html(suite_summary, test_results, chart_data, output_html_path, is_
         chart_data=chart_data
     )
 
-    with open(output_html_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
 def main():
     if len(sys.argv) != 4:
         print(f"Usage: {sys.argv[0]} <input_json> <detailed_html> <summary_html>")
@@ -344,6 +87,9 @@ def main():
     with open(input_json_file, 'r', encoding='utf-8') as jf:
         data = json.load(jf)
 
+    render_reports(data, detailed_html_file, summary_html_file)
+
+def render_reports(data, detailed_html_file, summary_html_file):
     # suite_summary we can take directly from top-level "suite_summary"
     suite_summary = data.get("suite_summary", {
         "total_passed": 0,
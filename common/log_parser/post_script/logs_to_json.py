@@ -17,6 +17,17 @@
 import sys
 import re
 import json
+import os
+
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import store_fail_counts
+from log_encoding import open_text
+# pylint: enable=wrong-import-position
 
 def parse_post_script_log(log_path):
     """
@@ -26,7 +37,7 @@ def parse_post_script_log(log_path):
         create a single Test Suite for the entire log.
     """
 
-    with open(log_path, 'r', encoding='utf-8') as f:
+    with open_text(log_path, encoding='utf-8') as f:
         lines = f.readlines()
 
     # Define a single test suite container (similar structure to FWTS parser)
@@ -121,11 +132,12 @@ def parse_post_script_log(log_path):
         "total_warnings": test_suite["test_suite_summary"]["total_warnings"]
     }
 
-    # Finally, return the final dictionary in the same style as FWTS parser
-    return {
+    # Finally, return the final dictionary in the same style as FWTS parser.
+    # Every failure is a subtest FAILED count, already summed into total_failed.
+    return store_fail_counts({
         "test_results": [test_suite],
         "suite_summary": suite_summary
-    }
+    }, suite_summary["total_failed"], 0)
 
 def main():
     if len(sys.argv) != 3:
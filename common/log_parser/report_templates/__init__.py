@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Jinja2 templates for the json_to_html and ACS summary pages.
+
+Every page extends base.html. Templates are loaded through one Environment
+per process, and their compiled code is kept in an on-disk bytecode cache so
+later runs skip the Jinja2 compiler. Pages are streamed into the output file
+rather than rendered into one string.
+"""
+
+import html
+import os
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from markupsafe import Markup
+
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Where compiled templates are kept; default is a per-user directory in /tmp
+CACHE_DIR_ENV = "ACS_TEMPLATE_CACHE_DIR"
+
+# Pages whose values are HTML-escaped; the other pages insert values as-is,
+# including markup such as the chart and <br>-joined reason lists.
+AUTOESCAPE_TEMPLATES = frozenset({"sct.html", "tpm.html", "results_diff.html"})
+
+_ENVIRONMENT = None
+
+
+def _bytecode_cache():
+    """Return the on-disk bytecode cache, or None if no writable directory."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    try:
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache = FileSystemBytecodeCache(cache_dir)
+        else:
+            cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+    # Jinja2 fails the render if it cannot store the compiled template
+    if not os.access(cache.directory, os.W_OK):
+        return None
+    return cache
+
+
+def suite_info_block(suite_info, test_suite):
+    """
+    Return the Test_suite_info block for the heading of test_suite.
+
+    suite_info maps lowercased test suite names to their Test_suite_info (see
+    suite_info.suite_info_for_page()); pages rendered without it, and test
+    suites it does not list, get an empty string. A list is shown as bullets.
+    """
+    if not suite_info or not test_suite:
+        return ""
+    info = suite_info.get(str(test_suite).strip().lower())
+    if info is None:
+        return ""
+    if isinstance(info, list):
+        items = "".join(f"<li>{html.escape(str(item))}</li>" for item in info)
+        text = f"<ul style=\"margin: 6px 0 0 18px;\">{items}</ul>"
+    else:
+        text = html.escape(str(info))
+    return Markup(
+        "<div class=\"test-suite-info\" "
+        "style=\"margin: 6px 0 16px 0; color: #7f8c8d; font-size: 16px;\">"
+        f"<strong>Test_suite_info:</strong>{text}</div>"
+    )
+
+
+def environment():
+    """Return the shared Environment, creating it on first use."""
+    global _ENVIRONMENT  # pylint: disable=global-statement
+    if _ENVIRONMENT is None:
+        _ENVIRONMENT = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            autoescape=lambda name: name in AUTOESCAPE_TEMPLATES,
+            bytecode_cache=_bytecode_cache(),
+        )
+        _ENVIRONMENT.globals["suite_info_block"] = suite_info_block
+    return _ENVIRONMENT
+
+
+def register_filters(**filters):
+    """
+    Add filters for the templates to use.
+
+    Jinja2 resolves filters when a template is compiled, so register them at
+    import time, before the template is loaded. Filters are shared by every
+    template; prefix suite-specific ones with the suite name.
+    """
+    environment().filters.update(filters)
+
+
+def get_template(name):
+    return environment().get_template(name)
+
+
+def preload():
+    """
+    Load every page template, e.g. before forking worker processes.
+
+    Import the renderers first: templates using their filters cannot compile
+    until the filters are registered.
+    """
+    for name in environment().list_templates(extensions=["html"]):
+        get_template(name)
+
+
+def render_to_file(name, output_path, **context):
+    """
+    Render template name into output_path without building the page in memory.
+
+    The page is streamed into a temporary file that replaces output_path once
+    complete, so a failed render never leaves a truncated report behind.
+    """
+    template = get_template(name)
+    tmp_path = os.fspath(output_path) + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(template.generate(**context))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ACS results read straight from a .tar(.gz/.bz2/.xz) or .zip archive.
+
+The archive is read front to back once, and only the members the parsers
+use are decompressed, each into a temporary file; dumps such as linux_dump/
+and uefi_dump/ are skipped without being written anywhere. Each kept member
+is handed to the parsers as a LogMember, which opens like a path to that
+file and is named by its path inside the archive (e.g.
+results.tar.gz/acs_results/uefi/BsaResults.log). Nothing of a member stays
+in memory, so large logs cost disk space rather than RAM in the driver and
+its forked workers. The temporary files are removed by close(), or when the
+process that read the archive exits if it was never closed.
+"""
+
+import collections
+import fnmatch
+import hashlib
+import os
+import posixpath
+import shutil
+import tarfile
+import tempfile
+import weakref
+import zipfile
+
+ARCHIVE_SUFFIXES = (".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz", ".tar", ".zip")
+
+# Archives read by this process, so forked workers reuse the parent's copy
+_OPENED = {}
+
+# Read size when copying a member to its temporary file
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def is_archive(path):
+    """True if path is a tar (optionally compressed) or zip file."""
+    if not os.path.isfile(path):
+        return False
+    return zipfile.is_zipfile(path) or tarfile.is_tarfile(path)
+
+
+def archive_stem(path):
+    """Return path without its archive suffix, e.g. results.tar.gz -> results."""
+    lower = path.lower()
+    for suffix in ARCHIVE_SUFFIXES:
+        if lower.endswith(suffix):
+            return path[:-len(suffix)]
+    return os.path.splitext(path)[0]
+
+
+class LogMember(os.PathLike):
+    """
+    An archive member; name is its path inside the archive.
+
+    open() and the log_encoding helpers read it through __fspath__(), which
+    is the path of the temporary file holding its contents.
+    """
+
+    # Marks archive members for log_encoding, which does not import this module
+    archive_member = True
+
+    def __init__(self, name, spool_path):
+        self.name = name
+        self.spool_path = spool_path
+
+    def __fspath__(self):
+        return self.spool_path
+
+    def __repr__(self):
+        return f"LogMember({self.name!r})"
+
+
+def _member_name(name):
+    """Normalised member name, or None for names escaping the archive."""
+    name = posixpath.normpath(name.replace("\\", "/")).lstrip("/")
+    if name in ("", ".") or name == ".." or name.startswith("../"):
+        return None
+    return name
+
+
+def _iter_members(archive_path, wanted):
+    """
+    Yield (name, stream) for the file members whose name satisfies wanted().
+
+    Each stream must be read before the next member is requested.
+    """
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as zf:
+            for info in zf.infolist():
+                name = _member_name(info.filename)
+                if name and not info.is_dir() and wanted(name):
+                    with zf.open(info) as stream:
+                        yield name, stream
+        return
+    # Stream mode never seeks back, so a compressed tar is decompressed once
+    with tarfile.open(archive_path, "r|*") as tf:
+        for member in tf:
+            name = _member_name(member.name)
+            if name and member.isfile() and wanted(name):
+                yield name, tf.extractfile(member)
+
+
+def _spool(stream, spool_path):
+    """Copy stream to spool_path in chunks and return the sha256 of its contents."""
+    digest = hashlib.sha256()
+    with open(spool_path, "wb") as out:
+        for chunk in iter(lambda: stream.read(_COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            out.write(chunk)
+    return digest.hexdigest()
+
+
+def _remove_spool_dir(spool_dir, owner_pid):
+    # Forked workers inherit the archive; only the process that read it cleans up
+    if os.getpid() == owner_pid:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+
+def _split_parents(pattern):
+    """Split "../fw/x.log" into (1, "fw/x.log")."""
+    parts = pattern.split("/")
+    levels = 0
+    while parts and parts[0] == "..":
+        parts.pop(0)
+        levels += 1
+    return levels, "/".join(parts)
+
+
+def _has_magic(pattern):
+    return any(c in pattern for c in "*?[")
+
+
+def _archive_key(archive_path, patterns):
+    return os.path.abspath(archive_path), tuple(patterns)
+
+
+def open_archive(archive_path, patterns):
+    """Return the ResultsArchive for archive_path, reading it on first use."""
+    key = _archive_key(archive_path, patterns)
+    archive = _OPENED.get(key)
+    if archive is None:
+        archive = _OPENED[key] = ResultsArchive(archive_path, patterns)
+    return archive
+
+
+class ResultsArchive:
+    """
+    The members of an ACS results archive that the pipeline reads.
+
+    patterns are fnmatch patterns relative to the results directory, such as
+    "uefi/BsaResults.log" or "../os-logs/*/ethtool_test.log". The results
+    directory may sit anywhere in the archive: it is the directory under
+    which most of the plain (no wildcard, no "..") patterns are found.
+
+    Paths given to the methods are on-disk style paths below archive_path;
+    root is the path of the results directory. Use open_archive() rather
+    than building one directly: a pickled ResultsArchive (e.g. handed to a
+    pool worker) is only a reference to the archive opened by that call.
+    Call close(), or use it as a context manager, once the members are no
+    longer needed: pool workers exit without running exit handlers, so a
+    worker that opened an archive would otherwise leave its files behind.
+    """
+
+    def __init__(self, archive_path, patterns):
+        self.archive_path = os.path.abspath(archive_path)
+        self.patterns = tuple(patterns)
+        patterns = [posixpath.normpath(p) for p in patterns if not posixpath.isabs(p)]
+        tails = [_split_parents(p) for p in patterns]
+
+        def wanted(name):
+            return any(fnmatch.fnmatchcase(name, tail) or fnmatch.fnmatchcase(name, "*/" + tail)
+                       for _, tail in tails)
+
+        self._spool_dir = tempfile.mkdtemp(prefix="acs_results_")
+        self._cleanup = weakref.finalize(self, _remove_spool_dir, self._spool_dir, os.getpid())
+
+        # Member name -> (temporary file, sha256 of its contents)
+        candidates = {}
+        votes = collections.Counter()
+        plain_tails = [tail for levels, tail in tails if not levels and not _has_magic(tail)]
+        try:
+            for index, (name, stream) in enumerate(_iter_members(self.archive_path, wanted)):
+                spool_path = os.path.join(self._spool_dir,
+                                          f"{index:05d}_{posixpath.basename(name)}")
+                candidates[name] = (spool_path, _spool(stream, spool_path))
+                for tail in plain_tails:
+                    if name == tail or name.endswith("/" + tail):
+                        votes[name[:len(name) - len(tail)].rstrip("/")] += 1
+            if not votes:
+                raise ValueError(f"No ACS results found in {archive_path}")
+        except BaseException:
+            self._cleanup()
+            raise
+        # Most matches wins; on a tie the shallower directory
+        root = min(votes, key=lambda r: (-votes[r], r.count("/"), r))
+
+        self.root = os.path.normpath(os.path.join(self.archive_path, root))
+        # On-disk style path -> (temporary file, sha256 of its contents)
+        self._files = {}
+        for name, spooled in candidates.items():
+            rel = posixpath.relpath(name, root or ".")
+            if any(fnmatch.fnmatchcase(rel, pattern) for pattern in patterns):
+                self._files[os.path.join(self.archive_path, name)] = spooled
+            else:
+                os.remove(spooled[0])
+        self._dirs = set()
+        for path in self._files:
+            parent = os.path.dirname(path)
+            while parent != self.archive_path and parent not in self._dirs:
+                self._dirs.add(parent)
+                parent = os.path.dirname(parent)
+
+    def __reduce__(self):
+        return open_archive, (self.archive_path, self.patterns)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Remove the temporary files and forget the archive in this process.
+
+        A forked worker closing its inherited copy only forgets it; the files
+        belong to the process that read the archive.
+        """
+        key = _archive_key(self.archive_path, self.patterns)
+        if _OPENED.get(key) is self:
+            del _OPENED[key]
+        self._cleanup()
+
+    def contains(self, path):
+        """True if path lies inside the archive."""
+        path = os.path.normpath(path)
+        return path == self.archive_path or path.startswith(self.archive_path + os.sep)
+
+    def isfile(self, path):
+        return os.path.normpath(path) in self._files
+
+    def isdir(self, path):
+        return os.path.normpath(path) in self._dirs
+
+    def glob(self, pattern):
+        """Like glob.glob over the kept members: "*" does not cross "/"."""
+        pattern = os.path.normpath(pattern)
+        depth = pattern.count(os.sep)
+        return sorted(path for path in self._dirs.union(self._files)
+                      if path.count(os.sep) == depth and fnmatch.fnmatchcase(path, pattern))
+
+    def listdir(self, path):
+        """Names of the kept entries directly below path."""
+        path = os.path.normpath(path)
+        return sorted(os.path.basename(p) for p in self._dirs.union(self._files)
+                      if os.path.dirname(p) == path)
+
+    def find(self, top, name):
+        """Paths of the kept files called name anywhere below top."""
+        prefix = os.path.normpath(top) + os.sep
+        return sorted(path for path in self._files
+                      if path.startswith(prefix) and os.path.basename(path) == name)
+
+    def open(self, path):
+        """Return the member at path as a LogMember."""
+        path = os.path.normpath(path)
+        try:
+            return LogMember(path, self._files[path][0])
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    def digest(self, path):
+        """sha256 of a member, or of the members below a directory; None if absent."""
+        path = os.path.normpath(path)
+        if path in self._files:
+            return self._files[path][1]
+        if path not in self._dirs:
+            return None
+        digest = hashlib.sha256()
+        for member in sorted(p for p in self._files if p.startswith(path + os.sep)):
+            digest.update(os.path.relpath(member, path).encode("utf-8") + b"\0")
+            digest.update(self._files[member][1].encode("ascii") + b"\0")
+        return digest.hexdigest()
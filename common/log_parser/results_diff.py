@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare two merged_results.json runs test by test.
+
+Testcases are matched by suite, Test_suite, Sub_test_suite and Test_case;
+subtests by their GUID, sub_Test_Path or sub_Test_Number together with the
+description, below the subtest or testcase that holds them. Every matched
+pair whose status or waiver differs is reported as a regression, fix, other
+change or waiver change; unmatched ones as new or removed tests.
+
+Suites, testcases and subtests that are equal in both runs are skipped as a
+whole: the trees are compared with dict equality, which runs in C, before
+anything is walked in Python.
+"""
+
+import argparse
+import collections
+import json
+import sys
+
+from report_templates import render_to_file
+from results_warehouse import (
+    ACS_INFO_SUITE, SUITE_PREFIX, VOLATILE_FIELDS, iter_testcases, subtest_result,
+    testcase_name, testcase_result, waiver_reason,
+)
+
+CATEGORIES = ("regressions", "fixes", "changed", "waiver_changes", "new", "removed")
+
+# Statuses that count as an unwaived failure, and as any failure
+BAD_STATUSES = frozenset({"FAILED", "ABORTED"})
+FAILED_STATUSES = BAD_STATUSES | {"FAILED_WITH_WAIVER"}
+
+
+def classify(old_status, new_status, old_waiver, new_waiver):
+    """Return the category of a matched test, or None if it did not change."""
+    if old_status == new_status:
+        return "waiver_changes" if old_waiver != new_waiver else None
+    if {old_status, new_status} == {"FAILED", "FAILED_WITH_WAIVER"}:
+        return "waiver_changes"
+    if new_status in BAD_STATUSES and old_status not in BAD_STATUSES:
+        return "regressions"
+    if new_status == "FAILED_WITH_WAIVER" and old_status not in FAILED_STATUSES:
+        return "regressions"
+    if old_status in FAILED_STATUSES and new_status not in FAILED_STATUSES:
+        return "fixes"
+    return "changed"
+
+
+def _keyed(items, key_of):
+    """Map identity key -> item; repeated keys get an occurrence number."""
+    keyed = {}
+    seen = collections.Counter()
+    for item in items:
+        key = key_of(item)
+        seen[key] += 1
+        keyed[key if seen[key] == 1 else key + (seen[key],)] = item
+    return keyed
+
+
+def _dicts(items):
+    return [item for item in items or [] if isinstance(item, dict)]
+
+
+def testcase_key(group, testcase):
+    return (str(group.get("Test_suite", "")), str(testcase.get("Sub_test_suite", "")),
+            testcase_name(testcase))
+
+
+def subtest_key(subtest):
+    identity = (subtest.get("sub_Test_GUID") or subtest.get("sub_Test_Path")
+                or subtest.get("sub_Test_Number") or "")
+    return (str(identity), str(subtest.get("sub_Test_Description", "")))
+
+
+def _subtest_label(subtest):
+    number = subtest.get("sub_Test_Number")
+    description = subtest.get("sub_Test_Description", "")
+    return f"{number}: {description}" if number not in (None, "") else str(description)
+
+
+class ResultsDiff:
+    """Differences between an old and a new merged result."""
+
+    def __init__(self, old, new):
+        self.entries = {category: [] for category in CATEGORIES}
+        self.unchanged_suites = []
+        self.changed_suites = []
+        self.system_changes = {}
+        self.compliance = {}
+        self._compare_acs_info(old.get(ACS_INFO_SUITE) or {}, new.get(ACS_INFO_SUITE) or {})
+
+        suites = [key for key in old if key.startswith(SUITE_PREFIX) and key != ACS_INFO_SUITE]
+        suites += [key for key in new if key.startswith(SUITE_PREFIX) and key != ACS_INFO_SUITE
+                   and key not in old]
+        for key in suites:
+            suite = key[len(SUITE_PREFIX):].strip()
+            if key not in new:
+                self.changed_suites.append(suite)
+                self._add_whole_suite("removed", suite, old[key], side="old")
+            elif key not in old:
+                self.changed_suites.append(suite)
+                self._add_whole_suite("new", suite, new[key], side="new")
+            elif old[key] == new[key]:
+                self.unchanged_suites.append(suite)
+            else:
+                self.changed_suites.append(suite)
+                self._compare_suite(suite, old[key], new[key])
+
+    @staticmethod
+    def _test_results(data):
+        return data.get("test_results") if isinstance(data, dict) else data
+
+    def _compare_acs_info(self, old_info, new_info):
+        old_system = old_info.get("System Info") or {}
+        new_system = new_info.get("System Info") or {}
+        for field in list(old_system) + [f for f in new_system if f not in old_system]:
+            if field not in VOLATILE_FIELDS and old_system.get(field) != new_system.get(field):
+                self.system_changes[field] = [old_system.get(field), new_system.get(field)]
+        old_summary = old_info.get("ACS Results Summary") or {}
+        new_summary = new_info.get("ACS Results Summary") or {}
+        self.compliance = {
+            "old": old_summary.get("Overall Compliance Result", ""),
+            "new": new_summary.get("Overall Compliance Result", ""),
+        }
+
+    def _entry(self, category, suite, group, testcase, path, old=None, new=None, subtest=False):
+        """Record one test; old/new are the testcase or subtest dicts on each side."""
+        result_of = subtest_result if subtest else testcase_result
+        entry = {
+            "suite": suite,
+            "test_suite": str(group.get("Test_suite", "")),
+            "test_case": testcase_name(testcase),
+            "subtest": " / ".join(path),
+        }
+        for side, item in (("old", old), ("new", new)):
+            result, status = result_of(item) if item is not None else ("", "")
+            entry[f"{side}_result"] = result
+            entry[f"{side}_status"] = status
+            entry[f"{side}_waiver_reason"] = waiver_reason(item) if item is not None else ""
+        self.entries[category].append(entry)
+
+    def _add_whole_suite(self, category, suite, data, side):
+        for group, testcase in iter_testcases(self._test_results(data)):
+            self._entry(category, suite, group, testcase, [], **{side: testcase})
+
+    def _compare_suite(self, suite, old_data, new_data):
+        old_cases = _keyed(iter_testcases(self._test_results(old_data)),
+                           lambda gt: testcase_key(*gt))
+        new_cases = _keyed(iter_testcases(self._test_results(new_data)),
+                           lambda gt: testcase_key(*gt))
+        for key, (group, old_case) in old_cases.items():
+            if key not in new_cases:
+                self._entry("removed", suite, group, old_case, [], old=old_case)
+                continue
+            new_group, new_case = new_cases[key]
+            if old_case == new_case:
+                continue
+            category = classify(testcase_result(old_case)[1], testcase_result(new_case)[1],
+                                waiver_reason(old_case), waiver_reason(new_case))
+            if category:
+                self._entry(category, suite, new_group, new_case, [], old=old_case, new=new_case)
+            self._compare_subtests(suite, new_group, new_case, [],
+                                   old_case.get("subtests"), new_case.get("subtests"))
+        for key, (group, new_case) in new_cases.items():
+            if key not in old_cases:
+                self._entry("new", suite, group, new_case, [], new=new_case)
+
+    def _compare_subtests(self, suite, group, testcase, path, old_subtests, new_subtests):
+        if old_subtests == new_subtests:
+            return
+        old_keyed = _keyed(_dicts(old_subtests), subtest_key)
+        new_keyed = _keyed(_dicts(new_subtests), subtest_key)
+        for key, old_sub in old_keyed.items():
+            sub_path = path + [_subtest_label(old_sub)]
+            if key not in new_keyed:
+                self._entry("removed", suite, group, testcase, sub_path, old=old_sub, subtest=True)
+                continue
+            new_sub = new_keyed[key]
+            if old_sub == new_sub:
+                continue
+            category = classify(subtest_result(old_sub)[1], subtest_result(new_sub)[1],
+                                waiver_reason(old_sub), waiver_reason(new_sub))
+            if category:
+                self._entry(category, suite, group, testcase, sub_path,
+                            old=old_sub, new=new_sub, subtest=True)
+            self._compare_subtests(suite, group, testcase, sub_path,
+                                   old_sub.get("subtests"), new_sub.get("subtests"))
+        for key, new_sub in new_keyed.items():
+            if key not in old_keyed:
+                self._entry("new", suite, group, testcase, path + [_subtest_label(new_sub)],
+                            new=new_sub, subtest=True)
+
+    def counts(self):
+        return {category: len(entries) for category, entries in self.entries.items()}
+
+    def to_dict(self, old_path="", new_path=""):
+        return {
+            "old": old_path,
+            "new": new_path,
+            "compliance": self.compliance,
+            "system_info_changes": self.system_changes,
+            "unchanged_suites": self.unchanged_suites,
+            "changed_suites": self.changed_suites,
+            "counts": self.counts(),
+            **self.entries,
+        }
+
+
+def load_merged(path):
+    with open(path, "r", encoding="utf-8") as f:
+        merged = json.load(f)
+    if not isinstance(merged, dict):
+        raise ValueError(f"{path} is not a merged ACS result")
+    return merged
+
+
+def write_html(diff, output_html, old_path, new_path):
+    render_to_file(
+        "results_diff.html", output_html,
+        old_path=old_path,
+        new_path=new_path,
+        compliance=diff.compliance,
+        system_changes=diff.system_changes,
+        unchanged_suites=diff.unchanged_suites,
+        changed_suites=diff.changed_suites,
+        counts=diff.counts(),
+        sections=[(category, category.replace("_", " ").title(), diff.entries[category])
+                  for category in CATEGORIES],
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two merged_results.json runs.")
+    parser.add_argument("old_json", help="merged_results.json of the earlier run")
+    parser.add_argument("new_json", help="merged_results.json of the later run")
+    parser.add_argument("--json", dest="output_json", default="",
+                        help="Write the differences as JSON")
+    parser.add_argument("--html", dest="output_html", default="",
+                        help="Write the differences as an HTML page")
+    args = parser.parse_args(argv)
+
+    try:
+        old, new = load_merged(args.old_json), load_merged(args.new_json)
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: {exc}")
+        return 1
+
+    diff = ResultsDiff(old, new)
+    if args.output_json:
+        with open(args.output_json, "w", encoding="utf-8") as f:
+            json.dump(diff.to_dict(args.old_json, args.new_json), f, indent=4)
+    if args.output_html:
+        write_html(diff, args.output_html, args.old_json, args.new_json)
+
+    print(f"Suites unchanged: {len(diff.unchanged_suites)}, changed: {len(diff.changed_suites)}")
+    for category, count in diff.counts().items():
+        print(f"{category.replace('_', ' ').capitalize()}: {count}")
+    for entry in diff.entries["regressions"]:
+        test = " / ".join(part for part in (entry["test_case"], entry["subtest"]) if part)
+        print(f"  REGRESSION {entry['suite']}: {test}: "
+              f"{entry['old_status']} -> {entry['new_status']}")
+    if args.output_json:
+        print(f"Diff JSON: {args.output_json}")
+    if args.output_html:
+        print(f"Diff HTML: {args.output_html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,610 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite warehouse of merged_results.json files, with a small query CLI.
+
+Each merged result is flattened into the runs, suites, testcases, subtests
+and waivers tables. Testcases and subtests carry the raw result string and a
+normalised status (PASSED, FAILED, FAILED_WITH_WAIVER, SKIPPED, WARNING,
+ABORTED, ...), so questions such as "which platforms fail B_PE_01" are one
+indexed query across every ingested run.
+
+Ingestion is incremental: a file whose path, size and mtime are already
+recorded is skipped without being read, a result whose content is already
+stored is not loaded again, and a re-parsed results directory replaces the
+run previously loaded from the same file.
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+
+MERGED_JSON_NAME = "merged_results.json"
+BATCH_INDEX_NAME = "batch_index.json"
+ACS_INFO_SUITE = "Suite_Name: acs_info"
+SUITE_PREFIX = "Suite_Name: "
+
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    source_size INTEGER,
+    source_mtime_ns INTEGER,
+    platform TEXT,
+    vendor TEXT,
+    soc_family TEXT,
+    firmware_version TEXT,
+    acs_version TEXT,
+    band TEXT,
+    generated_on TEXT,
+    overall_compliance TEXT,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS suites (
+    suite_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    suite TEXT NOT NULL,
+    requirement TEXT,
+    compliance TEXT,
+    passed INTEGER,
+    failed INTEGER,
+    failed_with_waiver INTEGER,
+    skipped INTEGER,
+    warnings INTEGER,
+    aborted INTEGER
+);
+CREATE TABLE IF NOT EXISTS testcases (
+    testcase_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    suite_id INTEGER NOT NULL REFERENCES suites(suite_id) ON DELETE CASCADE,
+    test_suite TEXT,
+    sub_test_suite TEXT,
+    test_case TEXT,
+    rule_id TEXT,
+    description TEXT,
+    result TEXT,
+    status TEXT,
+    waiver_reason TEXT
+);
+CREATE TABLE IF NOT EXISTS subtests (
+    subtest_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    testcase_id INTEGER NOT NULL REFERENCES testcases(testcase_id) ON DELETE CASCADE,
+    parent_id INTEGER REFERENCES subtests(subtest_id) ON DELETE CASCADE,
+    depth INTEGER NOT NULL,
+    number TEXT,
+    rule_id TEXT,
+    description TEXT,
+    guid TEXT,
+    result TEXT,
+    status TEXT,
+    reason TEXT,
+    waiver_reason TEXT
+);
+CREATE TABLE IF NOT EXISTS waivers (
+    waiver_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    suite_id INTEGER NOT NULL REFERENCES suites(suite_id) ON DELETE CASCADE,
+    testcase_id INTEGER NOT NULL REFERENCES testcases(testcase_id) ON DELETE CASCADE,
+    subtest_id INTEGER REFERENCES subtests(subtest_id) ON DELETE CASCADE,
+    reason TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_platform ON runs(platform);
+CREATE INDEX IF NOT EXISTS runs_source ON runs(source);
+CREATE INDEX IF NOT EXISTS suites_suite ON suites(suite);
+CREATE INDEX IF NOT EXISTS suites_run ON suites(run_id);
+CREATE INDEX IF NOT EXISTS testcases_suite ON testcases(suite_id);
+CREATE INDEX IF NOT EXISTS testcases_run ON testcases(run_id);
+CREATE INDEX IF NOT EXISTS testcases_test_case ON testcases(test_case);
+CREATE INDEX IF NOT EXISTS testcases_rule_status ON testcases(rule_id, status);
+CREATE INDEX IF NOT EXISTS testcases_status ON testcases(status);
+CREATE INDEX IF NOT EXISTS subtests_testcase ON subtests(testcase_id);
+CREATE INDEX IF NOT EXISTS subtests_run ON subtests(run_id);
+CREATE INDEX IF NOT EXISTS subtests_parent ON subtests(parent_id);
+CREATE INDEX IF NOT EXISTS subtests_rule_status ON subtests(rule_id, status);
+CREATE INDEX IF NOT EXISTS subtests_status ON subtests(status);
+CREATE INDEX IF NOT EXISTS waivers_suite ON waivers(suite_id);
+CREATE INDEX IF NOT EXISTS waivers_run ON waivers(run_id);
+CREATE INDEX IF NOT EXISTS waivers_subtest ON waivers(subtest_id);
+"""
+
+# System Info fields stored on the run
+RUN_FIELDS = {
+    "platform": "System Name",
+    "vendor": "Vendor",
+    "soc_family": "SoC Family",
+    "firmware_version": "Firmware Version",
+    "acs_version": "ACS version",
+    "band": "Band",
+    "generated_on": "Summary Generated On",
+}
+
+# Fields rewritten on every summary run; left out of the content digest
+VOLATILE_FIELDS = ("Date", "Summary Generated On")
+
+# Suite summary counters under the names used by the different parsers
+SUMMARY_COUNTERS = {
+    "passed": ("total_passed", "Passed"),
+    "failed": ("total_failed", "Failed"),
+    "failed_with_waiver": ("total_failed_with_waiver", "total_failed_with_waivers",
+                           "Total_failed_with_waiver"),
+    "skipped": ("total_skipped", "Skipped"),
+    "warnings": ("total_warnings", "Warnings"),
+    "aborted": ("total_aborted",),
+}
+
+# Status of a counter-style result; an unwaived failure outranks a waived one
+COUNTER_STATUS = (
+    ("FAILED", ("FAILED", "total_failed", "Failed")),
+    ("FAILED_WITH_WAIVER", ("FAILED_WITH_WAIVER", "total_failed_with_waiver",
+                            "total_failed_with_waivers", "Total_failed_with_waiver")),
+    ("ABORTED", ("ABORTED", "total_aborted")),
+    ("WARNING", ("WARNINGS", "total_warnings", "Warnings")),
+    ("SKIPPED", ("SKIPPED", "total_skipped", "Skipped")),
+    ("PASSED", ("PASSED", "total_passed", "Passed")),
+)
+
+# First matching keyword of an upper-cased result string decides its status
+RESULT_STATUS = (
+    ("WITH WAIVER", "FAILED_WITH_WAIVER"),
+    ("FAIL", "FAILED"),
+    ("ABORT", "ABORTED"),
+    ("WARN", "WARNING"),
+    ("SKIP", "SKIPPED"),
+    ("NOT IMPLEMENTED", "NOT_IMPLEMENTED"),
+    ("NOT SUPPORTED", "NOT_SUPPORTED"),
+    ("PASS", "PASSED"),
+)
+
+COMPLIANCE_KEY_RE = re.compile(r"^Suite_Name:\s*(\w+)\s*:\s*(.+)_compliance$")
+
+
+def result_status(result):
+    """Return the normalised status of a result string or counter dict."""
+    if isinstance(result, dict):
+        for status, keys in COUNTER_STATUS:
+            if any(isinstance(result.get(key), int) and result.get(key) > 0 for key in keys):
+                return status
+        return ""
+    text = str(result or "").strip().upper()
+    for keyword, status in RESULT_STATUS:
+        if keyword in text:
+            return status
+    return re.sub(r"\W+", "_", text).strip("_")
+
+
+def rule_id(test_number):
+    """Rule id of a BSA/SBSA style number such as 'B_PE_01 : 3'; '' otherwise."""
+    if isinstance(test_number, str) and ":" in test_number:
+        return test_number.split(":", 1)[0].strip()
+    return ""
+
+
+def _text(value):
+    """Store lists (reasons) as one string and everything else as text."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value if item not in (None, ""))
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True)
+    return str(value)
+
+
+def _result_text(result):
+    """Raw result column: the string itself, or the status of a counter dict."""
+    return result_status(result) if isinstance(result, dict) else _text(result)
+
+
+def _reasons(subtest, result):
+    if isinstance(result, dict):
+        reasons = []
+        for key in sorted(result):
+            if key.endswith("_reasons") and isinstance(result[key], list):
+                reasons.extend(result[key])
+        return _text(reasons)
+    return _text(subtest.get("reason"))
+
+
+def waiver_reason(entry):
+    """Waiver reason of a testcase or subtest; FWTS keeps it in the result counters."""
+    reason = entry.get("waiver_reason")
+    result = entry.get("sub_test_result")
+    if not reason and isinstance(result, dict):
+        reason = result.get("waiver_reason")
+    return _text(reason)
+
+
+def _counter(summary, names):
+    for name in names:
+        value = summary.get(name)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _summary_of(entry):
+    for key in ("test_case_summary", "Test_case_summary", "test_suite_summary"):
+        summary = entry.get(key)
+        if isinstance(summary, dict):
+            return summary
+    return {}
+
+
+def testcase_result(testcase):
+    """Return (result text, status) of a testcase; its counters decide if it has no result."""
+    result = testcase.get("Test_result", testcase.get("test_result"))
+    if result is None:
+        status = result_status(_summary_of(testcase))
+        return status, status
+    return _result_text(result), result_status(result)
+
+
+def subtest_result(subtest):
+    """Return (result text, status) of a subtest."""
+    result = subtest.get("sub_test_result")
+    return _result_text(result), result_status(result)
+
+
+def testcase_name(testcase):
+    """Test_case, or Test_suite for suites whose entries are whole test suites (FWTS, OS tests)."""
+    return _text(testcase.get("Test_case") or testcase.get("Test_suite"))
+
+
+def iter_testcases(test_results):
+    """Yield (group, testcase) for every testcase of a suite's test_results."""
+    if isinstance(test_results, dict):
+        test_results = [test_results]
+    for group in test_results or []:
+        if not isinstance(group, dict):
+            continue
+        # BSA/SBSA and SCMI nest testcases under a test suite, SBMR uses Test_cases;
+        # elsewhere (SCT, FWTS, OS tests, ...) each entry is the testcase itself
+        children = group.get("testcases", group.get("Test_cases"))
+        if isinstance(children, list):
+            for testcase in children:
+                if isinstance(testcase, dict):
+                    yield group, testcase
+        else:
+            yield group, group
+
+
+def content_digest(merged):
+    """sha256 of a merged result with the per-run generation timestamps removed."""
+    info = merged.get(ACS_INFO_SUITE)
+    if isinstance(info, dict):
+        merged = dict(merged)
+        info = {section: ({key: value for key, value in fields.items()
+                           if key not in VOLATILE_FIELDS}
+                          if isinstance(fields, dict) else fields)
+                for section, fields in info.items()}
+        merged[ACS_INFO_SUITE] = info
+    payload = json.dumps(merged, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Warehouse:
+    """A results warehouse database; use as a context manager to close it."""
+
+    def __init__(self, db_path, readonly=False):
+        self.db_path = db_path
+        if readonly:
+            if not os.path.isfile(db_path):
+                raise FileNotFoundError(db_path)
+            uri = "file:" + os.path.abspath(db_path) + "?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True)
+        else:
+            self.conn = sqlite3.connect(db_path)
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _next_id(self, table, column):
+        return (self.conn.execute(f"SELECT MAX({column}) FROM {table}").fetchone()[0] or 0) + 1
+
+    def ingest_file(self, path):
+        """
+        Load one merged_results.json; return "added", "replaced" or "skipped".
+
+        Raises ValueError if the file is not a merged result.
+        """
+        source = os.path.abspath(path)
+        stat = os.stat(source)
+        known = self.conn.execute(
+            "SELECT run_id FROM runs WHERE source = ? AND source_size = ? AND source_mtime_ns = ?",
+            (source, stat.st_size, stat.st_mtime_ns)).fetchone()
+        if known:
+            return "skipped"
+
+        with open(source, "r", encoding="utf-8") as f:
+            merged = json.load(f)
+        if not isinstance(merged, dict) or not any(key.startswith(SUITE_PREFIX) for key in merged):
+            raise ValueError(f"{path} is not a merged ACS result")
+        digest = content_digest(merged)
+        if self.conn.execute("SELECT 1 FROM runs WHERE digest = ?", (digest,)).fetchone():
+            return "skipped"
+
+        with self.conn:
+            # A re-parsed results directory supersedes what was loaded from it before
+            replaced = self.conn.execute("DELETE FROM runs WHERE source = ?", (source,)).rowcount
+            self._insert_run(merged, digest, source, stat)
+        return "replaced" if replaced else "added"
+
+    def _insert_run(self, merged, digest, source, stat):
+        info = merged.get(ACS_INFO_SUITE) or {}
+        system_info = info.get("System Info") or {}
+        results_summary = info.get("ACS Results Summary") or {}
+        compliance = {}
+        for key, value in results_summary.items():
+            match = COMPLIANCE_KEY_RE.match(key)
+            if match:
+                compliance[match.group(2).strip()] = (match.group(1), _text(value))
+
+        run_id = self._next_id("runs", "run_id")
+        self.conn.execute(
+            "INSERT INTO runs (run_id, digest, source, source_size, source_mtime_ns, platform,"
+            " vendor, soc_family, firmware_version, acs_version, band, generated_on,"
+            " overall_compliance, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (run_id, digest, source, stat.st_size, stat.st_mtime_ns)
+            + tuple(_text(system_info.get(field)) for field in RUN_FIELDS.values())
+            + (_text(results_summary.get("Overall Compliance Result")),
+               datetime.datetime.now().isoformat(timespec="seconds")))
+
+        suites, testcases, subtests, waivers = [], [], [], []
+        suite_id = self._next_id("suites", "suite_id")
+        testcase_id = self._next_id("testcases", "testcase_id")
+        subtest_id = self._next_id("subtests", "subtest_id")
+
+        def add_subtests(children, testcase, parent, depth):
+            nonlocal subtest_id
+            for subtest in children or []:
+                if not isinstance(subtest, dict):
+                    continue
+                own_id = subtest_id
+                subtest_id += 1
+                result_text, status = subtest_result(subtest)
+                reason = waiver_reason(subtest)
+                number = _text(subtest.get("sub_Test_Number"))
+                subtests.append((
+                    own_id, run_id, testcase, parent, depth, number,
+                    _text(subtest.get("sub_Rule_ID")) or rule_id(number),
+                    _text(subtest.get("sub_Test_Description")), _text(subtest.get("sub_Test_GUID")),
+                    result_text, status, _reasons(subtest, subtest.get("sub_test_result")), reason))
+                if reason or status == "FAILED_WITH_WAIVER":
+                    waivers.append((run_id, current_suite, testcase, own_id, reason))
+                add_subtests(subtest.get("subtests"), testcase, own_id, depth + 1)
+
+        for key, data in merged.items():
+            if key == ACS_INFO_SUITE or not key.startswith(SUITE_PREFIX):
+                continue
+            suite = key[len(SUITE_PREFIX):].strip()
+            if isinstance(data, dict):
+                summary, test_results = data.get("suite_summary") or {}, data.get("test_results")
+            else:
+                summary, test_results = {}, data
+            current_suite = suite_id
+            suite_id += 1
+            requirement, suite_compliance = compliance.get(suite, ("", ""))
+            suites.append((current_suite, run_id, suite, requirement, suite_compliance)
+                          + tuple(_counter(summary, names) for names in SUMMARY_COUNTERS.values()))
+
+            for group, testcase in iter_testcases(test_results):
+                own_id = testcase_id
+                testcase_id += 1
+                result_text, status = testcase_result(testcase)
+                name = testcase_name(testcase)
+                reason = waiver_reason(testcase)
+                testcases.append((
+                    own_id, run_id, current_suite, _text(group.get("Test_suite")),
+                    _text(testcase.get("Sub_test_suite")), name, rule_id(name),
+                    _text(testcase.get("Test_case_description")
+                          or testcase.get("Test_suite_description")),
+                    result_text, status, reason))
+                if reason:
+                    waivers.append((run_id, current_suite, own_id, None, reason))
+                add_subtests(testcase.get("subtests"), own_id, None, 1)
+
+        self.conn.executemany(
+            "INSERT INTO suites (suite_id, run_id, suite, requirement, compliance, passed, failed,"
+            " failed_with_waiver, skipped, warnings, aborted)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            suites)
+        self.conn.executemany(
+            "INSERT INTO testcases (testcase_id, run_id, suite_id, test_suite, sub_test_suite,"
+            " test_case, rule_id, description, result, status, waiver_reason)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            testcases)
+        self.conn.executemany(
+            "INSERT INTO subtests (subtest_id, run_id, testcase_id, parent_id, depth, number,"
+            " rule_id, description, guid, result, status, reason, waiver_reason)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            subtests)
+        self.conn.executemany(
+            "INSERT INTO waivers (run_id, suite_id, testcase_id, subtest_id, reason)"
+            " VALUES (?, ?, ?, ?, ?)",
+            waivers)
+
+    def query(self, sql, params=()):
+        """Return (column names, rows) of a query."""
+        cursor = self.conn.execute(sql, params)
+        columns = [column[0] for column in cursor.description or ()]
+        return columns, cursor.fetchall()
+
+
+def find_merged_results(paths):
+    """Expand files, batch indexes and directories into merged_results.json paths."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if d != "acs_cache")
+                if MERGED_JSON_NAME in filenames:
+                    found.append(os.path.join(dirpath, MERGED_JSON_NAME))
+        elif os.path.basename(path) == BATCH_INDEX_NAME:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            found.extend(entry["merged_json"] for entry in index.get("result_sets", [])
+                         if entry.get("merged_json"))
+        else:
+            found.append(path)
+    return found
+
+
+# Canned questions for the query CLI; each takes the parsed arguments
+def query_runs(warehouse, args):
+    return warehouse.query(
+        "SELECT run_id, platform, vendor, firmware_version, band, generated_on,"
+        " overall_compliance, source FROM runs WHERE (? = '' OR platform = ?) ORDER BY run_id",
+        (args.platform, args.platform))
+
+
+def query_rule(warehouse, args):
+    # A rule can be a top-level BSA/SBSA testcase or a nested rule below one
+    return warehouse.query(
+        "SELECT r.platform, r.run_id, s.suite, t.test_case AS test, t.status"
+        " FROM testcases t JOIN suites s ON s.suite_id = t.suite_id"
+        " JOIN runs r ON r.run_id = t.run_id"
+        " WHERE t.rule_id = ? AND (? = '' OR t.status = ?)"
+        " UNION ALL"
+        " SELECT r.platform, r.run_id, s.suite, st.number AS test, st.status"
+        " FROM subtests st JOIN testcases t ON t.testcase_id = st.testcase_id"
+        " JOIN suites s ON s.suite_id = t.suite_id JOIN runs r ON r.run_id = st.run_id"
+        " WHERE st.rule_id = ? AND (? = '' OR st.status = ?)"
+        " ORDER BY 1, 2",
+        (args.rule_id, args.status, args.status) * 2)
+
+
+def query_waived(warehouse, args):
+    return warehouse.query(
+        "SELECT s.suite, t.test_case, COALESCE(st.description, t.description) AS description,"
+        " COUNT(*) AS waived, COUNT(DISTINCT w.run_id) AS runs, MIN(w.reason) AS reason"
+        " FROM waivers w JOIN suites s ON s.suite_id = w.suite_id"
+        " JOIN testcases t ON t.testcase_id = w.testcase_id"
+        " LEFT JOIN subtests st ON st.subtest_id = w.subtest_id"
+        " WHERE (? = '' OR s.suite = ?)"
+        " GROUP BY s.suite, t.test_case, COALESCE(st.description, t.description)"
+        " ORDER BY waived DESC, s.suite, t.test_case LIMIT ?",
+        (args.suite, args.suite, args.limit))
+
+
+def query_sql(warehouse, args):
+    return warehouse.query(args.sql)
+
+
+def format_table(columns, rows):
+    """Plain-text table of a query result."""
+    cells = [[("" if value is None else str(value)) for value in row] for row in rows]
+    widths = [max([len(column)] + [len(row[i]) for row in cells])
+              for i, column in enumerate(columns)]
+    lines = ["  ".join(column.ljust(width) for column, width in zip(columns, widths)).rstrip(),
+             "  ".join("-" * width for width in widths)]
+    lines.extend("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+                 for row in cells)
+    return "\n".join(lines)
+
+
+def cmd_ingest(args):
+    counts = {"added": 0, "replaced": 0, "skipped": 0, "error": 0}
+    with Warehouse(args.db) as warehouse:
+        for path in find_merged_results(args.paths):
+            try:
+                outcome = warehouse.ingest_file(path)
+            except (OSError, ValueError) as exc:
+                print(f"ERROR: {path}: {exc}")
+                outcome = "error"
+            else:
+                if args.verbose or outcome != "skipped":
+                    print(f"{outcome}: {path}")
+            counts[outcome] += 1
+    print(", ".join(f"{count} {outcome}" for outcome, count in counts.items()))
+    return 1 if counts["error"] else 0
+
+
+def cmd_query(args):
+    try:
+        with Warehouse(args.db, readonly=True) as warehouse:
+            columns, rows = args.query(warehouse, args)
+    except FileNotFoundError:
+        print(f"ERROR: {args.db} does not exist; run 'ingest' first")
+        return 1
+    except sqlite3.Error as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    if args.json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=4))
+    else:
+        print(format_table(columns, rows))
+        print(f"({len(rows)} rows)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Load merged_results.json files into an SQLite warehouse and query it."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest",
+                                 help="Load merged results (files, directories or batch indexes)")
+    ingest.add_argument("db", help="Warehouse database (created if missing)")
+    ingest.add_argument("paths", nargs="+",
+                        help=f"{MERGED_JSON_NAME} files, directories searched for them, "
+                             f"or {BATCH_INDEX_NAME}")
+    ingest.add_argument("-v", "--verbose", action="store_true",
+                        help="Also list files that were already loaded")
+    ingest.set_defaults(handler=cmd_ingest)
+
+    def add_query(name, query, help_text):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument("db", help="Warehouse database")
+        sub.add_argument("--json", action="store_true", help="Print rows as JSON objects")
+        sub.set_defaults(handler=cmd_query, query=query)
+        return sub
+
+    runs = add_query("runs", query_runs, "List the ingested runs")
+    runs.add_argument("--platform", default="", help="Only runs of this System Name")
+    rule = add_query("rule", query_rule, "Results of a BSA/SBSA rule on every run")
+    rule.add_argument("rule_id", help="Rule id, e.g. B_PE_01")
+    rule.add_argument("--status", default="", type=str.upper,
+                      help="Only this status, e.g. FAILED or FAILED_WITH_WAIVER")
+    waived = add_query("waived", query_waived, "Most often waived testcases and subtests")
+    waived.add_argument("--suite", default="", help="Only this suite, e.g. SCT")
+    waived.add_argument("--limit", type=int, default=20, help="Number of rows (default: 20)")
+    sql = add_query("sql", query_sql, "Run a read-only SQL query")
+    sql.add_argument("sql", help="SELECT statement")
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
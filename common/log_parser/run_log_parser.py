@@ -0,0 +1,1294 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single-process driver for the ACS log parser pipeline.
+
+Runs the same flow as main_log_parser.sh, but imports every parser, waiver
+and renderer script once and hands parsed results between them in memory.
+Each suite JSON is written exactly once, after waivers have been applied.
+
+The results may also be given as a .tar.gz/.zip archive: the logs are then
+read from it without extracting it (see results_archive.py) and the reports
+are written to --output-dir.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import copy
+import glob
+import hashlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tarfile
+import traceback
+import zipfile
+
+# Define color codes
+YELLOW = "\033[1;33m"
+RED = "\033[0;31m"
+NC = "\033[0m"
+
+SCRIPTS_PATH = os.path.dirname(os.path.realpath(__file__))
+YOCTO_FLAG = "/mnt/yocto_image.flag"
+ACS_RUN_CONFIG = "/mnt/acs_tests/config/acs_run_config.ini"
+
+_MODULES = {}
+
+
+def load_script(rel_path):
+    """Import a log_parser script by path (several share a module name)."""
+    module = _MODULES.get(rel_path)
+    if module is None:
+        name = "acs_" + os.path.splitext(rel_path)[0].replace("/", "_").replace("-", "_")
+        spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPTS_PATH, rel_path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _MODULES[rel_path] = module
+    return module
+
+
+def call_parser(func, *args):
+    """Run a parser entry point; return (exit_code, result) like a subprocess would."""
+    try:
+        with load_script("stage_metrics.py").stage("parse", args):
+            return 0, func(*args)
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else 1
+        return code, None
+    except ValueError as ve:
+        print(f"Error: {ve}")
+        return 1, None
+    except Exception:
+        traceback.print_exc()
+        return 1, None
+
+
+def call_renderer(func, *args, **kwargs):
+    # Renderer failures are reported but never stop the remaining suites.
+    reports = [arg for arg in args if isinstance(arg, str) and arg.endswith(".html")]
+    try:
+        with load_script("stage_metrics.py").stage("render", outputs=reports):
+            return func(*args, **kwargs)
+    except SystemExit:
+        return None
+    except Exception:
+        traceback.print_exc()
+        return None
+
+
+def sbsa_run_enabled():
+    try:
+        with open(ACS_RUN_CONFIG, "r") as f:
+            for line in f:
+                if line.startswith("SbsaRunEnabled="):
+                    return line.split("=", 1)[1].strip() == "1"
+    except OSError:
+        pass
+    return False
+
+
+class ParserRun:
+    """
+    State shared by the pipeline steps of one results directory.
+
+    Logs are looked up and opened through the run: with an archive they are
+    read from it (logs_path is then the results directory inside the
+    archive), otherwise from disk. Reports go under output_path/acs_summary,
+    output_path defaulting to the results directory.
+    """
+
+    def __init__(self, logs_path, acs_config_path="", system_config_path="", waiver_json="",
+                 output_path="", archive=None):
+        self.archive = archive
+        self.logs_path = archive.root if archive is not None else logs_path
+        self.output_path = output_path or self.logs_path
+        self.acs_config_path = acs_config_path or ""
+        self.system_config_path = system_config_path or ""
+        self.waiver_json = waiver_json or ""
+        self.yocto = os.path.isfile(YOCTO_FLAG)
+        self.post_script_log = os.path.join(self.logs_path, "post-script", "post-script.log")
+        self.summary_dir = os.path.join(self.output_path, "acs_summary")
+        self.jsons_dir = os.path.join(self.summary_dir, "acs_jsons")
+        self.htmls_dir = os.path.join(self.summary_dir, "html_detailed_summaries")
+        if self.yocto:
+            self.test_category = "/usr/bin/log_parser/test_categoryDT.json"
+        else:
+            self.test_category = "/usr/bin/log_parser/test_category.json"
+        self.waiver_data = None
+        self.test_category_data = None
+        # load_waivers() result per suite name, indexed once per run
+        self.suite_waivers = {}
+        # JSON path -> parsed data for everything written during this run
+        self.json_data = {}
+
+    def log(self, *parts):
+        return os.path.join(self.logs_path, *parts)
+
+    def _in_archive(self, path):
+        return self.archive is not None and self.archive.contains(path)
+
+    def isfile(self, path):
+        return self.archive.isfile(path) if self._in_archive(path) else os.path.isfile(path)
+
+    def isdir(self, path):
+        return self.archive.isdir(path) if self._in_archive(path) else os.path.isdir(path)
+
+    def listdir(self, path):
+        return self.archive.listdir(path) if self._in_archive(path) else os.listdir(path)
+
+    def glob(self, pattern):
+        return self.archive.glob(pattern) if self._in_archive(pattern) else glob.glob(pattern)
+
+    def find(self, top, name):
+        """Paths of the files called name anywhere below top."""
+        if self._in_archive(top):
+            return self.archive.find(top, name)
+        return [os.path.join(root, name) for root, _, files in os.walk(top) if name in files]
+
+    def input(self, path):
+        """What a parser is given for path: the path itself, or the archive member."""
+        if self._in_archive(path) and self.archive.isfile(path):
+            return self.archive.open(path)
+        return path
+
+    def digest(self, path):
+        return self.archive.digest(path) if self._in_archive(path) else file_digest(path)
+
+    def check_file(self, path, mandatory=False):
+        if not self.isfile(path):
+            if mandatory:
+                print(f"{RED}ERROR: Log file {path} is missing.{NC}")
+            else:
+                print(f"{YELLOW}WARNING: Log file {path} is missing.{NC}")
+            return False
+        print(f"Processing {path} file.")
+        return True
+
+    def json_path(self, name):
+        return os.path.join(self.jsons_dir, name)
+
+    def html_path(self, name):
+        return os.path.join(self.htmls_dir, name)
+
+    def load_waivers(self):
+        if not self.waiver_json:
+            print(f"{YELLOW}WARNING: waiver.json not provided. Waivers will not be applied.{NC}")
+            print("")
+            return
+        if not os.path.isfile(self.waiver_json):
+            print(f"{YELLOW}WARNING: waiver.json ('{self.waiver_json}') must be provided "
+                  f"to apply waivers.{NC}")
+            print("Waivers will not be applied.")
+            print("")
+            return
+        print("Waivers will be applied using:")
+        print(f"  Waiver File        : {self.waiver_json}")
+        print("")
+        try:
+            with open(self.waiver_json, "r", encoding="utf-8") as f:
+                self.waiver_data = json.load(f)
+        except Exception:
+            self.waiver_data = None
+            return
+        try:
+            with open(self.test_category, "r", encoding="utf-8") as f:
+                self.test_category_data = json.load(f)
+        except Exception:
+            self.test_category_data = None
+
+    def emit_json(self, suite_name, json_name, data, waive=True):
+        """Apply waivers to parsed data, then write its JSON artifact once."""
+        path = self.json_path(json_name)
+        stage_metrics = load_script("stage_metrics.py")
+        if waive and self.waiver_data is not None:
+            with stage_metrics.stage("waivers", [self.waiver_json]):
+                apply_waivers = load_script("apply_waivers.py")
+                apply_waivers.verbose = False
+                if suite_name not in self.suite_waivers:
+                    self.suite_waivers[suite_name] = apply_waivers.load_waivers(self.waiver_data,
+                                                                                suite_name)
+                if apply_waivers.apply_waivers_to_data(suite_name, data, self.waiver_data,
+                                                       self.test_category_data, path,
+                                                       self.suite_waivers[suite_name]):
+                    print(f"Waivers successfully applied and '{path}' has been updated.")
+        with stage_metrics.stage("write_json", outputs=[path]):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4)
+        self.json_data[path] = data
+        return path
+
+
+def make_result(processed=False, summary_html="", jsons=None):
+    return {"processed": processed, "summary_html": summary_html, "jsons": jsons or []}
+
+
+################################################################################
+# Per-suite steps
+################################################################################
+
+def _bsa_family(run, suite, json_name, logs):
+    if not logs:
+        return make_result()
+    bsa_parser = load_script("bsa/logs_to_json.py")
+    rc, data = call_parser(bsa_parser.parse_bsa_logs, [run.input(p) for p in logs])
+    if rc != 0 or data is None:
+        print(f"{RED}ERROR: {suite} logs parsing to json failed.{NC}")
+        return make_result()
+    path = run.emit_json(suite, json_name, data)
+    prefix = suite.lower()
+    renderer = load_script("bsa/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path(f"{prefix}_detailed.html"),
+                  run.html_path(f"{prefix}_summary.html"), suite)
+    return make_result(True, run.html_path(f"{prefix}_summary.html"), [path])
+
+
+def step_bsa(run):
+    bsa_log = run.log("uefi", "BsaResults.log")
+    kernel_log = run.log("linux_acs", "bsa_acs_app", "BsaResultsKernel.log")
+    if not run.isfile(kernel_log):
+        kernel_log = run.log("linux", "BsaResultsKernel.log")
+    mandatory = not run.yocto
+    logs = [p for p in (bsa_log, kernel_log) if run.check_file(p, mandatory)]
+    return _bsa_family(run, "BSA", "bsa.json", logs)
+
+
+def step_sbsa(run):
+    if run.yocto:
+        return make_result()
+    mandatory = sbsa_run_enabled()
+    logs = [p for p in (run.log("uefi", "SbsaResults.log"),
+                        run.log("linux", "SbsaResultsKernel.log"))
+            if run.check_file(p, mandatory)]
+    return _bsa_family(run, "SBSA", "sbsa.json", logs)
+
+
+def _fwts_family(run, suite, log_path, json_name, prefix, mandatory):
+    if not run.check_file(log_path, mandatory):
+        return make_result()
+    fwts_parser = load_script("bbr/fwts/logs_to_json.py")
+    rc, data = call_parser(fwts_parser.parse_fwts_log, run.input(log_path))
+    if rc != 0:
+        if suite == "FWTS":
+            print(f"{RED}ERROR: FWTS logs parsing to json failed.{NC}")
+            return make_result()
+        # Like the shell flow, a failed BBSR parse still counts as processed
+        return make_result(True, run.html_path(f"{prefix}_summary.html"),
+                           [run.json_path(json_name)])
+    path = run.emit_json(suite, json_name, data)
+    renderer = load_script("bbr/fwts/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path(f"{prefix}_detailed.html"),
+                  run.html_path(f"{prefix}_summary.html"))
+    return make_result(True, run.html_path(f"{prefix}_summary.html"), [path])
+
+
+def step_fwts(run):
+    return _fwts_family(run, "FWTS", run.log("fwts", "FWTSResults.log"), "fwts.json", "fwts", True)
+
+
+def step_bbsr_fwts(run):
+    return _fwts_family(run, "BBSR-FWTS", run.log("bbsr", "fwts", "FWTSResults.log"),
+                        "bbsr_fwts.json", "bbsr_fwts", False)
+
+
+def _edk2_step(run, sct_log, edk2_log, json_name):
+    # edk2-test-parser results are only consumed when the matching SCT log exists
+    if not edk2_log or not run.isfile(sct_log) or not run.check_file(edk2_log):
+        return make_result()
+    edk2_parser = load_script("bbr/sct/logs_to_json_edk2.py")
+    rc, data = call_parser(edk2_parser.parse_edk2_log, run.input(edk2_log))
+    if rc != 0:
+        return make_result()
+    return make_result(False, "", [run.emit_json("EDK2", json_name, data, waive=False)])
+
+
+def step_edk2(run):
+    return _edk2_step(run, run.log("sct_results", "Overall", "Summary.log"),
+                      run.log("edk2-test-parser", "edk2-test-parser.log"),
+                      "edk2_test_parser.json")
+
+
+def step_bbsr_edk2(run):
+    # The BBSR edk2-test-parser log is only consumed in DT mode
+    edk2_log = run.log("edk2-test-parser", "edk2-test-parser-bbsr.log") if run.yocto else ""
+    return _edk2_step(run, run.log("bbsr", "sct_results", "Overall", "Summary.log"),
+                      edk2_log, "edk2_test_parser-bbsr.json")
+
+
+def _sct_family(run, suite, log_path, json_name, prefix, mandatory, edk2_json):
+    if not run.check_file(log_path, mandatory):
+        return make_result()
+    # Parsed by the edk2 step this run, else left over from an earlier one
+    edk2_path = run.json_path(edk2_json)
+    edk2 = run.json_data.get(edk2_path)
+    if edk2 is None and os.path.exists(edk2_path):
+        with open(edk2_path, "r", encoding="utf-8") as f:
+            edk2 = json.load(f)
+    sct_parser = load_script("bbr/sct/logs_to_json.py")
+    rc, data = call_parser(sct_parser.parse_sct_log, run.input(log_path), edk2)
+    if rc != 0:
+        if suite == "SCT":
+            print(f"{RED}ERROR: SCT logs parsing to json failed.{NC}")
+            return make_result()
+        # Like the shell flow, a failed BBSR parse still counts as processed
+        return make_result(True, run.html_path(f"{prefix}_summary.html"),
+                           [run.json_path(json_name)])
+    path = run.emit_json(suite, json_name, data)
+    renderer = load_script("bbr/sct/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path(f"{prefix}_detailed.html"),
+                  run.html_path(f"{prefix}_summary.html"))
+    return make_result(True, run.html_path(f"{prefix}_summary.html"), [path])
+
+
+def step_sct(run):
+    return _sct_family(run, "SCT", run.log("sct_results", "Overall", "Summary.log"),
+                       "sct.json", "sct", True, "edk2_test_parser.json")
+
+
+def step_bbsr_sct(run):
+    return _sct_family(run, "BBSR-SCT", run.log("bbsr", "sct_results", "Overall", "Summary.log"),
+                       "bbsr_sct.json", "bbsr_sct", False, "edk2_test_parser-bbsr.json")
+
+
+def step_bbsr_tpm(run):
+    log_path = run.log("bbsr", "tpm2", "verify_tpm_measurements.log")
+    if not run.check_file(log_path):
+        return make_result()
+    summary_html = run.html_path("bbsr_tpm_summary.html")
+    tpm_parser = load_script("bbr/tpm/logs_to_json.py")
+    rc, data = call_parser(tpm_parser.build_tpm_output, run.input(log_path))
+    if rc != 0 or data is None:
+        return make_result(True, summary_html, [run.json_path("bbsr_tpm.json")])
+    path = run.emit_json("BBSR-TPM", "bbsr_tpm.json", data)
+    renderer = load_script("bbr/tpm/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path("bbsr_tpm_detailed.html"), summary_html)
+    return make_result(True, summary_html, [path])
+
+
+def step_pfdi(run):
+    if not run.yocto:
+        return make_result()
+    log_path = run.log("uefi", "pfdiresults.log")
+    if not run.check_file(log_path):
+        return make_result()
+    bsa_parser = load_script("bsa/logs_to_json.py")
+    rc, data = call_parser(bsa_parser.parse_bsa_logs, [run.input(log_path)])
+    if rc == 0 and data is None:
+        rc = 1
+    if rc != 0:
+        if rc == 1:
+            print(f"{RED} PFDI -- Not Implemented{NC}")
+        else:
+            print(f"{RED}ERROR: PFDI logs parsing to json failed.{NC}")
+        return make_result()
+    path = run.emit_json("PFDI", "pfdi.json", data)
+    renderer = load_script("bsa/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path("pfdi_detailed.html"),
+                  run.html_path("pfdi_summary.html"), "PFDI")
+    return make_result(True, run.html_path("pfdi_summary.html"), [path])
+
+
+def step_scmi(run):
+    if not run.yocto:
+        return make_result()
+    log_path = run.log("linux_acs", "scmi_acs_app", "arm_scmi_test_log.txt")
+    if not run.check_file(log_path):
+        return make_result()
+    scmi_parser = load_script("scmi/logs_to_json.py")
+    rc, data = call_parser(scmi_parser.parse_scmi_logs, [run.input(log_path)])
+    if rc == 0:
+        if data is None:
+            rc = 2
+        elif not data:
+            rc = 1
+    if rc != 0:
+        result = make_result()
+        if rc == 2:
+            # Exported by the parent once the suite stage has joined
+            result["env"] = {"SCMI_LOG_PRESENT": "1"}
+            print(f"{YELLOW}WARNING: SCMI raw transport base path error; "
+                  f"treating SCMI as not run.{NC}")
+        elif rc == 1:
+            print(f"{RED} SCMI -- Not Implemented{NC}")
+        else:
+            print(f"{RED}ERROR: SCMI logs parsing to json failed.{NC}")
+        return result
+    path = run.emit_json("SCMI", "scmi.json", data)
+    renderer = load_script("scmi/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path("scmi_detailed.html"),
+                  run.html_path("scmi_summary.html"))
+    return make_result(True, run.html_path("scmi_summary.html"), [path])
+
+
+def _sbmr_band(run, band, band_dir):
+    xml_path = run.log("sbmr", band_dir, "output.xml")
+    if not run.check_file(xml_path, True):
+        return make_result()
+    sbmr_parser = load_script("sbmr/logs_to_json.py")
+    rc, data = call_parser(sbmr_parser.parse_robot_xml_data, run.input(xml_path))
+    if rc != 0:
+        print(f"{RED}ERROR: SBMR {band.upper()} logs parsing to json failed.{NC}")
+        return make_result()
+    json_name = f"sbmr_{band}.json"
+    path = run.emit_json("SBMR", json_name, data)
+    renderer = load_script("sbmr/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path(f"sbmr_{band}_detailed.html"),
+                  run.html_path(f"sbmr_{band}_summary.html"),
+                  renderer.friendly_label_from_filename(json_name),
+                  run.log("sbmr", band_dir, "report.html"))
+    return make_result(True, run.html_path(f"sbmr_{band}_summary.html"), [path])
+
+
+def step_sbmr_ib(run):
+    if run.yocto:
+        return make_result()
+    return _sbmr_band(run, "ib", "sbmr_in_band_logs")
+
+
+def step_sbmr_oob(run):
+    if run.yocto:
+        return make_result()
+    return _sbmr_band(run, "oob", "sbmr_out_of_band_logs")
+
+
+def step_post_script(run):
+    if not run.yocto or not run.check_file(run.post_script_log, True):
+        return make_result()
+    post_parser = load_script("post_script/logs_to_json.py")
+    rc, data = call_parser(post_parser.parse_post_script_log, run.input(run.post_script_log))
+    if rc != 0:
+        print(f"{RED}ERROR: post-script logs parsing to json failed.{NC}")
+        return make_result()
+    path = run.emit_json("POST_SCRIPT", "post_script.json", data)
+    renderer = load_script("post_script/json_to_html.py")
+    call_renderer(renderer.render_reports, copy.deepcopy(data),
+                  run.html_path("post_script_detailed.html"),
+                  run.html_path("post_script_summary.html"))
+    return make_result(True, run.html_path("post_script_summary.html"), [path])
+
+
+def step_standalone(run):
+    if not run.yocto:
+        return make_result()
+    standalone = load_script("standalone_tests/logs_to_json.py")
+    tools = run.log("linux_tools")
+    jsons = []
+
+    def single(log_path, json_name, mandatory, label=None, waive=True):
+        if not run.check_file(log_path, mandatory):
+            if label == "SMBIOS":
+                print(f"{YELLOW}WARNING: SMBIOS log not found: {log_path}{NC}")
+            return
+        rc, data = call_parser(standalone.parse_single_log, run.input(log_path))
+        if rc != 0:
+            if label:
+                print(f"{RED}ERROR: {label} log parsing to json failed.{NC}")
+            return
+        jsons.append(run.emit_json("Standalone", json_name, data, waive))
+
+    single(os.path.join(tools, "dt_kselftest.log"), "dt_kselftest.json", False)
+    single(os.path.join(tools, "dt-validate-parser.log"), "dt_validate.json", True)
+    single(os.path.join(tools, "ethtool-test.log"), "ethtool_test.json", True)
+    single(os.path.join(tools, "read_write_check_blk_devices.log"),
+           "read_write_check_blk_devices.json", True)
+
+    fw_dir = os.path.join(os.path.dirname(run.logs_path), "fw")
+    capsule_results = os.path.join(fw_dir, "capsule_test_results.log")
+    if run.check_file(capsule_results, True):
+        rc, data = call_parser(standalone.parse_capsule_update_logs,
+                               run.input(os.path.join(fw_dir, "capsule-update.log")),
+                               run.input(os.path.join(fw_dir, "capsule-on-disk.log")),
+                               run.input(capsule_results))
+        if rc == 0:
+            jsons.append(run.emit_json("Standalone", "capsule_update.json", data))
+        else:
+            print("WARNING: Capsule Update JSON not created.")
+
+    psci_log = os.path.join(tools, "psci", "psci_kernel.log")
+    if run.check_file(psci_log):
+        rc, data = call_parser(standalone.parse_psci_logs, run.input(psci_log))
+        if rc != 0:
+            print(f"{RED}ERROR: PSCI log parsing to json failed.{NC}")
+        elif not data:
+            print("Invalid PSCI log, skipping JSON dump.")
+        else:
+            jsons.append(run.emit_json("Standalone", "psci.json", data, waive=False))
+
+    single(run.log("sct_results", "Overall", "Summary.log"), "smbios_check.json", True, "SMBIOS")
+    single(run.log("network_boot", "network_boot_results.log"), "network_boot.json", True,
+           "Network boot")
+    single(os.path.join(tools, "runtime_device_mapping_conflict_test.log"),
+           "runtime_dev_map.json", True, "Runtime device mapping")
+
+    if not jsons:
+        return make_result()
+    summary_html = run.html_path("standalone_tests_summary.html")
+    renderer = load_script("standalone_tests/json_to_html.py")
+    call_renderer(renderer.render_reports, [copy.deepcopy(run.json_data[p]) for p in jsons],
+                  run.html_path("standalone_tests_detailed.html"), summary_html,
+                  include_drop_down=True)
+    return make_result(True, summary_html, jsons)
+
+
+def step_os_tests(run):
+    os_logs_path = os.path.join(os.path.dirname(run.logs_path), "os-logs")
+    os_renderer = load_script("os_tests/json_to_html.py")
+    summary_html = run.html_path("os_tests_summary.html")
+    jsons = []
+    boot_sources = []
+
+    if run.yocto:
+        os_parser = load_script("os_tests/logs_to_json.py")
+        if run.isdir(os_logs_path) and run.listdir(os_logs_path):
+            for os_dir in sorted(run.glob(os.path.join(os_logs_path, "linux*"))):
+                if not run.isdir(os_dir):
+                    continue
+                os_name = os.path.basename(os_dir)
+                eth_log = os.path.join(os_dir, "ethtool_test.log")
+                boot_log = os.path.join(os_dir, "boot_sources.log")
+                if not run.isfile(eth_log):
+                    print(f"{RED}ERROR: ethtool_test.log not found in {os_dir}{NC}")
+                    continue
+                rc, data = call_parser(os_parser.parse_log, run.input(eth_log), os_name)
+                if rc != 0:
+                    continue
+                jsons.append(run.emit_json("os Tests", f"ethtool_test_{os_name}.json", data))
+                boot_sources.append(boot_log if run.isfile(boot_log) else "Unknown")
+        else:
+            print(f"{RED}ERROR: No os-logs found in os-logs directory at {os_logs_path}{NC}")
+    else:
+        sr_parser = load_script("os_tests/sr_logs_to_json.py")
+        release_files = [run.input(p)
+                         for p in run.find(os_logs_path, sr_parser.OS_RELEASE_FILE_NAME)]
+        rc, data = call_parser(sr_parser.build_results, os_logs_path,
+                               run.input(run.post_script_log), release_files)
+        if rc == 0:
+            jsons.append(run.emit_json("os Tests", "os_test.json", data))
+        else:
+            print(f"{RED}ERROR: SR OS logs parsing to json failed.{NC}")
+
+    if not jsons:
+        return make_result()
+    call_renderer(os_renderer.render_reports,
+                  [(p, copy.deepcopy(run.json_data[p])) for p in jsons],
+                  run.html_path("os_tests_detailed.html"), summary_html,
+                  include_drop_down=True, boot_sources_paths=boot_sources)
+    return make_result(True, summary_html, jsons)
+
+
+SuiteStep = collections.namedtuple("SuiteStep", ["key", "run", "requires", "inputs", "outputs"])
+
+
+def _outputs(jsons=(), reports=()):
+    """Artifacts under acs_summary/ for the given JSON names and HTML report prefixes."""
+    paths = [os.path.join("acs_jsons", name) for name in jsons]
+    for prefix in reports:
+        paths.append(os.path.join("html_detailed_summaries", f"{prefix}_detailed.html"))
+        paths.append(os.path.join("html_detailed_summaries", f"{prefix}_summary.html"))
+    return tuple(paths)
+
+
+SCT_SUMMARY_LOG = "sct_results/Overall/Summary.log"
+BBSR_SCT_SUMMARY_LOG = "bbsr/sct_results/Overall/Summary.log"
+
+# Pipeline order matches main_log_parser.sh. "requires" lists the steps whose
+# outputs a step reads. "inputs" are the logs it reads, relative to the results
+# directory, and "outputs" the artifacts it may write under acs_summary/; both
+# feed the re-parse cache. Steps with no path between them in this graph may
+# run concurrently.
+SUITE_STEPS = [
+    SuiteStep("bsa", step_bsa, (),
+              ("uefi/BsaResults.log", "linux_acs/bsa_acs_app/BsaResultsKernel.log",
+               "linux/BsaResultsKernel.log"),
+              _outputs(["bsa.json"], ["bsa"])),
+    SuiteStep("sbsa", step_sbsa, (),
+              ("uefi/SbsaResults.log", "linux/SbsaResultsKernel.log", ACS_RUN_CONFIG),
+              _outputs(["sbsa.json"], ["sbsa"])),
+    SuiteStep("fwts", step_fwts, (), ("fwts/FWTSResults.log",),
+              _outputs(["fwts.json"], ["fwts"])),
+    SuiteStep("edk2", step_edk2, (),
+              (SCT_SUMMARY_LOG, "edk2-test-parser/edk2-test-parser.log"),
+              _outputs(["edk2_test_parser.json"])),
+    SuiteStep("sct", step_sct, ("edk2",), (SCT_SUMMARY_LOG,),
+              _outputs(["sct.json"], ["sct"])),
+    SuiteStep("bbsr_fwts", step_bbsr_fwts, (), ("bbsr/fwts/FWTSResults.log",),
+              _outputs(["bbsr_fwts.json"], ["bbsr_fwts"])),
+    SuiteStep("bbsr_edk2", step_bbsr_edk2, (),
+              (BBSR_SCT_SUMMARY_LOG, "edk2-test-parser/edk2-test-parser-bbsr.log"),
+              _outputs(["edk2_test_parser-bbsr.json"])),
+    SuiteStep("bbsr_sct", step_bbsr_sct, ("bbsr_edk2",), (BBSR_SCT_SUMMARY_LOG,),
+              _outputs(["bbsr_sct.json"], ["bbsr_sct"])),
+    SuiteStep("bbsr_tpm", step_bbsr_tpm, (), ("bbsr/tpm2/verify_tpm_measurements.log",),
+              _outputs(["bbsr_tpm.json"], ["bbsr_tpm"])),
+    SuiteStep("pfdi", step_pfdi, (), ("uefi/pfdiresults.log",),
+              _outputs(["pfdi.json"], ["pfdi"])),
+    SuiteStep("scmi", step_scmi, (), ("linux_acs/scmi_acs_app/arm_scmi_test_log.txt",),
+              _outputs(["scmi.json"], ["scmi"])),
+    SuiteStep("sbmr_ib", step_sbmr_ib, (),
+              ("sbmr/sbmr_in_band_logs/output.xml", "sbmr/sbmr_in_band_logs/report.html"),
+              _outputs(["sbmr_ib.json"], ["sbmr_ib"])),
+    SuiteStep("sbmr_oob", step_sbmr_oob, (),
+              ("sbmr/sbmr_out_of_band_logs/output.xml", "sbmr/sbmr_out_of_band_logs/report.html"),
+              _outputs(["sbmr_oob.json"], ["sbmr_oob"])),
+    SuiteStep("post_script", step_post_script, (), ("post-script/post-script.log",),
+              _outputs(["post_script.json"], ["post_script"])),
+    SuiteStep("standalone", step_standalone, (),
+              ("linux_tools/dt_kselftest.log", "linux_tools/dt-validate-parser.log",
+               "linux_tools/ethtool-test.log", "linux_tools/read_write_check_blk_devices.log",
+               "../fw/capsule-update.log", "../fw/capsule-on-disk.log",
+               "../fw/capsule_test_results.log", "linux_tools/psci/psci_kernel.log",
+               SCT_SUMMARY_LOG, "network_boot/network_boot_results.log",
+               "linux_tools/runtime_device_mapping_conflict_test.log"),
+              _outputs(["dt_kselftest.json", "dt_validate.json", "ethtool_test.json",
+                        "read_write_check_blk_devices.json", "capsule_update.json", "psci.json",
+                        "smbios_check.json", "network_boot.json", "runtime_dev_map.json"],
+                       ["standalone_tests"])),
+    SuiteStep("os_tests", step_os_tests, (), ("../os-logs", "post-script/post-script.log"),
+              _outputs(["os_test.json", "ethtool_test_linux*.json"], ["os_tests"])),
+]
+
+STEPS_BY_KEY = {step.key: step for step in SUITE_STEPS}
+
+# Members read from a results archive, relative to the results directory: the
+# step inputs, with os-logs narrowed to the files the OS steps open, and the
+# logs behind acs_info.json and the summary page.
+ARCHIVE_PATTERNS = sorted(
+    {rel for step in SUITE_STEPS for rel in step.inputs if not os.path.isabs(rel)} - {"../os-logs"}
+    | {"../os-logs/linux*/ethtool_test.log", "../os-logs/linux*/boot_sources.log",
+       "../os-logs/*cat-etc-os-release.txt", "uefi_dump/uefi_version.log",
+       "linux_dump/dmidecode.txt", "linux_dump/ipmitool.txt"}
+)
+
+# Scripts used by the suite steps; imported once before the pool forks so the
+# workers do not each pay for jinja2 start-up and template loading.
+STEP_SCRIPTS = [
+    "apply_waivers.py",
+    "bsa/logs_to_json.py", "bsa/json_to_html.py",
+    "bbr/fwts/logs_to_json.py", "bbr/fwts/json_to_html.py",
+    "bbr/sct/logs_to_json_edk2.py", "bbr/sct/logs_to_json.py", "bbr/sct/json_to_html.py",
+    "bbr/tpm/logs_to_json.py", "bbr/tpm/json_to_html.py",
+    "scmi/logs_to_json.py", "scmi/json_to_html.py",
+    "sbmr/logs_to_json.py", "sbmr/json_to_html.py",
+    "post_script/logs_to_json.py", "post_script/json_to_html.py",
+    "standalone_tests/logs_to_json.py", "standalone_tests/json_to_html.py",
+    "os_tests/logs_to_json.py", "os_tests/sr_logs_to_json.py", "os_tests/json_to_html.py",
+]
+
+# Scripts used by the stages around the suite steps
+STAGE_SCRIPTS = ["acs_info.py", "merge_jsons.py", "generate_acs_summary.py", "results_archive.py",
+                 "stage_metrics.py"]
+
+
+def preload_scripts(scripts=None):
+    """
+    Import scripts (default: STEP_SCRIPTS) and compile the report pages, so
+    forked workers share them.
+    """
+    for rel_path in STEP_SCRIPTS if scripts is None else scripts:
+        load_script(rel_path)
+    # The renderers share report_templates; compile its pages once too
+    importlib.import_module("report_templates").preload()
+
+
+# Order in which suite JSONs are handed to merge_jsons
+MERGE_ORDER = [
+    "bsa", "sbsa", "fwts", "sct", "sbmr_ib", "sbmr_oob", "bbsr_fwts", "bbsr_sct",
+    "bbsr_tpm", "pfdi", "scmi", "post_script", "standalone", "os_tests",
+]
+
+# Positional summary arguments of generate_acs_summary.py ("capsule" is always empty)
+SUMMARY_ORDER = [
+    "bsa", "sbsa", "fwts", "sct", "bbsr_fwts", "bbsr_sct", "bbsr_tpm", "pfdi",
+    "post_script", "standalone", "os_tests", "capsule", "sbmr_ib", "sbmr_oob", "scmi",
+]
+
+
+################################################################################
+# Re-parse cache
+################################################################################
+
+CACHE_DIR_NAME = "acs_cache"
+
+_PARSER_VERSION = None
+
+
+def file_digest(path):
+    """sha256 of a file, or of a directory tree; None if the path does not exist."""
+    if os.path.isdir(path):
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                full = os.path.join(root, name)
+                digest.update(os.path.relpath(full, path).encode("utf-8") + b"\0")
+                digest.update((file_digest(full) or "").encode("ascii") + b"\0")
+        return digest.hexdigest()
+    if not os.path.isfile(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(*parts):
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def parser_version():
+    """Hash of the parser sources, so any code change invalidates the cache."""
+    global _PARSER_VERSION
+    if _PARSER_VERSION is None:
+        scripts = STEP_SCRIPTS + STAGE_SCRIPTS + ["fail_counts.py", "log_encoding.py",
+                                                  "suite_info.py", "summary_chart.py",
+                                                  "report_templates/__init__.py"]
+        scripts += sorted(os.path.relpath(path, SCRIPTS_PATH) for path in
+                          glob.glob(os.path.join(SCRIPTS_PATH, "report_templates", "*.html")))
+        _PARSER_VERSION = cache_key(
+            file_digest(os.path.realpath(__file__)),
+            [[rel_path, file_digest(os.path.join(SCRIPTS_PATH, rel_path))] for rel_path in scripts],
+            # SVG and PNG charts produce different HTML from the same inputs
+            load_script("summary_chart.py").chart_format(),
+        )
+    return _PARSER_VERSION
+
+
+class ResultCache:
+    """Stage results of earlier runs, reused while the stage inputs are unchanged.
+
+    The cache lives in <output>/acs_cache/, next to acs_summary/. Each stage
+    keeps a manifest with the key of its inputs and its result, plus copies of
+    the artifacts it left under acs_summary/.
+    """
+
+    def __init__(self, run):
+        self.run = run
+        self.cache_dir = os.path.join(run.output_path, CACHE_DIR_NAME)
+
+    def _manifest_path(self, stage):
+        return os.path.join(self.cache_dir, f"{stage}.json")
+
+    def _files_dir(self, stage):
+        return os.path.join(self.cache_dir, stage)
+
+    def suite_keys(self):
+        """Input key of every suite step: logs, waivers, test category and parser version."""
+        run = self.run
+        waiver_digest = file_digest(run.waiver_json) if run.waiver_json else None
+        category_digest = file_digest(run.test_category)
+        keys = {}
+        for step in SUITE_STEPS:
+            keys[step.key] = cache_key(
+                step.key, parser_version(), run.yocto, waiver_digest, category_digest,
+                [[rel_path, run.digest(run.log(rel_path))] for rel_path in step.inputs],
+                [keys[dep] for dep in step.requires],
+            )
+        return keys
+
+    def lookup(self, stage, key):
+        try:
+            with open(self._manifest_path(stage), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("key") != key:
+            return None
+        files_dir = self._files_dir(stage)
+        if not all(os.path.isfile(os.path.join(files_dir, rel)) for rel in manifest["files"]):
+            return None
+        return manifest
+
+    def restore(self, stage, manifest):
+        """Copy cached artifacts back into acs_summary/ and return the stage result."""
+        summary_dir = self.run.summary_dir
+        files_dir = self._files_dir(stage)
+        for rel in manifest["files"]:
+            dest = os.path.join(summary_dir, rel)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copyfile(os.path.join(files_dir, rel), dest)
+        result = manifest.get("result")
+        if result is not None:
+            result = dict(result)
+            if result["summary_html"]:
+                result["summary_html"] = os.path.join(summary_dir, result["summary_html"])
+            result["jsons"] = [os.path.join(summary_dir, rel) for rel in result["jsons"]]
+        return result
+
+    def store(self, stage, key, patterns, result=None):
+        """Record the artifacts matching patterns (relative to acs_summary/)."""
+        summary_dir = self.run.summary_dir
+        files = []
+        for pattern in patterns:
+            for path in sorted(glob.glob(os.path.join(summary_dir, pattern))):
+                if os.path.isfile(path):
+                    files.append(os.path.relpath(path, summary_dir))
+        files_dir = self._files_dir(stage)
+        shutil.rmtree(files_dir, ignore_errors=True)
+        for rel in files:
+            dest = os.path.join(files_dir, rel)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copyfile(os.path.join(summary_dir, rel), dest)
+        if result is not None:
+            result = dict(result)
+            if result["summary_html"]:
+                result["summary_html"] = os.path.relpath(result["summary_html"], summary_dir)
+            result["jsons"] = [os.path.relpath(p, summary_dir) for p in result["jsons"]]
+        # The manifest goes last so an interrupted store is never reused
+        manifest_path = self._manifest_path(stage)
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"key": key, "files": files, "result": result}, f, indent=4)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def reused_message(stage):
+    return f"Reusing cached {stage} results; inputs unchanged.\n"
+
+
+################################################################################
+# Pipeline
+################################################################################
+
+def write_acs_info(run, cache=None, step_keys=None):
+    inputs = {
+        "acs_config_path": run.acs_config_path,
+        "system_config_path": run.system_config_path,
+        "uefi_version_log": run.log("uefi_dump", "uefi_version.log"),
+        "dmidecode_log": run.log("linux_dump", "dmidecode.txt"),
+        "ipmitool_log": run.log("linux_dump", "ipmitool.txt"),
+        "psci_kernel_log": run.log("linux_tools", "psci", "psci_kernel.log"),
+    }
+    path = run.json_path("acs_info.json")
+    read = [run.input(value) for value in inputs.values() if value and run.isfile(value)]
+    with load_script("stage_metrics.py").stage("acs_info", read, [path]) as stage:
+        key = None
+        if cache is not None:
+            # Keyed on every suite too, so the report date moves whenever a suite is re-parsed
+            key = cache_key("acs_info", parser_version(),
+                            [[name, run.digest(value) if value else None]
+                             for name, value in sorted(inputs.items())],
+                            sorted((step_keys or {}).items()))
+            manifest = cache.lookup("acs_info", key)
+            if manifest is not None:
+                stage.cached = True
+                cache.restore("acs_info", manifest)
+                with open(path, "r", encoding="utf-8") as f:
+                    run.json_data[path] = json.load(f)
+                sys.stdout.write(reused_message("acs_info"))
+                return path
+
+        acs_info = load_script("acs_info.py")
+        data = acs_info.collect_acs_info(**{name: run.input(value)
+                                            for name, value in inputs.items()})
+        run.emit_json("ACS_INFO", "acs_info.json", data, waive=False)
+        if cache is not None:
+            cache.store("acs_info", key, [os.path.join("acs_jsons", "acs_info.json")])
+    return path
+
+
+def merge_results(run, results, cache=None, compact=False, verify_counts=False):
+    merged_json = run.json_path("merged_results.json")
+    json_files = []
+    acs_info_json = run.json_path("acs_info.json")
+    if os.path.isfile(acs_info_json):
+        json_files.append(acs_info_json)
+    for key in MERGE_ORDER:
+        result = results.get(key, make_result())
+        if key in ("bsa", "fwts", "sct"):
+            # These are picked up whenever the JSON exists, as in the shell flow
+            path = run.json_path(f"{key}.json")
+            if os.path.isfile(path):
+                json_files.append(path)
+        elif key in ("standalone", "os_tests"):
+            if result["processed"]:
+                json_files.extend(result["jsons"])
+        elif result["processed"]:
+            json_files.extend(p for p in result["jsons"] if os.path.isfile(p))
+
+    if not json_files:
+        print("No JSON files to merge.")
+        return merged_json
+    with load_script("stage_metrics.py").stage("merge", json_files, [merged_json]) as stage:
+        key = None
+        if cache is not None:
+            key = cache_key("merge", parser_version(), run.yocto, compact, verify_counts,
+                            file_digest(run.test_category),
+                            [[os.path.relpath(p, run.summary_dir), file_digest(p)]
+                             for p in json_files])
+            manifest = cache.lookup("merge", key)
+            if manifest is not None:
+                stage.cached = True
+                cache.restore("merge", manifest)
+                sys.stdout.write(reused_message("merge"))
+                print(f"ACS Merged JSON: {merged_json}")
+                return merged_json
+
+        merge_jsons = load_script("merge_jsons.py")
+        merge_jsons.merge_json_files(json_files, merged_json, preloaded=run.json_data,
+                                     compact=compact, verify_counts=verify_counts)
+        if cache is not None:
+            cache.store("merge", key, [os.path.join("acs_jsons", "merged_results.json")])
+    print(f"ACS Merged JSON: {merged_json}")
+    return merged_json
+
+
+def generate_summary(run, results, merged_json, cache=None, pdf=None):
+    # The PDF is made in DT mode unless pdf says otherwise
+    make_pdf = run.yocto if pdf is None else pdf
+    acs_summary_html = run.html_path("acs_summary.html")
+    argv = []
+    for key in SUMMARY_ORDER:
+        result = results.get(key, make_result())
+        argv.append(result["summary_html"] if result["processed"] else "")
+    argv.append(acs_summary_html)
+
+    uefi_version_log = run.log("uefi_dump", "uefi_version.log")
+    if not run.isfile(uefi_version_log):
+        print(f"INFO: UEFI version log '{os.path.basename(uefi_version_log)}' not found.")
+        uefi_version_log = ""
+    device_tree_dts = os.environ.get("DEVICE_TREE_DTS", "")
+    acs_info_json = run.json_path("acs_info.json")
+    stage_metrics = load_script("stage_metrics.py")
+    metrics_json = os.path.join(run.summary_dir, stage_metrics.METRICS_FILE_NAME)
+    if not (stage_metrics.metrics_html_enabled() and os.path.isfile(metrics_json)):
+        metrics_json = ""
+    for flag, value in (("--acs_config_path", run.acs_config_path),
+                        ("--system_config_path", run.system_config_path),
+                        ("--uefi_version_log", uefi_version_log),
+                        ("--device_tree_dts", device_tree_dts),
+                        ("--acs_info_json", acs_info_json if os.path.isfile(acs_info_json) else ""),
+                        ("--merged_json", merged_json if os.path.isfile(merged_json) else ""),
+                        ("--stage_metrics_json", metrics_json)):
+        if value:
+            argv.extend([flag, value])
+
+    acs_summary_pdf = os.path.join(run.summary_dir, "acs_summary.pdf")
+    # The detailed suite pages belong to their suite steps; the summary step only retitles
+    # some of them, which is redone on a cache hit (see adjust_detailed_summary_headings())
+    summary_outputs = [os.path.join("html_detailed_summaries", "acs_summary.html"),
+                       "acs_summary.pdf"]
+    read = [run.input(arg) for arg in argv if arg != acs_summary_html and run.isfile(arg)]
+    with stage_metrics.stage("summary", read, [acs_summary_html]) as stage:
+        key = None
+        summary = load_script("generate_acs_summary.py")
+        if cache is not None:
+            detailed = [p for p in sorted(glob.glob(os.path.join(run.htmls_dir, "*.html")))
+                        if p != acs_summary_html]
+            key = cache_key("summary", parser_version(), run.yocto, make_pdf,
+                            [["file", os.path.relpath(arg, run.logs_path), run.digest(arg)]
+                             if run.isfile(arg) and arg != acs_summary_html else arg
+                             for arg in argv],
+                            [[os.path.relpath(p, run.summary_dir), file_digest(p)]
+                             for p in detailed])
+            manifest = cache.lookup("summary", key)
+            if manifest is not None:
+                stage.cached = True
+                cache.restore("summary", manifest)
+                summary.adjust_detailed_summary_headings(run.htmls_dir)
+                sys.stdout.write(reused_message("summary"))
+                print(f"ACS HTML Summary : {acs_summary_html}")
+                if make_pdf and os.path.isfile(acs_summary_pdf):
+                    print(f"ACS PDF Summary : {acs_summary_pdf}")
+                return acs_summary_html
+
+        call_renderer(summary.main, argv, uefi_version_log=run.input(uefi_version_log))
+    print(f"ACS HTML Summary : {acs_summary_html}")
+
+    if make_pdf and os.path.isfile(acs_summary_html):
+        print(" Converting ACS HTML Summary to PDF")
+        with stage_metrics.stage("pdf", [acs_summary_html], [acs_summary_pdf]):
+            try:
+                from weasyprint import HTML, CSS
+                HTML(acs_summary_html).write_pdf(
+                    acs_summary_pdf, stylesheets=[CSS(string='@page { margin: 0; }')])
+                print(f"ACS PDF Summary : {acs_summary_pdf}")
+            except Exception as e:
+                print(f"{RED}ERROR: PDF conversion failed: {e}{NC}")
+    if cache is not None:
+        cache.store("summary", key, summary_outputs)
+    return acs_summary_html
+
+
+def _summary_files(run, patterns):
+    """Files under acs_summary/ matching patterns relative to it."""
+    return [path for pattern in patterns
+            for path in sorted(glob.glob(os.path.join(run.summary_dir, pattern)))
+            if os.path.isfile(path)]
+
+
+def run_step(run, step):
+    """Run one suite step as a stage: its logs in, its artifacts out."""
+    logs = [run.input(run.log(rel)) for rel in step.inputs
+            if run.isfile(run.log(rel)) or run.isdir(run.log(rel))]
+    with load_script("stage_metrics.py").stage(step.key, logs) as stage:
+        result = step.run(run)
+        stage.outputs = _summary_files(run, step.outputs)
+    return result
+
+
+def _run_step_worker(run, key, metrics_started):
+    """Pool entry point: run one step and hand back its output, JSON data and stage records."""
+    stage_metrics = load_script("stage_metrics.py")
+    recorder = stage_metrics.StageRecorder(started=metrics_started)
+    previous = stage_metrics.activate(recorder)
+    inherited = set(run.json_data)
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            result = run_step(run, STEPS_BY_KEY[key])
+    finally:
+        stage_metrics.activate(previous)
+    written = {path: data for path, data in run.json_data.items() if path not in inherited}
+    return result, written, buf.getvalue(), recorder.records
+
+
+def _restore_step(run, cache, step, key):
+    """Return (result, JSON data) of a step reused from the cache, or None."""
+    if cache is None:
+        return None
+    manifest = cache.lookup(step.key, key)
+    if manifest is None:
+        return None
+    with load_script("stage_metrics.py").stage(step.key) as stage:
+        stage.cached = True
+        result = cache.restore(step.key, manifest)
+        data = {}
+        for path in result["jsons"]:
+            if os.path.isfile(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    data[path] = json.load(f)
+        stage.outputs = [os.path.join(run.summary_dir, rel) for rel in manifest["files"]]
+    return result, data
+
+
+def _run_suite_steps_parallel(run, jobs, cache, step_keys):
+    # Step output is buffered in the worker and replayed in SUITE_STEPS order,
+    # so the console log reads exactly as a serial run would.
+    order = [step.key for step in SUITE_STEPS]
+    results = {}
+    outputs = {}
+    written = {}
+    pending = list(order)
+    running = {}
+    next_to_print = 0
+
+    recorder = load_script("stage_metrics.py").current()
+    metrics_started = recorder.started if recorder is not None else None
+    mp_context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+        preload_scripts()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as pool:
+        while pending or running:
+            for key in list(pending):
+                if all(dep in results for dep in STEPS_BY_KEY[key].requires):
+                    pending.remove(key)
+                    cached = _restore_step(run, cache, STEPS_BY_KEY[key], step_keys.get(key))
+                    if cached is not None:
+                        results[key], step_written = cached
+                        written.update(step_written)
+                        outputs[key] = reused_message(key)
+                        continue
+                    # Workers only get the JSON data of the steps they depend on
+                    worker_run = copy.copy(run)
+                    worker_run.json_data = {}
+                    for dep in STEPS_BY_KEY[key].requires:
+                        for path in results[dep]["jsons"]:
+                            if path in written:
+                                worker_run.json_data[path] = written[path]
+                    running[pool.submit(_run_step_worker, worker_run, key, metrics_started)] = key
+            if running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+            else:
+                done = ()
+            for future in done:
+                key = running.pop(future)
+                results[key], step_written, outputs[key], records = future.result()
+                written.update(step_written)
+                if recorder is not None:
+                    recorder.extend(records)
+                if cache is not None:
+                    cache.store(key, step_keys[key], STEPS_BY_KEY[key].outputs, results[key])
+            while next_to_print < len(order) and order[next_to_print] in outputs:
+                sys.stdout.write(outputs.pop(order[next_to_print]))
+                sys.stdout.flush()
+                next_to_print += 1
+
+    # Record JSON data in pipeline order, as the serial path would
+    for key in order:
+        for path in results[key]["jsons"]:
+            if path in written:
+                run.json_data[path] = written[path]
+    return results
+
+
+def run_suite_steps(run, jobs=1, cache=None, step_keys=None):
+    step_keys = step_keys or {}
+    if jobs > 1:
+        results = _run_suite_steps_parallel(run, jobs, cache, step_keys)
+    else:
+        results = {}
+        for step in SUITE_STEPS:
+            cached = _restore_step(run, cache, step, step_keys.get(step.key))
+            if cached is not None:
+                results[step.key], step_written = cached
+                run.json_data.update(step_written)
+                sys.stdout.write(reused_message(step.key))
+                continue
+            results[step.key] = run_step(run, step)
+            if cache is not None:
+                cache.store(step.key, step_keys[step.key], step.outputs, results[step.key])
+    for key in STEPS_BY_KEY:
+        os.environ.update(results[key].get("env", {}))
+    return results
+
+
+def open_results_archive(archive_path):
+    """Read the members the pipeline needs from a results archive; None on error."""
+    results_archive = load_script("results_archive.py")
+    if not results_archive.is_archive(archive_path):
+        print(f"{RED}ERROR: {archive_path} is not a directory or a .tar/.tar.gz/.zip archive.{NC}")
+        return None
+    try:
+        archive = results_archive.open_archive(archive_path, ARCHIVE_PATTERNS)
+    except (ValueError, OSError, EOFError, tarfile.TarError, zipfile.BadZipFile) as exc:
+        print(f"{RED}ERROR: Cannot read results archive {archive_path}: {exc}{NC}")
+        return None
+    print(f"Reading results from {archive.root}")
+    return archive
+
+
+def run_pipeline(logs_path, acs_config_path="", system_config_path="", waiver_json="", jobs=1,
+                 use_cache=True, compact_json=False, output_path="", pdf=None, verify_counts=False):
+    archive = None
+    if os.path.isfile(logs_path):
+        archive = open_results_archive(logs_path)
+        if archive is None:
+            return None
+        if not output_path:
+            output_path = load_script("results_archive.py").archive_stem(logs_path)
+    # The archive's temporary files go as soon as the run is over, not at exit
+    with archive if archive is not None else contextlib.nullcontext():
+        run = ParserRun(logs_path, acs_config_path, system_config_path, waiver_json,
+                        output_path, archive)
+        usage = ("If you want {what}, please use this format: "
+                 f"{os.path.basename(sys.argv[0])} <acs_results_directory> "
+                 "[acs_config.txt] [system_config.txt] [waiver.json]")
+        if not run.acs_config_path:
+            print(f"{YELLOW}WARNING: ACS information will be affected on summary page "
+                  f"as acs_config.txt is not provided{NC}")
+            print("")
+            print(usage.format(what="ACS information"))
+            print("")
+        if not run.system_config_path:
+            print(f"{YELLOW}WARNING: System information may be incomplete "
+                  f"as system_config.txt is not provided{NC}")
+            print("")
+            print(usage.format(what="complete system information"))
+            print("")
+
+        os.makedirs(run.jsons_dir, exist_ok=True)
+        os.makedirs(run.htmls_dir, exist_ok=True)
+
+        cache = ResultCache(run) if use_cache else None
+        step_keys = cache.suite_keys() if cache is not None else {}
+
+        stage_metrics = load_script("stage_metrics.py")
+        recorder = stage_metrics.StageRecorder()
+        metrics_json = os.path.join(run.summary_dir, stage_metrics.METRICS_FILE_NAME)
+        previous = stage_metrics.activate(recorder)
+        try:
+            write_acs_info(run, cache, step_keys)
+            print("")
+            print(f"Test category: {run.test_category}\n")
+            run.load_waivers()
+
+            results = run_suite_steps(run, jobs, cache, step_keys)
+            merged_json = merge_results(run, results, cache, compact=compact_json,
+                                        verify_counts=verify_counts)
+            print("")
+            # Written before the summary too, for its optional stage table
+            recorder.write(metrics_json)
+            generate_summary(run, results, merged_json, cache, pdf=pdf)
+            print("")
+        finally:
+            stage_metrics.activate(previous)
+        recorder.write(metrics_json)
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Parse ACS results in a single process "
+                    "(in-memory equivalent of main_log_parser.sh)."
+    )
+    parser.add_argument("logs_path", help="ACS results directory, or a .tar.gz/.zip archive of it")
+    parser.add_argument("acs_config_path", nargs="?", default="", help="Path to acs_config.txt")
+    parser.add_argument("system_config_path", nargs="?", default="",
+                        help="Path to system_config.txt")
+    parser.add_argument("waiver_json", nargs="?", default="", help="Path to waiver.json")
+    parser.add_argument("-o", "--output-dir", default="",
+                        help="Where acs_summary/ is written (default: the results directory; "
+                             "for an archive, its path without the archive suffix)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of suites parsed in parallel "
+                             "(default: number of CPUs, 1 = serial)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Re-parse everything and leave {CACHE_DIR_NAME}/ untouched")
+    parser.add_argument("--png-charts", action="store_true",
+                        help="Embed matplotlib PNG charts instead of inline SVG "
+                             "(same as ACS_CHART_FORMAT=png)")
+    parser.add_argument("--compact-json", action="store_true",
+                        help="Write merged_results.json without indentation")
+    parser.add_argument("--verify-counts", action="store_true",
+                        help="Recount each suite's failures in the merge "
+                             "instead of trusting suite_summary")
+    parser.add_argument("--stage-metrics-html", action="store_true",
+                        help="Add the stage timing table to acs_summary.html "
+                             "(same as ACS_STAGE_METRICS_HTML=1)")
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.png_charts:
+        os.environ[load_script("summary_chart.py").CHART_FORMAT_ENV] = "png"
+    if args.stage_metrics_html:
+        os.environ[load_script("stage_metrics.py").METRICS_HTML_ENV] = "1"
+
+    results = run_pipeline(args.logs_path, args.acs_config_path, args.system_config_path,
+                           args.waiver_json, args.jobs, use_cache=not args.no_cache,
+                           compact_json=args.compact_json, output_path=args.output_dir,
+                           verify_counts=args.verify_counts)
+    return 0 if results is not None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
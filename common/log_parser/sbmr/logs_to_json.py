@@ -18,9 +18,20 @@
 
 import json
 import argparse
+import os
+import sys
 import xml.etree.ElementTree as ET
 from collections import OrderedDict
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import FailCounter
+# pylint: enable=wrong-import-position
+
 # ---------- constants ----------
 
 RESULT_MAP = {
@@ -86,8 +97,13 @@ def _extract_reason_from_test(test_elem):
 
 def parse_robot_xml(input_file, output_file):
     # Parse Robot Framework output.xml into SBMR JSON.
+    write_output(parse_robot_xml_data(input_file), output_file)
+
+def parse_robot_xml_data(input_file):
+    # Parse Robot Framework output.xml and return the SBMR result dict.
     suites = OrderedDict()
     overall = _empty_summary()
+    fails = FailCounter()
     global_subtest_num = 0
 
     def ensure_suite(suite_name: str):
@@ -152,6 +168,7 @@ def parse_robot_xml(input_file, output_file):
             sub["reason"] = reason
         suite_obj["Test_cases"][case_idx]["subtests"].append(sub)
         tally(mapped, suite_name, case_idx)
+        fails.add(mapped)
 
     # Robot Framework output.xml
     tree = ET.parse(input_file)
@@ -183,10 +200,18 @@ def parse_robot_xml(input_file, output_file):
     for top_suite in root.findall("suite"):
         walk_suite(top_suite, [])
 
-    finalize_and_write(suites, output_file)
+    return finalize(suites, fails)
 
 def finalize_and_write(suites, output_file):
     # Drop empty cases, recompute totals, and write the output JSON.
+    write_output(finalize(suites), output_file)
+
+def write_output(output, output_file):
+    with open(output_file, "w") as jf:
+        json.dump(output, jf, indent=4)
+
+def finalize(suites, fails=None):
+    # Drop empty cases and recompute totals; record the fails counted while parsing.
     for suite_name in list(suites.keys()):
         cases = suites[suite_name]["Test_cases"]
         filtered = [c for c in cases if c["subtests"]]
@@ -205,9 +230,7 @@ def finalize_and_write(suites, output_file):
         "test_results": list(suites.values()),
         "suite_summary": recompute_overall()
     }
-
-    with open(output_file, "w") as jf:
-        json.dump(output, jf, indent=4)
+    return fails.record(output) if fails is not None else output
 
 def main(input_file, output_file):
     # CLI entrypoint.
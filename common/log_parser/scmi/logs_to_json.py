@@ -15,11 +15,22 @@
 # limitations under the License.
 
 import argparse
-import chardet
 import json
+import os
 import re
+import sys
 from collections import OrderedDict
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import FailCounter, store_fail_counts
+from log_encoding import open_log
+# pylint: enable=wrong-import-position
+
 STATUS_MAP = {
     "CONFORMANT": "PASSED",
     "NON CONFORMANT": "FAILED",
@@ -38,14 +49,6 @@ NO_ACCESS_RE = re.compile(r"Calling agent have no access to\s+(.*?)\s+protocol",
 FATAL_SCMI_RE = re.compile(r"Failed to open SCMI raw transport base path", re.I)
 
 
-def detect_file_encoding(file_path):
-    """Detect log encoding so we can read bytes safely."""
-    with open(file_path, "rb") as file:
-        raw_data = file.read()
-    result = chardet.detect(raw_data)
-    return result["encoding"] or "utf-8"
-
-
 def init_summary():
     """Create a fresh summary counter dict."""
     return {
@@ -79,6 +82,8 @@ def parse_scmi_logs(input_files):
     """Parse SCMI log files into the common JSON structure."""
     suites = OrderedDict()
     overall_summary = init_summary()
+    # Per suite, since a suite found inaccessible drops its testcases
+    suite_fails = {}
     current_suite = ""
     current_test = None
     current_details = []
@@ -95,6 +100,7 @@ def parse_scmi_logs(input_files):
                 "testcases": [],
                 "test_suite_summary": init_summary(),
             }
+            suite_fails[suite_name] = FailCounter()
 
     def add_testcase(suite_name, number, description, result, reason=None):
         """Append a testcase and update per-suite and overall summaries."""
@@ -112,6 +118,7 @@ def parse_scmi_logs(input_files):
         suites[suite_name]["testcases"].append(testcase)
         update_summary(suites[suite_name]["test_suite_summary"], result)
         update_summary(overall_summary, result)
+        suite_fails[suite_name].add(result)
         return
 
     def start_new_run():
@@ -119,14 +126,14 @@ def parse_scmi_logs(input_files):
         nonlocal suites, overall_summary, current_suite, current_test, current_details, run_started
         suites = OrderedDict()
         overall_summary = init_summary()
+        suite_fails.clear()
         current_suite = ""
         current_test = None
         current_details = []
         run_started = True
 
     for input_file in input_files:
-        file_encoding = detect_file_encoding(input_file)
-        with open(input_file, "r", encoding=file_encoding, errors="ignore") as f:
+        with open_log(input_file) as f:
             lines = f.read().splitlines()
 
         for raw_line in lines:
@@ -161,6 +168,7 @@ def parse_scmi_logs(input_files):
                 reason_text = line.strip()
                 suite_entry["reason"] = reason_text
                 suite_entry["testcases"] = []
+                suite_fails[suite_key] = FailCounter()
                 current_test = None
                 current_details = []
                 continue
@@ -227,10 +235,11 @@ def parse_scmi_logs(input_files):
     if not suites:
         return {}
 
-    return {
+    return store_fail_counts({
         "test_results": list(suites.values()),
         "suite_summary": overall_summary,
-    }
+    }, sum(fails.failed for fails in suite_fails.values()),
+        sum(fails.failed_with_waiver for fails in suite_fails.values()))
 
 
 def main(input_files, output_file):
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall time, CPU time, peak RSS and I/O bytes of each log parser stage.
+
+run_log_parser.py wraps its parse, waiver, render, merge and summary stages
+in StageRecorder.stage(); with ACS_STAGE_METRICS=1, main_log_parser.sh runs
+every python3 step through "stage_metrics.py run". Both leave the figures in
+acs_summary/stage_metrics.json.
+
+Peak RSS is the VmHWM of the process, reset at the start of every stage
+through /proc/self/clear_refs, so each stage gets its own peak. Where that
+is not available, the process-wide ru_maxrss is used instead.
+
+With ACS_PROFILE_DIR set, each top-level stage also leaves a cProfile dump,
+<stage>.prof, in that directory.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+METRICS_FILE_NAME = "stage_metrics.json"
+PROFILE_DIR_ENV = "ACS_PROFILE_DIR"
+# Adds the stage table to acs_summary.html when set to 1
+METRICS_HTML_ENV = "ACS_STAGE_METRICS_HTML"
+
+_CLEAR_REFS = "/proc/self/clear_refs"
+_STATUS = "/proc/self/status"
+
+_current = None
+
+
+def metrics_html_enabled():
+    return os.environ.get(METRICS_HTML_ENV, "").strip() == "1"
+
+
+def profile_dir():
+    return os.environ.get(PROFILE_DIR_ENV, "").strip()
+
+
+def _read_vmhwm():
+    try:
+        with open(_STATUS, "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _reset_vmhwm():
+    """Restart the VmHWM peak at the current RSS; False if the kernel does not allow it."""
+    try:
+        with open(_CLEAR_REFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _maxrss_bytes(who=resource.RUSAGE_SELF):
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    maxrss = resource.getrusage(who).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def _peak_rss_method():
+    return "vmhwm" if _read_vmhwm() is not None and _reset_vmhwm() else "ru_maxrss"
+
+
+def size_of(item):
+    """Bytes behind a stage input or output: a path, an in-memory log, or a list of them."""
+    if isinstance(item, (list, tuple)):
+        return sum(size_of(i) for i in item)
+    if hasattr(item, "getbuffer"):
+        return item.getbuffer().nbytes
+    if not isinstance(item, (str, os.PathLike)) or not item:
+        return 0
+    if os.path.isfile(item):
+        return os.path.getsize(item)
+    if os.path.isdir(item):
+        return sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, files in os.walk(item) for name in files
+                   if os.path.isfile(os.path.join(root, name)))
+    return 0
+
+
+def _profile_path(directory, name):
+    return os.path.join(directory, name.replace("/", "_").replace(" ", "_") + ".prof")
+
+
+class Stage:
+    """A running stage; inputs and outputs may be added until it ends."""
+
+    def __init__(self, name, depth, inputs=(), outputs=()):
+        self.name = name
+        self.depth = depth
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.cached = False
+        self.peak_rss = 0
+
+
+class StageRecorder:
+    """Collects one record per stage; nested stages are recorded as name/child."""
+
+    def __init__(self, pipeline="run_log_parser", started=None):
+        self.pipeline = pipeline
+        self.records = []
+        self.peak_rss_method = _peak_rss_method()
+        self._stack = []
+        # perf_counter() is system-wide on Linux, so forked workers can share the start
+        self.started = time.perf_counter() if started is None else started
+
+    @contextlib.contextmanager
+    def stage(self, name, inputs=(), outputs=()):
+        if self._stack:
+            name = f"{self._stack[-1].name}/{name}"
+        stage = Stage(name, len(self._stack), inputs, outputs)
+        profiler = None
+        directory = profile_dir()
+        if directory and stage.depth == 0:
+            import cProfile
+            profiler = cProfile.Profile()
+        if self._stack and self.peak_rss_method == "vmhwm":
+            # The reset below would lose the enclosing stage's peak so far
+            self._stack[-1].peak_rss = max(self._stack[-1].peak_rss, _read_vmhwm() or 0)
+        if self.peak_rss_method == "vmhwm":
+            _reset_vmhwm()
+        self._stack.append(stage)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield stage
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            wall = time.perf_counter() - start_wall
+            cpu = time.process_time() - start_cpu
+            self._stack.pop()
+            if self.peak_rss_method == "vmhwm":
+                stage.peak_rss = max(stage.peak_rss, _read_vmhwm() or 0)
+            else:
+                stage.peak_rss = _maxrss_bytes()
+            if self._stack:
+                self._stack[-1].peak_rss = max(self._stack[-1].peak_rss, stage.peak_rss)
+            if profiler is not None:
+                os.makedirs(directory, exist_ok=True)
+                profiler.dump_stats(_profile_path(directory, name))
+            self.records.append(make_record(
+                name, wall, cpu, stage.peak_rss, size_of(stage.inputs), size_of(stage.outputs),
+                depth=stage.depth, cached=stage.cached,
+                start=start_wall - self.started,
+            ))
+
+    def extend(self, records):
+        """Add the records of a stage run in another process (e.g. a pool worker)."""
+        self.records.extend(records)
+
+    def to_dict(self):
+        # Records are added as stages end; list them as they started, parents first
+        records = sorted(self.records, key=lambda r: (r["start_seconds"], r["depth"]))
+        return metrics_document(self.pipeline, self.peak_rss_method, records)
+
+    def write(self, path):
+        write_metrics(path, self.to_dict())
+
+
+def make_record(name, wall, cpu, peak_rss, input_bytes, output_bytes, depth=0, cached=False,
+                start=0.0, pid=None):
+    return {
+        "stage": name,
+        "depth": depth,
+        "cached": cached,
+        "pid": pid if pid is not None else os.getpid(),
+        "start_seconds": round(start, 6),
+        "wall_seconds": round(wall, 6),
+        "cpu_seconds": round(cpu, 6),
+        "peak_rss_bytes": peak_rss,
+        "input_bytes": input_bytes,
+        "output_bytes": output_bytes,
+    }
+
+
+def metrics_document(pipeline, peak_rss_method, records):
+    # Nested stages are already part of their top-level stage
+    top = [r for r in records if r["depth"] == 0]
+    return {
+        "pipeline": pipeline,
+        "peak_rss_method": peak_rss_method,
+        "totals": {
+            "stages": len(top),
+            "wall_seconds": round(sum(r["wall_seconds"] for r in top), 6),
+            "cpu_seconds": round(sum(r["cpu_seconds"] for r in top), 6),
+            "peak_rss_bytes": max((r["peak_rss_bytes"] for r in top), default=0),
+            "input_bytes": sum(r["input_bytes"] for r in top),
+            "output_bytes": sum(r["output_bytes"] for r in top),
+        },
+        "stages": records,
+    }
+
+
+def write_metrics(path, document):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=4)
+    os.replace(path + ".tmp", path)
+
+
+def load_metrics(path):
+    """Return a stage_metrics.json document, or None if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return document if isinstance(document, dict) and "stages" in document else None
+
+
+def activate(recorder):
+    """Make recorder the target of stage(); return the one it replaces."""
+    global _current
+    previous, _current = _current, recorder
+    return previous
+
+
+def current():
+    return _current
+
+
+def stage(name, inputs=(), outputs=()):
+    """Record a stage with the active recorder; a no-op when there is none."""
+    if _current is None:
+        return contextlib.nullcontext(Stage(name, 0, inputs, outputs))
+    return _current.stage(name, inputs, outputs)
+
+
+################################################################################
+# main_log_parser.sh wrapper
+################################################################################
+
+def _file_state(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _snapshot(paths):
+    """State of every file argument, and of the files below every directory argument."""
+    files = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                for name in names:
+                    full = os.path.join(root, name)
+                    files[full] = _file_state(full)
+        else:
+            files[path] = _file_state(path)
+    return files
+
+
+def _shell_stage_name(command, named_file, scripts_path):
+    if command[0] == "-c":
+        return "python3 -c"
+    script = os.path.abspath(command[0])
+    if scripts_path and script.startswith(os.path.abspath(scripts_path) + os.sep):
+        script = os.path.relpath(script, scripts_path)
+    else:
+        script = os.path.basename(script)
+    return f"{script} ({os.path.basename(named_file)})" if named_file else script
+
+
+def run_command(command, metrics_path, scripts_path="", python=sys.executable):
+    """Run "python3 <command>", append its record to metrics_path and return its exit code.
+
+    Outputs are the files among, or below, the command's path arguments that
+    it creates or modifies. Inputs are the file arguments that exist
+    beforehand, and the files below directory arguments it does not write to.
+    """
+    # Arguments that name files, including outputs that do not exist yet
+    paths = [arg for arg in command[1:] if arg and not arg.startswith("-")
+             and (os.path.sep in arg or os.path.splitext(arg)[1] or os.path.exists(arg))]
+    before = _snapshot(paths)
+
+    argv = [python] + list(command)
+    directory = profile_dir()
+    profile_out = ""
+    if directory and command[0] != "-c":
+        os.makedirs(directory, exist_ok=True)
+        profile_out = os.path.join(directory, f"pending-{os.getpid()}.prof")
+        argv = [python, "-m", "cProfile", "-o", profile_out] + list(command)
+    start_wall = time.perf_counter()
+    try:
+        returncode = subprocess.call(argv)
+    except KeyboardInterrupt:
+        returncode = 130
+    wall = time.perf_counter() - start_wall
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    after = _snapshot(paths)
+    outputs = [path for path, state in after.items()
+               if state is not None and state != before.get(path)]
+    inputs = [path for path in paths if not os.path.isdir(path) and before.get(path) is not None]
+    for path in paths:
+        prefix = path.rstrip(os.sep) + os.sep
+        if os.path.isdir(path) and not any(out.startswith(prefix) for out in outputs):
+            inputs.append(path)
+    name = _shell_stage_name(command, (outputs or inputs or [""])[0], scripts_path)
+    if profile_out and os.path.isfile(profile_out):
+        os.replace(profile_out, _profile_path(directory, name))
+
+    document = load_metrics(metrics_path) or {"stages": []}
+    started = document.get("started", time.time() - wall)
+    record = make_record(name, wall, usage.ru_utime + usage.ru_stime,
+                         _maxrss_bytes(resource.RUSAGE_CHILDREN),
+                         size_of(inputs), size_of(outputs), start=time.time() - wall - started)
+    record["exit_code"] = returncode
+    document = metrics_document("main_log_parser.sh", "ru_maxrss", document["stages"] + [record])
+    document["started"] = started
+    write_metrics(metrics_path, document)
+    return returncode
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run one python3 step of main_log_parser.sh and record its stage metrics."
+    )
+    sub = parser.add_subparsers(dest="command_name", required=True)
+    run = sub.add_parser("run", help="Run a python3 command line and append its stage record")
+    run.add_argument("--metrics", required=True, help=f"{METRICS_FILE_NAME} to append to")
+    run.add_argument("--scripts-path", default="", help="Directory stage names are relative to")
+    run.add_argument("python_args", nargs=argparse.REMAINDER,
+                     help="Arguments for python3, after --")
+    show = sub.add_parser("show", help=f"Print the stages of a {METRICS_FILE_NAME}, slowest first")
+    show.add_argument("metrics", help=f"Path to {METRICS_FILE_NAME}")
+    args = parser.parse_args(argv)
+
+    if args.command_name == "run":
+        command = args.python_args[1:] if args.python_args[:1] == ["--"] else args.python_args
+        if not command:
+            parser.error("run needs a python3 command line after --")
+        return run_command(command, args.metrics, args.scripts_path)
+
+    document = load_metrics(args.metrics)
+    if document is None:
+        print(f"ERROR: {args.metrics} is not a stage metrics file")
+        return 1
+    print(f"{'Stage':<56} {'Wall s':>9} {'CPU s':>9} {'Peak RSS MiB':>13} "
+          f"{'In KiB':>10} {'Out KiB':>10}")
+    for record in sorted(document["stages"], key=lambda r: -r["wall_seconds"]):
+        print(f"{record['stage']:<56} {record['wall_seconds']:>9.3f} "
+              f"{record['cpu_seconds']:>9.3f} {record['peak_rss_bytes'] / 1048576:>13.1f} "
+              f"{record['input_bytes'] / 1024:>10.1f} {record['output_bytes'] / 1024:>10.1f}")
+    totals = document["totals"]
+    print(f"Total: {totals['stages']} stages, {totals['wall_seconds']:.3f} s wall, "
+          f"{totals['cpu_seconds']:.3f} s CPU")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
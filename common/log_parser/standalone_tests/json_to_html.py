@@ -15,13 +15,21 @@
 # limitations under the License.
 
 import json
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from jinja2 import Template
+import os
 import sys
 import argparse
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from report_templates import render_to_file
+from suite_info import suite_info_for_page
+from summary_chart import bar_chart_html
+# pylint: enable=wrong-import-position
+
 # 1) Detect which columns are used among all subtests in a given test
 def detect_columns_used(subtests):
     """
@@ -72,308 +80,14 @@ def generate_bar_chart(suite_summary):
     ]
     colors = ['#d4edda', '#f8d7da', '#fff3cd', '#f39c12']
 
-    plt.figure(figsize=(8, 6))
-    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
-
-    total_tests = sum(sizes)
-    for bar, size in zip(bars, sizes):
-        yval = bar.get_height()
-        if total_tests > 0:
-            percentage = (size / total_tests) * 100
-            label = f'{percentage:.2f}%'
-        else:
-            label = '0%'
-        plt.text(
-            bar.get_x() + bar.get_width() / 2,
-            yval + (max(sizes)*0.02 if total_tests > 0 else 0.1),
-            label,
-            ha='center',
-            va='bottom',
-            fontsize=12
-        )
-
-    plt.title('Standalone test Results', fontsize=16, fontweight='bold', pad=20)
-    plt.ylabel('Number of Standalone tests', fontsize=14)
-    plt.tight_layout()
-
-    buffer = BytesIO()
-    plt.savefig(buffer, format='png')
-    plt.close()
-    buffer.seek(0)
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return bar_chart_html(labels, sizes, colors, 'Standalone test Results',
+                          'Number of Standalone tests', figsize=(8, 6), title_size=16)
 
 
 def generate_html(suite_summary, test_results_list, output_html_path,
                   is_summary_page=True, include_drop_down=False):
     test_suite_name = 'Standalone'
 
-    template = Template(r"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>{{ test_suite_name }} Test Summary</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f4f4f4;
-        }
-        h1, h2, h3 {
-            color: #2c3e50;
-            text-align: center;
-            margin: 0;
-            padding: 10px 0;
-        }
-        h1 {
-            margin-bottom: 20px;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }
-        th, td {
-            padding: 12px;
-            border: 1px solid #ddd;
-            font-size: 16px;
-        }
-        th {
-            background-color: #3498db;
-            color: white;
-            font-weight: bold;
-            text-align: left;
-        }
-        td:first-child {
-            text-align: left;
-        }
-        .summary-table td:nth-child(2) {
-            text-align: center;
-            font-weight: bold;
-        }
-        .pass {
-            background-color: #d4edda;
-        }
-        .fail {
-            background-color: #f8d7da;
-        }
-        .waiver {
-            background-color: #f39c12;
-        }
-        .warning {
-            background-color: #fff3cd;
-        }
-        .aborted {
-            background-color: #9e9e9e;
-        }
-        .skipped {
-            background-color: #ffe0b2;
-        }
-        .unknown {
-            background-color: #cccccc;
-        }
-        .summary-table {
-            margin: 0 auto;
-            width: 80%;
-        }
-        .summary-table td.total-tests {
-            text-align: center;
-        }
-        .chart-container {
-            display: flex;
-            justify-content: center;
-            margin-bottom: 40px;
-        }
-        .result-summary, .detailed-summary {
-            margin-top: 40px;
-            padding: 20px;
-            background-color: #fff;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        }
-        .result-summary h2 {
-            border-bottom: 2px solid #27ae60;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-            font-weight: bold;
-        }
-        .test-suite-header {
-            font-size: 22px;
-            font-weight: bold;
-            color: #34495e;
-        }
-        .test-suite-description {
-            font-size: 20px;
-            margin-bottom: 20px;
-            color: #7f8c8d;
-        }
-        .test-case-header {
-            font-size: 20px;
-            font-weight: bold;
-            color: #16a085;
-            margin-top: 10px;
-        }
-        .test-case-description {
-            font-size: 18px;
-            margin-bottom: 15px;
-            color: #7f8c8d;
-        }
-        .dropdown {
-            margin: 20px 0;
-            text-align: center;
-        }
-        .dropdown select {
-            padding: 10px;
-            font-size: 16px;
-        }
-    </style>
-    <script>
-        function jumpToSection() {
-            var select = document.getElementById('sectionSelect');
-            var sectionId = select.options[select.selectedIndex].value;
-            location.hash = sectionId;
-        }
-    </script>
-</head>
-<body>
-    <h1>{{ test_suite_name }} Test Summary</h1>
-
-    {% if not is_summary_page %}
-    <div class="chart-container">
-        <img src="data:image/png;base64,{{ chart_data }}" alt="Standalone tests Results">
-    </div>
-    {% endif %}
-
-    <div class="result-summary">
-        <h2>Result Summary</h2>
-        <table class="summary-table">
-            <thead>
-                <tr>
-                    <th>Status</th>
-                    <th>Total</th>
-                </tr>
-            </thead>
-            <tbody>
-                <tr>
-                    <td>Total Standalone tests</td>
-                    <td class="total-tests">{{ total_tests }}</td>
-                </tr>
-                <tr>
-                    <td>Passed</td>
-                    <td class="pass">{{ total_passed }}</td>
-                </tr>
-                <tr>
-                    <td>Failed</td>
-                    <td class="fail">{{ total_failed }}</td>
-                </tr>
-                <tr>
-                    <td>Warnings</td>
-                    <td class="warning">{{ total_warnings }}</td>
-                </tr>
-                <tr>
-                    <td>Failed with Waiver</td>
-                    <td class="waiver">{{ total_failed_with_waiver }}</td>
-                </tr>
-            </tbody>
-        </table>
-    </div>
-
-    {% if not is_summary_page %}
-    {% if include_drop_down %}
-    <div class="dropdown">
-        <label for="sectionSelect">Jump to Standalone tests:</label>
-        <select id="sectionSelect" onchange="jumpToSection()">
-            {% for idx, test_results in enumerate(test_results_list) %}
-            {% if test_results and test_results[0] %}
-            {% set test = test_results[0] %}
-            <option value="section{{ idx }}">{{ test.Test_suite }} - {{ test.Test_case }}</option>
-            {% endif %}
-            {% endfor %}
-        </select>
-    </div>
-    {% endif %}
-
-    <div class="detailed-summary">
-        {% for idx, test_results in enumerate(test_results_list) %}
-        {% if include_drop_down %}
-        <a id="section{{ idx }}"></a>
-        {% endif %}
-        {% for test in test_results %}
-
-        <div class="test-suite-header">Test Suite: {{ test.Test_suite }}</div>
-        <div class="test-suite-description">Description: {{ test.Test_suite_description }}</div>
-
-        <div class="test-case-header">Test Case: {{ test.Test_case }}</div>
-        <div class="test-case-description">Description: {{ test.Test_case_description }}</div>
-
-        {# We ignore dynamic reason columns and use a single "Reason" + "Waiver Reason" #}
-        <table>
-            <thead>
-                <tr>
-                    <th>Sub Test Number</th>
-                    <th>Sub Test Description</th>
-                    <th>Sub Test Result</th>
-                    <th>Reason</th>
-                    <th>Waiver Reason</th>
-                </tr>
-            </thead>
-            <tbody>
-                {% for subtest in test.subtests %}
-                {% set r = subtest.sub_test_result %}
-                {% set status = (
-                    'PASSED' if r.PASSED > 0 else
-                    'FAILED_WITH_WAIVER' if r.FAILED_WITH_WAIVER > 0 else
-                    'FAILED' if r.FAILED > 0 else
-                    'ABORTED' if r.ABORTED > 0 else
-                    'SKIPPED' if r.SKIPPED > 0 else
-                    'WARNINGS' if r.WARNINGS > 0 else
-                    'UNKNOWN'
-                ) %}
-                <tr>
-                    <td>{{ subtest.sub_Test_Number }}</td>
-                    <td>{{ subtest.sub_Test_Description }}</td>
-                    <td class="{% if status == 'PASSED' %}pass{% elif status == 'FAILED' %}fail{% elif status == 'FAILED_WITH_WAIVER' %}waiver{% elif status == 'WARNINGS' %}warning{% elif status == 'ABORTED' %}aborted{% elif status == 'SKIPPED' %}skipped{% elif status == 'UNKNOWN' %}unknown{% endif %}">
-                        {% if status == 'FAILED_WITH_WAIVER' %}
-                            FAILED WITH WAIVER
-                        {% else %}
-                            {{ status }}
-                        {% endif %}
-                    </td>
-                    {# Combine pass, fail, skip, abort, warning reasons into one "Reason" column #}
-                    {% set all_reasons = [] %}
-                    {% for reasons in [r.pass_reasons, r.fail_reasons, r.abort_reasons, r.skip_reasons, r.warning_reasons] if reasons %}
-                        {# Handle both string and array formats #}
-                        {% if reasons is string %}
-                            {% set _ = all_reasons.append(reasons) %}
-                        {% elif reasons is iterable %}
-                            {% for reason in reasons %}
-                                {% if reason is iterable and reason is not string %}
-                                    {% for subreason in reason %}
-                                        {% set _ = all_reasons.append(subreason) %}
-                                    {% endfor %}
-                                {% else %}
-                                    {% set _ = all_reasons.append(reason) %}
-                                {% endif %}
-                            {% endfor %}
-                        {% endif %}
-                    {% endfor %}
-                    <td>
-                        {{ all_reasons|join("<br>")|safe if all_reasons else "N/A" }}
-                    </td>
-                    <td>
-                        {{ r.waiver_reason if r.waiver_reason else "N/A" }}
-                    </td>
-                </tr>
-                {% endfor %}
-            </tbody>
-        </table>
-        {% endfor %}
-        {% endfor %}
-    </div>
-    {% endif %}
-</body>
-</html>
-""")
-
     # Compute total tests for summary
     total_tests = (suite_summary.get('total_passed', 0) +
                    suite_summary.get('total_failed', 0) +
@@ -386,7 +100,10 @@ def generate_html(suite_summary, test_results_list, output_html_path,
     else:
         chart_data = None
 
-    html_content = template.render(
+    render_to_file(
+        "standalone_tests.html",
+        output_html_path,
+        suite_info=suite_info_for_page(output_html_path),
         test_suite_name=test_suite_name,
         total_tests=total_tests,
         total_passed=suite_summary.get("total_passed", 0),
@@ -400,9 +117,6 @@ def generate_html(suite_summary, test_results_list, output_html_path,
         enumerate=enumerate
     )
 
-    with open(output_html_path, "w") as f:
-        f.write(html_content)
-
 
 def get_subtest_status(subtest_result):
     if subtest_result.get('PASSED', 0) > 0:
@@ -430,6 +144,21 @@ def main():
                         help='Include drop-down menu in detailed summary')
     args = parser.parse_args()
 
+    datasets = []
+    for input_json_file in args.input_json_files:
+        try:
+            with open(input_json_file, 'r') as jf:
+                datasets.append(json.load(jf))
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Error reading {input_json_file}: {e}")
+            continue
+
+    if not render_reports(datasets, args.detailed_html_file, args.summary_html_file,
+                          include_drop_down=args.include_drop_down):
+        sys.exit(1)
+
+def render_reports(datasets, detailed_html_file, summary_html_file, include_drop_down=False):
+    """Render the combined standalone pages; return False when no results were found."""
     test_results_list = []
     combined_suite_summary = {
         'total_passed': 0,
@@ -438,14 +167,7 @@ def main():
         'total_failed_with_waiver': 0
     }
 
-    for input_json_file in args.input_json_files:
-        try:
-            with open(input_json_file, 'r') as jf:
-                data = json.load(jf)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Error reading {input_json_file}: {e}")
-            continue
-
+    for data in datasets:
         test_results = data.get("test_results", [])
         if test_results:
             # 2) For each test in test_results, compute columns_used
@@ -485,24 +207,25 @@ def main():
                          combined_suite_summary['total_failed_with_waiver'])
     if total_standalones == 0:
         print("No valid data found in input JSON(s).")
-        sys.exit(1)
+        return False
 
     # Generate detailed summary
     generate_html(
         combined_suite_summary,
         test_results_list,
-        args.detailed_html_file,
+        detailed_html_file,
         is_summary_page=False,
-        include_drop_down=args.include_drop_down
+        include_drop_down=include_drop_down
     )
 
     # Generate summary page
     generate_html(
         combined_suite_summary,
         test_results_list,
-        args.summary_html_file,
+        summary_html_file,
         is_summary_page=True
     )
+    return True
 
 if __name__ == "__main__":
     main()
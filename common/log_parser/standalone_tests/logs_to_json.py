@@ -19,6 +19,16 @@ import re
 import json
 import os
 
+# Shared helpers live in the log_parser root; a script run by path only has
+# its own directory on sys.path
+_LOG_PARSER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _LOG_PARSER_DIR not in sys.path:
+    sys.path.append(_LOG_PARSER_DIR)
+# pylint: disable=wrong-import-position
+from fail_counts import store_fail_counts
+from log_encoding import log_exists, log_name, open_text
+# pylint: enable=wrong-import-position
+
 # Test Suite Mapping
 test_suite_mapping = {
     "dt_kselftest": {
@@ -719,7 +729,7 @@ def parse_capsule_update_logs(capsule_update_log_path, capsule_on_disk_log_path,
 
     def read_file_lines(path, encoding='utf-8'):
         try:
-            with open(path, 'r', encoding=encoding, errors='ignore') as f:
+            with open_text(path, encoding=encoding, errors='ignore') as f:
                 return f.readlines()
         except:
             return []
@@ -932,10 +942,10 @@ def parse_capsule_update_logs(capsule_update_log_path, capsule_on_disk_log_path,
         if not subres["warning_reasons"]:
             del subres["warning_reasons"]
 
-    return {
+    return store_fail_counts({
         "test_results": [current_test],
         "suite_summary": suite_summary
-    }
+    }, suite_summary["total_failed"], 0)
 
 ###############################################################################
 # PSCI Checker Parse
@@ -964,11 +974,11 @@ def parse_psci_logs(psci_log_path):
     }
 
     # If file not found, return so that it is treated as failure
-    if not os.path.isfile(psci_log_path):
+    if not log_exists(psci_log_path):
         sys.exit(1)
 
     # Read lines
-    with open(psci_log_path, 'r') as f:
+    with open_text(psci_log_path) as f:
         lines = f.readlines()
 
     version_pattern = re.compile(r'psci:\s+PSCIv([\d\.]+)\s+detected in firmware\.', re.IGNORECASE)
@@ -1013,7 +1023,9 @@ def parse_psci_logs(psci_log_path):
             if not subres[key_list]:
                 del subres[key_list]
 
-    return {"test_results": [current_test], "suite_summary": current_test["test_suite_summary"]}
+    suite_summary = dict(current_test["test_suite_summary"])
+    return store_fail_counts({"test_results": [current_test], "suite_summary": suite_summary},
+                             suite_summary["total_failed"], 0)
 
 def extract_smbios_block(lines):
     """
@@ -1340,38 +1352,40 @@ def parse_runtime_dev_map_conflict(log_data):
 def parse_single_log(log_file_path):
     # Try UTF-8 → fallback to UTF-16 → fallback to binary-safe ignore
     try:
-        with open(log_file_path, 'r', encoding='utf-8') as f:
+        with open_text(log_file_path, encoding='utf-8') as f:
             log_data = f.readlines()
     except UnicodeDecodeError:
         try:
-            with open(log_file_path, 'r', encoding='utf-16') as f:
+            with open_text(log_file_path, encoding='utf-16') as f:
                 log_data = f.readlines()
         except UnicodeDecodeError:
             # As last fallback, ignore undecodable bytes
-            with open(log_file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            with open_text(log_file_path, encoding='utf-8', errors='ignore') as f:
                 log_data = f.readlines()
 
     log_content = ''.join(log_data)
-    name = os.path.basename(log_file_path).lower()
+    name = os.path.basename(log_name(log_file_path)).lower()
 
     if re.search(r'selftests: dt: test_unprobed_devices.sh', log_content):
-        return parse_dt_kselftest_log(log_data)
+        data = parse_dt_kselftest_log(log_data)
     elif ('dt-validate' in name
             or re.search(r'DeviceTree bindings of Linux kernel version', log_content, re.I)):
-        return parse_dt_validate_log(log_data)
+        data = parse_dt_validate_log(log_data)
     elif re.search(r'Running Networking Checks', log_content):
-        return parse_ethtool_test_log(log_data)
+        data = parse_ethtool_test_log(log_data)
     elif re.search(r'Read block devices tool', log_content):
-        return parse_read_write_check_blk_devices_log(log_data)
+        data = parse_read_write_check_blk_devices_log(log_data)
     elif "SmbiosTable" in log_content:
         smbios_block = extract_smbios_block(log_data)
-        return parse_smbios_log(smbios_block)
+        data = parse_smbios_log(smbios_block)
     elif "network_boot_checks" in log_content or "Network_Boot_Result:" in log_content:
-        return parse_network_boot_log(log_data)
+        data = parse_network_boot_log(log_data)
     elif re.search(r'Testing Runtime Device Mapping Conflict Test', log_content):
-        return parse_runtime_dev_map_conflict(log_data)
+        data = parse_runtime_dev_map_conflict(log_data)
     else:
         raise ValueError("Unknown or unsupported standalone log format.")
+    # Every parser above counts each FAILED subtest into total_failed as it adds it
+    return store_fail_counts(data, data["suite_summary"]["total_failed"], 0)
 
 if __name__ == "__main__":
     args = sys.argv[1:]
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test_suite_info shown on the detailed report pages.
+
+merge_jsons.py copies the Description of each test suite in the test
+category file into merged_results.json as Test_suite_info. The json_to_html
+renderers look the same descriptions up here and pass them to their
+templates, which print them under each test suite heading.
+"""
+
+import functools
+import json
+import os
+
+YOCTO_FLAG_PATH = "/mnt/yocto_image.flag"
+TEST_CATEGORY_DT_PATH = "/usr/bin/log_parser/test_categoryDT.json"
+TEST_CATEGORY_SR_PATH = "/usr/bin/log_parser/test_category.json"
+
+# Detailed page -> "Suite" column of the test category file, as merge_jsons
+# looks up the suites whose JSONs end up on that page
+DETAILED_PAGE_SUITES = {
+    "bsa_detailed.html": "bsa",
+    "sbsa_detailed.html": "sbsa",
+    "fwts_detailed.html": "fwts",
+    "sct_detailed.html": "sct",
+    "bbsr_fwts_detailed.html": "bbsr-fwts",
+    "bbsr_sct_detailed.html": "bbsr-sct",
+    "bbsr_tpm_detailed.html": "bbsr-tpm",
+    "pfdi_detailed.html": "pfdi",
+    "post_script_detailed.html": "post_script",
+    "scmi_detailed.html": "scmi",
+    "sbmr_ib_detailed.html": "sbmr",
+    "sbmr_oob_detailed.html": "sbmr",
+    "standalone_tests_detailed.html": "standalone",
+    "os_tests_detailed.html": "standalone",
+}
+
+
+def test_category_path():
+    """Test category file of the current mode, as merge_jsons.py uses it."""
+    if os.path.isfile(YOCTO_FLAG_PATH):
+        return TEST_CATEGORY_DT_PATH
+    return TEST_CATEGORY_SR_PATH
+
+
+@functools.lru_cache(maxsize=None)
+def load_descriptions(category_path):
+    """
+    Return {suite: {test_suite: Description}} from a test category file.
+
+    Names are lowercased; when a test suite is listed twice the last row is
+    used, as in merge_jsons.build_testcategory_dict(). A missing or invalid
+    file gives {}.
+    """
+    try:
+        with open(category_path, "r", encoding="utf-8") as f:
+            category_data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(category_data, dict):
+        return {}
+
+    rows_by_suite = {}
+    for rows in category_data.values():
+        if not isinstance(rows, list):
+            continue
+        for row in rows:
+            suite = row.get("Suite", "").strip().lower()
+            test_suite = row.get("Test Suite", "").strip().lower()
+            if suite and test_suite:
+                rows_by_suite.setdefault(suite, {})[test_suite] = row
+    return {
+        suite: {name: row["Description"] for name, row in rows.items() if "Description" in row}
+        for suite, rows in rows_by_suite.items()
+    }
+
+
+def suite_info_for_page(page_path, category_path=None):
+    """Return {test_suite_lowercase: Test_suite_info} for a detailed page."""
+    suite = DETAILED_PAGE_SUITES.get(os.path.basename(page_path))
+    if suite is None:
+        return {}
+    return load_descriptions(category_path or test_category_path()).get(suite, {})
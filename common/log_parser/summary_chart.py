@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# Copyright (c) 2026, Arm Limited or its affiliates. All rights reserved.
+# SPDX-License-Identifier : Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Result distribution bar chart shared by the json_to_html renderers.
+
+The chart is written as inline SVG, laid out like the matplotlib figure
+the renderers used to rasterize. Set ACS_CHART_FORMAT=png to embed a
+matplotlib PNG instead; matplotlib is only imported in that case.
+"""
+
+import base64
+import math
+import os
+from html import escape
+from io import BytesIO
+
+CHART_FORMAT_ENV = "ACS_CHART_FORMAT"
+CHART_FORMATS = ("svg", "png")
+
+# Geometry in points, as matplotlib lays out a figure; the SVG is drawn in a
+# 72-per-inch viewBox and displayed at the 100 dpi the PNG used to have.
+POINTS_PER_INCH = 72
+PIXELS_PER_INCH = 100
+FONT_FAMILY = "DejaVu Sans, Bitstream Vera Sans, Arial, sans-serif"
+LABEL_FONT_SIZE = 12
+TICK_FONT_SIZE = 11
+YLABEL_FONT_SIZE = 14
+TICK_LENGTH = 3.5
+BAR_WIDTH = 0.8
+# matplotlib pads the data limits by 5% on each side
+AXIS_MARGIN = 0.05
+
+
+def chart_format():
+    """Return the chart format selected by ACS_CHART_FORMAT (default svg)."""
+    value = os.environ.get(CHART_FORMAT_ENV, "svg").strip().lower()
+    return value if value in CHART_FORMATS else "svg"
+
+
+def percentage_labels(sizes, total=None):
+    """Return the '12.34%' label drawn above each bar."""
+    if total is None:
+        total = sum(sizes)
+    return [f"{(size / total) * 100 if total > 0 else 0:.2f}%" for size in sizes]
+
+
+def nice_ticks(max_value):
+    """Return y-axis tick values from 0 up to max_value, on a 1/2/2.5/5 step."""
+    raw_step = max_value / 7
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    for factor in (1, 2, 2.5, 5, 10):
+        step = factor * magnitude
+        if step >= raw_step:
+            break
+    # Counts are whole numbers, so never place ticks between them
+    step = max(1, step)
+    count = math.floor(max_value / step + 1e-9)
+    return [round(i * step, 6) for i in range(count + 1)]
+
+
+def format_tick(value):
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def render_svg(labels, sizes, colors, title, ylabel, total=None,
+               figsize=(12, 7), title_size=18, rotate_labels=False):
+    """Return the bar chart as an inline <svg> element."""
+    width = figsize[0] * POINTS_PER_INCH
+    height = figsize[1] * POINTS_PER_INCH
+    left = 70
+    right = width - 15
+    top = title_size * 2.5
+    bottom = height - (100 if rotate_labels else 45)
+    plot_width = right - left
+    plot_height = bottom - top
+
+    # Same data limits as plt.bar: bars centred on 0..n-1, 5% margins
+    max_size = max(sizes) if sizes else 0
+    y_max = max_size * (1 + AXIS_MARGIN) if max_size > 0 else 1
+    ticks = nice_ticks(y_max)
+    x_min = -BAR_WIDTH / 2
+    x_span = max(len(labels), 1) - 1 + BAR_WIDTH
+    x_min -= x_span * AXIS_MARGIN
+    x_span *= 1 + 2 * AXIS_MARGIN
+    scale = plot_width / x_span
+
+    def y_pos(value):
+        return bottom - (value / y_max) * plot_height
+
+    font = f'font-family="{FONT_FAMILY}"'
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" role="img" '
+        f'width="{figsize[0] * PIXELS_PER_INCH}" height="{figsize[1] * PIXELS_PER_INCH}" '
+        f'viewBox="0 0 {width:g} {height:g}" style="max-width:100%;height:auto" '
+        f'aria-label="{escape(title)}">',
+        f'<title>{escape(title)}</title>',
+        f'<rect width="{width:g}" height="{height:g}" fill="#ffffff"/>',
+        f'<text x="{(left + right) / 2:.1f}" y="{title_size * 1.6:.1f}" {font} '
+        f'font-size="{title_size}" font-weight="bold" text-anchor="middle">{escape(title)}</text>',
+        f'<text transform="translate(18 {(top + bottom) / 2:.1f}) rotate(-90)" {font} '
+        f'font-size="{YLABEL_FONT_SIZE}" text-anchor="middle">{escape(ylabel)}</text>',
+    ]
+
+    for tick in ticks:
+        y = y_pos(tick)
+        parts.append(
+            f'<line x1="{left - TICK_LENGTH}" y1="{y:.1f}" x2="{left}" y2="{y:.1f}" '
+            f'stroke="#000000"/>'
+            f'<text x="{left - TICK_LENGTH - 3}" y="{y + 4:.1f}" {font} '
+            f'font-size="{LABEL_FONT_SIZE}" text-anchor="end">{format_tick(tick)}</text>'
+        )
+
+    for index, (label, size, color, pct) in enumerate(
+            zip(labels, sizes, colors, percentage_labels(sizes, total))):
+        center = left + (index - x_min) * scale
+        bar_width = BAR_WIDTH * scale
+        y = y_pos(size)
+        parts.append(
+            f'<rect x="{center - bar_width / 2:.1f}" y="{y:.1f}" width="{bar_width:.1f}" '
+            f'height="{bottom - y:.1f}" fill="{color}" stroke="#000000"/>'
+            f'<text x="{center:.1f}" y="{y - 6:.1f}" {font} font-size="{LABEL_FONT_SIZE}" '
+            f'text-anchor="middle">{pct}</text>'
+            f'<line x1="{center:.1f}" y1="{bottom}" x2="{center:.1f}" '
+            f'y2="{bottom + TICK_LENGTH}" stroke="#000000"/>'
+        )
+        if rotate_labels:
+            parts.append(
+                f'<text transform="translate({center:.1f} {bottom + TICK_LENGTH + 8:.1f}) '
+                f'rotate(-30)" '
+                f'{font} font-size="{TICK_FONT_SIZE}" text-anchor="end">{escape(label)}</text>'
+            )
+        else:
+            parts.append(
+                f'<text x="{center:.1f}" y="{bottom + TICK_LENGTH + 16:.1f}" {font} '
+                f'font-size="{LABEL_FONT_SIZE}" text-anchor="middle">{escape(label)}</text>'
+            )
+
+    parts.append(
+        f'<rect x="{left}" y="{top:.1f}" width="{plot_width:g}" height="{plot_height:.1f}" '
+        f'fill="none" stroke="#000000"/>'
+    )
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def render_png(labels, sizes, colors, title, ylabel, total=None,
+               figsize=(12, 7), title_size=18, rotate_labels=False):
+    """Return the bar chart as an <img> tag holding a base64 matplotlib PNG."""
+    import matplotlib.pyplot as plt  # pylint: disable=import-error,import-outside-toplevel
+
+    plt.figure(figsize=figsize)
+    bars = plt.bar(labels, sizes, color=colors, edgecolor='black')
+
+    max_size = max(sizes) if sizes else 0
+    for chart_bar, pct in zip(bars, percentage_labels(sizes, total)):
+        plt.text(
+            chart_bar.get_x() + chart_bar.get_width() / 2,
+            chart_bar.get_height() + (0.01 * max_size if max_size else 0.05),
+            pct,
+            ha='center',
+            va='bottom',
+            fontsize=LABEL_FONT_SIZE
+        )
+
+    plt.title(title, fontsize=title_size, fontweight='bold')
+    plt.ylabel(ylabel, fontsize=YLABEL_FONT_SIZE)
+    if rotate_labels:
+        plt.xticks(fontsize=TICK_FONT_SIZE, rotation=30, ha='right')
+    else:
+        plt.xticks(fontsize=LABEL_FONT_SIZE)
+    plt.yticks(fontsize=LABEL_FONT_SIZE)
+    plt.tight_layout()
+
+    buffer = BytesIO()
+    plt.savefig(buffer, format='png')
+    plt.close()
+    data = base64.b64encode(buffer.getvalue()).decode('utf-8')
+    return f'<img src="data:image/png;base64,{data}" alt="{escape(title)}">'
+
+
+def bar_chart_html(labels, sizes, colors, title, ylabel="Total Count", total=None,
+                   figsize=(12, 7), title_size=18, rotate_labels=False):
+    """
+    Return an HTML fragment with a bar chart of sizes, one bar per label.
+
+    Each bar is annotated with its share of total (default: the sum of
+    sizes). The fragment is inline SVG unless ACS_CHART_FORMAT=png.
+    """
+    render = render_png if chart_format() == "png" else render_svg
+    return render(labels, sizes, colors, title, ylabel, total=total, figsize=figsize,
+                  title_size=title_size, rotate_labels=rotate_labels)